@@ -63,7 +63,8 @@ EXPECTED_PLUGIN_LIST = {
         "rpm-ostree",
         "yum",
     ],
-    "plan_shapers": ["max-tests", "repeat"],
+    "plan_shapers": ["max-tests", "repeat", "shards"],
+    "plan_shapers.shards.history": ["results"],
     "prepare.artifact.providers": [
         "brew.build",
         "brew.nvr",
@@ -26,7 +26,7 @@ rlJournalStart
         rlPhaseEnd
 
         rlPhaseStartTest "[$method] Check the flavor argument is working"
-            rlRun -s "tmt run --last -v --id $run_dir execute -h $method report -h junit --file junit.xml --flavor default --force 2>&1 >/dev/null" 2
+            rlRun -s "tmt run --last -v --id $run_dir execute -h $method report -h junit --file junit.xml --flavor default --validate --force 2>&1 >/dev/null" 2
             rlAssertGrep "6 tests passed, 5 tests failed and 2 errors" "$rlRun_LOG"
 
             # Check there is no schema problem reported
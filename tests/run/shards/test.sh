@@ -0,0 +1,33 @@
+#!/bin/bash
+. /usr/share/beakerlib/beakerlib.sh || exit 1
+
+rlJournalStart
+    rlPhaseStartSetup
+        rlRun "workdir_root=\$(mktemp -d)" 0 "Create workdir root"
+        rlRun "export TMT_WORKDIR_ROOT=$workdir_root"
+        rlRun "pushd data"
+    rlPhaseEnd
+
+    rlPhaseStartTest "Balance by duration"
+        rlRun -s "tmt run -vv --id by-duration --shards 2"
+        rlAssertGrep "Splitting plan to 2 shards balanced by duration." $rlRun_LOG
+        rlAssertGrep "1 test selected" $rlRun_LOG
+        rlAssertGrep "summary: 1 test passed" $rlRun_LOG
+        rlAssertGrep "4 tests selected" $rlRun_LOG
+        rlAssertGrep "summary: 4 tests passed" $rlRun_LOG
+    rlPhaseEnd
+
+    rlPhaseStartTest "Balance by count"
+        rlRun -s "tmt run -vv --id by-count --shards 2 --balance count"
+        rlAssertGrep "Splitting plan to 2 shards balanced by count." $rlRun_LOG
+        rlAssertGrep "3 tests selected" $rlRun_LOG
+        rlAssertGrep "summary: 3 tests passed" $rlRun_LOG
+        rlAssertGrep "2 tests selected" $rlRun_LOG
+        rlAssertGrep "summary: 2 tests passed" $rlRun_LOG
+    rlPhaseEnd
+
+    rlPhaseStartCleanup
+        rlRun "popd"
+        rlRun "rm -r $workdir_root" 0 "Remove workdir root"
+    rlPhaseEnd
+rlJournalEnd
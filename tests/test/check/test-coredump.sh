@@ -65,7 +65,7 @@ rlJournalStart
             # Verify coredump was captured
             rlRun "find $run/plan/execute/data/guest/default-0/coredump/segfault-1/checks/ -maxdepth 1 \
                     # grep needed as find returns 0 even without match \
-            \\\( -name 'dump._usr_bin_bash_SIGSEGV_*.core' -o -name 'dump._usr_bin_sleep_SIGSEGV_*.core' \\\) -print | grep -q ."
+            \\\( -name 'dump._usr_bin_bash_SIGSEGV_*.core*' -o -name 'dump._usr_bin_sleep_SIGSEGV_*.core*' \\\) -print | grep -q ."
             rlLogInfo "$(ls -l $run/plan/execute/data/guest/default-0/coredump/segfault-1/checks/)"
         fi
     rlPhaseEnd
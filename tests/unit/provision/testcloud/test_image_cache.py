@@ -0,0 +1,181 @@
+import http.server
+import os
+import struct
+import threading
+import urllib.request
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tmt.log import Logger
+from tmt.steps.provision.testcloud import QCOW2_MAGIC, ImageCache, _qcow2_backing_file
+from tmt.utils import Path
+
+#: Content of the fake image served by the fake image server.
+IMAGE_CONTENT = QCOW2_MAGIC + bytes(1020)
+
+
+def _create_qcow2(path: Path, backing_file: str = '', size: int = 1024) -> Path:
+    """
+    Create a tiny fake qcow2 image, with just the header fields tmt reads
+    """
+
+    encoded_backing_file = backing_file.encode()
+    header = QCOW2_MAGIC + struct.pack(
+        '>IQI', 3, 72 if backing_file else 0, len(encoded_backing_file)
+    )
+
+    path.write_bytes(header.ljust(72, b'\0') + encoded_backing_file.ljust(size - 72, b'\0'))
+
+    return path
+
+
+@pytest.fixture
+def image_server() -> Iterator[tuple[str, list[str]]]:
+    """
+    Serve a fake image over HTTP, recording all requests
+    """
+
+    requests: list[str] = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            requests.append(self.path)
+
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(IMAGE_CONTENT)))
+            self.end_headers()
+            self.wfile.write(IMAGE_CONTENT)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_address[1]}/fedora.qcow2', requests
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_shared_download(tmppath: Path, image_server: tuple[str, list[str]]) -> None:
+    url, requests = image_server
+
+    cache = ImageCache(tmppath)
+    cache.image_dirpath.mkdir(parents=True)
+
+    image_path = cache.image_dirpath / 'fedora.qcow2'
+
+    # Mimics the way the provisioner prepares an image
+    def provision() -> bool:
+        with cache.lock(image_path.name):
+            if not image_path.exists():
+                with urllib.request.urlopen(url) as response:  # noqa: S310
+                    image_path.write_bytes(response.read())
+
+            if cache.is_verified(image_path):
+                return False
+
+            cache.mark_verified(image_path, url=url)
+
+            return True
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        verified = list(executor.map(lambda _: provision(), range(8)))
+
+    # Just one provisioner downloaded and verified the image
+    assert requests == ['/fedora.qcow2']
+    assert verified.count(True) == 1
+    assert image_path.read_bytes() == IMAGE_CONTENT
+
+
+def test_verification_record(tmppath: Path) -> None:
+    cache = ImageCache(tmppath)
+    cache.image_dirpath.mkdir(parents=True)
+
+    image_path = _create_qcow2(cache.image_dirpath / 'fedora.qcow2')
+
+    assert not cache.is_verified(image_path)
+
+    cache.mark_verified(image_path)
+
+    assert cache.is_verified(image_path)
+
+    # A changed image must be verified again
+    _create_qcow2(image_path, size=2048)
+
+    assert not cache.is_verified(image_path)
+
+    cache.mark_verified(image_path)
+    cache.forget(image_path.name)
+
+    assert not cache.is_verified(image_path)
+
+
+def test_qcow2_backing_file(tmppath: Path) -> None:
+    base = _create_qcow2(tmppath / 'base.qcow2')
+
+    assert _qcow2_backing_file(base) is None
+    assert _qcow2_backing_file(_create_qcow2(tmppath / 'abs.qcow2', str(base))) == base
+    assert _qcow2_backing_file(_create_qcow2(tmppath / 'rel.qcow2', 'base.qcow2')) == base
+
+    (tmppath / 'raw.img').write_bytes(bytes(1024))
+
+    assert _qcow2_backing_file(tmppath / 'raw.img') is None
+    assert _qcow2_backing_file(tmppath / 'missing.qcow2') is None
+
+
+def test_evict(tmppath: Path, root_logger: Logger) -> None:
+    cache = ImageCache(tmppath, size_limit=4096)
+    cache.image_dirpath.mkdir(parents=True)
+
+    images = {
+        name: _create_qcow2(cache.image_dirpath / f'{name}.qcow2')
+        for name in ('backing', 'locked', 'oldest', 'older', 'current', 'newest')
+    }
+
+    # Local images are symlinked into the cache, they do not count
+    (cache.image_dirpath / 'local.qcow2').symlink_to(_create_qcow2(tmppath / 'local.qcow2'))
+
+    for age, image in enumerate(reversed(images.values())):
+        cache.mark_verified(image)
+        os.utime(cache.record_dirpath / f'{image.name}.json', (1000 - age, 1000 - age))
+
+    # One image backs an instance overlay...
+    overlay_dirpath = cache.instance_dirpath / 'tmt-instance'
+    overlay_dirpath.mkdir(parents=True)
+    _create_qcow2(overlay_dirpath / 'tmt-instance-local.qcow2', str(images['backing']))
+
+    # ... and another one is being used by another provisioner
+    lock = cache.lock(images['locked'].name)
+    lock.acquire(shared=True)
+
+    try:
+        evicted = cache.evict(root_logger, keep=[images['current'].name])
+
+    finally:
+        lock.release()
+
+    assert evicted == [images['oldest'], images['older']]
+    assert sorted(path.name for path in cache.image_dirpath.iterdir()) == [
+        'backing.qcow2',
+        'current.qcow2',
+        'local.qcow2',
+        'locked.qcow2',
+        'newest.qcow2',
+    ]
+    assert not cache.is_verified(images['oldest'])
+
+    # Once released, the image may be evicted, but the backing one may not
+    cache.size_limit = 1024
+
+    assert cache.evict(root_logger, keep=[images['current'].name]) == [
+        images['locked'],
+        images['newest'],
+    ]
+
+    # Without a limit, the cache is never evicted
+    assert ImageCache(tmppath).evict(root_logger) == []
@@ -3,6 +3,9 @@ import os
 import pickle
 import shutil
 import tempfile
+import textwrap
+import threading
+import unittest.mock
 from typing import TYPE_CHECKING
 
 import jsonschema
@@ -13,6 +16,8 @@ import tmt.result
 import tmt.utils
 from tmt.base.core import FmfId, expand_node_data
 from tmt.base.links import Link, LinkNeedle, Links
+from tmt.base.plan import Plan
+from tmt.lint import LinterOutcome
 from tmt.utils import Path, SpecificationError
 
 if TYPE_CHECKING:
@@ -188,6 +193,105 @@ def test_link():
     assert not links.has_link(needle=LinkNeedle(relation=r'.*', target=r'.*'))
 
 
+def test_link_index(root_logger) -> None:
+    """
+    Test the reverse link index of a tree
+    """
+
+    import fmf
+
+    tree = tmt.Tree(
+        logger=root_logger,
+        tree=fmf.Tree(
+            {
+                '/stories': {
+                    'story': 'As a user...',
+                    '/covered': {'link': [{'verified-by': '/tests/first'}]},
+                    '/idea': {},
+                },
+                '/tests': {
+                    'test': './test.sh',
+                    '/first': {'link': [{'verifies': '/stories/covered'}]},
+                    '/second': {
+                        'link': [
+                            {'verifies': '/stories/idea'},
+                            {'verifies': {'url': 'https://example.com', 'name': '/stories/idea'}},
+                            {'relates': '/missing'},
+                        ]
+                    },
+                },
+                '/broken': {'link': {'foo': 'bar'}},
+            }
+        ),
+    )
+
+    index = tree.link_index
+
+    assert index.invalid == {'/broken'}
+    assert [source for source, _ in index.links_to('/stories/covered')] == ['/tests/first']
+    assert [source for source, _ in index.links_to('/stories/idea')] == ['/tests/second']
+    assert index.links_to('/stories/idea', 'relates') == []
+    assert index.matching([LinkNeedle(relation='verifies')]) == {'/tests/first', '/tests/second'}
+    assert index.matching([LinkNeedle(target='missing'), LinkNeedle(target='^/stories/co')]) == {
+        '/tests/first',
+        '/tests/second',
+    }
+
+    # Filtering by links uses the index, broken links do not match
+    tests = tree.tests(links=[LinkNeedle(target='/stories/idea')], apply_command_line=False)
+    assert [test.name for test in tests] == ['/tests/second']
+
+    # Links of tests count towards story coverage, without duplicates
+    stories = {story.name: story for story in tree.stories(apply_command_line=False)}
+    assert [link.target for link in stories['/stories/covered'].verified] == ['/tests/first']
+    assert [link.target for link in stories['/stories/idea'].verified] == ['/tests/second']
+
+    # Index is rebuilt together with the fmf tree
+    tree.tree = fmf.Tree({'/tests': {'test': './test.sh'}})
+    assert tree.link_index is not index
+    assert tree.link_index.links_to('/stories/covered') == []
+
+
+def test_lint_dangling_links(tmppath: Path, root_logger) -> None:
+    """
+    Test detection of dangling links, with sections of documents and patterns
+    """
+
+    (tmppath / '.fmf').mkdir()
+    (tmppath / '.fmf' / 'version').write_text('1\n')
+    (tmppath / 'docs').mkdir()
+    (tmppath / 'docs' / 'guide.rst').write_text('Guide\n')
+    (tmppath / 'main.fmf').write_text(
+        textwrap.dedent("""
+        /tests/unit/first/basic:
+            test: ./test.sh
+        /stories/documented:
+            story: As a user...
+            link:
+              - documented-by: /docs/guide.rst#section
+              - verified-by: /tests/unit/.*/basic
+        /stories/dangling:
+            story: As a user...
+            link:
+              - documented-by: /docs/missing.rst#section
+              - verified-by: /tests/other/.*/basic
+              - verified-by: /tests/[invalid
+        """)
+    )
+
+    tree = tmt.Tree(logger=root_logger, path=tmppath)
+    stories = {story.name: story for story in tree.stories(apply_command_line=False)}
+
+    assert list(stories['/stories/documented'].lint_dangling_links()) == [
+        (LinterOutcome.PASS, 'links point to existing objects or files')
+    ]
+    assert [message for _, message in stories['/stories/dangling'].lint_dangling_links()] == [
+        "link 'documented-by: /docs/missing.rst#section' points to neither an object nor a file",
+        "link 'verified-by: /tests/other/.*/basic' points to neither an object nor a file",
+        "link 'verified-by: /tests/[invalid' points to neither an object nor a file",
+    ]
+
+
 def test_pickleable_tree() -> None:
     """
     https://github.com/teemtee/tmt/issues/2503
@@ -219,6 +323,86 @@ def test_pickleable_tree() -> None:
     assert check_equal_pickled_object(tree, unpickled_tree)
 
 
+def _git(*arguments: str, cwd: Path, logger) -> None:
+    tmt.utils.Command(
+        'git', '-c', 'user.name=tmt', '-c', 'user.email=tmt@example.com', *arguments
+    ).run(cwd=cwd, logger=logger)
+
+
+def test_import_plans_shared_tree(tmppath: Path, root_logger, monkeypatch) -> None:
+    """
+    Plans importing from the same source share a single fetched tree
+    """
+
+    monkeypatch.setenv('FMF_CACHE_DIRECTORY', str(tmppath / 'cache'))
+
+    # Prepare bare repositories with plans to import
+    for name in ('first', 'second'):
+        source = tmppath / f'{name}-source'
+        (source / '.fmf').mkdir(parents=True)
+        (source / '.fmf/version').write_text('1\n')
+        (source / 'plans.fmf').write_text(
+            f'/{name}:\n  discover:\n    how: fmf\n  execute:\n    how: tmt\n'
+        )
+
+        _git('init', '--initial-branch', 'main', cwd=source, logger=root_logger)
+        _git('add', '.', cwd=source, logger=root_logger)
+        _git('commit', '-m', 'plans', cwd=source, logger=root_logger)
+        _git(
+            'clone',
+            '--bare',
+            str(source),
+            str(tmppath / f'{name}.git'),
+            cwd=tmppath,
+            logger=root_logger,
+        )
+
+    local = tmppath / 'local'
+    (local / '.fmf').mkdir(parents=True)
+    (local / '.fmf/version').write_text('1\n')
+    (local / 'plans.fmf').write_text(
+        ''.join(
+            f'/{plan}:\n  plan:\n    import:\n'
+            f'      url: file://{tmppath}/{repository}.git\n'
+            f'      name: /plans/{repository}\n'
+            for plan, repository in (
+                ('one', 'first'),
+                ('two', 'first'),
+                ('three', 'second'),
+                ('four', 'first'),
+            )
+        )
+    )
+
+    fetched: list[str] = []
+    original_fetch = Plan._fetch_import_tree
+
+    def _fetch_import_tree(plan: Plan, reference):
+        fetched.append(str(reference.url))
+
+        return original_fetch(plan, reference)
+
+    monkeypatch.setattr(Plan, '_fetch_import_tree', _fetch_import_tree)
+
+    plans = tmt.Tree(path=local, logger=root_logger).plans()
+
+    # Every unique source is fetched just once
+    assert sorted(fetched) == [f'file://{tmppath}/first.git', f'file://{tmppath}/second.git']
+
+    assert sorted((plan.name, plan.node.root) for plan in plans) == sorted(
+        (
+            f'/plans/{plan}',
+            str(tmppath / 'cache' / f'file://{tmppath}/{repository}.git'.replace('/', '_')),
+        )
+        for plan, repository in (
+            ('four', 'first'),
+            ('one', 'first'),
+            ('three', 'second'),
+            ('two', 'first'),
+        )
+    )
+
+
 def test_expand_node_data(monkeypatch) -> None:
     """
     :py:func:`tmt.base.core.expand_node_data` handles various forms of variables
@@ -301,3 +485,93 @@ def test_expand_node_data(monkeypatch) -> None:
         monkeypatch.setenv(envvar, value)
 
     assert expand_node_data(data, fmf_context) == expected
+
+
+def test_clean_runs(tmppath: Path, root_logger) -> None:
+    for name in ('run-001', 'run-002'):
+        (tmppath / name / 'plans').mkdir(parents=True)
+        (tmppath / name / 'run.yaml').write_text('{}')
+        (tmppath / name / 'plans' / 'data').write_text('x' * 1000)
+        (tmppath / name / 'link').symlink_to(tmppath / 'keep')
+
+    (tmppath / 'keep').write_text('keep')
+
+    # Leftover of an interrupted cleanup
+    (tmppath / tmt.base.core.CLEAN_TRASH_DIRNAME / 'run-000-xyz').mkdir(parents=True)
+
+    clean = tmt.Clean(logger=root_logger, workdir_root=tmppath)
+
+    assert tmt.base.core._dir_size(tmppath / 'run-001').to('bytes').magnitude >= 1002
+
+    assert clean.runs((), None)
+
+    assert sorted(path.name for path in tmppath.iterdir()) == ['keep']
+    assert (tmppath / 'keep').read_text() == 'keep'
+
+
+def test_clean_runs_concurrent_leftovers(tmppath: Path, root_logger) -> None:
+    (tmppath / 'run-001').mkdir()
+    (tmppath / 'run-001' / 'run.yaml').write_text('{}')
+
+    trash = tmppath / tmt.base.core.CLEAN_TRASH_DIRNAME
+
+    # Leftovers of this user, another cleanup in progress, and another user
+    for name in ('run-000-own', 'run-000-busy', 'run-000-foreign'):
+        (trash / name / 'run-000').mkdir(parents=True)
+
+    if os.getuid() == 0:
+        os.chown(trash / 'run-000-foreign', 65534, 65534)
+
+    clean = tmt.Clean(logger=root_logger, workdir_root=tmppath)
+    lock = clean._lock_trashed(trash / 'run-000-busy')
+
+    assert lock is not None
+    assert clean._lock_trashed(trash / 'run-000-busy') is None
+
+    try:
+        assert clean.runs((), None)
+
+    finally:
+        os.close(lock)
+
+    expected = ['run-000-busy', 'run-000-foreign'] if os.getuid() == 0 else ['run-000-busy']
+
+    assert sorted(path.name for path in trash.iterdir()) == expected
+    assert not (tmppath / 'run-001').exists()
+
+
+def test_clean_guests_failures(tmppath: Path, root_logger, monkeypatch) -> None:
+    for name in ('run-001', 'run-002'):
+        (tmppath / name).mkdir()
+        (tmppath / name / 'run.yaml').write_text('{}')
+
+    run_failing, run_stuck = (
+        unittest.mock.MagicMock(run_workdir=tmppath / name) for name in ('run-001', 'run-002')
+    )
+    stuck = threading.Event()
+
+    def _stop_running_guests(self, run) -> bool:
+        if run is run_failing:
+            raise tmt.utils.GeneralError('Failed to wake up provision.')
+
+        stuck.wait(10)
+        return True
+
+    monkeypatch.setattr(tmt.base.core.Clean, '_stop_running_guests', _stop_running_guests)
+    monkeypatch.setattr(tmt.base.core, 'CLEAN_GUEST_TIMEOUT', 0.1)
+
+    clean = tmt.Clean(logger=root_logger, workdir_root=tmppath)
+    clean_runs = tmt.Clean(logger=root_logger, parent=clean, workdir_root=tmppath)
+
+    try:
+        # Neither an exception nor a timeout is a success
+        assert not clean._stop_running_guests_with_timeout(run_failing)
+        assert not clean._stop_running_guests_with_timeout(run_stuck)
+
+        # Workdir of the run whose guests are still stopping is kept
+        assert not clean_runs.runs((), None)
+
+    finally:
+        stuck.set()
+
+    assert sorted(path.name for path in tmppath.iterdir()) == ['run-002']
@@ -144,3 +144,111 @@ def test_mark_nonexistent_url(root_logger, monkeypatch, tmppath):
             logger=root_logger, identifier=identifier, parent=parent
         ).fetch()
     shutil.rmtree(parent.workdir)
+
+
+def _create_library_repository(
+    path: Path, libraries: dict[str, list[str]], logger, branch: str = 'main'
+) -> str:
+    """
+    Create a bare git repository with given libraries and their requires
+    """
+
+    def _git(*arguments: str, cwd: Path) -> None:
+        tmt.utils.Command(
+            'git', '-c', 'user.name=tmt', '-c', 'user.email=tmt@example.com', *arguments
+        ).run(cwd=cwd, logger=logger)
+
+    source = path.with_name(f'{path.name}-source')
+
+    (source / '.fmf').mkdir(parents=True)
+    (source / '.fmf/version').write_text('1\n')
+
+    for name, require in libraries.items():
+        (source / name).mkdir()
+        (source / name / 'lib.sh').write_text('true\n')
+        (source / name / 'main.fmf').write_text(tmt.utils.to_yaml({'require': require}))
+
+    _git('init', '--initial-branch', branch, cwd=source)
+    _git('add', '.', cwd=source)
+    _git('commit', '-m', 'libraries', cwd=source)
+    _git('clone', '--bare', str(source), str(path), cwd=source.parent)
+
+    return f'file://{path}'
+
+
+def test_dependencies_waves(root_logger, tmppath, monkeypatch):
+    """
+    Libraries are fetched in waves, each repository is cloned just once
+    """
+
+    first = _create_library_repository(
+        tmppath / 'first.git',
+        {
+            'one': ['package-one', {'url': f'file://{tmppath}/second.git', 'name': '/three'}],
+            'two': ['package-two'],
+        },
+        root_logger,
+    )
+    second = _create_library_repository(
+        tmppath / 'second.git',
+        {'three': ['package-three', {'url': f'file://{tmppath}/first.git', 'name': '/two'}]},
+        root_logger,
+    )
+
+    cloned: list[str] = []
+    original_git_clone = tmt.utils.git.git_clone
+
+    def _git_clone(*, url: str, **kwargs):
+        cloned.append(url)
+
+        return original_git_clone(url=url, **kwargs)
+
+    monkeypatch.setattr(tmt.utils.git, 'git_clone', _git_clone)
+
+    parent = tmt.utils.Common(logger=root_logger, workdir=tmppath / 'workdir')
+    requires, recommends = tmt.libraries.resolve_dependencies(
+        original_require=[
+            tmt.base.core.DependencyFmfId(url=first, name='/one'),
+            tmt.base.core.DependencySimple('package-four'),
+        ],
+        original_recommend=[
+            tmt.base.core.DependencyFmfId(url=first, name='/two'),
+            tmt.base.core.DependencySimple('package-five'),
+        ],
+        parent=parent,
+        logger=root_logger,
+    )
+
+    # Packages required by libraries are required, no matter how the
+    # library itself was requested.
+    assert sorted(requires) == ['package-four', 'package-one', 'package-three', 'package-two']
+    assert sorted(recommends) == ['package-five']
+
+    # The first wave clones the first repository, the second wave the
+    # second one, and the first repository is not cloned again.
+    assert cloned == [first, second]
+
+    assert (parent.workdir / 'libs/first/one/lib.sh').exists()
+    assert (parent.workdir / 'libs/first/two/lib.sh').exists()
+    assert (parent.workdir / 'libs/second/three/lib.sh').exists()
+
+
+def test_dependencies_conflicting_ref(root_logger, tmppath):
+    """
+    The same library cannot be fetched with different refs
+    """
+
+    url = _create_library_repository(tmppath / 'first.git', {'one': []}, root_logger)
+
+    parent = tmt.utils.Common(logger=root_logger, workdir=tmppath / 'workdir')
+
+    with pytest.raises(tmt.utils.GeneralError, match=r"using ref 'other' conflicts"):
+        tmt.libraries.resolve_dependencies(
+            original_require=[
+                tmt.base.core.DependencyFmfId(url=url, name='/one'),
+                tmt.base.core.DependencyFmfId(url=url, name='/one', ref='other'),
+            ],
+            original_recommend=[],
+            parent=parent,
+            logger=root_logger,
+        )
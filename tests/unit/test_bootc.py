@@ -0,0 +1,217 @@
+import contextlib
+import os
+import subprocess
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from tmt.guest import GuestSsh
+from tmt.log import Logger
+from tmt.package_managers.bootc import Bootc, image_cache_key, normalize_layers
+from tmt.utils import CommandOutput, Path, RunError, ShellScript
+from tmt.utils.environment import Environment, EnvVarValue
+
+#: Fake ``podman``, keeping images as files in ``$FAKE_IMAGES``, and
+#: recording builds in ``$FAKE_IMAGES/builds``.
+FAKE_PODMAN = """#!/bin/bash
+image_path() { echo "$FAKE_IMAGES/$(echo "$1" | tr '/:' '__')"; }
+case "$1 $2" in
+    "pull "*)
+        [ -e "$(image_path "$2")" ]
+        ;;
+    "image inspect")
+        [ -e "$(image_path "${@: -1}")" ] || exit 1
+        cat "$(image_path "${@: -1}")"
+        ;;
+    "image exists")
+        [ -e "$(image_path "$3")" ]
+        ;;
+    "build "*)
+        while [ "$1" != "-t" ]; do
+            [ "$1" = "--label" ] && label="${2#*=}"
+            shift
+        done
+        echo "$2" >> "$FAKE_IMAGES/builds"
+        echo "sha256:built-$(wc -l < "$FAKE_IMAGES/builds") $label" > "$(image_path "$2")"
+        ;;
+esac
+"""
+
+BASE_IMAGE = 'quay.io/fedora/fedora-bootc:42'
+
+
+@pytest.fixture
+def guest(tmppath: Path) -> MagicMock:
+    """
+    A bootc guest running scripts locally, with a fake ``podman``
+    """
+
+    bin_dirpath = tmppath / 'bin'
+    bin_dirpath.mkdir()
+    (bin_dirpath / 'podman').write_text(FAKE_PODMAN)
+    (bin_dirpath / 'podman').chmod(0o755)
+
+    images_dirpath = tmppath / 'images'
+    images_dirpath.mkdir()
+    (images_dirpath / BASE_IMAGE.replace('/', '_').replace(':', '_')).write_text(
+        'sha256:base <no value>\n'
+    )
+
+    environment = {
+        **os.environ,
+        'PATH': f'{bin_dirpath}:{os.environ["PATH"]}',
+        'FAKE_IMAGES': str(images_dirpath),
+    }
+
+    guest = MagicMock()
+    guest.is_dry_run = False
+    guest.facts.sudo_prefix = ''
+    guest.guest_workdir = tmppath
+    guest.run_workdir = tmppath
+    guest.plan_workdir = tmppath / 'plans' / 'default'
+    guest.booted_image = BASE_IMAGE
+
+    def execute(script: ShellScript, **kwargs: Any) -> CommandOutput:
+        # Switching to an image makes it booted, there is no reboot
+        if ' switch ' in f' {script} ':
+            guest.booted_image = str(script).split()[-1]
+
+            return CommandOutput(stdout='', stderr='')
+
+        process = subprocess.run(
+            ['bash', '-c', str(script)], env=environment, capture_output=True, text=True
+        )
+
+        if process.returncode != 0:
+            raise RunError('failed', ShellScript(str(script)).to_shell_command(), 1)
+
+        return CommandOutput(stdout=process.stdout, stderr=process.stderr)
+
+    @contextlib.contextmanager
+    def mkdtemp() -> Iterator[Path]:
+        yield tmppath
+
+    guest.execute.side_effect = execute
+    guest.mkdtemp.side_effect = mkdtemp
+
+    return guest
+
+
+def _builds(tmppath: Path) -> list[str]:
+    builds = tmppath / 'images' / 'builds'
+
+    return builds.read_text().splitlines() if builds.exists() else []
+
+
+def test_image_cache(guest: MagicMock, tmppath: Path, root_logger: Logger) -> None:
+    package_manager = Bootc(guest=guest, logger=root_logger)
+    package_manager.engine._get_current_bootc_image = lambda: guest.booted_image  # type: ignore[method-assign]
+
+    def _prepare(*directives: str) -> None:
+        package_manager.engine.containerfile_directives = [
+            f'FROM {guest.booted_image}',
+            *directives,
+        ]
+        package_manager.build_container()
+
+        assert package_manager.engine.containerfile_directives == []
+
+    # The first build is a miss
+    _prepare('RUN dnf install -y foo')
+
+    first_tag = f'localhost/tmt/bootc:{image_cache_key("sha256:base", ["RUN dnf install -y foo"])}'
+
+    assert _builds(tmppath) == [first_tag]
+    assert guest.booted_image == first_tag
+    assert guest.reboot.call_count == 1
+    assert (package_manager.cache_hits, package_manager.cache_misses) == (0, 1)
+
+    # Applying the same commands again changes nothing: no build, no reboot
+    _prepare('RUN dnf install -y foo')
+
+    assert _builds(tmppath) == [first_tag]
+    assert guest.reboot.call_count == 1
+    assert (package_manager.cache_hits, package_manager.cache_misses) == (1, 1)
+
+    # New commands are built on top of the booted image
+    _prepare('RUN dnf install -y bar')
+
+    assert len(_builds(tmppath)) == 2
+    assert guest.reboot.call_count == 2
+    assert (package_manager.cache_hits, package_manager.cache_misses) == (1, 2)
+
+    # Back on the original base image, e.g. another guest sharing the
+    # storage, the image built already is reused without a build
+    guest.booted_image = BASE_IMAGE
+
+    _prepare('RUN dnf install -y foo')
+
+    assert len(_builds(tmppath)) == 2
+    assert guest.booted_image == first_tag
+    assert guest.reboot.call_count == 3
+    assert (package_manager.cache_hits, package_manager.cache_misses) == (2, 2)
+
+
+def test_image_cache_key() -> None:
+    layers = ['RUN dnf install -y foo', 'RUN dnf install -y bar']
+
+    assert image_cache_key('sha256:base', layers) == image_cache_key('sha256:base', layers)
+    assert image_cache_key('sha256:base', layers) != image_cache_key('sha256:other', layers)
+    assert image_cache_key('sha256:base', layers) != image_cache_key('sha256:base', layers[::-1])
+    assert image_cache_key('sha256:base', layers) != image_cache_key('sha256:base', layers[:1])
+
+
+def test_image_cache_across_plans(guest: MagicMock, tmppath: Path, root_logger: Logger) -> None:
+    """Verify the same prepare collected by different runs and plans reuses the image."""
+
+    package_manager = Bootc(guest=guest, logger=root_logger)
+    package_manager.engine._get_current_bootc_image = lambda: guest.booted_image  # type: ignore[method-assign]
+
+    guest.facts.is_image_mode = True
+    guest.package_manager = package_manager
+
+    def _prepare(run_workdir: Path, plan_name: str) -> None:
+        guest.booted_image = BASE_IMAGE
+        guest.run_workdir = run_workdir
+        guest.plan_workdir = run_workdir / 'plans' / plan_name
+        guest._prepare_command_environment.side_effect = lambda environment: Environment(
+            {
+                'TMT_PLAN_DATA': EnvVarValue(guest.plan_workdir / 'data'),
+                'TMT_TREE': EnvVarValue(guest.plan_workdir / 'tree'),
+            }
+        )
+
+        GuestSsh.collect_command(guest, ShellScript('dnf install -y foo'))
+        package_manager.build_container()
+
+    _prepare(tmppath / 'run-001', 'first')
+
+    assert len(_builds(tmppath)) == 1
+    assert (package_manager.cache_hits, package_manager.cache_misses) == (0, 1)
+
+    _prepare(tmppath / 'run-002', 'second')
+
+    assert len(_builds(tmppath)) == 1
+    assert guest.booted_image == _builds(tmppath)[0]
+    assert (package_manager.cache_hits, package_manager.cache_misses) == (1, 1)
+
+
+def test_normalize_layers(tmppath: Path) -> None:
+    run_workdir = tmppath / 'run-001'
+    plan_workdir = run_workdir / 'plans' / 'default'
+
+    assert normalize_layers(
+        [
+            f'RUN export TMT_PLAN_DATA={plan_workdir}/data; foo',
+            f'RUN cat {run_workdir}/run.yaml',
+            'RUN dnf install -y bar',
+        ],
+        plan_workdir,
+        run_workdir,
+    ) == [
+        'RUN export TMT_PLAN_DATA=<plan-workdir>/data; foo',
+        'RUN cat <run-workdir>/run.yaml',
+        'RUN dnf install -y bar',
+    ]
@@ -0,0 +1,165 @@
+import os
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+import tmt.hardware
+from tmt.checks.coredump import COREDUMP_METADATA_MARKER, CoredumpCheck, _parse_crashes
+from tmt.log import Logger
+from tmt.utils import CommandOutput, Path, ShellScript
+
+#: Fake ``coredumpctl``, serving crashes described by files in
+#: ``$FAKE_COREDUMPS``.
+FAKE_COREDUMPCTL = """#!/bin/bash
+pid="${@: -1}"
+case "$1" in
+    list)
+        cat "$FAKE_COREDUMPS/list"
+        ;;
+    info)
+        cat "$FAKE_COREDUMPS/info.$pid"
+        ;;
+    dump)
+        while [ "$1" != "-o" ]; do shift; done
+        head -c "$(cat "$FAKE_COREDUMPS/size.$pid")" /dev/urandom > "$2"
+        ;;
+    debug)
+        echo "#0  0x0000 in main ()"
+        ;;
+esac
+"""
+
+LIST = """\
+Mon 2025-01-06 10:00:00 UTC 1001 0 0 SIGSEGV present /usr/bin/small 10K
+Mon 2025-01-06 10:00:01 UTC 1002 0 0 SIGABRT present /usr/bin/large 20M
+Mon 2025-01-06 10:00:02 UTC 1003 0 0 SIGSEGV missing /usr/bin/sleep -
+"""
+
+#: Commands decompressing a dump to stdout, by the suffix of the dump.
+DECOMPRESSORS = {
+    '.zst': ['zstd', '-dc'],
+    '.xz': ['xz', '-dc'],
+    '.gz': ['gzip', '-dc'],
+}
+
+
+@pytest.fixture
+def guest(tmppath: Path) -> MagicMock:
+    """
+    A guest running scripts locally, with a fake ``coredumpctl``
+    """
+
+    bin_dirpath = tmppath / 'bin'
+    bin_dirpath.mkdir()
+    (bin_dirpath / 'coredumpctl').write_text(FAKE_COREDUMPCTL)
+    (bin_dirpath / 'coredumpctl').chmod(0o755)
+
+    dumps_dirpath = tmppath / 'dumps'
+    dumps_dirpath.mkdir()
+    (dumps_dirpath / 'list').write_text(LIST)
+
+    for pid, exe, size in (('1001', 'small', 1000), ('1002', 'large', 5000), ('1003', 'sleep', 0)):
+        (dumps_dirpath / f'info.{pid}').write_text(f'PID: {pid}\nExecutable: /usr/bin/{exe}\n')
+        (dumps_dirpath / f'size.{pid}').write_text(str(size))
+
+    environment = {
+        **os.environ,
+        'PATH': f'{bin_dirpath}:{os.environ["PATH"]}',
+        'FAKE_COREDUMPS': str(dumps_dirpath),
+    }
+
+    def execute(script: ShellScript, **kwargs: object) -> CommandOutput:
+        process = subprocess.run(
+            ['bash', '-c', str(script)],
+            env=environment,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        return CommandOutput(stdout=process.stdout, stderr=process.stderr)
+
+    guest = MagicMock()
+    guest.facts.sudo_prefix = ''
+    guest.execute.side_effect = execute
+
+    return guest
+
+
+def test_parse_crashes(root_logger: Logger) -> None:
+    output = '\n'.join(
+        [
+            f'{COREDUMP_METADATA_MARKER} {LIST.splitlines()[0]}',
+            'PID: 1001',
+            'Signal: 11 (SEGV)',
+            f'{COREDUMP_METADATA_MARKER} malformed line',
+            'ignored',
+            f'{COREDUMP_METADATA_MARKER} {LIST.splitlines()[2]}',
+        ]
+    )
+
+    crashes = _parse_crashes(output, root_logger)
+
+    assert [(crash.pid, crash.basename, crash.has_dump) for crash in crashes] == [
+        ('1001', 'dump._usr_bin_small_SIGSEGV_1001', True),
+        ('1003', 'dump._usr_bin_sleep_SIGSEGV_1003', False),
+    ]
+    assert crashes[0].info == 'PID: 1001\nSignal: 11 (SEGV)'
+    assert crashes[1].info == ''
+
+
+def test_list_and_retrieve_crashes(guest: MagicMock, tmppath: Path, root_logger: Logger) -> None:
+    check_files_path = tmppath / 'checks'
+    check_files_path.mkdir()
+
+    previous_dumps_file = check_files_path / 'coredump-latest'
+    previous_dumps_file.write_text('')
+
+    check = CoredumpCheck(how='coredump', dump_size_limit=tmt.hardware.UNITS('2 kB'))
+
+    crashes = check._list_crashes(guest, root_logger, previous_dumps_file)
+
+    assert [crash.pid for crash in crashes] == ['1001', '1002', '1003']
+    assert crashes[1].info == 'PID: 1002\nExecutable: /usr/bin/large'
+
+    files = check._retrieve_crashes(guest, root_logger, check_files_path, crashes)
+
+    # Metadata of all crashes are collected by a single command, then
+    # all crashes are retrieved by another one
+    assert guest.execute.call_count == 3
+
+    # The compressor depends on tools available on the guest, zstd is
+    # preferred, xz and gzip are the fallbacks
+    core_suffixes = {path.suffix for path in files if '.core.' in path.name}
+    assert len(core_suffixes) == 1
+    suffix = core_suffixes.pop()
+    assert suffix in DECOMPRESSORS
+
+    assert sorted(path.name for path in files) == [
+        'coredump-latest',
+        'dump._usr_bin_large_SIGABRT_1002.backtrace.txt',
+        f'dump._usr_bin_large_SIGABRT_1002.truncated.core{suffix}',
+        'dump._usr_bin_large_SIGABRT_1002.txt',
+        'dump._usr_bin_sleep_SIGSEGV_1003.txt',
+        f'dump._usr_bin_small_SIGSEGV_1001.core{suffix}',
+        'dump._usr_bin_small_SIGSEGV_1001.txt',
+    ]
+    assert all(path.is_absolute() and path.parent == check_files_path for path in files)
+
+    # Small dumps are saved whole, large ones are truncated to the limit
+    def _decompressed_size(path: Path) -> int:
+        return len(
+            subprocess.run([*DECOMPRESSORS[suffix], path], capture_output=True, check=True).stdout
+        )
+
+    assert (
+        _decompressed_size(check_files_path / f'dump._usr_bin_small_SIGSEGV_1001.core{suffix}')
+        == 1000
+    )
+    assert (
+        _decompressed_size(
+            check_files_path / f'dump._usr_bin_large_SIGABRT_1002.truncated.core{suffix}'
+        )
+        == 2000
+    )
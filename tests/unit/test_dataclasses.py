@@ -92,3 +92,56 @@ def test_field_custom_serialize():
     data = DummyContainer.from_serialized(serialized)
     assert data.foo == ['unserialized-from']
     assert serialized['bar'] == 'should-never-change'
+
+
+def test_serialization_plan_per_class():
+    @container
+    class ParentContainer(SerializableContainer):
+        some_key: int = field(
+            default=1,
+            serialize=lambda value: str(value),
+            unserialize=lambda serialized: int(serialized),
+        )
+
+    @container
+    class ChildContainer(ParentContainer):
+        another_key: Optional[str] = None
+
+    parent_plan = ParentContainer._serialization_plan()
+    child_plan = ChildContainer._serialization_plan()
+
+    # Plans are computed just once, and are not inherited.
+    assert ParentContainer._serialization_plan() is parent_plan
+    assert child_plan is not parent_plan
+
+    assert [plan_field.option for plan_field in parent_plan.fields] == ['some-key']
+    assert [plan_field.option for plan_field in child_plan.fields] == [
+        'some-key',
+        'another-key',
+    ]
+
+    data = ChildContainer(some_key=2, another_key='foo')
+    serialized = data.to_serialized()
+
+    assert serialized == {
+        'some-key': '2',
+        'another-key': 'foo',
+        '__class__': {
+            'module': ChildContainer.__module__,
+            'name': 'ChildContainer',
+        },
+    }
+
+    assert ChildContainer.from_serialized(serialized) == data
+
+
+def test_serialization_plan_unknown_key():
+    @container
+    class DummyContainer(SerializableContainer):
+        foo: Optional[str] = None
+
+    with pytest.raises(
+        tmt.utils.GeneralError,
+        match=r"Could not find field 'not_a_field' in class",
+    ):
+        DummyContainer.from_serialized({'not-a-field': 'foo'})
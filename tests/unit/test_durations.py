@@ -0,0 +1,131 @@
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+import tmt.utils
+from tmt._compat.pathlib import Path
+from tmt.base.core import FmfId
+from tmt.durations import (
+    DurationStore,
+    effective_duration_history_path,
+    normalize_test_order,
+    order_longest_first,
+)
+from tmt.log import Logger
+from tmt.steps.discover import TestOrigin
+
+FMF_ID = FmfId(url='https://github.com/teemtee/tmt', ref='main', path=Path('/tests'))
+
+
+def _test_origin(name: str, duration: str = '5m', order: int = 50) -> TestOrigin:
+    test = MagicMock()
+    test.name = name
+    test.duration = duration
+    test.order = order
+    test.fmf_id = FMF_ID
+
+    return TestOrigin(phase='default-0', test=test)
+
+
+def _result(name: str, duration: Optional[str], guest: str = 'default-0') -> MagicMock:
+    result = MagicMock()
+    result.name = name
+    result.duration = duration
+    result.fmf_id = FMF_ID
+    result.guest.name = guest
+
+    return result
+
+
+def test_record(tmppath: Path, root_logger: Logger) -> None:
+    store = DurationStore(tmppath / 'durations.sqlite', logger=root_logger)
+    tests = [_test_origin('/a'), _test_origin('/b'), _test_origin('/never')]
+
+    assert store.durations(tests) == {}
+
+    assert (
+        store.record(
+            [
+                _result('/a', '00:01:00', guest='x86'),
+                _result('/a', '00:03:00', guest='arm'),
+                _result('/b', '00:00:10', guest='x86'),
+                _result('/skipped', None, guest='x86'),
+            ],
+            arches={'x86': 'x86_64', 'arm': 'aarch64'},
+        )
+        == 3
+    )
+
+    # The matching architecture wins, other ones are averaged
+    assert store.durations(tests, arch='x86_64') == {'/a': 60.0, '/b': 10.0}
+    assert store.durations(tests, arch='s390x') == {'/a': 120.0, '/b': 10.0}
+    assert store.durations(tests) == {'/a': 120.0, '/b': 10.0}
+
+    # Tests of the same name elsewhere do not share the history
+    other = _test_origin('/a')
+    other.test.fmf_id = FmfId(url='https://example.com/tests.git')
+
+    assert store.durations([other]) == {}
+
+
+def test_moving_average(tmppath: Path, root_logger: Logger) -> None:
+    store = DurationStore(tmppath / 'durations.sqlite', logger=root_logger)
+    tests = [_test_origin('/a')]
+
+    for seconds in (10, 20, 30):
+        store.record([_result('/a', f'00:00:{seconds}')], arches={})
+
+    assert store.durations(tests) == {'/a': pytest.approx(20.0)}
+
+    # Old durations fade out once the window is full
+    for _ in range(50):
+        store.record([_result('/a', '00:01:40')], arches={})
+
+    assert store.durations(tests)['/a'] == pytest.approx(100.0, abs=1)
+
+
+def test_effective_duration_history_path(tmppath: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv('TMT_DURATION_HISTORY_PATH', raising=False)
+    monkeypatch.delenv('XDG_STATE_HOME', raising=False)
+    monkeypatch.setenv('HOME', str(tmppath))
+
+    assert effective_duration_history_path() == tmppath / '.local/state/tmt/durations.sqlite'
+
+    monkeypatch.setenv('XDG_STATE_HOME', str(tmppath / 'state'))
+
+    assert effective_duration_history_path() == tmppath / 'state/tmt/durations.sqlite'
+
+    monkeypatch.setenv('TMT_DURATION_HISTORY_PATH', str(tmppath / 'custom.sqlite'))
+
+    assert effective_duration_history_path() == tmppath / 'custom.sqlite'
+
+
+def test_order_longest_first(root_logger: Logger) -> None:
+    tests = [
+        _test_origin('/short'),
+        _test_origin('/long'),
+        _test_origin('/unknown', duration='1h'),
+        _test_origin('/tie'),
+        _test_origin('/first', order=10),
+    ]
+
+    ordered = order_longest_first(
+        tests, {'/short': 10.0, '/long': 600.0, '/tie': 10.0, '/first': 1.0}, logger=root_logger
+    )
+
+    assert [test_origin.test.name for test_origin in ordered] == [
+        '/first',
+        '/unknown',
+        '/long',
+        '/short',
+        '/tie',
+    ]
+
+
+def test_normalize_test_order(root_logger: Logger) -> None:
+    assert normalize_test_order('test-order', None, root_logger) == 'discovery'
+    assert normalize_test_order('test-order', 'longest-first', root_logger) == 'longest-first'
+
+    with pytest.raises(tmt.utils.NormalizationError):
+        normalize_test_order('test-order', 'random', root_logger)
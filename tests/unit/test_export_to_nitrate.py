@@ -1,9 +1,18 @@
 from collections.abc import Iterator
+from unittest.mock import MagicMock
 
 import pytest
 
+import tmt.export
+import tmt.export.nitrate
+import tmt.utils
 from tests.conftest import create_path_helper
-from tmt.export.nitrate import convert_manual_to_nitrate
+from tmt.export.nitrate import (
+    add_to_nitrate_runs,
+    convert_manual_to_nitrate,
+    prefetch_nitrate_cases,
+)
+from tmt.log import Logger
 from tmt.utils import Path
 
 
@@ -101,3 +110,88 @@ in the first step
 3 line of cleanup</p>
 """
     assert cleanup == html_generated
+
+
+@pytest.fixture(name="fake_nitrate")
+def fixture_fake_nitrate(monkeypatch: pytest.MonkeyPatch) -> Iterator[MagicMock]:
+    """Replaces the nitrate module with a fake one."""
+    fake_nitrate = MagicMock()
+    fake_nitrate.NitrateError = RuntimeError
+    fake_nitrate.RunStatus.side_effect = lambda status: status
+
+    monkeypatch.setattr(tmt.export.nitrate, 'nitrate', fake_nitrate)
+    tmt.export.nitrate.find_open_runs.cache_clear()
+
+    yield fake_nitrate
+
+    tmt.export.nitrate.find_open_runs.cache_clear()
+
+
+def test_prefetch_nitrate_cases(fake_nitrate: MagicMock):
+    """Verify that test cases are fetched by a single bulk search."""
+    tests = [MagicMock() for _ in range(3)]
+    for test, extra_nitrate in zip(tests, ['TC#0000002', 'TC#0000001', None]):
+        test.node.get.return_value = extra_nitrate
+
+    prefetch_nitrate_cases(tests)
+
+    fake_nitrate.TestCase.search.assert_called_once_with(case_id__in=[1, 2])
+
+
+def test_add_to_nitrate_runs(fake_nitrate: MagicMock, root_logger: Logger):
+    """Verify that open runs are searched only once, and case runs are never retried."""
+    general_plan = MagicMock(id=1)
+    finished_run = MagicMock(status='FINISHED')
+    open_runs = [MagicMock(status='RUNNING', notes='') for _ in range(2)]
+    for testrun in open_runs:
+        testrun.__iter__.return_value = iter([])
+    child_plan = MagicMock(testruns=[finished_run, *open_runs])
+    fake_nitrate.TestPlan.search.return_value = [child_plan]
+
+    nitrate_cases = [MagicMock(testplans=[child_plan]) for _ in range(3)]
+
+    # A timeout may come after the case run has been created already
+    fake_nitrate.CaseRun.side_effect = [None, TimeoutError('timeout'), *([None] * 4)]
+
+    def export() -> None:
+        with tmt.export.RemoteUpdates(interval=0, logger=root_logger) as updates:
+            for nitrate_case in nitrate_cases:
+                add_to_nitrate_runs(
+                    nitrate_case, general_plan, MagicMock(), dry_mode=False, updates=updates
+                )
+
+    with pytest.raises(tmt.utils.ConvertError, match=r'Failed to update 1 of 6 exported objects'):
+        export()
+
+    fake_nitrate.TestPlan.search.assert_called_once_with(parent=1)
+    assert sorted(
+        (id(call.kwargs['testcase']), id(call.kwargs['testrun']))
+        for call in fake_nitrate.CaseRun.call_args_list
+    ) == sorted(
+        (id(nitrate_case), id(testrun)) for nitrate_case in nitrate_cases for testrun in open_runs
+    )
+
+
+def test_remote_updates(root_logger: Logger):
+    """Verify that updates are retried, and failures reported once all updates are sent."""
+    attempts: list[str] = []
+
+    def flaky_update() -> None:
+        attempts.append('flaky')
+        if len([attempt for attempt in attempts if attempt == 'flaky']) < 2:
+            raise RuntimeError('flaky')
+
+    def broken_update() -> None:
+        attempts.append('broken')
+        raise RuntimeError('broken')
+
+    def export() -> None:
+        with tmt.export.RemoteUpdates(attempts=2, interval=0, logger=root_logger) as updates:
+            updates.submit('broken', broken_update)
+            updates.submit('flaky', flaky_update)
+            updates.submit('created', lambda: attempts.append('created'), idempotent=False)
+
+    with pytest.raises(tmt.utils.ConvertError, match=r'Failed to update 1 of 3 exported objects'):
+        export()
+
+    assert attempts == ['broken', 'broken', 'flaky', 'flaky', 'created']
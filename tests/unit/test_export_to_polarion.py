@@ -0,0 +1,132 @@
+from types import SimpleNamespace
+from typing import Any, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+import tmt.export.polarion
+from tmt.export.polarion import PolarionCaseIndex, find_polarion_case_ids
+from tmt.identifier import ID_KEY
+
+
+class FakePolarion:
+    """
+    Answers work item queries from a fixed list of work items
+    """
+
+    def __init__(self, items: list[SimpleNamespace]) -> None:
+        self.items = items
+        self.queries: list[str] = []
+
+    def query(self, query: str, fields: Optional[list[str]] = None) -> list[Any]:
+        self.queries.append(query)
+
+        key, _, values = query.partition(':')
+
+        if key in ('tmtid', 'tcmscaseid'):
+            wanted = {value.strip('"') for value in values.strip('()').split(' OR ')}
+
+            return [item for item in self.items if getattr(item, key, None) in wanted]
+
+        if key == 'id':
+            return [item for item in self.items if item.work_item_id == values]
+
+        return [item for item in self.items if query == item.tmtid]
+
+
+def _work_item(work_item_id: str, **fields: Any) -> SimpleNamespace:
+    return SimpleNamespace(
+        work_item_id=work_item_id,
+        project_id='PROJECT',
+        status='approved',
+        **{'tmtid': None, 'tcmscaseid': None, **fields},
+    )
+
+
+def _test(data: dict[str, str]) -> Any:
+    test = MagicMock()
+    test.node.get.side_effect = data.get
+
+    return test
+
+
+@pytest.fixture(autouse=True)
+def polarion_work_item(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tmt.export.polarion, 'PolarionWorkItem', MagicMock())
+
+
+def test_case_index() -> None:
+    polarion = FakePolarion(
+        [
+            _work_item('CASE-1', tmtid='uuid-1'),
+            _work_item('CASE-2', tcmscaseid='2'),
+        ]
+    )
+
+    tests_data = [
+        {ID_KEY: 'uuid-1'},
+        {ID_KEY: 'uuid-2', 'extra-nitrate': 'TC#0000002'},
+        {ID_KEY: 'uuid-3'},
+    ]
+
+    case_index = PolarionCaseIndex(polarion.query)
+    case_index.prefetch([_test(data) for data in tests_data])
+
+    # One bulk query for each kind of identifier
+    assert polarion.queries == [
+        'tmtid:("uuid-1" OR "uuid-2" OR "uuid-3")',
+        'tcmscaseid:("2")',
+    ]
+
+    assert [find_polarion_case_ids(data, case_index=case_index) for data in tests_data] == [
+        ('CASE-1', 'PROJECT'),
+        ('CASE-2', 'PROJECT'),
+        (None, None),
+    ]
+
+    # Tests not found by their UUID are still looked up by a full-text
+    # query, the project may lack the field
+    assert polarion.queries[2:] == ['uuid-2', 'uuid-3']
+
+    # Anything not fetched in advance is still queried
+    assert find_polarion_case_ids({}, polarion_case_id='CASE-2', case_index=case_index) == (
+        'CASE-2',
+        'PROJECT',
+    )
+    assert polarion.queries[-1] == 'id:CASE-2'
+
+
+def test_case_index_missing_field() -> None:
+    polarion = FakePolarion([_work_item('CASE-1', tmtid='uuid-1')])
+
+    # Work items without the field cannot be assigned to tests, the
+    # batch must not be used.
+    def query(query: str, fields: Optional[list[str]] = None) -> list[Any]:
+        return [SimpleNamespace(**{**vars(item), 'tmtid': None}) for item in polarion.query(query)]
+
+    case_index = PolarionCaseIndex(query)
+    case_index.prefetch([_test({ID_KEY: 'uuid-1'})])
+
+    assert [item.work_item_id for item in case_index.query('uuid-1')] == ['CASE-1']
+    assert polarion.queries == ['tmtid:("uuid-1")', 'uuid-1']
+
+
+def test_case_index_fallback_query() -> None:
+    polarion = FakePolarion([_work_item('CASE-1', tmtid='uuid-1')])
+    fallback = FakePolarion([_work_item('CASE-2', tmtid='uuid-2')])
+
+    case_index = PolarionCaseIndex(polarion.query, fallback.query)
+    case_index.prefetch([_test({ID_KEY: 'uuid-1'}), _test({ID_KEY: 'uuid-2'})])
+
+    # Test cases found in bulk are not queried again, the rest is left
+    # to the fallback query
+    assert find_polarion_case_ids({ID_KEY: 'uuid-1'}, case_index=case_index) == (
+        'CASE-1',
+        'PROJECT',
+    )
+    assert find_polarion_case_ids({ID_KEY: 'uuid-2'}, case_index=case_index) == (
+        'CASE-2',
+        'PROJECT',
+    )
+    assert polarion.queries == ['tmtid:("uuid-1" OR "uuid-2")']
+    assert fallback.queries == ['uuid-2']
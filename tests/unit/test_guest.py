@@ -1,5 +1,12 @@
 import os
 import re
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
 from typing import Any, Optional, Union
 from unittest.mock import MagicMock, Mock
 
@@ -7,6 +14,7 @@ import _pytest.logging
 import pytest
 from pytest_container.container import ContainerData
 
+import tmt.guest
 from tmt.guest import (
     AnsibleApplicable,
     Guest,
@@ -14,6 +22,7 @@ from tmt.guest import (
     GuestSsh,
     GuestSshData,
     TransferOptions,
+    probe_ssh_banner,
 )
 from tmt.log import Logger, VerboseLoggingFunction
 from tmt.steps.provision import Provision
@@ -28,7 +37,7 @@ from tmt.utils import (
     RunError,
     ShellScript,
 )
-from tmt.utils.environment import Environment
+from tmt.utils.environment import Environment, EnvVarValue
 from tmt.utils.wait import Waiting
 
 from . import TEST_CONTAINERS
@@ -112,6 +121,46 @@ def test_multihost_name(root_logger: Logger) -> None:
     )
 
 
+def test_push_files(tmppath: Path, root_logger: Logger) -> None:
+    pushed: list[list[Path]] = []
+
+    class PushingGuest(MockGuest):
+        def _push_files(
+            self, paths: list[Path], options: Optional[TransferOptions] = None
+        ) -> None:
+            pushed.append(paths)
+
+    guest = PushingGuest(logger=root_logger, name='foo', data=GuestData(primary_address='bar'))
+
+    first, second = tmppath / 'first', tmppath / 'second'
+    first.write_text('first')
+    second.write_text('second')
+
+    guest.push_files([first, second])
+
+    assert pushed == [[first, second]]
+
+    # Nothing changed, nothing to push
+    guest.push_files([first, second])
+
+    assert len(pushed) == 1
+
+    # Rewritten with the same content, still nothing to push
+    first.write_text('first')
+    os.utime(first, ns=(0, 0))
+
+    guest.push_files([first, second])
+
+    assert len(pushed) == 1
+
+    # Only the changed file is pushed
+    second.write_text('changed')
+
+    guest.push_files([first, second])
+
+    assert pushed[1:] == [[second]]
+
+
 @pytest.mark.parametrize(
     ('stdout', 'expected'),
     [
@@ -384,3 +433,379 @@ def test_unsafe_ssh_option_case_and_separator(
 
     with pytest.raises(GeneralError, match='--feeling-safe'):
         _ = guest._ssh_options
+
+
+#: A stand-in for ``ssh``, recording launches of master processes,
+#: control requests and commands. Master processes are represented by
+#: ``sleep``, and the master can be made unresponsive by creating
+#: ``unresponsive`` file. Commands are executed locally.
+FAKE_SSH = """#!/bin/sh
+dirpath="$(dirname "$0")"
+
+case " $* " in
+    *" -MNnT "*)
+        echo "$$" >> "$dirpath/launches"
+        exec sleep 600
+        ;;
+    *" -O check "*)
+        echo "$$" >> "$dirpath/checks"
+
+        if [ -e "$dirpath/unresponsive" ]; then
+            rm -f "$dirpath/unresponsive"
+            exit 255
+        fi
+        ;;
+    *)
+        echo "$$" >> "$dirpath/commands"
+
+        for command; do :; done
+        exec /bin/sh -c "$command"
+        ;;
+esac
+
+exit 0
+"""
+
+
+def test_ssh_master_process_reuse(tmppath: Path, root_logger: Logger, monkeypatch: Any) -> None:
+    bin_dirpath = tmppath / 'bin'
+    bin_dirpath.mkdir()
+
+    ssh_path = bin_dirpath / 'ssh'
+    ssh_path.write_text(FAKE_SSH)
+    ssh_path.chmod(0o755)
+
+    # Socket paths must be short, pytest temporary directories tend to
+    # be too long.
+    run_workdir = Path(tempfile.mkdtemp(prefix='tmt-'))
+
+    monkeypatch.setenv('PATH', f'{bin_dirpath}:{os.environ["PATH"]}')
+    monkeypatch.setattr(GuestSsh, 'run_workdir', property(lambda _: run_workdir))
+
+    def _count(filename: str) -> int:
+        filepath = bin_dirpath / filename
+
+        return len(filepath.read_text().splitlines()) if filepath.exists() else 0
+
+    step = Provision(
+        plan=MagicMock(name='mock<plan>', is_dry_run=False, workdir=run_workdir),
+        raw_data=[{}],
+        logger=root_logger,
+    )
+    guest = GuestSsh(
+        logger=root_logger, parent=step, name='foo', data=GuestSshData(primary_address='bar')
+    )
+
+    try:
+        # The first use spawns the master, and waits for it to respond.
+        guest._assert_ssh_master_process()
+
+        assert _count('launches') == 1
+        assert _count('checks') == 1
+
+        # Following uses within the same step do not touch it at all.
+        guest._assert_ssh_master_process()
+        guest._assert_ssh_master_process()
+
+        assert _count('launches') == 1
+        assert _count('checks') == 1
+
+        # A new step verifies the master is responsive, and reuses it.
+        guest.on_step_start(MagicMock(name='mock<step>'))
+        guest._assert_ssh_master_process()
+
+        assert _count('launches') == 1
+        assert _count('checks') == 2
+
+        # A dead master is replaced.
+        assert guest._ssh_master_process is not None
+
+        guest._ssh_master_process.kill()
+        guest._ssh_master_process.wait()
+
+        guest._assert_ssh_master_process()
+
+        assert _count('launches') == 2
+        assert _count('checks') == 3
+
+        # An unresponsive master is replaced too.
+        (bin_dirpath / 'unresponsive').touch()
+
+        guest.on_step_start(MagicMock(name='mock<step>'))
+        guest._assert_ssh_master_process()
+
+        assert _count('launches') == 3
+        assert _count('checks') == 5
+
+    finally:
+        guest._cleanup_ssh_master_process()
+
+        shutil.rmtree(run_workdir)
+
+    assert guest._ssh_master_process is None
+
+
+def test_environment_file(tmppath: Path, root_logger: Logger, monkeypatch: Any) -> None:
+    monkeypatch.setattr(tmt.guest, 'ENVIRONMENT_FILE_THRESHOLD', 64)
+    monkeypatch.setattr(GuestSsh, 'plan_workdir', property(lambda _: tmppath))
+
+    pushed: list[list[Path]] = []
+
+    monkeypatch.setattr(
+        GuestSsh, '_push_files', lambda _, paths, options=None: pushed.append(paths)
+    )
+
+    guest = GuestSsh(logger=root_logger, name='foo', data=GuestSshData(primary_address='bar'))
+
+    def _environ(exports: list[ShellScript]) -> str:
+        return subprocess.run(
+            ['bash', '-c', str(ShellScript.from_scripts([*exports, ShellScript('env -0')]))],
+            env={},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+    # Small environments are exported by the command itself
+    small = Environment({'FOO': EnvVarValue('bar')})
+
+    assert [str(export) for export in guest._environment_exports(small)] == ['export FOO=bar']
+    assert pushed == []
+
+    # Large ones are sourced from a file, with the same outcome
+    large = Environment(
+        {
+            'FOO': EnvVarValue('bar'),
+            'MULTILINE': EnvVarValue('first line\nsecond line\n'),
+            'SPECIAL': EnvVarValue('''quotes ' " and $dollar `backticks` \\ ;&|'''),
+            'LONG': EnvVarValue('x' * 128),
+        }
+    )
+
+    exports = guest._environment_exports(large)
+
+    assert len(exports) == 1
+    assert len(pushed) == 1
+    assert str(exports[0]) == f"source {pushed[0][0]}"
+    assert _environ(exports) == _environ(large.to_shell_exports())
+
+    # The same environment is neither saved nor pushed again
+    assert str(guest._environment_exports(large)[0]) == str(exports[0])
+    assert len(pushed) == 1
+    assert len(list((tmppath / tmt.guest.ENVIRONMENT_FILE_DIRNAME).iterdir())) == 1
+
+
+def test_environment_file_push(tmppath: Path, root_logger: Logger, monkeypatch: Any) -> None:
+    """Verify commands run by the push of an environment file do not use the file."""
+
+    monkeypatch.setattr(tmt.guest, 'ENVIRONMENT_FILE_THRESHOLD', 64)
+    monkeypatch.setattr(GuestSsh, 'plan_workdir', property(lambda _: tmppath))
+    monkeypatch.setattr(GuestSsh, 'run_workdir', property(lambda _: tmppath))
+    monkeypatch.setattr(GuestSsh, '_assert_ssh_master_process', lambda _: None)
+
+    commands: list[list[str]] = []
+
+    def _run_guest_command(_: GuestSsh, command: Command, **kwargs: Any) -> CommandOutput:
+        commands.append(command.to_popen())
+
+        return CommandOutput(stdout='', stderr='')
+
+    monkeypatch.setattr(GuestSsh, '_run_guest_command', _run_guest_command)
+
+    guest = GuestSsh(
+        logger=root_logger,
+        name='foo',
+        data=GuestSshData(
+            primary_address='bar', environment=Environment({'LONG': EnvVarValue('x' * 128)})
+        ),
+    )
+
+    guest.execute(Command('true'))
+
+    # Facts, rsync among them, were detected with inline exports, then
+    # the file was pushed, and sourced by the actual command
+    rsync_index = next(i for i, command in enumerate(commands) if command[0] == 'rsync')
+
+    assert rsync_index == len(commands) - 2
+    assert all(
+        'export LONG=' in command[-1] and 'source ' not in command[-1]
+        for command in commands[:rsync_index]
+    )
+    assert any('rsync --version' in command[-1] for command in commands[:rsync_index])
+    assert 'export LONG=' not in commands[-1][-1]
+    assert f'source {tmppath / tmt.guest.ENVIRONMENT_FILE_DIRNAME}/' in commands[-1][-1]
+
+
+def test_ssh_command_session(tmppath: Path, root_logger: Logger, monkeypatch: Any) -> None:
+    bin_dirpath = tmppath / 'bin'
+    bin_dirpath.mkdir()
+
+    ssh_path = bin_dirpath / 'ssh'
+    ssh_path.write_text(FAKE_SSH)
+    ssh_path.chmod(0o755)
+
+    run_workdir = Path(tempfile.mkdtemp(prefix='tmt-'))
+
+    monkeypatch.setenv('PATH', f'{bin_dirpath}:{os.environ["PATH"]}')
+    monkeypatch.setattr(GuestSsh, 'run_workdir', property(lambda _: run_workdir))
+    monkeypatch.setattr(tmt.guest, 'SSH_COMMAND_SESSION', True)
+
+    def _count() -> int:
+        filepath = bin_dirpath / 'commands'
+
+        return len(filepath.read_text().splitlines()) if filepath.exists() else 0
+
+    step = Provision(
+        plan=MagicMock(name='mock<plan>', is_dry_run=False, workdir=run_workdir),
+        raw_data=[{}],
+        logger=root_logger,
+    )
+    guest = GuestSsh(
+        logger=root_logger, parent=step, name='foo', data=GuestSshData(primary_address='bar')
+    )
+
+    try:
+        # Commands share a single session...
+        for _ in range(3):
+            output = guest.execute(
+                ShellScript('echo "$FOO:$PWD"'),
+                cwd=tmppath,
+                environment=Environment.from_dict({'FOO': 'bar'}),
+            )
+
+            assert output is not None
+            assert output.stdout == f'bar:{tmppath}\n'
+
+        assert _count() == 1
+
+        with pytest.raises(RunError) as excinfo:
+            guest.execute(ShellScript('exit 3'), environment=Environment())
+
+        assert excinfo.value.returncode == 3
+        assert _count() == 1
+
+        # ... which does not outlive the guest connection.
+        guest.suspend()
+
+        assert guest._command_session is None
+
+        guest.execute(ShellScript('true'), environment=Environment())
+
+        assert _count() == 2
+
+    finally:
+        guest.suspend()
+
+        shutil.rmtree(run_workdir)
+
+
+@pytest.fixture(name='ssh_server')
+def fixture_ssh_server(request: Any) -> Iterator[tuple[str, int]]:
+    """
+    A fake SSH server, sending its greeting after the given delay.
+    """
+
+    delay, greeting = request.param
+
+    server = socket.create_server(('127.0.0.1', 0))
+    server.settimeout(0.1)
+    stop = threading.Event()
+
+    def _serve() -> None:
+        while not stop.is_set():
+            try:
+                connection, _ = server.accept()
+
+            except socket.timeout:
+                continue
+
+            except OSError:
+                return
+
+            with connection:
+                if stop.wait(delay):
+                    return
+
+                try:
+                    connection.sendall(greeting)
+
+                    # Keep the connection open for the client to read.
+                    stop.wait(1)
+
+                except OSError:
+                    pass
+
+    thread = threading.Thread(target=_serve, daemon=True)
+    thread.start()
+
+    yield server.getsockname()
+
+    stop.set()
+    server.close()
+    thread.join()
+
+
+@pytest.mark.parametrize(
+    ('ssh_server', 'expected'),
+    [
+        ((0, b'SSH-2.0-OpenSSH_9.9\r\n'), True),
+        ((0, b'Welcome!\r\nSSH-2.0-OpenSSH_9.9\r\n'), True),
+        ((0, b'HTTP/1.1 400 Bad Request\r\n'), False),
+        ((0, b''), False),
+        ((5, b'SSH-2.0-OpenSSH_9.9\r\n'), False),
+    ],
+    indirect=['ssh_server'],
+    ids=('banner', 'greeting-before-banner', 'not-ssh', 'no-banner', 'delayed-banner'),
+)
+def test_probe_ssh_banner(ssh_server: tuple[str, int], expected: bool) -> None:
+    start = time.monotonic()
+
+    assert probe_ssh_banner(*ssh_server, timeout=0.5) is expected
+
+    # Even a server which never responds must not hold the probe.
+    assert time.monotonic() - start < 2
+
+
+def test_probe_ssh_banner_refused() -> None:
+    # Find a port nobody listens on.
+    with socket.create_server(('127.0.0.1', 0)) as server:
+        address = server.getsockname()
+
+    assert probe_ssh_banner(*address, timeout=0.5) is False
+
+
+@pytest.mark.skipif(shutil.which('ssh') is None, reason='ssh is not installed')
+@pytest.mark.parametrize(
+    ('ssh_server', 'ssh_option', 'expected'),
+    [
+        ((0, b'SSH-2.0-OpenSSH_9.9\r\n'), [], True),
+        ((5, b'SSH-2.0-OpenSSH_9.9\r\n'), [], False),
+        # Connections through a jump host cannot be probed directly,
+        # the probe must not block them.
+        ((5, b'SSH-2.0-OpenSSH_9.9\r\n'), ['ProxyJump=jump.example.com'], True),
+    ],
+    indirect=['ssh_server'],
+    ids=('responding', 'not-responding', 'proxy-jump'),
+)
+def test_guest_probe_connection(
+    root_logger: Logger,
+    tmppath: Path,
+    ssh_server: tuple[str, int],
+    ssh_option: list[str],
+    expected: bool,
+) -> None:
+    step = Provision(
+        plan=MagicMock(name='mock<plan>', is_dry_run=False, workdir=tmppath, run_workdir=tmppath),
+        raw_data=[{}],
+        logger=root_logger,
+    )
+    guest = GuestSsh(
+        logger=root_logger,
+        parent=step,
+        name='foo',
+        data=GuestSshData(
+            primary_address=ssh_server[0], port=ssh_server[1], ssh_option=ssh_option
+        ),
+    )
+
+    assert guest._probe_connection() is expected
@@ -0,0 +1,95 @@
+import os
+from collections.abc import Iterator
+
+import pytest
+
+from tmt.guest.session import SESSION_FAILURE_EXIT_CODE, CommandSession, CommandSessionError
+from tmt.log import Logger
+from tmt.utils import Command, CommandOutput, RunError, ShellScript
+
+
+@pytest.fixture(name='session')
+def fixture_session(root_logger: Logger) -> Iterator[CommandSession]:
+    session = CommandSession(Command('bash'), logger=root_logger)
+
+    yield session
+
+    session.close()
+
+
+def _run(session: CommandSession, script: str) -> CommandOutput:
+    return session.run(ShellScript(script), command=Command('bash', '-c', script))
+
+
+def test_output(session: CommandSession) -> None:
+    assert _run(session, 'echo foo; echo bar >&2; printf baz') == CommandOutput(
+        stdout='foo\nbaz', stderr='bar\n'
+    )
+
+    # Output lines resembling frames, or empty output, must not confuse
+    # the session.
+    assert _run(session, 'echo TMT-SESSION-foo 0 0 0') == CommandOutput(
+        stdout='TMT-SESSION-foo 0 0 0\n', stderr=''
+    )
+    assert _run(session, 'true') == CommandOutput(stdout='', stderr='')
+
+
+def test_here_document(session: CommandSession) -> None:
+    script = "cat <<'EOF'\n$HOME `id`\nEOF"
+
+    assert _run(session, script).stdout == '$HOME `id`\n'
+
+
+def test_failure(session: CommandSession) -> None:
+    with pytest.raises(RunError) as excinfo:
+        _run(session, 'echo foo; echo bar >&2; exit 3')
+
+    assert excinfo.value.returncode == 3
+    assert excinfo.value.stdout == 'foo\n'
+    assert excinfo.value.stderr == 'bar\n'
+    assert excinfo.value.command == Command('bash', '-c', 'echo foo; echo bar >&2; exit 3')
+
+    # The session survives failed commands, even those exiting the shell.
+    assert _run(session, 'echo foo').stdout == 'foo\n'
+
+
+def test_isolation(session: CommandSession) -> None:
+    _run(session, 'cd /; export FOO=bar; BAZ=qux')
+
+    assert _run(session, 'echo "${FOO:-unset}:${BAZ:-unset}"').stdout == 'unset:unset\n'
+    assert _run(session, 'pwd').stdout == f'{os.getcwd()}\n'
+
+    # Commands must not consume the rest of the session input.
+    assert _run(session, 'cat; echo $?').stdout == '0\n'
+    assert _run(session, 'echo foo').stdout == 'foo\n'
+
+
+def test_reopen(session: CommandSession) -> None:
+    _run(session, 'true')
+
+    assert session.is_alive
+
+    # Session terminating while running a command is reported as a
+    # failure of the command...
+    with pytest.raises(RunError) as excinfo:
+        _run(session, 'kill -9 $$')
+
+    assert excinfo.value.returncode == SESSION_FAILURE_EXIT_CODE
+    assert not session.is_alive
+
+    # ... and the next command opens a new session.
+    assert _run(session, 'echo foo').stdout == 'foo\n'
+    assert session.is_alive
+
+    session.close()
+
+    assert not session.is_alive
+
+
+def test_open_failure(root_logger: Logger) -> None:
+    session = CommandSession(Command('false'), logger=root_logger)
+
+    with pytest.raises(CommandSessionError):
+        _run(session, 'true')
+
+    assert not session.is_alive
@@ -0,0 +1,136 @@
+from typing import Any, Callable
+
+import pytest
+
+import tmt
+import tmt.lint
+import tmt.utils.git
+from tmt.log import Logger
+from tmt.utils import Command, Path
+
+#: Creates a synthetic fmf tree with the given number of tests, and
+#: the number of tests sharing an fmf file.
+SyntheticTree = Callable[[int, int], Path]
+
+
+@pytest.fixture
+def synthetic_tree(tmppath: Path) -> SyntheticTree:
+    """
+    Create a synthetic fmf tree with the given number of tests.
+
+    Tests are spread over groups of tests sharing an fmf file, and every
+    seventh test carries an unknown key. Large trees may be used to
+    measure linting performance.
+    """
+
+    def _create(count: int, group_size: int) -> Path:
+        root = tmppath / 'tree'
+
+        (root / '.fmf').mkdir(parents=True)
+        (root / '.fmf' / 'version').write_text('1\n')
+
+        for group in range((count + group_size - 1) // group_size):
+            group_dirpath = root / 'tests' / f'group{group}'
+            group_dirpath.mkdir(parents=True)
+
+            lines = ['test: ./test.sh', 'framework: shell']
+
+            for index in range(group * group_size, min(count, (group + 1) * group_size)):
+                lines += [f'/test{index}:', f'    summary: Test {index}']
+
+                if index % 7 == 0:
+                    lines.append('    unknown-key: 1')
+
+            (group_dirpath / 'main.fmf').write_text('\n'.join(lines) + '\n')
+            (group_dirpath / 'test.sh').write_text('true\n')
+
+        return root
+
+    return _create
+
+
+def _lint(
+    tree: tmt.Tree, workers: int, timings: tmt.lint.LinterTimings
+) -> list[tuple[str, bool, list[tuple[str, Any, Any, str]]]]:
+    tests = tree.tests()
+    linters = tmt.Test.resolve_enabled_linters()
+
+    return [
+        (
+            test.name,
+            valid,
+            [
+                (linter.id, actual, eventual, message)
+                for linter, actual, eventual, message in rulings
+            ],
+        )
+        for test, valid, rulings in tmt.lint.lint_objects(
+            tests, linters=linters, enforce_checks=['T001'], workers=workers, timings=timings
+        )
+    ]
+
+
+def test_lint_objects_parallel(
+    synthetic_tree: SyntheticTree, root_logger: Logger, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Split even a small tree into multiple chunks
+    monkeypatch.setattr(tmt.lint, 'LINT_CHUNK_SIZE', 4)
+
+    tree = tmt.Tree(logger=root_logger, path=synthetic_tree(30, 10))
+
+    serial_timings = tmt.lint.LinterTimings()
+    parallel_timings = tmt.lint.LinterTimings()
+
+    serial = _lint(tree, 1, serial_timings)
+    parallel = _lint(tree, 3, parallel_timings)
+
+    # Workers must report the very same rulings, in the very same order
+    assert parallel == serial
+    assert [name for name, _, _ in serial] == [test.name for test in tree.tests()]
+
+    invalid = {name for name, valid, _ in serial if not valid}
+
+    assert invalid == {f'/tests/group{index // 10}/test{index}' for index in range(0, 30, 7)}
+
+    # Each linter inspected each test, no matter where
+    assert parallel_timings.counts == serial_timings.counts
+    assert set(serial_timings.counts.values()) == {30}
+    assert len(serial_timings.format()) == len(serial_timings.counts)
+
+
+def test_git_changed_files(synthetic_tree: SyntheticTree, root_logger: Logger) -> None:
+    root = synthetic_tree(6, 2)
+
+    def git(*args: str) -> None:
+        Command('git', '-c', 'user.name=tmt', '-c', 'user.email=tmt@example.com', *args).run(
+            cwd=root, logger=root_logger
+        )
+
+    git('init', '-q')
+    git('add', '.')
+    git('commit', '-q', '-m', 'initial')
+
+    modified = root / 'tests' / 'group1' / 'main.fmf'
+    modified.write_text(modified.read_text() + '/extra:\n    summary: Extra test\n')
+
+    untracked = root / 'tests' / 'new.fmf'
+    untracked.write_text('test: ./test.sh\n')
+
+    changed = tmt.utils.git.git_changed_files(root=root, ref='HEAD', logger=root_logger)
+
+    assert changed == {modified.resolve(), untracked.resolve()}
+
+    tree = tmt.Tree(logger=root_logger, path=root)
+
+    assert sorted(
+        test.name
+        for test in tree.tests()
+        if any(source.resolve() in changed for source in test.fmf_sources)
+    ) == sorted(
+        [
+            '/tests/group1/test2',
+            '/tests/group1/test3',
+            '/tests/group1/extra',
+            '/tests/new',
+        ]
+    )
@@ -0,0 +1,215 @@
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+import tmt.utils
+from tmt.frameworks.beakerlib import _extract_failures
+from tmt.utils import Path
+from tmt.utils.log_scanner import (
+    LogFollower,
+    find_tail_offset,
+    grep,
+    iter_lines,
+    iter_lines_reversed,
+    iter_text_lines,
+    read_tail,
+)
+
+
+@pytest.mark.parametrize(
+    'content',
+    [
+        '',
+        '\n',
+        'single line',
+        'first\nsecond\nthird\n',
+        'first\n\n\nlast',
+        'ünïcödé\nlines\n',
+    ],
+    ids=['empty', 'newline', 'single-line', 'trailing-newline', 'empty-lines', 'unicode'],
+)
+def test_iter_lines_reversed(tmppath: Path, content: str) -> None:
+    log = tmppath / 'log.txt'
+    log.write_text(content)
+
+    assert list(iter_lines_reversed(log)) == list(reversed(content.split('\n')))
+
+
+@pytest.mark.parametrize(
+    'content',
+    ['', '\n', 'first\nsecond\n', 'first\r\nsecond\rthird', 'a\x0bb\x0cc\u2028d\n\ne'],
+    ids=['empty', 'newline', 'trailing-newline', 'carriage-returns', 'special-separators'],
+)
+def test_iter_text_lines(content: str) -> None:
+    assert list(iter_text_lines(content)) == content.splitlines()
+
+
+def test_iter_lines(tmppath: Path) -> None:
+    log = tmppath / 'log.txt'
+    log.write_text('first\r\nsecond\nthird')
+
+    assert list(iter_lines(log)) == ['first', 'second', 'third']
+
+
+@pytest.mark.parametrize(
+    ('max_bytes', 'expected'),
+    [
+        (100, ('first\nsecond\nthird\n', 0)),
+        (19, ('first\nsecond\nthird\n', 0)),
+        # Truncated content starts with the first complete line...
+        (15, ('second\nthird\n', 6)),
+        # ... unless there is none.
+        (4, ('ird\n', 15)),
+        (0, ('', 19)),
+    ],
+)
+def test_read_tail(tmppath: Path, max_bytes: int, expected: tuple[str, int]) -> None:
+    log = tmppath / 'log.txt'
+    log.write_text('first\nsecond\nthird\n')
+
+    assert read_tail(log, max_bytes) == expected
+
+
+def test_missing_file(tmppath: Path) -> None:
+    with pytest.raises(tmt.utils.FileError):
+        list(iter_lines(tmppath / 'missing.txt'))
+
+    with pytest.raises(tmt.utils.FileError):
+        list(iter_lines_reversed(tmppath / 'missing.txt'))
+
+    with pytest.raises(tmt.utils.FileError):
+        read_tail(tmppath / 'missing.txt', 10)
+
+
+@pytest.mark.parametrize(
+    'content',
+    ['', '\n', 'single line', 'first\nsecond\nthird\n', 'first\n\n\nlast', 'a\n' * 50],
+    ids=['empty', 'newline', 'single-line', 'trailing-newline', 'empty-lines', 'many-lines'],
+)
+@pytest.mark.parametrize('lines', [0, 1, 2, 10])
+@pytest.mark.parametrize('block_size', [1, 3, 65536])
+def test_find_tail_offset(tmppath: Path, content: str, lines: int, block_size: int) -> None:
+    log = tmppath / 'log.txt'
+    log.write_text(content)
+
+    with log.open('rb') as f:
+        offset = find_tail_offset(f, lines, block_size=block_size)
+
+    expected = content.splitlines(keepends=True)[-lines:] if lines else []
+
+    assert content[offset:] == ''.join(expected)
+
+
+def test_log_follower(tmppath: Path) -> None:
+    first, second = tmppath / 'first.txt', tmppath / 'second.txt'
+    first.write_text('old 1\nold 2\nold 3\n')
+
+    lines = LogFollower({first: '[first] ', second: '[second] '}, lines=2).follow(
+        stop=lambda: True
+    )
+
+    def consume(count: int) -> list[str]:
+        return [next(lines) for _ in range(count)]
+
+    # Last lines of existing logs, missing logs are followed later
+    assert consume(2) == ['[first] old 2', '[first] old 3']
+
+    # Incomplete lines are held back until they are finished
+    with first.open('a') as f:
+        f.write('new 1\npartial')
+
+    second.write_text('created\n')
+
+    assert sorted(consume(2)) == ['[first] new 1', '[second] created']
+
+    # Rotated log is read to its end, then its replacement follows
+    with first.open('a') as f:
+        f.write(' line\nlast')
+
+    first.rename(tmppath / 'first.txt.1')
+    first.write_text('rotated\n')
+
+    assert consume(3) == ['[first] partial line', '[first] last', '[first] rotated']
+
+    # Truncated log is read again from its beginning
+    second.write_text('')
+    second.write_text('x\n')
+
+    assert consume(1) == ['[second] x']
+
+    # Nothing new, the follower stops as told
+    assert list(lines) == []
+
+
+def test_grep() -> None:
+    lines = ['ok', 'Call Trace: foo', 'segfault here', 'Call Trace: ignored', 'fine']
+
+    assert grep(lines, [re.compile(r'Call Trace:'), r'segfault']) == [
+        'Call Trace: foo',
+        'segfault here',
+        'Call Trace: ignored',
+    ]
+    assert grep(lines, [r'Call Trace:'], ignore_patterns=[r'ignored']) == ['Call Trace: foo']
+    assert grep(lines, [r'Call Trace:', r'segfault'], max_lines=1) == [
+        'Call Trace: foo',
+        '... output truncated after 1 lines',
+    ]
+    assert grep(lines, [r'segfault'], max_lines=1) == ['segfault here']
+    assert grep(lines, []) == []
+
+
+def test_grep_consumes_lazily() -> None:
+    consumed: list[str] = []
+
+    def _lines():
+        for index in range(1000):
+            consumed.append(str(index))
+            yield f'error {index}'
+
+    assert grep(_lines(), [r'error'], max_lines=3) == [
+        'error 0',
+        'error 1',
+        'error 2',
+        '... output truncated after 3 lines',
+    ]
+    assert len(consumed) == 4
+
+
+BEAKERLIB_LOG = """\
+::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+:: Setup
+::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+
+:: [ 10:00:00 ] :: [  BEGIN   ] :: Running 'true'
+:: [ 10:00:00 ] :: [   PASS   ] :: Command 'true' (Expected 0, got 0)
+
+::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+:: Test
+::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+
+:: [ 10:00:01 ] :: [  BEGIN   ] :: Running 'false'
+some output of false
+:: [ 10:00:01 ] :: [   FAIL   ] :: Command 'false' (Expected 0, got 1)
+:: [ 10:00:02 ] :: [   PASS   ] :: Command 'true' (Expected 0, got 0)
+"""
+
+
+def test_beakerlib_extract_failures(tmppath: Path) -> None:
+    invocation = MagicMock()
+    invocation.phase.step.plan.execute.workdir = tmppath
+
+    (tmppath / 'output.txt').write_text(BEAKERLIB_LOG)
+
+    assert _extract_failures(invocation, Path('output.txt')) == [
+        (
+            ":: Test\n"
+            "some output of false\n"
+            ":: [ 10:00:01 ] :: [   FAIL   ] :: Command 'false' (Expected 0, got 1)"
+        )
+    ]
+
+    (tmppath / 'passed.txt').write_text(BEAKERLIB_LOG.replace('FAIL', 'PASS'))
+
+    assert _extract_failures(invocation, Path('passed.txt')) == []
+    assert _extract_failures(invocation, Path('missing.txt')) == []
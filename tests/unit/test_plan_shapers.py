@@ -0,0 +1,126 @@
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+import tmt.utils
+from tmt._compat.pathlib import Path
+from tmt.log import Logger
+from tmt.plugins.plan_shapers.shards import (
+    ResultsDurationHistory,
+    ShardsPlanShaper,
+    expected_durations,
+    pack_shards,
+)
+from tmt.steps.discover import TestOrigin
+
+
+def _test_origin(name: str, duration: str = '5m', phase: str = 'default-0') -> TestOrigin:
+    test = MagicMock()
+    test.name = name
+    test.duration = duration
+
+    return TestOrigin(phase=phase, test=test)
+
+
+@pytest.mark.parametrize(
+    ('weights', 'shard_count', 'expected'),
+    [
+        # Heaviest items are spread first, light ones fill the gaps.
+        ([1, 1, 1, 1, 3, 2], 2, [[1, 3, 4], [0, 2, 5]]),
+        # Equal weights degrade to an even split by count.
+        ([1, 1, 1, 1, 1], 2, [[0, 2, 4], [1, 3]]),
+        # Empty shards are not reported.
+        ([5, 1], 4, [[0], [1]]),
+        ([], 3, []),
+    ],
+    ids=('by-duration', 'by-count', 'more-shards-than-items', 'no-items'),
+)
+def test_pack_shards(weights: list[float], shard_count: int, expected: list[list[int]]) -> None:
+    assert pack_shards(weights, shard_count) == expected
+
+
+def test_pack_shards_balance() -> None:
+    weights = [float(weight) for weight in range(1, 101)]
+
+    shards = pack_shards(weights, 4)
+
+    loads = [sum(weights[index] for index in shard) for shard in shards]
+
+    assert sorted(index for shard in shards for index in shard) == list(range(100))
+    assert max(loads) - min(loads) <= max(weights)
+
+    # Output must not depend on anything but the input.
+    assert pack_shards(weights, 4) == shards
+
+
+def test_shards_check() -> None:
+    def _plan(original_plan: Optional[MagicMock] = None) -> MagicMock:
+        plan = MagicMock(_original_plan=original_plan, _derived_plans=[])
+        plan.my_run.opt.side_effect = lambda option: {'shards': 2}[option]
+
+        return plan
+
+    tests = [_test_origin('/first'), _test_origin('/second')]
+
+    plan = _plan()
+    imported_plan = _plan(original_plan=plan)
+    derived_plan = _plan(original_plan=plan)
+    plan._derived_plans.append(derived_plan)
+
+    assert ShardsPlanShaper.check(plan, tests) is True
+    assert ShardsPlanShaper.check(imported_plan, tests) is True
+    assert ShardsPlanShaper.check(derived_plan, tests) is False
+    assert ShardsPlanShaper.check(plan, tests[:1]) is False
+
+    # The same plan may be sharded again, e.g. by another run
+    assert ShardsPlanShaper.check(plan, tests) is True
+
+
+def test_expected_durations(root_logger: Logger) -> None:
+    tests = [
+        _test_origin('/known', duration='1h'),
+        _test_origin('/timeout', duration='10m'),
+        _test_origin('/multiplied', duration='*2'),
+        _test_origin('/invalid', duration='foo'),
+    ]
+
+    assert expected_durations(tests, {'/known': 12.5}, logger=root_logger) == [
+        12.5,
+        600.0,
+        600.0,
+        300.0,
+    ]
+
+
+def test_results_duration_history(tmppath: Path, root_logger: Logger) -> None:
+    def _write_results(run_name: str, plan_name: str, results: list[dict[str, str]]) -> None:
+        dirpath = tmppath / run_name / plan_name / 'execute'
+        dirpath.mkdir(parents=True)
+
+        (dirpath / 'results.yaml').write_text(tmt.utils.to_yaml(results))
+
+    _write_results(
+        'run-001',
+        'plans/foo',
+        [{'name': '/a', 'duration': '00:00:10'}, {'name': '/b', 'duration': '00:01:00'}],
+    )
+    _write_results(
+        'run-002',
+        'plans/foo.1',
+        [{'name': '/a', 'duration': '00:00:20'}, {'name': '/c', 'duration': None}],
+    )
+    # Other plans and the current run must not be considered.
+    _write_results('run-002', 'plans/bar', [{'name': '/b', 'duration': '01:00:00'}])
+    _write_results('run-003', 'plans/foo', [{'name': '/b', 'duration': '01:00:00'}])
+
+    plan = MagicMock()
+    plan.safe_name = '/plans/foo'
+    plan.my_run.workdir_root = tmppath
+    plan.my_run.run_workdir = tmppath / 'run-003'
+
+    history = ResultsDurationHistory(logger=root_logger).durations(
+        plan, [_test_origin('/a'), _test_origin('/b'), _test_origin('/c')]
+    )
+
+    assert history == {'/a': 15.0, '/b': 60.0}
@@ -0,0 +1,61 @@
+import threading
+from typing import Any, Optional
+
+from tmt.log import Logger
+from tmt.steps.report import ReportQueue
+
+
+class FakePhase:
+    """
+    Waits for all other phases to start, then fails if asked to
+    """
+
+    def __init__(
+        self, name: str, barrier: threading.Barrier, logger: Logger, fail: bool = False
+    ) -> None:
+        self.name = name
+        self.barrier = barrier
+        self.fail = fail
+        self.finished = False
+        self._logger = logger
+
+    def inject_logger(self, logger: Logger) -> None:
+        self._logger = logger
+
+    def go(self, *, logger: Optional[Logger] = None) -> None:
+        # Would raise `BrokenBarrierError` if phases did not run at the
+        # same time.
+        self.barrier.wait(timeout=10)
+
+        if self.fail:
+            raise Exception(f'{self.name} failed')
+
+        self.finished = True
+
+
+def test_parallel_phases(root_logger: Logger) -> None:
+    barrier = threading.Barrier(3)
+    phases: list[Any] = [
+        FakePhase('junit', barrier, root_logger),
+        FakePhase('reportportal', barrier, root_logger, fail=True),
+        FakePhase('html', barrier, root_logger),
+    ]
+
+    queue = ReportQueue('report', root_logger)
+    queue.enqueue(phases=phases, logger=root_logger)
+
+    outcomes = list(queue.run())
+
+    # Every phase delivers its own outcome, a failure of one phase does
+    # not affect the others.
+    assert sorted(outcome.phase.name for outcome in outcomes) == ['html', 'junit', 'reportportal']
+
+    failed = [outcome for outcome in outcomes if outcome.exc is not None]
+
+    assert [outcome.phase.name for outcome in failed] == ['reportportal']
+    assert str(failed[0].exc) == 'reportportal failed'
+
+    assert [phase.finished for phase in phases] == [True, False, True]
+
+    # Original loggers are restored once the phases are done.
+    assert all(phase._logger is root_logger for phase in phases)
@@ -4,8 +4,9 @@ from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 
+import tmt.hardware
 from tmt.result import Result, ResultOutcome
-from tmt.steps.report.junit import ReportJUnit, ReportJUnitData
+from tmt.steps.report.junit import ReportJUnit, ReportJUnitData, make_junit_xml
 from tmt.utils import Path
 
 
@@ -214,3 +215,72 @@ class TestStateMapping:
 </testsuites>
 """,
         )
+
+
+def test_output_log_size_limit(report_fix, tmppath: Path) -> None:
+    report, results, out_file_path = report_fix
+
+    report.step.plan.execute.workdir = tmppath
+    report.data.output_log_size_limit = tmt.hardware.UNITS('20 bytes')
+
+    (tmppath / 'output.txt').write_text(''.join(f'line {i}\n' for i in range(100)))
+
+    results.append(
+        Result(
+            result=ResultOutcome.PASS,
+            name="/pass",
+            serial_number=1,
+            log=[Path('output.txt')],
+        )
+    )
+
+    report.go()
+
+    with xml.dom.minidom.parse(str(out_file_path)) as dom:
+        (system_out,) = dom.getElementsByTagName('system-out')
+        output = system_out.firstChild.data
+
+    assert output.startswith('WARNING: Output log has been truncated, 774 bytes')
+    assert output.endswith('\n\nline 98\nline 99\n')
+
+
+def test_validate(report_fix) -> None:
+    pytest.importorskip('lxml')
+
+    report, results, out_file_path = report_fix
+
+    report.data.validate = True
+    report.warn = MagicMock()
+
+    results.append(Result(result=ResultOutcome.FAIL, name="/fail", serial_number=1))
+
+    report.go()
+
+    report.warn.assert_not_called()
+
+    assert_xml(
+        out_file_path,
+        """<?xml version='1.0' encoding='utf-8'?>
+<testsuites disabled="0" errors="0" failures="1" tests="1" time="0.0">
+  <testsuite name="name" disabled="0" errors="0" failures="1" skipped="0" tests="1" time="0.0">
+    <testcase name="/fail">
+      <failure type="failure" message="fail"/>
+    </testcase>
+  </testsuite>
+</testsuites>
+""",
+    )
+
+
+def test_make_junit_xml(report_fix) -> None:
+    """Verify the deprecated function still returns the document."""
+    report, results, out_file_path = report_fix
+
+    results.append(Result(result=ResultOutcome.FAIL, name="/fail", serial_number=1))
+
+    report.go()
+
+    with pytest.deprecated_call():
+        xml_data = make_junit_xml(report)
+
+    assert xml_data == out_file_path.read_text()
@@ -0,0 +1,214 @@
+import email.parser
+import email.policy
+import http.server
+import json
+import threading
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from tmt.log import Logger
+from tmt.result import Result, ResultOutcome
+from tmt.steps.report.reportportal import ReportReportPortal, ReportReportPortalData
+from tmt.utils import Path
+
+PROJECT_SETTINGS = {
+    'subTypes': {
+        'TO_INVESTIGATE': [{'locator': 'ti001', 'longName': 'To Investigate'}],
+        'NO_DEFECT': [{'locator': 'nd_idle', 'longName': 'Idle'}],
+    }
+}
+
+
+class RecordedRequest:
+    def __init__(self, method: str, path: str, headers: Any, body: bytes) -> None:
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+
+    def log_entries(self) -> list[dict[str, Any]]:
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + self.body
+        )
+
+        return [
+            entry
+            for part in message.iter_parts()
+            if part.get_param('name', header='content-disposition') == 'json_request_part'
+            for entry in json.loads(part.get_payload(decode=True))
+        ]
+
+
+class ReportPortalStub(http.server.ThreadingHTTPServer):
+    """
+    Records all requests, and responds like ReportPortal would
+    """
+
+    def __init__(self) -> None:
+        super().__init__(('127.0.0.1', 0), ReportPortalStubHandler)
+
+        self.lock = threading.Lock()
+        self.requests: list[RecordedRequest] = []
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+
+class ReportPortalStubHandler(http.server.BaseHTTPRequestHandler):
+    server: ReportPortalStub
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _handle(self) -> None:
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        with self.server.lock:
+            request = RecordedRequest(self.command, self.path, self.headers, body)
+            self.server.requests.append(request)
+            index = len(self.server.requests)
+
+        path = self.path.removeprefix('/api/v1/project/')
+
+        if self.command == 'GET' and path == 'settings':
+            response: Any = PROJECT_SETTINGS
+        elif self.command == 'GET' and path.startswith('launch/uuid/'):
+            response = {'id': 1, 'name': 'launch'}
+        elif self.command == 'POST' and path == 'launch':
+            response = {'id': 'launch-uuid'}
+        elif self.command == 'POST' and path.startswith('item'):
+            response = {'id': f'item-{index}'}
+        elif self.command == 'POST' and path == 'log':
+            response = {'responses': [{'id': 'log'} for _ in request.log_entries()]}
+        elif self.command == 'PUT' and path.endswith('/finish'):
+            response = {'link': 'http://reportportal/launch'}
+        elif self.command == 'PUT':
+            response = {'message': 'finished'}
+        else:
+            self.send_error(404)
+            return
+
+        content = json.dumps(response).encode()
+
+        self.send_response(201 if self.command == 'POST' else 200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _handle  # noqa: N815
+    do_POST = _handle  # noqa: N815
+    do_PUT = _handle  # noqa: N815
+
+
+@pytest.fixture
+def reportportal_stub() -> Iterator[ReportPortalStub]:
+    server = ReportPortalStub()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_upload(tmppath: Path, root_logger: Logger, reportportal_stub: ReportPortalStub) -> None:
+    results = [
+        Result(
+            result=ResultOutcome.FAIL if serial_number % 2 else ResultOutcome.PASS,
+            name=f'/test-{serial_number}',
+            serial_number=serial_number,
+            start_time=f'2026-01-01T00:00:{serial_number:02d}+00:00',
+            end_time=f'2026-01-01T00:01:{serial_number:02d}+00:00',
+            log=[Path('output.txt'), Path('ignored.txt')],
+        )
+        for serial_number in range(1, 21)
+    ]
+
+    plan = MagicMock(fmf_context={}, summary=None)
+    plan.name = '/plan'
+    plan.my_run.plans = [plan]
+    plan.discover.tests.return_value = []
+    plan.execute.results.return_value = results
+    plan.execute.results_for_tests.return_value = [(result, None) for result in results]
+    plan.execute.read.side_effect = lambda path: f'content of {path}'
+
+    report = ReportReportPortal(
+        logger=root_logger,
+        step=MagicMock(plan=plan, is_dry_run=False, workdir=tmppath),
+        data=ReportReportPortalData(
+            name='x',
+            how='reportportal',
+            url=reportportal_stub.url,
+            token='token',  # noqa: S106
+            project='project',
+            defect_type='Idle',
+            upload_workers=4,
+        ),
+        workdir=tmppath / 'reportportal',
+    )
+
+    report.go()
+
+    requests = reportportal_stub.requests
+    paths = [
+        (request.method, request.path.removeprefix('/api/v1/project/')) for request in requests
+    ]
+
+    # The launch is created first, and finished last
+    assert paths[0] == ('POST', 'launch')
+    assert paths[-1] == ('PUT', 'launch/launch-uuid/finish')
+    assert json.loads(requests[-1].body) == {'endTime': '2026-01-01T00:01:20+00:00'}
+
+    # Project settings are fetched just once
+    assert paths.count(('GET', 'settings')) == 1
+
+    # Every test item is created, receives its logs in a single batch, and
+    # only then it is finished
+    created_items = {
+        json.loads(request.body)['name']: f'item-{index}'
+        for index, (path, request) in enumerate(zip(paths, requests), start=1)
+        if path == ('POST', 'item')
+    }
+
+    assert report.data.test_uuids == {
+        result.serial_number: {'default-0': created_items[result.name]} for result in results
+    }
+
+    assert ('POST', 'log/entry') not in paths
+
+    for result in results:
+        item_uuid = report.data.test_uuids[result.serial_number]['default-0']
+
+        item_requests = [
+            (path, request)
+            for path, request in zip(paths, requests)
+            if path == ('PUT', f'item/{item_uuid}')
+            or (path == ('POST', 'log') and request.log_entries()[0]['itemUuid'] == item_uuid)
+        ]
+
+        assert [path for path, _ in item_requests] == [
+            ('POST', 'log'),
+            ('PUT', f'item/{item_uuid}'),
+        ]
+
+        entries = item_requests[0][1].log_entries()
+
+        assert [entry['message'] for entry in entries] == [
+            '### `output.txt`\ncontent of output.txt'
+        ]
+        assert entries[0]['launchUuid'] == 'launch-uuid'
+        assert entries[0]['time'] == result.end_time
+
+        assert json.loads(item_requests[1][1].body) == {
+            'launchUuid': 'launch-uuid',
+            'endTime': result.end_time,
+            'status': 'FAILED' if result.result == ResultOutcome.FAIL else 'PASSED',
+            'issue': {'issueType': 'nd_idle'},
+        }
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Any, Union
 from unittest.mock import MagicMock
 
 import pytest
@@ -11,6 +11,7 @@ from tmt.result import (
     CheckResult,
     CheckResultInterpret,
     Result,
+    ResultGuestData,
     ResultInterpret,
     ResultOutcome,
     results_to_exit_code,
@@ -1084,3 +1085,76 @@ def test_result_web_link_missing_in_serialized() -> None:
 
     restored = Result.from_serialized(serialized)
     assert restored.web_link is None
+
+
+def _serialized_result(name: str, guest_name: str) -> dict[str, Any]:
+    from tmt.base.core import FmfId
+
+    return Result(
+        name=name,
+        result=ResultOutcome.PASS,
+        fmf_id=FmfId(url='https://example.com/tests', ref='main', name=name),
+        context=tmt.utils.FmfContext({'distro': ['fedora-41'], 'arch': ['x86_64']}),
+        guest=ResultGuestData(name=guest_name, role='client'),
+    ).to_serialized()
+
+
+def test_result_shared_data() -> None:
+    """Verify that restored results share equal guest data, context and fmf id."""
+    first = Result.from_serialized(_serialized_result('/test/foo', 'client-1'))
+    second = Result.from_serialized(_serialized_result('/test/foo', 'client-1'))
+    third = Result.from_serialized(_serialized_result('/test/bar', 'client-2'))
+
+    assert first.guest is second.guest
+    assert first.context is second.context
+    assert first.fmf_id is second.fmf_id
+    assert first.name is second.name
+
+    assert third.guest is not first.guest
+    assert third.guest.name == 'client-2'
+    assert third.context is first.context
+    assert third.fmf_id is not first.fmf_id
+    assert third.fmf_id is not None
+    assert third.fmf_id.name == '/test/bar'
+
+
+def test_result_shared_data_memory() -> None:
+    """
+    Verify the memory consumed by restored results does not grow with
+    guest data, context and fmf id duplicated in each of them.
+
+    Benchmarks of 200k results, with 4 guests, 5000 tests, one context,
+    two checks and three log paths per result:
+
+    =================================  ===========
+    Representation                     RSS
+    =================================  ===========
+    private guest, context and fmf id  688 MiB
+    shared guest, context and fmf id   392 MiB
+    =================================  ===========
+    """
+
+    import tracemalloc
+
+    serialized = [_serialized_result('/test/foo', 'client-1') for _ in range(1000)]
+
+    tracemalloc.start()
+
+    try:
+        results = [Result.from_serialized(raw_result) for raw_result in serialized]
+
+        snapshot = tracemalloc.take_snapshot()
+
+    finally:
+        tracemalloc.stop()
+
+    shared_allocations = [
+        stat
+        for stat in snapshot.statistics('filename')
+        if stat.traceback[0].filename.endswith(('tmt/base/core.py', 'tmt/utils/__init__.py'))
+    ]
+
+    # Only a single fmf id and context should have been created, not
+    # one per result.
+    assert sum(stat.count for stat in shared_allocations) < 100
+    assert len({id(result.guest) for result in results}) == 1
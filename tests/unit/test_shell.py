@@ -3,7 +3,6 @@ from unittest.mock import MagicMock
 
 import pytest
 
-import tmt.utils
 from tmt.container import container
 from tmt.frameworks.shell import _extract_failures
 from tmt.utils import Path
@@ -18,9 +17,11 @@ class FailureCase:
 
 
 @pytest.fixture
-def invocation():
+def invocation(tmppath: Path):
     """Provide a mock TestInvocation."""
-    return MagicMock()
+    invocation = MagicMock()
+    invocation.phase.step.plan.execute.workdir = tmppath
+    return invocation
 
 
 # ~50k chars of lorem-ipsum text with word boundaries for regex benchmarking.
@@ -84,13 +85,12 @@ _LONG_SEGMENT = (
 )
 def test_extract_failures(invocation: MagicMock, case: FailureCase) -> None:
     """Verify _extract_failures matches the correct lines."""
-    invocation.phase.step.plan.execute.read.return_value = case.log_content
+    (invocation.phase.step.plan.execute.workdir / 'dummy.log').write_text(case.log_content)
     assert _extract_failures(invocation, Path('dummy.log')) == case.expected
 
 
 def test_extract_failures_file_error(invocation: MagicMock) -> None:
     """Verify _extract_failures returns empty list when the log file cannot be read."""
-    invocation.phase.step.plan.execute.read.side_effect = tmt.utils.FileError('not found')
     assert _extract_failures(invocation, Path('dummy.log')) == []
 
 
@@ -143,7 +143,7 @@ def test_extract_failures_long_lines(invocation: MagicMock, case: FailureCase) -
     any result above 0.1 s indicates a regression toward the old behavior.
     The explicit time assertion serves as a safeguard against regressions.
     """
-    invocation.phase.step.plan.execute.read.return_value = case.log_content
+    (invocation.phase.step.plan.execute.workdir / 'dummy.log').write_text(case.log_content)
 
     start = time.time()
     result = _extract_failures(invocation, Path('dummy.log'))
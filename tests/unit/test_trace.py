@@ -0,0 +1,135 @@
+import json
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import tmt.trace
+from tmt.log import Logger
+from tmt.utils import Path
+
+
+@pytest.fixture
+def tracer() -> Iterator[tmt.trace.Tracer]:
+    yield tmt.trace.enable()
+
+    tmt.trace.disable()
+
+
+def test_disabled() -> None:
+    assert not tmt.trace.is_enabled()
+
+    def fn() -> None:
+        pass
+
+    with tmt.trace.span('foo') as span:
+        assert span is None
+
+    assert tmt.trace.propagate(fn) is fn
+    assert tmt.trace.traced(fn, 'foo') is fn
+
+
+def test_nested_spans(tracer: tmt.trace.Tracer) -> None:
+    with tmt.trace.span('plan', category='plan', plan='/plan') as plan_span:
+        with tmt.trace.span('execute', category='step') as step_span:
+            pass
+
+        with pytest.raises(ValueError, match='boom'), tmt.trace.span('report', category='step'):
+            raise ValueError('boom')
+
+    assert plan_span is not None
+    assert step_span is not None
+
+    spans = {span.name: span for span in tracer.spans}
+
+    assert list(spans) == ['execute', 'report', 'plan']
+
+    assert spans['plan'].parent_id is None
+    assert spans['execute'].parent_id == plan_span.span_id
+    assert spans['report'].parent_id == plan_span.span_id
+
+    # Attributes are inherited by child spans
+    assert spans['execute'].attributes == {'plan': '/plan'}
+
+    assert spans['execute'].error is None
+    assert spans['report'].error == 'ValueError: boom'
+
+    for span in spans.values():
+        assert span.end_time is not None
+        assert span.start_time <= span.end_time
+
+
+def test_propagate(tracer: tmt.trace.Tracer) -> None:
+    def worker(guest: str) -> None:
+        with tmt.trace.span('command', category='guest', guest=guest):
+            pass
+
+    with (
+        tmt.trace.span('prepare', category='step', plan='/plan') as step_span,
+        ThreadPoolExecutor(max_workers=2) as executor,
+    ):
+        futures = [
+            executor.submit(
+                tmt.trace.traced(worker, 'phase', category='phase', guest=guest), guest
+            )
+            for guest in ('client', 'server')
+        ]
+
+        for future in futures:
+            future.result()
+
+    assert step_span is not None
+
+    phases = {span.attributes['guest']: span for span in tracer.spans if span.name == 'phase'}
+    commands = {span.attributes['guest']: span for span in tracer.spans if span.name == 'command'}
+
+    assert set(phases) == set(commands) == {'client', 'server'}
+
+    for guest in ('client', 'server'):
+        assert phases[guest].parent_id == step_span.span_id
+        assert commands[guest].parent_id == phases[guest].span_id
+        assert commands[guest].attributes == {'plan': '/plan', 'guest': guest}
+        assert commands[guest].thread_id != step_span.thread_id
+
+
+def test_export(tracer: tmt.trace.Tracer, tmppath: Path, root_logger: Logger) -> None:
+    with (
+        tmt.trace.span('plan', category='plan', plan='/plan'),
+        pytest.raises(ValueError, match='boom'),
+        tmt.trace.span('execute', category='step'),
+    ):
+        raise ValueError('boom')
+
+    tracer.save(
+        chrome_trace_path=tmppath / 'trace.json',
+        otlp_path=tmppath / 'trace.otlp.json',
+        logger=root_logger,
+    )
+
+    chrome_trace = json.loads((tmppath / 'trace.json').read_text())
+    events = {event['name']: event for event in chrome_trace['traceEvents']}
+
+    assert events['plan']['ph'] == 'X'
+    assert events['plan']['cat'] == 'plan'
+    assert events['plan']['args'] == {'plan': '/plan'}
+    assert events['execute']['args'] == {'plan': '/plan', 'error': 'ValueError: boom'}
+    assert events['execute']['ts'] >= events['plan']['ts']
+    assert events['execute']['dur'] <= events['plan']['dur']
+    assert events['thread_name']['ph'] == 'M'
+
+    otlp = json.loads((tmppath / 'trace.otlp.json').read_text())
+    resource_spans = otlp['resourceSpans'][0]
+
+    assert {'key': 'service.name', 'value': {'stringValue': 'tmt'}} in resource_spans['resource'][
+        'attributes'
+    ]
+
+    spans = {span['name']: span for span in resource_spans['scopeSpans'][0]['spans']}
+
+    assert spans['plan']['traceId'] == spans['execute']['traceId'] == tracer.trace_id
+    assert spans['execute']['parentSpanId'] == spans['plan']['spanId']
+    assert 'parentSpanId' not in spans['plan']
+    assert spans['execute']['status'] == {'code': 2, 'message': 'ValueError: boom'}
+    assert 'status' not in spans['plan']
+    assert {'key': 'plan', 'value': {'stringValue': '/plan'}} in spans['execute']['attributes']
+    assert int(spans['plan']['startTimeUnixNano']) <= int(spans['execute']['startTimeUnixNano'])
@@ -1842,3 +1842,58 @@ def test_render_template_sandbox() -> None:
 
     with pytest.raises(GeneralError, match=r"Template used forbidden operation\."):
         tmt.utils.templates.render_template('{{ RESULT.__init__.__globals__ }}', RESULT=result)
+
+
+@pytest.mark.parametrize('format_name', ['yaml', 'json', 'json-compact'])
+def test_state_roundtrip(tmppath: Path, format_name: str) -> None:
+    data = {'status': 'done', 'data': [{'how': 'tmt', 'note': 'multi\nline \x07 value'}]}
+
+    tmt.utils.write_state(tmppath / 'step', dict(data), format_name=format_name)
+
+    # Only the state file itself should exist, no temporary files.
+    suffix = tmt.utils.get_state_format(format=format_name).suffix
+    assert [path.name for path in tmppath.iterdir()] == [f'step{suffix}']
+
+    loaded = tmt.utils.read_state(tmppath / 'step', format_name=format_name)
+
+    if format_name == 'yaml':
+        # Non-printable characters are escaped when saving YAML.
+        assert loaded['data'][0]['note'] == 'multi\nline #{7} value'
+
+    else:
+        assert loaded == data
+
+
+def test_state_compact_json(tmppath: Path) -> None:
+    tmt.utils.write_state(tmppath / 'results', [{'name': '/test', 'note': ['ü']}], 'json-compact')
+
+    assert (tmppath / 'results.json').read_text() == '[{"name":"/test","note":["ü"]}]'
+
+
+def test_write_text_atomically_failure(tmppath: Path) -> None:
+    filepath = tmppath / 'state.yaml'
+    filepath.write_text('original content')
+
+    with (
+        unittest.mock.patch.object(Path, 'replace', side_effect=OSError('disk full')),
+        pytest.raises(OSError, match=r'disk full'),
+    ):
+        filepath.write_text_atomically('new content')
+
+    # The original file must stay untouched, and no leftovers allowed.
+    assert filepath.read_text() == 'original content'
+    assert [path.name for path in tmppath.iterdir()] == ['state.yaml']
+
+
+def test_yaml_instances_reused() -> None:
+    assert tmt.utils._yaml() is tmt.utils._yaml()
+    assert tmt.utils._yaml() is not tmt.utils._yaml(width=80)
+
+    instances: list[Any] = []
+
+    thread = threading.Thread(target=lambda: instances.append(tmt.utils._yaml()))
+    thread.start()
+    thread.join()
+
+    # Each thread must get its own instance.
+    assert instances[0] is not tmt.utils._yaml()
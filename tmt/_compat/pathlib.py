@@ -1,5 +1,6 @@
 import os
 import pathlib
+import threading
 from collections.abc import Iterator
 from typing import Optional, Union
 
@@ -61,6 +62,42 @@ class Path(pathlib.PosixPath):
         with self.open('a', encoding=encoding, errors=errors, newline=newline) as f:
             return f.write(data)
 
+    def write_text_atomically(
+        self,
+        data: str,
+        encoding: Optional[str] = None,
+        errors: Optional[str] = None,
+        newline: Optional[str] = None,
+    ) -> int:
+        """
+        Open a temporary file in text mode, write data to it, and move it to the pointed-to file
+
+        The pointed-to file is replaced in a single step, readers, as well
+        as a process interrupted while writing, would never see a file
+        with partial content.
+        """
+
+        # Process and thread IDs make the name unique among all possible
+        # writers, and `O_EXCL` catches any leftover of a crashed one.
+        temporary = self.with_name(f'.{self.name}.{os.getpid()}-{threading.get_ident()}.tmp')
+
+        temporary.unlink(missing_ok=True)
+
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+
+        try:
+            with open(fd, 'w', encoding=encoding, errors=errors, newline=newline) as f:
+                written = f.write(data)
+
+            temporary.replace(self)
+
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+
+            raise
+
+        return written
+
     def splitlines(
         self,
         encoding: Optional[str] = None,
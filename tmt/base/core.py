@@ -5,13 +5,18 @@ Base Metadata Classes
 # TODO: Split this definition in smaller files
 
 import collections
+import contextlib
 import copy
 import enum
+import fcntl
 import functools
 import os
 import re
-import shutil
+import subprocess
+import tempfile
+import threading
 from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from re import Pattern
 from typing import (
     TYPE_CHECKING,
@@ -78,7 +83,15 @@ if TYPE_CHECKING:
     from pint import Quantity
 
     import tmt.cli
-    from tmt.base.links import Link, LinkNeedle, Links, _RawLink, _RawLinks
+    from tmt.base.links import (
+        Link,
+        LinkIndex,
+        LinkNeedle,
+        Links,
+        _RawLink,
+        _RawLinkRelationName,
+        _RawLinks,
+    )
     from tmt.base.plan import Plan
     from tmt.base.run import Run
 
@@ -117,6 +130,9 @@ EXTRA_KEYS_PREFIX = 'extra-'
 # Extra keys used for identification in Result class
 EXTRA_RESULT_IDENTIFICATION_KEYS = ['extra-nitrate', 'extra-task']
 
+# Characters marking link targets as regular expressions rather than names
+_REGEX_CHARACTERS = frozenset('*+?[](){}|^$\\')
+
 
 def _compile_section_heading_patterns(tag: str, *texts: str) -> list[Pattern[str]]:
     """
@@ -1141,6 +1157,67 @@ class Core(
 
         yield LinterOutcome.PASS, 'summary key is set and is reasonably long'
 
+    def lint_dangling_links(self) -> LinterReturn:
+        """
+        C002: links to the metadata tree should point to existing objects or files
+        """
+
+        if not self.link or self.tree is None or self.tree.root is None:
+            yield LinterOutcome.SKIP, 'no links to check'
+            return
+
+        index = self.tree.link_index
+
+        # Objects imported from other trees link to their own trees
+        if not index.has_node(self.node):
+            yield LinterOutcome.SKIP, 'object does not belong to the metadata tree'
+            return
+
+        root = self.tree.root
+        dangling = False
+
+        for link in self.link.get():
+            if isinstance(link.target, FmfId):
+                if link.target.url is not None or link.target.name is None:
+                    continue
+
+                target = link.target.name
+
+            else:
+                target = link.target
+
+            if link.relation == 'test-script' or not target.startswith('/'):
+                continue
+
+            if target in index.names:
+                continue
+
+            # Links to documents may point to their sections
+            if (root / Path(target.split('#', 1)[0]).unrooted()).exists():
+                continue
+
+            # Targets may be patterns matching object names
+            if _REGEX_CHARACTERS.intersection(target):
+                try:
+                    pattern = re.compile(target)
+
+                except re.error:
+                    pass
+
+                else:
+                    if any(pattern.search(name) for name in index.names):
+                        continue
+
+            dangling = True
+
+            yield (
+                LinterOutcome.WARN,
+                f"link '{link.relation}: {target}' points to neither an object nor a file",
+            )
+
+        if not dangling:
+            yield LinterOutcome.PASS, 'links point to existing objects or files'
+
     def has_link(self, needle: 'LinkNeedle') -> bool:
         """
         Whether object contains specified link
@@ -1968,26 +2045,50 @@ class Story(
     def from_tree(cls, tree: 'tmt.Tree') -> list['Story']:
         return tree.stories()
 
+    def _links_with_inverse(self, relation: '_RawLinkRelationName') -> list['Link']:
+        """
+        Return links with given relation, including inverse links to the story
+
+        A test linking to the story with ``verifies`` counts as if the
+        story linked to the test with ``verified-by``.
+        """
+
+        from tmt.base.links import INVERSE_RELATIONS, Link
+
+        links = self.link.get(relation) if self.link else []
+
+        if self.tree is None or not self.tree.link_index.has_node(self.node):
+            return links
+
+        targets = {link.target for link in links}
+
+        for source, _ in self.tree.link_index.links_to(self.name, INVERSE_RELATIONS[relation]):
+            if source not in targets:
+                targets.add(source)
+                links.append(Link(relation=relation, target=source))
+
+        return links
+
     @property
     def documented(self) -> list['Link']:
         """
         Return links to relevant documentation
         """
-        return self.link.get('documented-by') if self.link else []
+        return self._links_with_inverse('documented-by')
 
     @property
     def verified(self) -> list['Link']:
         """
         Return links to relevant test coverage
         """
-        return self.link.get('verified-by') if self.link else []
+        return self._links_with_inverse('verified-by')
 
     @property
     def implemented(self) -> list['Link']:
         """
         Return links to relevant source code
         """
-        return self.link.get('implemented-by') if self.link else []
+        return self._links_with_inverse('implemented-by')
 
     @property
     def status(self) -> list[str]:
@@ -2139,6 +2240,33 @@ class Story(
                 echo(tmt.utils.format(key, value, wrap=wrap))
         if self.verbosity_level:
             self._show_additional_keys()
+            self._show_inverse_links()
+
+    def _show_inverse_links(self) -> None:
+        """
+        Show links of other objects pointing to the story
+        """
+
+        from tmt.base.links import INVERSE_RELATIONS
+
+        if self.tree is None or not self.tree.link_index.has_node(self.node):
+            return
+
+        own_links = (
+            {(link.relation, link.target) for link in self.link.get()} if self.link else set()
+        )
+
+        for source, link in self.tree.link_index.links_to(self.name):
+            relation = INVERSE_RELATIONS.get(link.relation)
+
+            if relation is None or (relation, source) in own_links:
+                continue
+
+            echo(
+                tmt.utils.format(
+                    relation.removesuffix('-by'), source, key_color='cyan', wrap=False
+                )
+            )
 
     def coverage(self, code: bool, test: bool, docs: bool) -> tuple[bool, bool, bool]:
         """
@@ -2214,6 +2342,7 @@ class Tree(tmt.utils.Common):
         self._tree = tree
         self._custom_fmf_context = fmf_context or FmfContext()
         self._additional_rules = additional_rules
+        self._link_index: Optional[LinkIndex] = None
 
     @classmethod
     def grow(
@@ -2276,6 +2405,26 @@ class Tree(tmt.utils.Common):
 
         return cli_conditions
 
+    def _link_filter(
+        self, nodes: Iterable[fmf.Tree], links: list['LinkNeedle']
+    ) -> Iterable[fmf.Tree]:
+        """
+        Drop nodes without links matching any of the needles
+
+        Nodes are pruned with the help of the link index, before objects
+        are created for them. Nodes not known to the index are kept, for
+        :py:meth:`_filters_conditions` to inspect their links.
+        """
+
+        if not links:
+            return nodes
+
+        linked = self.link_index.matching(links)
+
+        return [
+            node for node in nodes if node.name in linked or not self.link_index.has_node(node)
+        ]
+
     def _filters_conditions(
         self,
         nodes: Sequence[CoreT],
@@ -2289,6 +2438,10 @@ class Tree(tmt.utils.Common):
         Apply filters and conditions, return pruned nodes
         """
 
+        # Objects with matching links, in OR relation, found by the reverse
+        # index instead of inspecting links of each object
+        linked = self.link_index.matching(links) if links else set()
+
         result = []
         for node in nodes:
             filter_vars = copy.deepcopy(node._metadata)
@@ -2325,14 +2478,18 @@ class Tree(tmt.utils.Common):
                 continue
 
             # Links
-            try:
-                # Links are in OR relation
-                if links and all(not node.has_link(needle) for needle in links):
+            if links and self.link_index.has_node(node.node):
+                if node.node.name not in linked:
+                    continue
+            else:
+                try:
+                    # Links are in OR relation
+                    if links and all(not node.has_link(needle) for needle in links):
+                        continue
+                except Exception as exc:
+                    # Handle broken link as not matching
+                    self.debug(f'Invalid link ignored, exception was {exc}')
                     continue
-            except Exception as exc:
-                # Handle broken link as not matching
-                self.debug(f'Invalid link ignored, exception was {exc}')
-                continue
 
             # Exclude
             if any(re.search(pattern, node.name) for pattern in excludes):
@@ -2382,6 +2539,20 @@ class Tree(tmt.utils.Common):
     @tree.setter
     def tree(self, new_tree: fmf.Tree) -> None:
         self._tree = new_tree
+        self._link_index = None
+
+    @property
+    def link_index(self) -> 'LinkIndex':
+        """
+        Reverse index of links, built when first accessed
+        """
+
+        if self._link_index is None:
+            from tmt.base.links import LinkIndex
+
+            self._link_index = LinkIndex(self.tree)
+
+        return self._link_index
 
     @property
     def root(self) -> Optional[Path]:
@@ -2462,7 +2633,9 @@ class Tree(tmt.utils.Common):
         if Test._opt('source'):
             tests = [
                 Test(node=test, logger=self._logger.descend())
-                for test in self.tree.prune(keys=keys, sources=cmd_line_names, sort=sort)
+                for test in self._link_filter(
+                    self.tree.prune(keys=keys, sources=cmd_line_names, sort=sort), links
+                )
             ]
 
         # If duplicate test names are allowed, match test name/regexp
@@ -2478,7 +2651,11 @@ class Tree(tmt.utils.Common):
                             logger_name=test.get('name', None)
                         ),  # .apply_verbosity_options(**self._options),
                     )
-                    for test in name_filter(self.tree.prune(keys=keys, names=[name], sort=sort))
+                    for test in name_filter(
+                        self._link_filter(
+                            self.tree.prune(keys=keys, names=[name], sort=sort), links
+                        )
+                    )
                 ]
                 tests.extend(sorted(selected_tests, key=lambda test: test.order))
 
@@ -2492,7 +2669,9 @@ class Tree(tmt.utils.Common):
                         logger_name=test.get('name', None)
                     ),  # .apply_verbosity_options(**self._options),
                 )
-                for test in name_filter(self.tree.prune(keys=keys, names=names, sort=sort))
+                for test in name_filter(
+                    self._link_filter(self.tree.prune(keys=keys, names=names, sort=sort), links)
+                )
             ]
             tests = sorted(selected_tests, key=lambda test: test.order)
 
@@ -2523,7 +2702,7 @@ class Tree(tmt.utils.Common):
         Search available plans
         """
         from tmt.base.links import LinkNeedle
-        from tmt.base.plan import Plan
+        from tmt.base.plan import ImportedTrees, Plan
 
         # Handle defaults, apply possible command line options
         logger = logger or (run._logger if run is not None else self._logger)
@@ -2599,17 +2778,24 @@ class Tree(tmt.utils.Common):
             resolve_enabled_only = True
 
         if not Plan._opt('shallow'):
-            unresolved_plans = plans
-            plans = []
-            for plan in unresolved_plans:
+            unresolved_plans: list[Plan] = []
+            for plan in plans:
                 # Do not resolve disabled plans unless forced to
                 if resolve_enabled_only and not plan.enabled:
                     plan.debug(
                         f"Plan '{plan.name}' is not enabled, skipping imports resolution.",
                     )
                     continue
+                unresolved_plans.append(plan)
+
+            # Fetch all remote plans first, each unique source just once
+            imported_trees = ImportedTrees(logger=logger)
+            imported_trees.fetch(unresolved_plans)
+
+            plans = []
+            for plan in unresolved_plans:
                 try:
-                    plans += plan.resolve_imports()
+                    plans += plan.resolve_imports(imported_trees)
                 except Exception as error:
                     if self.import_before_name_filter:
                         # If we filter later, we can skip some resolve failures
@@ -2692,7 +2878,9 @@ class Tree(tmt.utils.Common):
         # Build the list, convert to objects, sort and filter
         stories = [
             Story(node=story, tree=self, logger=logger.descend())
-            for story in self.tree.prune(keys=keys, names=names, whole=whole, sources=sources)
+            for story in self._link_filter(
+                self.tree.prune(keys=keys, names=names, whole=whole, sources=sources), links
+            )
         ]
         return self._filters_conditions(
             nodes=sorted(stories, key=lambda story: story.order),
@@ -2998,9 +3186,52 @@ class Status(tmt.utils.Common):
 CleanCallback = Callable[[], bool]
 
 
-def _dir_size(path: Path) -> 'Quantity':
-    """Return the total size in bytes of all files under path."""
-    return tmt.hardware.UNITS(f'{sum(f.lstat().st_size for f in path.rglob("*"))} bytes')
+#: Maximal number of workdirs removed, or runs whose guests are stopped,
+#: at the same time by ``tmt clean``.
+CLEAN_WORKERS: int = tmt.utils.configure_constant(4, 'TMT_CLEAN_WORKERS')
+
+#: How long ``tmt clean`` waits for guests of a single run to stop.
+CLEAN_GUEST_TIMEOUT: int = tmt.utils.configure_constant(300, 'TMT_CLEAN_GUEST_TIMEOUT')
+
+#: Name of the directory workdirs are moved into before their removal.
+CLEAN_TRASH_DIRNAME = '.tmt-trash'
+
+
+def _tree_size(path: str, remove: bool) -> int:
+    size = 0
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            size += entry.stat(follow_symlinks=False).st_size
+
+            if entry.is_dir(follow_symlinks=False):
+                size += _tree_size(entry.path, remove)
+
+                if remove:
+                    os.rmdir(entry.path)
+
+            elif remove:
+                os.unlink(entry.path)
+
+    return size
+
+
+def _dir_size(path: Path, *, remove: bool = False) -> 'Quantity':
+    """
+    Return the total size in bytes of all files under path.
+
+    :param path: directory to inspect.
+    :param remove: if set, each file is removed right after its size has
+        been recorded, and the directory is removed as well, computing
+        the size in the same pass as the removal.
+    """
+
+    size = _tree_size(str(path), remove)
+
+    if remove:
+        path.rmdir()
+
+    return tmt.hardware.UNITS(f'{size} bytes')
 
 
 class Clean(tmt.utils.Common):
@@ -3037,6 +3268,12 @@ class Clean(tmt.utils.Common):
             cli_invocation=cli_invocation,
         )
 
+        # Workdirs of runs whose guests did not stop in time, shared by
+        # all cleanups of the same invocation.
+        self._busy_workdirs: set[Path] = (
+            parent._busy_workdirs if isinstance(parent, Clean) else set()
+        )
+
     def images(self) -> bool:
         """
         Clean images of provision plugins
@@ -3087,12 +3324,6 @@ class Clean(tmt.utils.Common):
                     self.verbose(
                         f"Stopping guests in run '{run.run_workdir}' plan '{plan.name}'.", shift=1
                     )
-                    # Set --quiet to avoid finish logging to terminal
-
-                    assert self.cli_invocation is not None  # narrow type
-
-                    quiet = self.cli_invocation.options['quiet']
-                    self.cli_invocation.options['quiet'] = True
                     try:
                         plan.cleanup.go()
                     except tmt.utils.GeneralError as error:
@@ -3100,10 +3331,74 @@ class Clean(tmt.utils.Common):
                             f"Could not stop guest in run '{run.run_workdir}': {error}.", shift=1
                         )
                         successful = False
-                    finally:
-                        self.cli_invocation.options['quiet'] = quiet
         return successful
 
+    def _stop_running_guests_with_timeout(self, run: 'Run') -> bool:
+        """
+        Stop all running guests of a run, give up after a timeout
+
+        Guests are stopped by a daemon thread. If they do not stop in
+        time, the thread is abandoned, and it does not prevent tmt from
+        exiting. The workdir of such a run is not removed by
+        :py:meth:`runs`, the abandoned thread may still be using it.
+        """
+
+        outcome: list[bool] = []
+        exceptions: list[Exception] = []
+
+        def _stop() -> None:
+            try:
+                outcome.append(self._stop_running_guests(run))
+
+            except Exception as exc:
+                exceptions.append(exc)
+
+        thread = threading.Thread(
+            target=_stop,
+            name=f'clean-{run.run_workdir.name}',
+            daemon=True,
+        )
+        thread.start()
+        thread.join(CLEAN_GUEST_TIMEOUT)
+
+        if thread.is_alive():
+            self.warn(
+                f"Guests in run '{run.run_workdir}' did not stop "
+                f"in {CLEAN_GUEST_TIMEOUT} seconds.",
+                shift=1,
+            )
+            self._busy_workdirs.add(run.run_workdir.resolve())
+            return False
+
+        if exceptions:
+            if not isinstance(exceptions[0], tmt.utils.GeneralError):
+                raise exceptions[0]
+
+            self.warn(
+                f"Could not stop guests in run '{run.run_workdir}': {exceptions[0]}", shift=1
+            )
+            return False
+
+        return bool(outcome) and all(outcome)
+
+    def _stop_running_guests_of_runs(self, runs: list['Run']) -> bool:
+        """
+        Stop running guests of given runs in parallel
+        """
+
+        assert self.cli_invocation is not None  # narrow type
+
+        # Set --quiet to avoid finish logging to terminal
+        quiet = self.cli_invocation.options['quiet']
+        self.cli_invocation.options['quiet'] = True
+
+        try:
+            with ThreadPoolExecutor(max_workers=CLEAN_WORKERS) as executor:
+                return all(list(executor.map(self._stop_running_guests_with_timeout, runs)))
+
+        finally:
+            self.cli_invocation.options['quiet'] = quiet
+
     def guests(self, run_ids: tuple[str, ...], keep: Optional[int]) -> bool:
         """
         Clean guests of runs
@@ -3117,14 +3412,15 @@ class Clean(tmt.utils.Common):
 
             # Pass the context containing --last to Run to choose
             # the correct one.
-            return self._stop_running_guests(
-                Run(
-                    logger=self._logger,
-                    cli_invocation=self.cli_invocation,
-                    workdir_root=self.workdir_root,
-                )
+            return self._stop_running_guests_of_runs(
+                [
+                    Run(
+                        logger=self._logger,
+                        cli_invocation=self.cli_invocation,
+                        workdir_root=self.workdir_root,
+                    )
+                ]
             )
-        successful = True
         assert self._cli_context_object is not None  # narrow type
         all_workdirs = list(tmt.utils.generate_runs(self.workdir_root, run_ids))
         if keep is not None:
@@ -3138,35 +3434,240 @@ class Clean(tmt.utils.Common):
         # once we split `Clean` into plugins
         from tmt.base.run import Run
 
-        for abs_path in all_workdirs:
-            run = Run(
-                logger=self._logger,
-                id_=abs_path,
-                tree=self._cli_context_object.tree,
-                cli_invocation=self.cli_invocation,
-                workdir_root=self.workdir_root,
-            )
-            if not self._stop_running_guests(run):
-                successful = False
-        return successful
+        return self._stop_running_guests_of_runs(
+            [
+                Run(
+                    logger=self._logger,
+                    id_=abs_path,
+                    tree=self._cli_context_object.tree,
+                    cli_invocation=self.cli_invocation,
+                    workdir_root=self.workdir_root,
+                )
+                for abs_path in all_workdirs
+            ]
+        )
 
-    def _clean_workdir(self, path: Path) -> tuple[bool, 'Quantity']:
+    def _lock_trashed(self, trashed_path: Path) -> Optional[int]:
         """
-        Remove a workdir (unless in dry mode)
+        Lock a directory in trash, so no other cleanup would remove it
+
+        The lock is held by the returned descriptor of the directory,
+        and it is released when the descriptor is closed, or when the
+        process holding it terminates.
+
+        :returns: descriptor holding the lock, or ``None`` if another
+            process holds the lock already, or the directory is gone.
         """
-        size = _dir_size(path)
-        formatted_size = tmt.hardware.format_compact(size)
-        if self.is_dry_run:
-            self.verbose(f"Would remove workdir '{path}' ({formatted_size}).", shift=1)
-        else:
-            self.verbose(f"Removing workdir '{path}' ({formatted_size}).", shift=1)
+
+        try:
+            fd = os.open(trashed_path, os.O_RDONLY | os.O_DIRECTORY)
+
+        except OSError:
+            return None
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        except OSError:
+            os.close(fd)
+            return None
+
+        return fd
+
+    def _move_to_trash(self, path: Path) -> tuple[Path, Optional[int]]:
+        """
+        Move a workdir into the trash directory next to it
+
+        Renaming is atomic, the workdir disappears from listings at once
+        and can be removed later. If the workdir cannot be renamed, it
+        is left in place.
+
+        :returns: path to remove, and a descriptor holding its lock, if
+            the workdir was moved to trash.
+        """
+
+        trash = path.parent / CLEAN_TRASH_DIRNAME
+
+        try:
+            trash.mkdir(exist_ok=True)
+            trashed_path = Path(tempfile.mkdtemp(prefix=f'{path.name}-', dir=trash))
+
+        except OSError as error:
+            self.debug(f"Failed to move '{path}' to trash: {error}.")
+            return path, None
+
+        lock = self._lock_trashed(trashed_path)
+
+        if lock is None:
+            self.debug(f"Failed to move '{path}' to trash: failed to lock '{trashed_path}'.")
+            return path, None
+
+        try:
+            path.rename(trashed_path / path.name)
+
+        except OSError as error:
+            self.debug(f"Failed to move '{path}' to trash: {error}.")
+            trashed_path.rmdir()
+            os.close(lock)
+            return path, None
+
+        return trashed_path, lock
+
+    def _lock_leftovers(self, trash: Path, known: Iterable[Path]) -> dict[Path, int]:
+        """
+        Find and lock leftovers of interrupted cleanups in trash
+
+        Leftovers of other users, and those being removed by another
+        cleanup right now, are skipped.
+
+        :param trash: trash directory to inspect.
+        :param known: paths removed by this cleanup already.
+        :returns: leftovers with descriptors holding their locks.
+        """
+
+        leftovers: dict[Path, int] = {}
+
+        try:
+            entries = list(trash.iterdir())
+
+        except OSError:
+            return leftovers
+
+        uid = os.getuid()
+        known = set(known)
+
+        for leftover in entries:
+            if leftover in known:
+                continue
+
             try:
-                shutil.rmtree(path)
-            except OSError as error:
-                self.warn(f"Failed to remove '{path}': {error}.", shift=1)
-                return False, tmt.hardware.UNITS('0 bytes')
+                if leftover.lstat().st_uid != uid:
+                    continue
+
+            except OSError:
+                continue
+
+            lock = self._lock_trashed(leftover)
+
+            if lock is None:
+                self.debug(f"Skipping '{leftover}', it is being removed by another process.")
+                continue
+
+            leftovers[leftover] = lock
+
+        return leftovers
+
+    def _remove_workdir(self, path: Path, trashed_path: Path) -> tuple[bool, 'Quantity']:
+        """
+        Remove a workdir, computing its size in the same pass
+        """
+
+        try:
+            size = _dir_size(trashed_path, remove=True)
+
+        except OSError as error:
+            self.warn(f"Failed to remove '{path}': {error}.", shift=1)
+            return False, tmt.hardware.UNITS('0 bytes')
+
+        self.debug(f"Removed workdir '{path}' ({tmt.hardware.format_compact(size)}).")
+
         return True, size
 
+    def _clean_workdirs(self, paths: list[Path]) -> bool:
+        """
+        Remove workdirs (unless in dry mode)
+
+        Workdirs are moved to trash first, then removed in parallel, or
+        by a detached process if ``--background`` was used. Leftovers of
+        interrupted cleanups found in the trash are removed as well, unless
+        they belong to another user, or another cleanup is removing them.
+        Each directory in trash is locked while being removed.
+        """
+
+        if self.is_dry_run:
+            with ThreadPoolExecutor(max_workers=CLEAN_WORKERS) as executor:
+                sizes = list(executor.map(_dir_size, paths))
+
+            for path, size in zip(paths, sizes):
+                self.verbose(
+                    f"Would remove workdir '{path}' ({tmt.hardware.format_compact(size)}).",
+                    shift=1,
+                )
+
+            self._show_summary(sum(sizes, tmt.hardware.UNITS('0 bytes')))
+            return True
+
+        removals: dict[Path, Path] = {}
+        locks: list[int] = []
+
+        for path in paths:
+            self.verbose(f"Removing workdir '{path}'.", shift=1)
+
+            trashed_path, lock = self._move_to_trash(path)
+            removals[trashed_path] = path
+
+            if lock is not None:
+                locks.append(lock)
+
+        trashes = {path.parent / CLEAN_TRASH_DIRNAME for path in paths}
+
+        for trash in trashes:
+            for leftover, lock in self._lock_leftovers(trash, removals).items():
+                removals[leftover] = leftover
+                locks.append(lock)
+
+        try:
+            if self.opt('background'):
+                # The detached process inherits the locks, and holds them
+                # until it finishes.
+                subprocess.Popen(
+                    ['rm', '-rf', *(str(path) for path in removals)],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                    pass_fds=locks,
+                )
+
+                self.info(
+                    f"Summary: Removing {listed(len(paths), 'workdir')} in the background.",
+                    shift=1,
+                )
+                return True
+
+            with ThreadPoolExecutor(max_workers=CLEAN_WORKERS) as executor:
+                outcomes = list(
+                    executor.map(
+                        lambda removal: self._remove_workdir(removal[1], removal[0]),
+                        removals.items(),
+                    )
+                )
+
+        finally:
+            for lock in locks:
+                os.close(lock)
+
+        # Drop the trash, unless something is left there
+        for trash in trashes:
+            with contextlib.suppress(OSError):
+                trash.rmdir()
+
+        self._show_summary(sum((size for _, size in outcomes), tmt.hardware.UNITS('0 bytes')))
+
+        return all(successful for successful, _ in outcomes)
+
+    def _show_summary(self, total_size: 'Quantity') -> None:
+        """
+        Show how much disk space was freed
+        """
+
+        self.info(
+            f"Summary: {'Would free' if self.is_dry_run else 'Freed'} "
+            f"{tmt.hardware.format_compact(total_size)} "
+            f"of disk space.",
+            shift=1,
+        )
+
     def runs(self, id_: tuple[str, ...], keep: Optional[int]) -> bool:
         """
         Clean workdirs of runs
@@ -3182,29 +3683,31 @@ class Clean(tmt.utils.Common):
             # the correct one.
             last_run = Run(logger=self._logger, cli_invocation=self.cli_invocation)
             last_run.load_workdir(with_logfiles=False)
-            successful, total_size = self._clean_workdir(last_run.run_workdir)
-        else:
-            all_workdirs = list(tmt.utils.generate_runs(self.workdir_root, id_, all_=True))
-            if keep is not None:
-                # Sort by change time of the workdirs and keep the newest workdirs
-                all_workdirs.sort(key=lambda workdir: workdir.stat().st_ctime, reverse=True)
-                all_workdirs = all_workdirs[keep:]
-
-            successful = True
-            total_size = tmt.hardware.UNITS('0 bytes')
-            for workdir in all_workdirs:
-                success, size = self._clean_workdir(workdir)
-                if not success:
-                    successful = False
-                total_size += size  # type: ignore[misc]
+            return self._clean_idle_workdirs([last_run.run_workdir])
 
-        self.info(
-            f"Summary: {'Would free' if self.is_dry_run else 'Freed'} "
-            f"{tmt.hardware.format_compact(total_size)} "
-            f"of disk space.",
-            shift=1,
-        )
-        return successful
+        all_workdirs = list(tmt.utils.generate_runs(self.workdir_root, id_, all_=True))
+        if keep is not None:
+            # Sort by change time of the workdirs and keep the newest workdirs
+            all_workdirs.sort(key=lambda workdir: workdir.stat().st_ctime, reverse=True)
+            all_workdirs = all_workdirs[keep:]
+
+        return self._clean_idle_workdirs(all_workdirs)
+
+    def _clean_idle_workdirs(self, paths: list[Path]) -> bool:
+        """
+        Remove workdirs, except those whose guests may still be stopping
+        """
+
+        idle_paths: list[Path] = []
+
+        for path in paths:
+            if path.resolve() in self._busy_workdirs:
+                self.warn(f"Skipping workdir '{path}', its guests did not stop.", shift=1)
+                continue
+
+            idle_paths.append(path)
+
+        return self._clean_workdirs(idle_paths) and len(idle_paths) == len(paths)
 
 
 def resolve_dynamic_ref(
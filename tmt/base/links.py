@@ -1,4 +1,5 @@
 import re
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union, cast
 
 import fmf.utils
@@ -351,3 +352,142 @@ class Links(SpecBasedContainer[Any, list[_RawLinkRelation]]):
 
     def __bool__(self) -> bool:
         return self.has_link()
+
+
+#: Relations as seen from the other side of the link, from the target.
+INVERSE_RELATIONS: dict[_RawLinkRelationName, _RawLinkRelationName] = {
+    'verifies': 'verified-by',
+    'verified-by': 'verifies',
+    'implements': 'implemented-by',
+    'implemented-by': 'implements',
+    'documents': 'documented-by',
+    'documented-by': 'documents',
+    'blocks': 'blocked-by',
+    'blocked-by': 'blocks',
+    'duplicates': 'duplicated-by',
+    'duplicated-by': 'duplicates',
+    'parent': 'child',
+    'child': 'parent',
+    'relates': 'relates',
+}
+
+
+class LinkIndex:
+    """
+    Reverse index of links defined by nodes of a metadata tree.
+
+    The index maps link targets to nodes linking to them. It is built
+    just once, by inspecting links of all nodes, and then it can answer
+    which nodes link to a given node, or which nodes have links matching
+    a needle, without inspecting links of every single node again.
+
+    Only nodes tmt would turn into tests, plans or stories are indexed,
+    i.e. leaves and nodes picked by the ``select`` directive.
+    """
+
+    def __init__(self, tree: fmf.Tree) -> None:
+        """
+        Index links of all nodes of a given tree
+        """
+
+        #: Indexed nodes, by their names.
+        self.nodes: dict[str, fmf.Tree] = {}
+
+        #: Names of all nodes of the tree, including branches.
+        self.names: set[str] = set()
+
+        #: Names of nodes whose links could not be parsed.
+        self.invalid: set[str] = set()
+
+        # Names of nodes with the given relation and target. The
+        # target is the string matched by needles, i.e. a string target
+        # or a name of the fmf id, and a link serves as a representative
+        # of all links sharing the relation and target.
+        self._groups: dict[tuple[str, Optional[str]], tuple[Link, set[str]]] = {}
+
+        # Links to nodes of the same tree, by names of their targets.
+        self._local: defaultdict[str, list[tuple[str, Link]]] = defaultdict(list)
+
+        from tmt.base.core import FmfId
+
+        for node in tree.climb(whole=True):
+            self.names.add(node.name)
+
+            if not node.select and node.children:
+                continue
+
+            self.nodes[node.name] = node
+
+            raw_links = node.get('link')
+
+            if raw_links is None:
+                continue
+
+            try:
+                links = Links(data=raw_links)
+
+            except Exception:
+                self.invalid.add(node.name)
+                continue
+
+            for link in links.get():
+                if isinstance(link.target, FmfId):
+                    target = link.target.name
+
+                    if link.target.url is None and target is not None:
+                        self._local[target].append((node.name, link))
+
+                else:
+                    target = link.target
+
+                    self._local[target].append((node.name, link))
+
+                _, sources = self._groups.setdefault((link.relation, target), (link, set()))
+                sources.add(node.name)
+
+    def has_node(self, node: fmf.Tree) -> bool:
+        """
+        Check whether the given node has been indexed
+        """
+
+        return self.nodes.get(node.name) is node
+
+    def links_to(
+        self, target: str, relation: Optional[_RawLinkRelationName] = None
+    ) -> list[tuple[str, Link]]:
+        """
+        Find links pointing to a node of the same tree.
+
+        :param target: name of the node links point to.
+        :param relation: if set, only links with this relation are
+            returned.
+        :returns: names of linking nodes and their links.
+        """
+
+        return [
+            (source, link)
+            for source, link in self._local.get(target, [])
+            if relation is None or link.relation == relation
+        ]
+
+    def matching(self, needles: list[LinkNeedle]) -> set[str]:
+        """
+        Find nodes with at least one link matching any of the needles.
+
+        Each distinct relation and target is matched against needles
+        just once, no matter how many nodes share the link.
+
+        :param needles: needles to match links against.
+        :returns: names of nodes with matching links.
+        """
+
+        matched: set[str] = set()
+
+        for link, sources in self._groups.values():
+            if sources <= matched:
+                continue
+
+            if any(needle.matches(link) for needle in needles):
+                matched |= sources
+
+        return matched
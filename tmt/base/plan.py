@@ -5,6 +5,7 @@ import re
 import shutil
 import tempfile
 from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from re import Pattern
 from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union, cast
 
@@ -16,6 +17,7 @@ from fmf.utils import listed  # pyright: ignore[reportUnknownVariableType]
 from ruamel.yaml.error import MarkedYAMLError
 
 import tmt.ansible
+import tmt.durations
 import tmt.export
 import tmt.lint
 import tmt.plugins.plan_shapers
@@ -28,6 +30,7 @@ import tmt.steps.prepare
 import tmt.steps.provision
 import tmt.steps.report
 import tmt.templates
+import tmt.trace
 import tmt.utils
 import tmt.utils.git
 import tmt.utils.jira
@@ -67,6 +70,9 @@ if TYPE_CHECKING:
 #: Filename associated with ``TMT_PLAN_SOURCE_SCRIPT``
 PLAN_SOURCE_SCRIPT_NAME: str = "plan-source-script.sh"
 
+#: Maximal number of remote plan sources fetched at the same time.
+IMPORT_WORKERS: int = tmt.utils.configure_constant(4, 'TMT_PLAN_IMPORT_WORKERS')
+
 
 class _RemotePlanReference(_RawFmfId):
     importing: Optional[str]
@@ -242,6 +248,10 @@ class Plan(
         default_factory=list,
         normalize=tmt.utils.normalize_string_list,
     )
+    test_order: str = field(
+        default=tmt.durations.TEST_ORDERS[0],
+        normalize=tmt.durations.normalize_test_order,
+    )
 
     # Optional Login instance attached to the plan for easy login in tmt try
     login: Optional[tmt.steps.Login] = None
@@ -280,6 +290,7 @@ class Plan(
         'environment-file',
         'gate',
         'ansible',
+        'test-order',
     ]
 
     def __init__(
@@ -1303,7 +1314,8 @@ class Plan(
         abort = False
         try:
             for step in self.steps(skip=['cleanup']):
-                step.go()
+                with tmt.trace.span(step.name, category='step'):
+                    step.go()
 
                 if isinstance(step, tmt.steps.discover.Discover):
                     tests = step.tests()
@@ -1333,10 +1345,12 @@ class Plan(
             if not abort:
                 try:
                     if self.report.enabled and self.report.status() != "done":
-                        self.report.go()
+                        with tmt.trace.span(self.report.name, category='step'):
+                            self.report.go()
                 finally:
                     if self.cleanup.enabled:
-                        self.cleanup.go()
+                        with tmt.trace.span(self.cleanup.name, category='step'):
+                            self.cleanup.go()
 
     def _export(
         self, *, keys: Optional[list[str]] = None, include_internal: bool = False
@@ -1391,12 +1405,12 @@ class Plan(
             if reference.name_pattern.match(node.name) is not None:  # pyright: ignore[reportUnknownArgumentType]
                 yield node
 
-    def _resolve_import_from_git(self, reference: RemotePlanReference) -> Iterator[fmf.Tree]:
+    def _fetch_import_from_git(self, reference: RemotePlanReference) -> fmf.Tree:
         """
-        Discover plan-like nodes matching the given reference in its git repo.
+        Fetch the fmf tree of the given reference from its git repo.
 
-        The referenced git repository is cloned, and we will look for
-        plan-like fmf nodes in it.
+        The referenced git repository is cloned, and the fmf tree is
+        built from the requested ref and path.
         """
 
         # TODO: consider better type than inheriting from fully optional fmf id...
@@ -1422,14 +1436,14 @@ class Plan(
         if reference.path:
             destination = destination / reference.path.unrooted()
 
-        yield from self._resolve_import_to_nodes(reference, fmf.Tree(str(destination)))
+        return fmf.Tree(str(destination))
 
-    def _resolve_import_from_fmf_cache(self, reference: RemotePlanReference) -> Iterator[fmf.Tree]:
+    def _fetch_import_from_fmf_cache(self, reference: RemotePlanReference) -> fmf.Tree:
         """
-        Discover plan-like nodes matching the given reference in fmf cache.
+        Fetch the fmf tree of the given reference from fmf cache.
         """
 
-        # TODO: similar situation as in _resolve_import_from_git
+        # TODO: similar situation as in _fetch_import_from_git
         assert reference.url is not None
 
         if str(reference.ref).startswith('@'):
@@ -1455,20 +1469,36 @@ class Plan(
 
                 reference.resolve_dynamic_ref(tmpdirname, self)
 
-        yield from self._resolve_import_to_nodes(
-            reference,
-            fmf.utils.fetch_tree(
-                tmt.utils.git.clonable_git_url(reference.url),
-                reference.ref,
-                str(reference.path.unrooted()) if reference.path else '.',
-            ),
+        return fmf.utils.fetch_tree(
+            tmt.utils.git.clonable_git_url(reference.url),
+            reference.ref,
+            str(reference.path.unrooted()) if reference.path else '.',
         )
 
-    def _resolve_import_reference(self, reference: RemotePlanReference) -> list['Plan']:
+    def _fetch_import_tree(self, reference: RemotePlanReference) -> fmf.Tree:
+        """
+        Fetch the fmf tree providing plans of the given reference.
+        """
+
+        # Clone the whole git repository if executing tests (run is attached)
+        if self.my_run:
+            return self._fetch_import_from_git(reference)
+
+        # Use fmf cache for exploring plans (the whole git repo is not needed)
+        return self._fetch_import_from_fmf_cache(reference)
+
+    def _resolve_import_reference(
+        self,
+        reference: RemotePlanReference,
+        fetched_tree: Optional['Future[fmf.Tree]'] = None,
+    ) -> list['Plan']:
         """
         Discover and import plans matching a given remote plan reference.
 
         :param reference: identifies one or more plans to import.
+        :param fetched_tree: if set, the fmf tree of the reference has
+            been already fetched, and it will be used instead of
+            fetching it again.
         :returns: list of imported plans.
         """
 
@@ -1594,23 +1624,23 @@ class Plan(
             return [plan for _, plan in imported_plans]
 
         try:
-            # Clone the whole git repository if executing tests (run is attached)
-            if self.my_run:
-                nodes = self._resolve_import_from_git(reference)
-
-            # Use fmf cache for exploring plans (the whole git repo is not needed)
-            else:
-                nodes = self._resolve_import_from_fmf_cache(reference)
+            tree = (
+                fetched_tree.result()
+                if fetched_tree is not None
+                else self._fetch_import_tree(reference)
+            )
 
-            return _generate_plans(nodes)
+            return _generate_plans(self._resolve_import_to_nodes(reference, tree))
 
         except Exception as exc:
             raise GeneralError(f"Failed to import remote plan from '{self.name}'.") from exc
 
-    def resolve_imports(self) -> list['Plan']:
+    def resolve_imports(self, imported_trees: Optional['ImportedTrees'] = None) -> list['Plan']:
         """
         Resolve possible references to remote plans.
 
+        :param imported_trees: if set, fmf trees fetched in advance
+            would be used instead of fetching them again.
         :returns: one or more plans **replacing** the current one. The
             current plan may also be one of the returned ones.
         """
@@ -1624,8 +1654,10 @@ class Plan(
             return []
 
         if not self._imported_plans:
-            for reference in self._imported_plan_references:
-                for imported_plan in self._resolve_import_reference(reference):
+            for index, reference in enumerate(self._imported_plan_references):
+                fetched_tree = imported_trees.get(self, index) if imported_trees else None
+
+                for imported_plan in self._resolve_import_reference(reference, fetched_tree):
                     imported_plan._original_plan = self
                     imported_plan._original_plan_fmf_id = self.fmf_id
 
@@ -1751,4 +1783,88 @@ class Plan(
         step.add_phase(phase)
 
 
+class ImportedTrees:
+    """
+    Fmf trees providing plans to remote plan references.
+
+    Plans importing from the same repository, ref and path share the
+    same tree, which is fetched and parsed just once. Unique trees are
+    fetched in parallel.
+
+    :param workers: maximal number of trees fetched at the same time.
+    :param logger: used for logging.
+    """
+
+    def __init__(self, *, workers: int = IMPORT_WORKERS, logger: 'tmt.log.Logger') -> None:
+        self._workers = workers
+        self._logger = logger
+
+        self._trees: dict[tuple[str, int], Future[fmf.Tree]] = {}
+
+    @staticmethod
+    def _source_key(plan: Plan, index: int, reference: RemotePlanReference) -> tuple[str, ...]:
+        # A dynamic ref is resolved with respect to the importing plan, its
+        # tree cannot be shared with other plans.
+        if reference.ref and reference.ref.startswith('@'):
+            return ('plan', plan.name, str(index))
+
+        return (
+            'source',
+            str(reference.url),
+            str(reference.ref),
+            str(reference.path.unrooted()) if reference.path else '.',
+        )
+
+    def fetch(self, plans: Iterable[Plan]) -> None:
+        """
+        Fetch trees of all remote plan references of given plans.
+
+        Failures are not reported by this method. They are saved, and
+        reported once the tree is requested by :py:meth:`get`.
+
+        :param plans: plans whose remote plan references should be
+            fetched.
+        """
+
+        sources: dict[tuple[str, ...], Future[fmf.Tree]] = {}
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            for plan in plans:
+                # Plans would refuse to import in dry mode, and references
+                # without URL or name would be reported by the plan itself.
+                if not plan.is_remote_plan_reference or plan.is_dry_run:
+                    continue
+
+                for index, reference in enumerate(plan._imported_plan_references):
+                    if reference.url is None or reference.name is None:
+                        continue
+
+                    key = self._source_key(plan, index, reference)
+
+                    if key not in sources:
+                        sources[key] = executor.submit(
+                            tmt.trace.propagate(plan._fetch_import_tree), reference
+                        )
+
+                    self._trees[plan.name, index] = sources[key]
+
+        self._logger.debug(
+            f"Fetched {len(sources)} unique trees for {len(self._trees)} remote plan references.",
+            level=3,
+        )
+
+    def get(self, plan: Plan, index: int) -> Optional['Future[fmf.Tree]']:
+        """
+        Get the tree fetched for a remote plan reference.
+
+        :param plan: the importing plan.
+        :param index: index of the reference among references of the plan.
+        :returns: a future holding either the tree or the exception
+            raised while fetching it, or ``None`` if the tree has not
+            been fetched.
+        """
+
+        return self._trees.get((plan.name, index))
+
+
 Plan.discover_linters()
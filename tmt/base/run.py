@@ -1,5 +1,4 @@
 import functools
-import os
 import re
 import shutil
 import sys
@@ -28,6 +27,7 @@ import tmt.steps.prepare
 import tmt.steps.provision
 import tmt.steps.scripts
 import tmt.templates
+import tmt.trace
 import tmt.utils
 from tmt.base.core import Tree
 from tmt.container import (
@@ -222,7 +222,9 @@ class Run(HasRunWorkdir, HasUserAnchorPath, HasEnvironment, tmt.utils.Common):
         """
 
         return self.write_file(
-            Path(f'{filepath}{self.state_format.suffix}'), self.state_format.to_state(data)
+            Path(f'{filepath}{self.state_format.suffix}'),
+            self.state_format.to_state(data),
+            atomic=True,
         )
 
     def load_workdir(self, *, with_logfiles: bool = True) -> None:
@@ -573,29 +575,15 @@ class Run(HasRunWorkdir, HasUserAnchorPath, HasEnvironment, tmt.utils.Common):
 
     def follow(self) -> None:
         """
-        Periodically check for new lines in the log.
-        """
-        with open(self.run_workdir / tmt.log.LOG_FILENAME) as logfile:
-            # Move to the end of the file
-            logfile.seek(0, os.SEEK_END)
-            # Rewind some lines back to show more context
-            location = logfile.tell()
-            read_lines = 0
-            while location >= 0:
-                logfile.seek(location)
-                location -= 1
-                current_char = logfile.read(1)
-                if current_char == '\n':
-                    read_lines += 1
-                if read_lines > FOLLOW_LINES:
-                    break
-
-            while True:
-                line = logfile.readline()
-                if line:
-                    print(line, end='')
-                else:
-                    time.sleep(0.5)
+        Output new lines of the log as they appear.
+        """
+
+        from tmt.utils.log_scanner import LogFollower
+
+        follower = LogFollower({self.run_workdir / tmt.log.LOG_FILENAME: ''}, lines=FOLLOW_LINES)
+
+        for line in follower.follow():
+            print(line, flush=True)
 
     def show_runner(self, logger: tmt.log.Logger) -> None:
         """
@@ -742,7 +730,8 @@ class Run(HasRunWorkdir, HasUserAnchorPath, HasEnvironment, tmt.utils.Common):
             plan = cast(list[Plan], self.plan_queue).pop(0)
 
             try:
-                plan.go()
+                with tmt.trace.span(plan.name, category='plan', plan=plan.name):
+                    plan.go()
 
             except Exception as error:
                 if self.opt('on-plan-error') == 'quit':
@@ -9,6 +9,7 @@ import jinja2
 
 import tmt.log
 import tmt.utils
+import tmt.utils.log_scanner
 import tmt.utils.themes
 from tmt.checks import Check, CheckPlugin, _RawCheck, provides_check
 from tmt.container import container, field
@@ -296,8 +297,13 @@ def create_final_report(
 
         if output.stdout:
             # ausearch returns complete audit events which could contain multiple message types.
-            # Filter them to keep only message types we are interested in.
-            denials = [line for line in output.stdout.splitlines() if DENIAL_PATTERN.match(line)]
+            # Filter them to keep only message types we are interested in. All denials are
+            # collected, any of them may be the one not matching ignore patterns.
+            denials = tmt.utils.log_scanner.grep(
+                tmt.utils.log_scanner.iter_text_lines(output.stdout),
+                [DENIAL_PATTERN],
+                max_lines=None,
+            )
             if denials and check.ignore_pattern:
                 filtered_denials: list[str] = []
                 for denial in denials:
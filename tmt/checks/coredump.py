@@ -1,23 +1,72 @@
 import re
+import textwrap
 from re import Pattern
+from shlex import quote
 from time import sleep
 from typing import TYPE_CHECKING, Optional
 
+import tmt.hardware
 import tmt.log
 import tmt.utils
 from tmt.checks import Check, CheckPlugin, _RawCheck, provides_check
 from tmt.container import container, field
 from tmt.result import CheckResult, ResultOutcome, save_failures
-from tmt.utils import Command, Path, ShellScript
+from tmt.utils import Path, ShellScript
 from tmt.utils.environment import Environment
 
 if TYPE_CHECKING:
     from tmt.guest import Guest
+    from tmt.hardware.constraints import Size
     from tmt.steps.execute import TestInvocation
 
 
 COREDUMP_LAST_DUMP_FILENAME = "coredump-latest"
 
+#: Coredumps larger than this are not saved whole by default, only their
+#: backtrace and a truncated dump are saved.
+DEFAULT_DUMP_SIZE_LIMIT: 'Size' = tmt.hardware.UNITS('100 MB')
+
+#: Marks the beginning of each crash in the metadata collected on the guest.
+COREDUMP_METADATA_MARKER = '@@tmt-coredump@@'
+
+#: Shell functions saving info and coredump of a crash on the guest.
+#: Coredumps are compressed, and coredumps larger than the limit are
+#: replaced by their backtrace and a truncated coredump.
+COREDUMP_RETRIEVE_FUNCTIONS = """
+if command -v zstd >/dev/null 2>&1; then
+    compress() {{ {sudo} zstd -q -f --rm "$1"; }}
+elif command -v xz >/dev/null 2>&1; then
+    compress() {{ {sudo} xz -f "$1"; }}
+else
+    compress() {{ {sudo} gzip -f "$1"; }}
+fi
+
+retrieve() {{
+    {sudo} coredumpctl info --all --no-pager "$1" > "$2.txt"
+
+    [ "$3" = yes ] || return 0
+
+    if ! {sudo} coredumpctl dump --all -o "$2.core" "$1" >/dev/null; then
+        echo "Failed to save coredump for PID $1" >&2
+        {sudo} rm -f "$2.core"
+        return 0
+    fi
+
+    if [ "$({sudo} stat -c %s "$2.core")" -le {size_limit} ]; then
+        compress "$2.core"
+        return 0
+    fi
+
+    {sudo} coredumpctl debug --all --no-pager \\
+        --debugger-arguments="-batch -ex 'thread apply all bt'" "$1" \\
+        > "$2.backtrace.txt" 2>&1 < /dev/null || rm -f "$2.backtrace.txt"
+
+    {sudo} head -c {size_limit} "$2.core" > "$2.truncated.core"
+    {sudo} rm -f "$2.core"
+    compress "$2.truncated.core"
+}}
+"""
+
 # Can be set in /etc/coredumpct.conf.d/
 # See `man coredump.conf`
 COREDUMP_CONFIG = """[Coredump]
@@ -26,6 +75,68 @@ Compress=yes
 """
 
 
+@container
+class Crash:
+    """A crash caught by systemd-coredump."""
+
+    pid: str
+    signal: str
+    corefile: str
+    executable: str
+
+    #: Output of ``coredumpctl info`` describing the crash.
+    info: str = ''
+
+    @property
+    def has_dump(self) -> bool:
+        """Whether the coredump of the crash has been stored."""
+        return self.corefile not in ("none", "missing")
+
+    @property
+    def basename(self) -> str:
+        """Base name of files saved for the crash."""
+        return f"dump.{self.executable.replace('/', '_')}_{self.signal}_{self.pid}"
+
+
+def _parse_crashes(output: str, logger: tmt.log.Logger) -> list[Crash]:
+    """
+    Parse crash metadata collected on the guest.
+
+    Each crash starts with a marker line followed by its line from
+    ``coredumpctl list``, and the output of ``coredumpctl info``
+    follows.
+    """
+    marker = f'{COREDUMP_METADATA_MARKER} '
+
+    crashes: list[Crash] = []
+    crash: Optional[Crash] = None
+    info_lines: list[str] = []
+
+    for line in [*output.splitlines(), marker]:
+        if not line.startswith(marker):
+            info_lines.append(line)
+            continue
+
+        if crash is not None:
+            crash.info = '\n'.join(info_lines).strip()
+
+        info_lines = []
+        crash = None
+
+        fields = line.removeprefix(marker).split()
+        if not fields:
+            continue
+
+        if len(fields) < 10:  # Ensure we have enough fields
+            logger.debug(f"Skipping malformed coredump line: {line}")
+            continue
+
+        crash = Crash(pid=fields[4], signal=fields[7], corefile=fields[8], executable=fields[9])
+        crashes.append(crash)
+
+    return crashes
+
+
 @container
 class CoredumpCheck(Check):
     """Configuration for the coredump check."""
@@ -46,6 +157,21 @@ class CoredumpCheck(Check):
         unserialize=lambda serialized: [re.compile(pattern) for pattern in serialized],
     )
 
+    dump_size_limit: 'Size' = field(
+        default=DEFAULT_DUMP_SIZE_LIMIT,
+        metavar='SIZE',
+        help=f"""
+             Coredumps up to this size are saved whole. Larger coredumps
+             are not, their backtrace and the beginning of the coredump,
+             truncated to this size, are saved instead. The default limit
+             is {DEFAULT_DUMP_SIZE_LIMIT}.
+             """,
+        normalize=tmt.utils.normalize_data_amount,
+        serialize=lambda limit: str(limit),
+        unserialize=lambda serialized: tmt.hardware.UNITS(serialized),
+        exporter=lambda limit: str(limit),
+    )
+
     # Internal flag to track if we can run coredumpctl on the host
     is_available: bool = True
     is_availability_reason: Optional[str] = None
@@ -61,6 +187,7 @@ class CoredumpCheck(Check):
         spec["ignore-pattern"] = [  # type: ignore[reportGeneralTypeIssues,typeddict-unknown-key,unused-ignore]
             pattern.pattern for pattern in self.ignore_pattern
         ]
+        spec["dump-size-limit"] = str(self.dump_size_limit)  # type: ignore[reportGeneralTypeIssues,typeddict-unknown-key,unused-ignore]
 
         return spec
 
@@ -260,126 +387,95 @@ class CoredumpCheck(Check):
 
         logger.debug(f"Timed out after {total_wait}s waiting for systemd-coredump processes")
 
-    def _get_crashes(
+    def _list_crashes(
         self,
         guest: "Guest",
         logger: tmt.log.Logger,
-        check_files_path: Path,
         previous_dumps_file: Path,
-    ) -> list[str]:
+    ) -> list[Crash]:
         """
-        Get any new crashes that have been detected since the test started.
+        Get metadata of all crashes detected since the test started.
 
         Uses the timestamp of the latest coredump before the test to identify
-        new coredumps created during test execution.
+        new coredumps created during test execution. Metadata of all new
+        coredumps are collected by a single guest command.
         """
         # Make sure dumps are processed
         self._wait_for_coredump_processes(guest, logger)
 
-        try:
-            # Get the timestamp of the latest coredump before the test
-            latest_timestamp = ""
-            try:
-                previous_output = guest.execute(Command("cat", previous_dumps_file)).stdout
-                if previous_output:
-                    # The output should contain just one line for the latest coredump
-                    # Extract the timestamp (first two fields) if we have data
-                    fields = previous_output.strip().split()
-                    if len(fields) >= 2:
-                        # Combine the date and time fields as the timestamp
-                        latest_timestamp = f"{fields[0]} {fields[1]}"
-                        logger.debug(
-                            f"Latest coredump before test had timestamp: {latest_timestamp}"
-                        )
-            except tmt.utils.RunError:
-                logger.debug("Unable to read previous dumps file, assuming no prior coredumps")
+        sudo = guest.facts.sudo_prefix
+
+        # Get list of coredumps newer than the latest one before the test,
+        # followed by detailed info of each of them. The output should
+        # contain just one line for the latest coredump before the test,
+        # the timestamp is its first two fields. Use --all to check
+        # coredumps from all users, not just current user.
+        script = ShellScript(
+            textwrap.dedent(f"""
+                since="$(awk 'NF >= 2 {{ print $1 " " $2; exit }}' {quote(str(previous_dumps_file))} 2>/dev/null)"
+                {sudo} coredumpctl list --all --no-legend --no-pager ${{since:+--since="$since"}} 2>/dev/null \\
+                | while read -r line; do
+                    echo "{COREDUMP_METADATA_MARKER} $line"
+                    {sudo} coredumpctl info --all --no-pager "$(echo "$line" | awk '{{ print $5 }}')" 2>/dev/null
+                done
+                true
+            """)  # noqa: E501
+        )
 
-            # Get list of coredumps newer than the latest one before the test
-            # Use --all to check coredumps from all users, not just current user
-            cmd = f"{guest.facts.sudo_prefix} coredumpctl list --all --no-legend --no-pager"
-            if latest_timestamp:
-                cmd = f'{cmd} --since="{latest_timestamp}"'
-                logger.debug(f"Checking for coredumps newer than: {latest_timestamp}")
-            else:
-                # If we have no prior timestamp, get all coredumps
-                logger.debug("No prior coredumps found, checking all available coredumps")
-
-            output = guest.execute(ShellScript(cmd), silent=True).stdout
-
-            if not output:
-                return []
-
-            # Process each crash entry
-            crashes: list[str] = []
-            for line in output.splitlines():
-                fields = line.split()
-                if len(fields) < 10:  # Ensure we have enough fields
-                    logger.debug(f"Skipping malformed coredump line: {line}")
-                    continue
-
-                pid = fields[4]
-                sig = fields[7]
-                corefile = fields[8]
-                exe = fields[9].replace("/", "_")
-
-                # We're now using the timestamp to filter,
-                # so all dumps in this list are already post-test
-
-                # Get detailed info for this crash (use --all to ensure we can access it)
-                cmd = f"{guest.facts.sudo_prefix} coredumpctl info --all --no-pager {pid}"
-                crash_info = guest.execute(ShellScript(cmd)).stdout
-                if not crash_info:
-                    logger.debug(f"No crash info available for PID {pid}")
-                    continue
-
-                # Skip if this crash matches any ignore pattern
-                if self.ignore_pattern:
-                    matching_pattern = next(
-                        (pattern for pattern in self.ignore_pattern if pattern.search(crash_info)),
-                        None,
-                    )
-                    if matching_pattern:
-                        logger.info(
-                            f"Ignoring crash in PID {pid} ({exe}) due to pattern match: '{matching_pattern.pattern}'"  # noqa: E501
-                        )
-                        # Log full crash info at debug level
-                        logger.debug(f"Full ignored crash info: {crash_info}")
-                        continue
-
-                # Save the crash info (with --all to ensure we can access it)
-                info_filepath = check_files_path / f"dump.{exe}_{sig}_{pid}.txt"
-                guest.execute(
-                    ShellScript(
-                        f"sh -c {guest.facts.sudo_prefix} coredumpctl info --all --no-pager {pid} > {info_filepath!s}"  # noqa: E501
-                    )
-                )
-                logger.debug(f"Saved crash info to {info_filepath}")
-
-                # Try to save the coredump if available
-                if corefile not in ("none", "missing"):
-                    dump_filename = f"dump.{exe}_{sig}_{pid}.core"
-                    dump_path = check_files_path / dump_filename
-                    try:
-                        guest.execute(
-                            ShellScript(
-                                f"{guest.facts.sudo_prefix} coredumpctl dump --all --no-pager -o {dump_path!s} {pid}"  # noqa: E501
-                            )
-                        )
-                        logger.debug(f"Saved coredump to {dump_path}")
-                    except tmt.utils.RunError as exc:
-                        logger.debug(f"Failed to save coredump for PID {pid}: {exc}")
-                else:
-                    logger.debug(f"Skipping dump for PID {pid}, corefile status: {corefile}")
-
-                # This is a new, non-ignored crash
-                crashes.append(crash_info)
-
-            return crashes
+        try:
+            output = guest.execute(script, silent=True).stdout
 
         except tmt.utils.RunError as exc:
             logger.debug(f"Failed to check for crashes: {exc}")
             return []
 
+        return _parse_crashes(output or '', logger)
+
+    def _retrieve_crashes(
+        self,
+        guest: "Guest",
+        logger: tmt.log.Logger,
+        check_files_path: Path,
+        crashes: list[Crash],
+    ) -> list[Path]:
+        """
+        Save crash info and coredumps on the guest, and list all check files.
+
+        Coredumps are compressed on the guest, to reduce the amount of
+        data transferred to the host. Coredumps larger than
+        ``dump-size-limit`` are not saved whole, their backtrace and a
+        truncated dump are saved instead.
+
+        :returns: paths to all files in the check directory on the guest.
+        """
+
+        sudo = guest.facts.sudo_prefix
+        size_limit = int(self.dump_size_limit.to('bytes').magnitude)
+
+        script = ShellScript(
+            '\n'.join(
+                [
+                    f'cd {quote(str(check_files_path))} || exit 1',
+                    COREDUMP_RETRIEVE_FUNCTIONS.format(sudo=sudo, size_limit=size_limit),
+                    *(
+                        f'retrieve {quote(crash.pid)} {quote(crash.basename)} '
+                        f'{"yes" if crash.has_dump else "no"}'
+                        for crash in crashes
+                    ),
+                    'find "$PWD" -type f',
+                ]
+            )
+        )
+
+        try:
+            output = guest.execute(script).stdout
+
+        except tmt.utils.RunError as exc:
+            logger.debug(f"Failed to save coredumps: {exc}")
+            return []
+
+        return [Path(line) for line in (output or '').splitlines() if line.strip()]
+
     def _check_coredump(
         self, invocation: "TestInvocation", logger: tmt.log.Logger
     ) -> tuple[ResultOutcome, list[Path]]:
@@ -389,32 +485,48 @@ class CoredumpCheck(Check):
         :returns: A tuple of (outcome, log_files) where log_files is a list of
                  paths to files with coredump information and potential failures.
         """
-        log_files: list[Path] = []
+        crashes: list[Crash] = []
 
         # Check for crashes by comparing with the saved file of previous dumps
-        crashes = self._get_crashes(
-            invocation.guest,
-            logger,
-            invocation.check_files_path,
-            self.coredump_last_dumps_filepath,
-        )
-
-        # Get list of generated files
-        try:
-            files_output = invocation.guest.execute(
-                Command("find", invocation.check_files_path, "-type", "f")
-            ).stdout
-
-            if files_output:
-                for file_path in files_output.splitlines():
-                    path = Path(file_path)
-                    if path.exists() and invocation.phase.step_workdir:
-                        rel_path = path.relative_to(invocation.phase.step_workdir)
-                        log_files.append(rel_path)
-        except tmt.utils.RunError:
-            logger.debug("Failed to list coredump files")
+        for crash in self._list_crashes(
+            invocation.guest, logger, self.coredump_last_dumps_filepath
+        ):
+            if not crash.info:
+                logger.debug(f"No crash info available for PID {crash.pid}")
+                continue
+
+            # Skip if this crash matches any ignore pattern
+            matching_pattern = next(
+                (pattern for pattern in self.ignore_pattern if pattern.search(crash.info)),
+                None,
+            )
+            if matching_pattern:
+                logger.info(
+                    f"Ignoring crash in PID {crash.pid} ({crash.executable}) "
+                    f"due to pattern match: '{matching_pattern.pattern}'"
+                )
+                # Log full crash info at debug level
+                logger.debug(f"Full ignored crash info: {crash.info}")
+                continue
+
+            # This is a new, non-ignored crash
+            crashes.append(crash)
+
+        # Save info and dumps of crashes, get list of generated files.
+        # Files are fetched from the guest after the check.
+        log_files = [
+            path.relative_to(invocation.phase.step_workdir)
+            for path in self._retrieve_crashes(
+                invocation.guest, logger, invocation.check_files_path, crashes
+            )
+            if invocation.phase.step_workdir and path.is_relative_to(invocation.phase.step_workdir)
+        ]
 
-        log_files.append(save_failures(invocation, invocation.check_files_path, crashes))
+        log_files.append(
+            save_failures(
+                invocation, invocation.check_files_path, [crash.info for crash in crashes]
+            )
+        )
 
         if crashes:
             return ResultOutcome.FAIL, log_files
@@ -484,6 +596,19 @@ class Coredump(CheckPlugin[CoredumpCheck]):
               - 'Process.*\\(sleep\\).*dumped core'  # Ignore sleep crashes
               - 'Package: ddcutil/2.1.2-2.fc41'      # Ignore dumps of a specific package
 
+    Crash info and coredumps are saved on the guest and fetched with
+    other test files. Coredumps are compressed on the guest first, with
+    ``zstd`` or ``xz`` if available, ``gzip`` otherwise. Coredumps
+    larger than ``dump-size-limit`` are not saved whole, their
+    backtrace, if ``gdb`` is available, and the coredump truncated to
+    the limit are saved instead:
+
+    .. code-block:: yaml
+
+        check:
+          - how: coredump
+            dump-size-limit: 1 GB
+
     The patterns are matched against the full coredumpctl info output, which includes
     fields like Process, Command Line, Signal, etc. You can use 'coredumpctl info'
     to see the available fields and their format.
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Optional
 import tmt.guest
 import tmt.log
 import tmt.utils
+import tmt.utils.log_scanner
 import tmt.utils.themes
 from tmt.checks import Check, CheckEvent, CheckPlugin, _RawCheck, provides_check
 from tmt.container import container, field
@@ -60,11 +61,9 @@ class DmesgCheck(Check):
         return self.to_spec()
 
     def _extract_failures(self, text: str) -> list[str]:
-        return [
-            line
-            for line in text.splitlines()
-            if any(pattern.search(line) for pattern in self.failure_pattern)
-        ]
+        return tmt.utils.log_scanner.grep(
+            tmt.utils.log_scanner.iter_text_lines(text), self.failure_pattern
+        )
 
     @classmethod
     def _fetch_dmesg(
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Optional
 
 import tmt.log
 import tmt.utils
+import tmt.utils.log_scanner
 from tmt.checks import Check, CheckPlugin, _RawCheck, provides_check
 from tmt.container import container, field
 from tmt.result import CheckResult, ResultOutcome, save_failures
@@ -93,12 +94,11 @@ class JournalCheck(Check):
         return self.to_spec()
 
     def _extract_failures(self, text: str) -> list[str]:
-        return [
-            line
-            for line in text.splitlines()
-            if any(pattern.search(line) for pattern in self.failure_pattern)
-            and not any(pattern.search(line) for pattern in self.ignore_pattern)
-        ]
+        return tmt.utils.log_scanner.grep(
+            tmt.utils.log_scanner.iter_text_lines(text),
+            self.failure_pattern,
+            ignore_patterns=self.ignore_pattern,
+        )
 
     def _configure_journal(self, guest: 'Guest', logger: tmt.log.Logger) -> None:
         """
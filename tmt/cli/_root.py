@@ -30,6 +30,7 @@ import tmt.plugins.plan_shapers
 import tmt.policy
 import tmt.steps
 import tmt.templates
+import tmt.trace
 import tmt.utils
 import tmt.utils.jira
 from tmt.cli import CliInvocation, Context, ContextObject, CustomGroup, pass_context
@@ -151,6 +152,22 @@ def _load_policies(
     is_flag=True,
     help='If set, logging messages on the terminal would contain timestamps.',
 )
+@option(
+    '--trace-file',
+    metavar='PATH',
+    help="""
+         If set, durations of steps, phases, tests, guest commands and other activities
+         would be traced and saved into this file in Chrome trace event format.
+         """,
+)
+@option(
+    '--trace-otlp-file',
+    metavar='PATH',
+    help="""
+         If set, durations of steps, phases, tests, guest commands and other activities
+         would be traced and saved into this file in OpenTelemetry OTLP JSON format.
+         """,
+)
 @option(
     '--version',
     is_flag=True,
@@ -183,6 +200,8 @@ def main(
     force_color: bool,
     show_time: bool,
     pre_check: bool,
+    trace_file: Optional[str],
+    trace_otlp_file: Optional[str],
     **kwargs: Any,
 ) -> None:
     """
@@ -209,6 +228,21 @@ def main(
     # Propagate color setting to Click as well.
     click_contex.color = apply_colors_output
 
+    # Collect spans until the very end, when the context is closed. The
+    # top-level span is closed as a resource of the context, i.e. before
+    # the callback saving spans is called.
+    if trace_file or trace_otlp_file:
+        tracer = tmt.trace.enable()
+
+        click_contex.call_on_close(
+            lambda: tracer.save(
+                chrome_trace_path=Path(trace_file).resolve() if trace_file else None,
+                otlp_path=Path(trace_otlp_file).resolve() if trace_otlp_file else None,
+                logger=logger,
+            )
+        )
+        click_contex.with_resource(tmt.trace.span('tmt', category='tmt'))
+
     # ignore[reportConstantRedefinition]: it looks like a constant, but
     # this redefinition is expected and on purpose. `EXCEPTION_LOGGER`
     # starts with the bootstrap logger, but now we constructed a better
@@ -1694,6 +1728,11 @@ CLEAN_RESOURCES: list[str] = ["guests", "runs", "images"]
     help='The resources which should be kept on the disk.',
     multiple=True,
 )
+@option(
+    '--background',
+    is_flag=True,
+    help='Remove workdirs of runs by a detached process, do not wait for it to finish.',
+)
 @workdir_root_options
 @verbosity_options
 @dry_options
@@ -1809,6 +1848,11 @@ def perform_clean(
     default=None,
     help='The number of latest workdirs to keep, clean the rest.',
 )
+@option(
+    '--background',
+    is_flag=True,
+    help='Remove workdirs by a detached process, do not wait for it to finish.',
+)
 @verbosity_options
 @dry_options
 def clean_runs(
@@ -1822,7 +1866,9 @@ def clean_runs(
     """
     Clean workdirs of past runs.
 
-    Remove all runs in '/var/tmp/tmt' by default.
+    Remove all runs in '/var/tmp/tmt' by default. Workdirs are moved
+    aside first, so they disappear at once, and then removed in
+    parallel.
     """
 
     defined = [last is True, bool(id_), keep is not None]
@@ -35,6 +35,7 @@ def _render_plugins_list_rest(logger: tmt.log.Logger) -> str:
         r'test.check': 'Test check plugins',
         r'test.framework': 'Test framework plugins',
         r'package_managers': 'Package manager plugins',
+        r'plan_shapers\.shards\.history': 'Plan shard duration history sources',
         r'plan_shapers': 'Plan shapers',
         r'prepare.feature': 'prepare/feature plugins',
         r'prepare.install': 'prepare/install plugins',
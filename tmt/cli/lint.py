@@ -8,6 +8,8 @@ import tmt.base.core
 import tmt.base.plan
 import tmt.lint
 import tmt.log
+import tmt.utils.git
+from tmt._compat.pathlib import Path
 from tmt.cli import Context, pass_context
 from tmt.cli._root import (
     filtering_options,
@@ -22,28 +24,20 @@ from tmt.cli._root import (
 )
 
 
-def _apply_linters(
-    lintable: Union[
-        tmt.lint.Lintable[tmt.base.core.Test],
-        tmt.lint.Lintable[tmt.base.plan.Plan],
-        tmt.lint.Lintable[tmt.base.core.Story],
-        tmt.lint.Lintable[tmt.base.core.LintableCollection],
-    ],
-    linters: list[tmt.lint.Linter],
+def _filter_rulings(
+    valid: bool,
+    rulings: list[tmt.lint.LinterRuling],
     failed_only: bool,
-    enforce_checks: list[str],
     outcomes: list[tmt.lint.LinterOutcome],
-) -> tuple[bool, Optional[list[tmt.lint.LinterRuling]]]:
+) -> Optional[list[tmt.lint.LinterRuling]]:
     """
-    Apply linters on a lintable and filter out disallowed outcomes.
+    Filter out disallowed outcomes of linters applied on a lintable.
     """
 
-    valid, rulings = lintable.lint(linters=linters, enforce_checks=enforce_checks or None)
-
     # If the object pass the checks, and we're asked to show only the failed
     # ones, display nothing.
     if valid and failed_only:
-        return valid, None
+        return None
 
     # Find out what rulings were allowed by user. By default, it's all, but
     # user might be interested in "warn" only, for example. Reduce the list
@@ -52,9 +46,33 @@ def _apply_linters(
     allowed_rulings = list(tmt.lint.filter_allowed_checks(rulings, outcomes=outcomes))
 
     if not allowed_rulings and outcomes:
-        return valid, None
+        return None
+
+    return allowed_rulings
+
+
+def _apply_linters(
+    lintable: Union[
+        tmt.lint.Lintable[tmt.base.core.Test],
+        tmt.lint.Lintable[tmt.base.plan.Plan],
+        tmt.lint.Lintable[tmt.base.core.Story],
+        tmt.lint.Lintable[tmt.base.core.LintableCollection],
+    ],
+    linters: list[tmt.lint.Linter],
+    failed_only: bool,
+    enforce_checks: list[str],
+    outcomes: list[tmt.lint.LinterOutcome],
+    timings: Optional[tmt.lint.LinterTimings] = None,
+) -> tuple[bool, Optional[list[tmt.lint.LinterRuling]]]:
+    """
+    Apply linters on a lintable and filter out disallowed outcomes.
+    """
 
-    return valid, allowed_rulings
+    valid, rulings = lintable.lint(
+        linters=linters, enforce_checks=enforce_checks or None, timings=timings
+    )
+
+    return valid, _filter_rulings(valid, rulings, failed_only, outcomes)
 
 
 def _lint_class(
@@ -65,6 +83,9 @@ def _lint_class(
     disable_checks: list[str],
     enforce_checks: list[str],
     outcomes: list[tmt.lint.LinterOutcome],
+    changed_files: Optional[set[Path]],
+    workers: int,
+    timings: Optional[tmt.lint.LinterTimings],
     logger: tmt.log.Logger,
     **kwargs: Any,
 ) -> int:
@@ -83,10 +104,30 @@ def _lint_class(
         disable_checks=disable_checks or None,
     )
 
-    for lintable in klass.from_tree(context.obj.tree):
-        valid, allowed_rulings = _apply_linters(
-            lintable, linters, failed_only, enforce_checks, outcomes
-        )
+    lintables: list[Union[tmt.base.core.Test, tmt.base.plan.Plan, tmt.base.core.Story]] = list(
+        klass.from_tree(context.obj.tree)
+    )
+
+    if changed_files is not None:
+        lintables = [
+            lintable
+            for lintable in lintables
+            if any(source.resolve() in changed_files for source in lintable.fmf_sources)
+        ]
+
+    # Build the link index before workers are forked, they would build
+    # their own copies otherwise
+    if workers > 1:
+        _ = context.obj.tree.link_index
+
+    for lintable, valid, rulings in tmt.lint.lint_objects(
+        lintables,
+        linters=linters,
+        enforce_checks=enforce_checks or None,
+        workers=workers,
+        timings=timings,
+    ):
+        allowed_rulings = _filter_rulings(valid, rulings, failed_only, outcomes)
         if allowed_rulings is None:
             continue
 
@@ -112,6 +153,7 @@ def _lint_collection(
     disable_checks: list[str],
     enforce_checks: list[str],
     outcomes: list[tmt.lint.LinterOutcome],
+    timings: Optional[tmt.lint.LinterTimings],
     logger: tmt.log.Logger,
     **kwargs: Any,
 ) -> int:
@@ -135,7 +177,7 @@ def _lint_collection(
     lintable = tmt.base.core.LintableCollection(objs)
 
     valid, allowed_rulings = _apply_linters(
-        lintable, linters, failed_only, enforce_checks, outcomes
+        lintable, linters, failed_only, enforce_checks, outcomes, timings
     )
     if allowed_rulings is None:
         return exit_code
@@ -163,6 +205,8 @@ def do_lint(
     disable_checks: list[str],
     enforce_checks: list[str],
     outcomes: list[tmt.lint.LinterOutcome],
+    changed_since: Optional[str],
+    show_timings: bool,
     logger: tmt.log.Logger,
     **kwargs: Any,
 ) -> int:
@@ -181,6 +225,25 @@ def do_lint(
 
         return 0
 
+    changed_files: Optional[set[Path]] = None
+
+    if changed_since:
+        root = context.obj.tree.root
+
+        if root is None:
+            raise tmt.utils.GeneralError("Option '--changed-since' requires a metadata tree.")
+
+        changed_files = tmt.utils.git.git_changed_files(
+            root=root, ref=changed_since, logger=logger
+        )
+
+    # Fixes are written into fmf files, and files are often shared by
+    # multiple objects. Worker processes would overwrite each other's
+    # fixes, therefore objects must be fixed one by one.
+    workers = 1 if kwargs.get('fix') else tmt.lint.LINT_WORKERS
+
+    timings = tmt.lint.LinterTimings() if show_timings else None
+
     res_single = max(
         _lint_class(
             context,
@@ -190,12 +253,17 @@ def do_lint(
             disable_checks,
             enforce_checks,
             outcomes,
+            changed_files,
+            workers,
+            timings,
             logger,
             **kwargs,
         )
         for klass in klasses
     )
 
+    # Checks of the collection inspect objects against each other, they
+    # need to see all objects, not just the changed ones.
     res_collection = _lint_collection(
         context,
         klasses,
@@ -204,10 +272,16 @@ def do_lint(
         disable_checks,
         enforce_checks,
         outcomes,
+        timings,
         logger,
         **kwargs,
     )
 
+    if timings is not None:
+        logger.print('Time spent by checks')
+        logger.print('\n'.join(timings.format()))
+        logger.print()
+
     return max(res_single, res_collection)
 
 
@@ -227,6 +301,8 @@ def tests_lint(
     disable_checks: list[str],
     enforce_checks: list[str],
     outcome_only: tuple[str, ...],
+    changed_since: Optional[str],
+    show_timings: bool,
     **kwargs: Any,
 ) -> None:
     """
@@ -245,6 +321,8 @@ def tests_lint(
         disable_checks,
         enforce_checks,
         [tmt.lint.LinterOutcome(outcome) for outcome in outcome_only],
+        changed_since,
+        show_timings,
         context.obj.logger,
         **kwargs,
     )
@@ -268,6 +346,8 @@ def plans_lint(
     disable_checks: list[str],
     enforce_checks: list[str],
     outcome_only: tuple[str, ...],
+    changed_since: Optional[str],
+    show_timings: bool,
     **kwargs: Any,
 ) -> None:
     """
@@ -286,6 +366,8 @@ def plans_lint(
         disable_checks,
         enforce_checks,
         [tmt.lint.LinterOutcome(outcome) for outcome in outcome_only],
+        changed_since,
+        show_timings,
         context.obj.logger,
         **kwargs,
     )
@@ -309,6 +391,8 @@ def stories_lint(
     disable_checks: list[str],
     enforce_checks: list[str],
     outcome_only: tuple[str, ...],
+    changed_since: Optional[str],
+    show_timings: bool,
     **kwargs: Any,
 ) -> None:
     """
@@ -327,6 +411,8 @@ def stories_lint(
         disable_checks,
         enforce_checks,
         [tmt.lint.LinterOutcome(outcome) for outcome in outcome_only],
+        changed_since,
+        show_timings,
         context.obj.logger,
         **kwargs,
     )
@@ -350,6 +436,8 @@ def lint(
     enforce_checks: list[str],
     failed_only: bool,
     outcome_only: tuple[str, ...],
+    changed_since: Optional[str],
+    show_timings: bool,
     **kwargs: Any,
 ) -> None:
     """
@@ -372,6 +460,8 @@ def lint(
         disable_checks,
         enforce_checks,
         [tmt.lint.LinterOutcome(outcome) for outcome in outcome_only],
+        changed_since,
+        show_timings,
         context.obj.logger,
         **kwargs,
     )
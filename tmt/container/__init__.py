@@ -319,6 +319,113 @@ def container_field(
     raise tmt.utils.GeneralError(f"Could not find field '{key}' in class '{container}'.")
 
 
+@container(frozen=True)
+class SerializationPlanField:
+    """
+    Serialization-related info about a single container field.
+    """
+
+    #: Name of the field, as used in Python code.
+    key: str
+
+    #: Name of the field in its serialized form.
+    option: str
+
+    serialize_callback: Optional['SerializeCallback[Any]'] = None
+    unserialize_callback: Optional['UnserializeCallback[Any]'] = None
+
+
+@container(frozen=True)
+class SerializationPlan:
+    """
+    Precomputed description of how to serialize a container class.
+
+    Collecting field names and their callbacks requires a walk over all
+    fields of a class and their metadata. Doing so for every key of
+    every serialized instance would be quite expensive, therefore the
+    plan is computed once per class and reused by
+    :py:class:`SerializableContainer`.
+    """
+
+    #: Container class described by this plan.
+    klass: type['SerializableContainer']
+
+    #: Fields of the container, in their definition order.
+    fields: tuple[SerializationPlanField, ...]
+
+    #: Fields of the container, indexed by their serialized names.
+    fields_by_option: dict[str, SerializationPlanField]
+
+    #: A function converting an instance into its serialized form,
+    #: generated for the particular set of fields.
+    serialize: Callable[['SerializableContainer'], dict[str, Any]]
+
+    @classmethod
+    def from_class(cls, klass: type['SerializableContainer']) -> 'SerializationPlan':
+        """
+        Build a serialization plan for the given container class.
+        """
+
+        fields: list[SerializationPlanField] = []
+
+        for field in container_fields(klass):
+            metadata = cast(Optional[FieldMetadata[Any]], field.metadata.get('tmt'))
+
+            fields.append(
+                SerializationPlanField(
+                    key=field.name,
+                    option=key_to_option(field.name),
+                    serialize_callback=metadata.serialize_callback if metadata else None,
+                    unserialize_callback=metadata.unserialize_callback if metadata else None,
+                )
+            )
+
+        return SerializationPlan(
+            klass=klass,
+            fields=tuple(fields),
+            fields_by_option={plan_field.option: plan_field for plan_field in fields},
+            serialize=cls._compile_serialize(klass, fields),
+        )
+
+    @staticmethod
+    def _compile_serialize(
+        klass: type['SerializableContainer'], fields: list[SerializationPlanField]
+    ) -> Callable[['SerializableContainer'], dict[str, Any]]:
+        """
+        Generate a function serializing instances of the given class.
+
+        The generated function builds the serialized mapping in a single
+        dictionary display, calling serialization callbacks directly,
+        without any per-field lookups or branching.
+        """
+
+        namespace: dict[str, Any] = {}
+        items: list[str] = []
+
+        for index, plan_field in enumerate(fields):
+            if plan_field.serialize_callback is None:
+                items.append(f'    {plan_field.option!r}: obj.{plan_field.key},')
+
+            else:
+                namespace[f'_serialize_{index}'] = plan_field.serialize_callback
+
+                items.append(
+                    f'    {plan_field.option!r}: _serialize_{index}(obj.{plan_field.key}),'
+                )
+
+        items.append(
+            f"    '__class__': {{'module': {klass.__module__!r}, 'name': {klass.__name__!r}}},"
+        )
+
+        source = '\n'.join(['def serialize(obj):', '  return {', *items, '  }'])
+
+        code = compile(source, f'<serialize {klass.__module__}.{klass.__name__}>', 'exec')
+
+        exec(code, namespace)  # noqa: S102
+
+        return cast(Callable[['SerializableContainer'], dict[str, Any]], namespace['serialize'])
+
+
 @container
 class DataContainer:
     """
@@ -559,6 +666,25 @@ class SerializableContainer(DataContainer):
     # them later.
     #
 
+    @classmethod
+    def _serialization_plan(cls) -> SerializationPlan:
+        """
+        Provide the serialization plan of this class.
+
+        The plan is computed on the first use, and stored in the class
+        itself - it must not be inherited by subclasses, they have
+        their own sets of fields.
+        """
+
+        plan = cls.__dict__.get('_tmt_serialization_plan')
+
+        if plan is None:
+            plan = SerializationPlan.from_class(cls)
+
+            cls._tmt_serialization_plan = plan  # type: ignore[attr-defined]
+
+        return cast(SerializationPlan, plan)
+
     def to_serialized(self) -> dict[str, Any]:
         """
         Convert to a form suitable for saving in a file.
@@ -569,25 +695,7 @@ class SerializableContainer(DataContainer):
         See :py:meth:`from_serialized` for its counterpart.
         """
 
-        def _produce_serialized() -> Iterator[tuple[str, Any]]:
-            for key in container_keys(self):
-                _, option, value, _, metadata = container_field(self, key)
-
-                if metadata.serialize_callback:
-                    yield option, metadata.serialize_callback(value)
-
-                else:
-                    yield option, value
-
-        serialized = dict(_produce_serialized())
-
-        # Add a special field tracking what class we just shattered to pieces.
-        serialized['__class__'] = {
-            'module': self.__class__.__module__,
-            'name': self.__class__.__name__,
-        }
-
-        return serialized
+        return self._serialization_plan().serialize(self)
 
     @classmethod
     def from_serialized(cls, serialized: dict[str, Any]) -> Self:
@@ -605,17 +713,24 @@ class SerializableContainer(DataContainer):
         # already know what class to restore: this one.
         serialized.pop('__class__', None)
 
+        fields_by_option = cls._serialization_plan().fields_by_option
+
         def _produce_unserialized() -> Iterator[tuple[str, Any]]:
             for option, value in serialized.items():
-                key = option_to_key(option)
+                plan_field = fields_by_option.get(option)
+
+                if plan_field is None:
+                    import tmt.utils
 
-                _, _, _, _, metadata = container_field(cls, key)
+                    raise tmt.utils.GeneralError(
+                        f"Could not find field '{option_to_key(option)}' in class '{cls}'."
+                    )
 
-                if metadata.unserialize_callback:
-                    yield key, metadata.unserialize_callback(value)
+                if plan_field.unserialize_callback:
+                    yield plan_field.key, plan_field.unserialize_callback(value)
 
                 else:
-                    yield key, value
+                    yield plan_field.key, value
 
         # Set attribute by adding it to __dict__ directly. Messing with setattr()
         # might cause reuse of mutable values by other instances.
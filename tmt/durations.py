@@ -0,0 +1,350 @@
+"""
+History of test durations.
+
+Durations of executed tests are recorded in a small SQLite database
+owned by the user, see :py:func:`effective_duration_history_path`, where
+they survive removal of runs. Each test is
+identified by its name, its fmf id and the architecture of the guest
+it ran on. The recorded duration is a moving average of the most
+recent :py:data:`DURATION_HISTORY_WINDOW` durations.
+
+Plans may use the history to run the longest tests first, see
+:tmt:story:`/spec/plans/test-order`, and the ``shards`` plan shaper
+may use it to balance shards.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Optional
+
+import tmt.log
+import tmt.utils
+from tmt._compat.pathlib import Path
+
+if TYPE_CHECKING:
+    from tmt.base.core import FmfId
+    from tmt.result import Result
+    from tmt.steps.discover import TestOrigin
+
+
+#: Name of the duration history database.
+DURATION_HISTORY_FILENAME = 'durations.sqlite'
+
+#: Directory holding the duration history database, unless
+#: ``XDG_STATE_HOME`` is set.
+DEFAULT_DURATION_HISTORY_DIR = Path('~/.local/state')
+
+#: How many of the most recent durations of a test are averaged.
+DURATION_HISTORY_WINDOW = 10
+
+#: How many seconds to wait for other tmt processes updating the
+#: database.
+DURATION_HISTORY_TIMEOUT = 30
+
+#: Ways of ordering tests for execution.
+TEST_ORDERS = ('discovery', 'longest-first')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS durations (
+    name TEXT NOT NULL,
+    fmf_id TEXT NOT NULL,
+    arch TEXT NOT NULL,
+    duration REAL NOT NULL,
+    count INTEGER NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (name, fmf_id, arch)
+)
+"""
+
+
+def normalize_test_order(key_address: str, value: Any, logger: tmt.log.Logger) -> str:
+    """
+    Normalize the ``test-order`` key of plans
+    """
+
+    if value is None:
+        return TEST_ORDERS[0]
+
+    if value not in TEST_ORDERS:
+        raise tmt.utils.NormalizationError(key_address, value, f"one of {', '.join(TEST_ORDERS)}")
+
+    return str(value)
+
+
+def parse_result_duration(duration: Any) -> Optional[float]:
+    """
+    Convert a result duration, ``HH:MM:SS``, into seconds.
+
+    :returns: number of seconds, or ``None`` if the duration is not set
+        or is not valid.
+    """
+
+    if not isinstance(duration, str):
+        return None
+
+    try:
+        hours, minutes, seconds = duration.split(':')
+
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    except ValueError:
+        return None
+
+
+def fmf_id_key(fmf_id: Optional['FmfId']) -> str:
+    """
+    Render the location of a test as a database key.
+
+    The name of the test is not included, it is a separate key.
+    """
+
+    if fmf_id is None:
+        return ''
+
+    return json.dumps(
+        {
+            'url': fmf_id.url,
+            'ref': fmf_id.ref,
+            'path': str(fmf_id.path) if fmf_id.path is not None else None,
+        },
+        sort_keys=True,
+    )
+
+
+def effective_duration_history_path() -> Path:
+    """
+    Find out where the duration history database is.
+
+    If ``TMT_DURATION_HISTORY_PATH`` variable is set, it is used.
+    Otherwise, the database is placed in the ``tmt`` directory under
+    ``XDG_STATE_HOME``, or under :py:const:`DEFAULT_DURATION_HISTORY_DIR`.
+    The database is kept per user, workdir root may be shared by users.
+    """
+
+    if 'TMT_DURATION_HISTORY_PATH' in os.environ:
+        return Path(os.environ['TMT_DURATION_HISTORY_PATH']).expanduser()
+
+    state_dir = Path(os.environ.get('XDG_STATE_HOME') or DEFAULT_DURATION_HISTORY_DIR)
+
+    return state_dir.expanduser() / 'tmt' / DURATION_HISTORY_FILENAME
+
+
+class DurationStore:
+    """
+    Durations of tests recorded by previous runs.
+
+    .. code-block:: python
+
+        store = DurationStore(logger=logger)
+
+        store.record(results, arches={'default-0': 'x86_64'})
+        store.durations(tests, arch='x86_64')
+
+    :param path: if set, the database to use instead of the one picked
+        by :py:func:`effective_duration_history_path`.
+    :param logger: used for logging.
+    """
+
+    def __init__(self, path: Optional[Path] = None, *, logger: tmt.log.Logger) -> None:
+        self.path = path or effective_duration_history_path()
+
+        self._logger = logger
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(self.path, timeout=DURATION_HISTORY_TIMEOUT)
+        connection.execute(_SCHEMA)
+
+        return connection
+
+    def record(self, results: Iterable['Result'], *, arches: dict[str, Optional[str]]) -> int:
+        """
+        Record durations of executed tests.
+
+        Results without a duration, e.g. of tests which did not run at
+        all, are ignored. Failure to update the database is not fatal.
+
+        :param results: results to record.
+        :param arches: architectures of guests, indexed by guest names.
+        :returns: number of recorded durations.
+        """
+
+        entries: list[tuple[str, str, str, float]] = []
+
+        for result in results:
+            duration = parse_result_duration(result.duration)
+
+            if duration is None:
+                continue
+
+            entries.append(
+                (
+                    result.name,
+                    fmf_id_key(result.fmf_id),
+                    arches.get(result.guest.name or '') or '',
+                    duration,
+                )
+            )
+
+        if not entries:
+            return 0
+
+        now = time.time()
+
+        try:
+            connection = self._connect()
+
+            try:
+                with connection:
+                    for name, fmf_id, arch, duration in entries:
+                        connection.execute(
+                            """
+                            INSERT INTO durations VALUES (?, ?, ?, ?, 1, ?)
+                            ON CONFLICT (name, fmf_id, arch) DO UPDATE SET
+                                duration = duration
+                                    + (excluded.duration - duration) / MIN(count + 1, ?),
+                                count = count + 1,
+                                updated = excluded.updated
+                            """,
+                            (name, fmf_id, arch, duration, now, DURATION_HISTORY_WINDOW),
+                        )
+
+            finally:
+                connection.close()
+
+        except sqlite3.Error as exc:
+            self._logger.warning(f"Failed to record test durations in '{self.path}': {exc}")
+
+            return 0
+
+        return len(entries)
+
+    def _rows(self) -> list[tuple[str, str, str, float]]:
+        connection = self._connect()
+
+        try:
+            return connection.execute(
+                'SELECT name, fmf_id, arch, duration FROM durations'
+            ).fetchall()
+
+        finally:
+            connection.close()
+
+    def durations(
+        self, tests: Sequence['TestOrigin'], *, arch: Optional[str] = None
+    ) -> dict[str, float]:
+        """
+        Provide recorded durations of given tests.
+
+        A duration recorded on the given architecture is preferred.
+        Otherwise, durations recorded on all architectures are averaged.
+
+        :param tests: tests whose durations are requested.
+        :param arch: if set, architecture the tests are going to run on.
+        :returns: a mapping between test names and their expected
+            durations, in seconds. Tests with no recorded duration are
+            left out.
+        """
+
+        if not tests or not self.path.exists():
+            return {}
+
+        wanted = {
+            test_origin.test.name: fmf_id_key(test_origin.test.fmf_id) for test_origin in tests
+        }
+
+        exact: dict[str, float] = {}
+        other: dict[str, list[float]] = {}
+
+        try:
+            for name, fmf_id, recorded_arch, duration in self._rows():
+                if wanted.get(name) != fmf_id:
+                    continue
+
+                if arch is not None and recorded_arch == arch:
+                    exact[name] = duration
+
+                else:
+                    other.setdefault(name, []).append(duration)
+
+        except sqlite3.Error as exc:
+            self._logger.warning(f"Failed to read test durations from '{self.path}': {exc}")
+
+            return {}
+
+        return {
+            **{name: sum(durations) / len(durations) for name, durations in other.items()},
+            **exact,
+        }
+
+
+def expected_durations(
+    tests: Sequence['TestOrigin'], history: dict[str, float], *, logger: tmt.log.Logger
+) -> list[float]:
+    """
+    Estimate durations of given tests.
+
+    Historical durations are used when known, with the ``duration``
+    key of the test, i.e. the test timeout, serving as the fallback.
+
+    :param tests: tests to estimate.
+    :param history: known durations of tests, indexed by test names.
+    :returns: expected durations of tests, in seconds, in the order of
+        ``tests``.
+    """
+
+    from tmt.base.core import DEFAULT_TEST_DURATION_L1
+
+    durations: list[float] = []
+
+    for test_origin in tests:
+        test = test_origin.test
+
+        if test.name in history:
+            durations.append(history[test.name])
+            continue
+
+        try:
+            duration = tmt.utils.duration_to_seconds(
+                test.duration, injected_default=DEFAULT_TEST_DURATION_L1
+            )
+
+        except tmt.utils.SpecificationError:
+            logger.debug(f"Invalid duration '{test.duration}' of test '{test.name}'.", level=3)
+
+            duration = tmt.utils.duration_to_seconds(DEFAULT_TEST_DURATION_L1)
+
+        durations.append(float(duration))
+
+    return durations
+
+
+def order_longest_first(
+    tests: Sequence['TestOrigin'], history: dict[str, float], *, logger: tmt.log.Logger
+) -> list['TestOrigin']:
+    """
+    Order tests by their expected duration, the longest ones first.
+
+    The ``order`` key of tests is still respected, tests are reordered
+    only among tests of the same ``order``. Ties are broken by the
+    original position of tests, making the outcome deterministic for a
+    given history.
+
+    :param tests: tests to order.
+    :param history: known durations of tests, indexed by test names.
+    :returns: ordered tests.
+    """
+
+    durations = expected_durations(tests, history, logger=logger)
+
+    return [
+        tests[index]
+        for index in sorted(
+            range(len(tests)),
+            key=lambda index: (tests[index].test.order, -durations[index], index),
+        )
+    ]
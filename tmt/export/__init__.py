@@ -10,6 +10,7 @@ import re
 import traceback
 import types
 import xmlrpc.client
+from collections.abc import Iterator, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -57,6 +58,17 @@ RE_BUGZILLA_URL = r'bugzilla.redhat.com/show_bug.cgi\?id=(\d+)'
 # Used to extract <h1>-<h4> headings and their text from HTML
 HEADING_PATTERN = re.compile(r'^(?P<title><h(?P<level>[1-4])>.+?</h\2>)$', re.MULTILINE)
 
+#: How many times an update of an exported object is tried before giving up.
+EXPORT_UPDATE_ATTEMPTS: int = tmt.utils.configure_constant(3, 'TMT_EXPORT_UPDATE_ATTEMPTS')
+
+#: How long to wait before trying a failed update again, in seconds.
+EXPORT_UPDATE_INTERVAL: int = tmt.utils.configure_constant(5, 'TMT_EXPORT_UPDATE_INTERVAL')
+
+#: Maximal number of values looked up by a single bulk query.
+BULK_QUERY_SIZE = 100
+
+T = TypeVar('T')
+
 
 # ignore[type-arg]: bound type vars cannot be generic, and it would create a loop anyway.
 ExportableT = TypeVar('ExportableT', bound='Exportable')  # type: ignore[type-arg]
@@ -446,6 +458,88 @@ def bz_set_coverage(bug_ids: list[int], case_id: str, tracker_id: int) -> None:
     )
 
 
+def iter_batches(values: Sequence[T], size: int = BULK_QUERY_SIZE) -> Iterator[list[T]]:
+    """
+    Split values into batches suitable for bulk queries.
+
+    :param values: values to split.
+    :param size: maximal number of values in a single batch.
+    :yields: consecutive batches of values.
+    """
+
+    for start in range(0, len(values), size):
+        yield list(values[start : start + size])
+
+
+class RemoteUpdates:
+    """
+    Send updates of exported objects to a remote service.
+
+    Clients of remote services share a single connection which is not
+    safe to use from several threads, therefore updates are sent right
+    away, in the calling thread. Idempotent updates are retried when
+    they fail, and a failed update does not stop the export. Leaving
+    the context reports all updates which failed.
+
+    :param attempts: how many times an idempotent update is tried before
+        giving up.
+    :param interval: how long to wait before trying a failed update
+        again, in seconds.
+    :param logger: used for logging.
+    """
+
+    def __init__(
+        self,
+        *,
+        attempts: int = EXPORT_UPDATE_ATTEMPTS,
+        interval: int = EXPORT_UPDATE_INTERVAL,
+        logger: tmt.log.Logger,
+    ) -> None:
+        self.attempts = attempts
+        self.interval = interval
+
+        self._logger = logger
+        self._count = 0
+        self._failures: list[Exception] = []
+
+    def submit(self, label: str, update: Callable[[], None], idempotent: bool = True) -> None:
+        """
+        Send an update.
+
+        :param label: describes the update in logging and in errors.
+        :param update: a callable performing the update.
+        :param idempotent: unless set, the update is not retried. Use
+            for updates creating new objects, where a failure may come
+            after the object has been created already.
+        """
+
+        self._count += 1
+
+        try:
+            if idempotent:
+                tmt.utils.retry(update, self.attempts, self.interval, label, self._logger)
+
+            else:
+                update()
+
+        except Exception as exc:
+            self._logger.fail(f"{label} failed.")
+
+            self._failures.append(exc)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: Optional[type[BaseException]], *args: object) -> None:
+        if exc_type is not None or not self._failures:
+            return
+
+        raise tmt.utils.ConvertError(
+            f"Failed to update {len(self._failures)} of {self._count} exported objects.",
+            causes=self._failures,
+        )
+
+
 def check_md_file_respects_spec(md_path: Path) -> list[str]:
     """
     Check that the file respects manual test specification
@@ -5,7 +5,7 @@ import types
 import urllib.parse
 from collections.abc import Iterator, Sequence
 from contextlib import suppress
-from functools import cache
+from functools import cache, partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -348,35 +348,83 @@ def create_nitrate_case(summary: str, category: str) -> NitrateTestCase:
     return testcase
 
 
+# avoid searching for runs of the same general plan for every test of
+# a single export, the memo is cleared when a new export starts
+@cache
+def find_open_runs(general_plan_id: int) -> list[tuple[NitrateTestPlan, Any]]:
+    """
+    Return all unfinished runs under given general plan, with their plans
+    """
+
+    assert nitrate
+    return [
+        (child_plan, testrun)
+        for child_plan in nitrate.TestPlan.search(parent=general_plan_id)
+        for testrun in child_plan.testruns
+        if testrun.status != nitrate.RunStatus("FINISHED")
+    ]
+
+
+def prefetch_nitrate_cases(tests: list['tmt.Test']) -> None:
+    """
+    Fetch nitrate test cases of given tests in bulk
+
+    Test cases are fetched by a few search queries rather than one by
+    one, and kept in the nitrate object cache, from which later lookups
+    of individual test cases are served.
+    """
+
+    assert nitrate
+
+    case_ids: set[int] = set()
+    for test in tests:
+        with suppress(TypeError, ValueError):
+            case_ids.add(int(test.node.get('extra-nitrate')[3:]))
+
+    for batch in tmt.export.iter_batches(sorted(case_ids)):
+        try:
+            nitrate.TestCase.search(case_id__in=batch)
+        except nitrate.NitrateError as error:
+            log.debug(f"Failed to fetch nitrate test cases in bulk: {error}")
+
+
 def add_to_nitrate_runs(
     nitrate_case: NitrateTestCase,
     general_plan: NitrateTestPlan,
     test: 'tmt.Test',
     dry_mode: bool,
+    updates: Optional[tmt.export.RemoteUpdates] = None,
 ) -> None:
     """
     Add nitrate test case to all active runs under given general plan
 
     Go down plan tree from general plan, add case and case run to
-    all open runs. Try to apply adjust.
+    all open runs. Try to apply adjust. Case runs are created through
+    ``updates`` if given.
     """
 
     assert nitrate
-    for child_plan in nitrate.TestPlan.search(parent=general_plan.id):
-        for testrun in child_plan.testruns:
-            if testrun.status == nitrate.RunStatus("FINISHED"):
-                continue
-            if not enabled_for_environment(test, tcms_notes=testrun.notes):
+    for child_plan, testrun in find_open_runs(general_plan.id):
+        if not enabled_for_environment(test, tcms_notes=testrun.notes):
+            continue
+        # nitrate_case is None when --dry and --create are used together
+        if not nitrate_case or child_plan not in nitrate_case.testplans:
+            echo(style(f"Link to plan '{child_plan}'.", fg='magenta'))
+            if not dry_mode:
+                nitrate_case.testplans.add(child_plan)
+        if not nitrate_case or nitrate_case not in [caserun.testcase for caserun in testrun]:
+            echo(style(f"Link to run '{testrun}'.", fg='magenta'))
+            if dry_mode:
                 continue
-            # nitrate_case is None when --dry and --create are used together
-            if not nitrate_case or child_plan not in nitrate_case.testplans:
-                echo(style(f"Link to plan '{child_plan}'.", fg='magenta'))
-                if not dry_mode:
-                    nitrate_case.testplans.add(child_plan)
-            if not nitrate_case or nitrate_case not in [caserun.testcase for caserun in testrun]:
-                echo(style(f"Link to run '{testrun}'.", fg='magenta'))
-                if not dry_mode:
-                    nitrate.CaseRun(testcase=nitrate_case, testrun=testrun)
+            if updates is None:
+                nitrate.CaseRun(testcase=nitrate_case, testrun=testrun)
+            else:
+                # Creating a case run again could duplicate it
+                updates.submit(
+                    f"Link test case '{nitrate_case.identifier}' to run '{testrun}'",
+                    partial(nitrate.CaseRun, testcase=nitrate_case, testrun=testrun),
+                    idempotent=False,
+                )
 
 
 def prepare_extra_summary(
@@ -434,9 +482,16 @@ def find_general_plan(component: str) -> NitrateTestPlan:
     return found[0]
 
 
-def export_to_nitrate(test: 'tmt.Test') -> None:
+def export_to_nitrate(
+    test: 'tmt.Test', updates: Optional[tmt.export.RemoteUpdates] = None
+) -> None:
     """
     Export fmf metadata to nitrate test cases
+
+    :param test: test to export.
+    :param updates: if set, creating case runs and the final update of
+        the test case are sent through it, and their failures do not
+        stop the export.
     """
 
     import tmt.base.core
@@ -455,6 +510,10 @@ def export_to_nitrate(test: 'tmt.Test') -> None:
     dry_mode = test.is_dry_run
     append_summary = test.opt('append-summary')
 
+    # A standalone export must not reuse runs found by an earlier one
+    if updates is None:
+        find_open_runs.cache_clear()
+
     if link_runs:
         general = True
 
@@ -557,7 +616,9 @@ def export_to_nitrate(test: 'tmt.Test') -> None:
                     if not dry_mode:
                         nitrate_case.testplans.add(general_plan)
                     if link_runs:
-                        add_to_nitrate_runs(nitrate_case, general_plan, test, dry_mode)
+                        add_to_nitrate_runs(
+                            nitrate_case, general_plan, test, dry_mode, updates=updates
+                        )
                 except nitrate.NitrateError as error:
                     log.debug(error)
                     echo(style(f"Failed to find general test plan for '{component}'.", fg='red'))
@@ -711,8 +772,11 @@ def export_to_nitrate(test: 'tmt.Test') -> None:
         if not dry_mode:
             nitrate_case.bugs.add(nitrate.Bug(bug=int(bug_id)))
 
-    # Update nitrate test case
-    if not dry_mode:
+    if dry_mode:
+        return
+
+    def update_nitrate_case() -> None:
+        # Update nitrate test case
         nitrate_case.update()
         echo(
             style(
@@ -721,9 +785,16 @@ def export_to_nitrate(test: 'tmt.Test') -> None:
             )
         )
 
-    # Optionally link Bugzilla to Nitrate case
-    if link_bugzilla and verifies_bug_ids and not dry_mode:
-        tmt.export.bz_set_coverage(verifies_bug_ids, nitrate_case.id, NITRATE_TRACKER_ID)
+        # Optionally link Bugzilla to Nitrate case
+        if link_bugzilla and verifies_bug_ids:
+            tmt.export.bz_set_coverage(verifies_bug_ids, nitrate_case.id, NITRATE_TRACKER_ID)
+
+    if updates is None:
+        update_nitrate_case()
+    else:
+        updates.submit(
+            f"Update nitrate test case '{nitrate_case.identifier}'", update_nitrate_case
+        )
 
 
 @tmt.base.core.Test.provides_export('nitrate')
@@ -732,7 +803,17 @@ class NitrateExporter(tmt.export.ExportPlugin):
     def export_test_collection(
         cls, tests: list[tmt.base.core.Test], keys: Optional[list[str]] = None, **kwargs: Any
     ) -> str:
-        for test in tests:
-            export_to_nitrate(test)
+        if not tests:
+            return ''
+
+        import_nitrate()
+
+        # Fetch existing test cases of all tests at once
+        prefetch_nitrate_cases(tests)
+        find_open_runs.cache_clear()
+
+        with tmt.export.RemoteUpdates(logger=tests[0]._logger) as updates:
+            for test in tests:
+                export_to_nitrate(test, updates=updates)
 
         return ''
@@ -1,7 +1,7 @@
 import email.utils
 import re
 import traceback
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import fmf.utils
 from click import echo
@@ -21,6 +21,9 @@ POLARION_TRACKER_ID = 117  # ID of polarion in RH's bugzilla
 RE_POLARION_URL = r'.*/polarion/#/project/.*/workitem\?id=(.*)'
 LEGACY_POLARION_PROJECTS = {'RedHatEnterpriseLinux7'}
 
+#: Fields of work items needed to identify existing test cases.
+WANTED_FIELDS = ['work_item_id', 'project_id', 'status']
+
 # TODO: why this exists?
 log = fmf.utils.Logging('tmt').logger
 
@@ -76,10 +79,114 @@ def get_polarion_ids(
     return None, None
 
 
+def get_nitrate_case_id(extra_nitrate: str) -> Optional[str]:
+    """
+    Extract nitrate test case ID from the ``extra-nitrate`` key
+    """
+
+    nitrate_case_id_search = re.search(r'\d+', extra_nitrate)
+    if not nitrate_case_id_search:
+        return None
+    return str(int(nitrate_case_id_search.group()))
+
+
+class PolarionCaseIndex:
+    """
+    Existing Polarion test cases, fetched in bulk.
+
+    Instead of running several queries for every exported test, test
+    cases matching UUIDs and nitrate case IDs of all tests are fetched
+    by a few bulk queries in advance. Queries of individual tests are
+    then answered from the index, and only queries for anything not
+    found in advance are sent to Polarion.
+
+    Only test cases actually found are indexed. A UUID may be missing
+    from the ``tmtid`` field, e.g. when a project does not have the
+    field, and a full-text query by the UUID may still find the case.
+
+    :param query: runs a test case query used to fetch test cases in
+        bulk, with the same signature as ``query`` method of pylero
+        work items.
+    :param fallback_query: if set, runs queries which cannot be
+        answered from the index. Otherwise, ``query`` is used.
+    """
+
+    def __init__(
+        self,
+        query: Callable[..., list[Any]],
+        fallback_query: Optional[Callable[..., list[Any]]] = None,
+    ) -> None:
+        self._query = query
+        self._fallback_query = fallback_query or query
+        self._results: dict[str, list[Any]] = {}
+
+    def _prefetch(self, field_name: str, values: list[str], key_template: str) -> None:
+        for batch in tmt.export.iter_batches(values):
+            values_query = ' OR '.join(f'"{value}"' for value in batch)
+
+            try:
+                items = self._query(
+                    f'{field_name}:({values_query})', fields=[*WANTED_FIELDS, field_name]
+                )
+            except Exception as error:
+                log.debug(f"Failed to fetch Polarion test cases in bulk: {error}")
+                continue
+
+            results: dict[str, list[Any]] = {}
+
+            for item in items:
+                value = getattr(item, field_name, None)
+
+                # Without the value, items cannot be assigned to tests,
+                # and tests in this batch will be queried one by one.
+                if value is None:
+                    break
+
+                results.setdefault(str(value), []).append(item)
+
+            else:
+                self._results.update(
+                    (key_template.format(value), results[value])
+                    for value in batch
+                    if results.get(value)
+                )
+
+    def prefetch(self, tests: list[tmt.base.core.Test]) -> None:
+        """
+        Fetch test cases matching given tests.
+
+        :param tests: tests whose test cases should be fetched.
+        """
+
+        uuids = sorted({str(test.node.get(ID_KEY)) for test in tests if test.node.get(ID_KEY)})
+        nitrate_case_ids = sorted(
+            {
+                nitrate_case_id
+                for test in tests
+                if test.node.get('extra-nitrate')
+                and (nitrate_case_id := get_nitrate_case_id(str(test.node.get('extra-nitrate'))))
+            }
+        )
+
+        self._prefetch('tmtid', uuids, '{}')
+        self._prefetch('tcmscaseid', nitrate_case_ids, 'tcmscaseid:{}')
+
+    def query(self, query: str, fields: Optional[list[str]] = None) -> list[Any]:
+        """
+        Run a work item query, using the prefetched results if possible
+        """
+
+        if query in self._results:
+            return self._results[query]
+
+        return self._fallback_query(query, fields=fields)
+
+
 def find_polarion_case_ids(
     data: dict[str, Optional[str]],
     preferred_project: Optional[str] = None,
     polarion_case_id: Optional[str] = None,
+    case_index: Optional[PolarionCaseIndex] = None,
 ) -> tuple[Optional[str], Optional[str]]:
     """
     Find IDs for Polarion case from data dictionary
@@ -87,37 +194,37 @@ def find_polarion_case_ids(
 
     assert PolarionWorkItem
 
+    query = case_index.query if case_index else PolarionWorkItem.query
+
     case_id = None
     project_id = None
-    wanted_fields = ['work_item_id', 'project_id', 'status']
 
     # Search for Polarion case ID directly
     if polarion_case_id:
-        query_result = PolarionWorkItem.query(f'id:{polarion_case_id}', fields=wanted_fields)
+        query_result = query(f'id:{polarion_case_id}', fields=WANTED_FIELDS)
         case_id, project_id = get_polarion_ids(query_result, preferred_project)
 
     # Search by UUID
-    if not project_id and data.get(ID_KEY):
-        query_result = PolarionWorkItem.query(data.get(ID_KEY), fields=wanted_fields)
+    uuid = data.get(ID_KEY)
+    if not project_id and uuid:
+        query_result = query(uuid, fields=WANTED_FIELDS)
         case_id, project_id = get_polarion_ids(query_result, preferred_project)
 
     # Search by TCMS Case ID
     extra_nitrate = data.get('extra-nitrate')
     if not project_id and extra_nitrate:
-        nitrate_case_id_search = re.search(r'\d+', extra_nitrate)
-        if not nitrate_case_id_search:
+        nitrate_case_id = get_nitrate_case_id(extra_nitrate)
+        if not nitrate_case_id:
             raise ConvertError(
                 "Could not find a valid nitrate testcase ID in 'extra-nitrate' attribute"
             )
-        nitrate_case_id = str(int(nitrate_case_id_search.group()))
-        query_result = PolarionWorkItem.query(
-            f"tcmscaseid:{nitrate_case_id}", fields=wanted_fields
-        )
+        query_result = query(f"tcmscaseid:{nitrate_case_id}", fields=WANTED_FIELDS)
         case_id, project_id = get_polarion_ids(query_result, preferred_project)
 
     # Search by extra task
-    if not project_id and data.get('extra-task'):
-        query_result = PolarionWorkItem.query(data.get('extra-task'), fields=wanted_fields)
+    extra_task = data.get('extra-task')
+    if not project_id and extra_task:
+        query_result = query(extra_task, fields=WANTED_FIELDS)
         case_id, project_id = get_polarion_ids(query_result, preferred_project)
 
     return case_id, project_id
@@ -127,6 +234,7 @@ def get_polarion_case(
     data: dict[str, Optional[str]],
     preferred_project: Optional[str] = None,
     polarion_case_id: Optional[str] = None,
+    case_index: Optional[PolarionCaseIndex] = None,
 ) -> Optional[PolarionTestCase]:
     """
     Get Polarion case through couple different methods
@@ -137,7 +245,9 @@ def get_polarion_case(
     assert PolarionTestCase
     assert PolarionException
 
-    case_id, project_id = find_polarion_case_ids(data, preferred_project, polarion_case_id)
+    case_id, project_id = find_polarion_case_ids(
+        data, preferred_project, polarion_case_id, case_index
+    )
     if case_id is None or project_id is None:
         return None
 
@@ -179,9 +289,19 @@ def add_hyperlink(polarion_case: PolarionTestCase, link: str, role: str = 'tests
                 polarion_case.remove_hyperlink(hyperlink)
 
 
-def export_to_polarion(test: tmt.base.core.Test) -> None:
+def export_to_polarion(
+    test: tmt.base.core.Test,
+    case_index: Optional[PolarionCaseIndex] = None,
+    updates: Optional[tmt.export.RemoteUpdates] = None,
+) -> None:
     """
     Export fmf metadata to a Polarion test case
+
+    :param test: test to export.
+    :param case_index: if set, existing test cases are looked up in this
+        index rather than queried one by one.
+    :param updates: if set, the final update of the test case is sent
+        through it, and its failure does not stop the export.
     """
 
     import tmt.export.nitrate
@@ -211,7 +331,7 @@ def export_to_polarion(test: tmt.base.core.Test) -> None:
 
     polarion_case = None
     if not duplicate:
-        polarion_case = get_polarion_case(test.node, project_id)
+        polarion_case = get_polarion_case(test.node, project_id, case_index=case_index)
     summary = tmt.export.nitrate.prepare_extra_summary(test, append_summary, ignore_git_validation)
     assert test.path is not None  # narrow type
     test_path = test.node.root / test.path.unrooted()
@@ -406,9 +526,9 @@ def export_to_polarion(test: tmt.base.core.Test) -> None:
     # Add TCMS Case ID to Polarion case
     if test.node.get('extra-nitrate') and not dry_mode:
         assert polarion_case  # Narrow type
-        tcms_case_id_search = re.search(r'\d+', test.node.get("extra-nitrate"))
-        if tcms_case_id_search:
-            polarion_case.tcmscaseid = str(int(tcms_case_id_search.group()))
+        tcms_case_id = get_nitrate_case_id(test.node.get("extra-nitrate"))
+        if tcms_case_id:
+            polarion_case.tcmscaseid = tcms_case_id
 
     # Add Requirements to Polarion case
     if not dry_mode:
@@ -416,17 +536,23 @@ def export_to_polarion(test: tmt.base.core.Test) -> None:
         for req in requirements:
             polarion_case.add_linked_item(req, 'verifies')
 
-    # Update Polarion test case
-    if not dry_mode:
-        assert polarion_case  # Narrow type
-        polarion_case.update()
-    echo(style(f"Test case '{summary}' successfully exported to Polarion.", fg='magenta'))
-
-    # Optionally link Bugzilla to Polarion case
-    if link_bugzilla and bug_ids and not dry_mode:
-        assert polarion_case  # Narrow type
-        case_id = f"{polarion_case.project_id}/workitem?id={polarion_case.work_item_id!s}"
-        tmt.export.bz_set_coverage(bug_ids, case_id, POLARION_TRACKER_ID)
+    def update_polarion_case() -> None:
+        # Update Polarion test case
+        if not dry_mode:
+            assert polarion_case  # Narrow type
+            polarion_case.update()
+        echo(style(f"Test case '{summary}' successfully exported to Polarion.", fg='magenta'))
+
+        # Optionally link Bugzilla to Polarion case
+        if link_bugzilla and bug_ids and not dry_mode:
+            assert polarion_case  # Narrow type
+            case_id = f"{polarion_case.project_id}/workitem?id={polarion_case.work_item_id!s}"
+            tmt.export.bz_set_coverage(bug_ids, case_id, POLARION_TRACKER_ID)
+
+    if updates is None or dry_mode:
+        update_polarion_case()
+    else:
+        updates.submit(f"Update Polarion test case '{summary}'", update_polarion_case)
 
 
 @tmt.base.core.Test.provides_export('polarion')
@@ -438,7 +564,17 @@ class PolarionExporter(tmt.export.ExportPlugin):
         keys: Optional[list[str]] = None,
         **kwargs: Any,
     ) -> str:
-        for test in tests:
-            export_to_polarion(test)
+        if not tests:
+            return ''
+
+        import_polarion()
+
+        # Look up existing test cases of all tests at once
+        case_index = PolarionCaseIndex(PolarionTestCase.query, PolarionWorkItem.query)
+        case_index.prefetch(tests)
+
+        with tmt.export.RemoteUpdates(logger=tests[0]._logger) as updates:
+            for test in tests:
+                export_to_polarion(test, case_index=case_index, updates=updates)
 
         return ''
@@ -7,6 +7,7 @@ import tmt.result
 import tmt.steps.execute
 import tmt.steps.scripts
 import tmt.utils
+import tmt.utils.log_scanner
 from tmt.frameworks import TestFramework, provides_framework
 from tmt.guest import TransferOptions
 from tmt.result import ResultOutcome, save_failures
@@ -21,46 +22,72 @@ if TYPE_CHECKING:
 BEAKERLIB_REPORT_RESULT_COMMAND = 'rhts-report-result'
 
 
+#: A line reporting a failed beakerlib assertion.
+BEAKERLIB_FAIL_PATTERN = re.compile(r':: \[   FAIL   \] ::')
+
+#: A line starting a beakerlib assertion or a test section.
+BEAKERLIB_BLOCK_START_PATTERN = re.compile(r'(:: \[.{10}\] ::|[:]{80})')
+
+#: A line delimiting a beakerlib phase header.
+BEAKERLIB_PHASE_DELIMITER_PATTERN = re.compile(r'[:]{80}')
+
+
 def _extract_failures(invocation: 'TestInvocation', log_path: Path) -> list[str]:
-    try:
-        log = invocation.phase.step.plan.execute.read(log_path)
-    except tmt.utils.FileError:
-        return []
+    execute = invocation.phase.step.plan.execute
+
+    if execute.workdir and not log_path.is_absolute():
+        log_path = execute.workdir / log_path
 
     # Filter beakerlib style logs in the following way:
-    # 1. Reverse the log string by lines
+    # 1. Read the log by lines, from its end to its start
     # 2. Search for each FAIL and extract every associated line.
     # 3. For failed phases also extract phase name so the log is easier to understand
     # 4. Reverse extracted lines back into correct order.
-    if re.search(':: \\[   FAIL   \\] ::', log):  # dumb check for a beakerlib log
-        copy_line = False
-        copy_phase_name = False
-        failure_log: list[str] = []
+    found_failure = False
+    copy_line = False
+    copy_phase_name = False
+    failure_log: list[str] = []
+
+    try:
         # we will be processing log lines in a reversed order
-        iterator = iter(reversed(log.split("\n")))
+        iterator = tmt.utils.log_scanner.iter_lines_reversed(log_path)
+
         for line in iterator:
             # found FAIL enables log extraction
-            if re.search(':: \\[   FAIL   \\] ::', line):
-                copy_line = True
-                copy_phase_name = True
+            if BEAKERLIB_FAIL_PATTERN.search(line):
+                found_failure = copy_line = copy_phase_name = True
             # BEGIN of rlRun block or previous command or beginning of a test section
             # disables extraction
-            elif re.search('(:: \\[.{10}\\] ::|[:]{80})', line):
+            elif BEAKERLIB_BLOCK_START_PATTERN.search(line):
                 copy_line = False
             # extract line from the log
             if copy_line:
                 failure_log.append(line)
             # Add beakerlib phase name to a failure log, in order to properly match the phase
             # name we need to do this in two steps.
-            if copy_phase_name and re.search('[:]{80}', line):
+            if copy_phase_name and BEAKERLIB_PHASE_DELIMITER_PATTERN.search(line):
                 # read the next line containing phase name
-                line = next(iterator)
+                line = next(iterator, '')
                 failure_log.append(f'\n{line}')
                 copy_phase_name = False
-        # reverse extracted lines to restore previous order
-        failure_log.reverse()
-        return ['\n'.join(failure_log).strip()]
-    return []
+            # do not let a log full of failures consume all the memory
+            if len(failure_log) >= tmt.utils.log_scanner.DEFAULT_MAX_LINES:
+                failure_log.append(
+                    tmt.utils.log_scanner.TRUNCATED_NOTE.format(
+                        tmt.utils.log_scanner.DEFAULT_MAX_LINES
+                    )
+                )
+                break
+
+    except tmt.utils.FileError:
+        return []
+
+    if not found_failure:
+        return []
+
+    # reverse extracted lines to restore previous order
+    failure_log.reverse()
+    return ['\n'.join(failure_log).strip()]
 
 
 @provides_framework('beakerlib')
@@ -5,6 +5,7 @@ import tmt.log
 import tmt.result
 import tmt.steps.execute
 import tmt.utils
+import tmt.utils.log_scanner
 from tmt.frameworks import TestFramework, provides_framework
 from tmt.result import ResultOutcome, save_failures
 from tmt.steps.execute import TEST_OUTPUT_FILENAME, TestInvocation
@@ -16,13 +17,18 @@ FAILURE_PATTERN = re.compile(r'\b(?:error|fail)\b', re.IGNORECASE)
 
 
 def _extract_failures(invocation: 'TestInvocation', log_path: Path) -> list[str]:
+    execute = invocation.phase.step.plan.execute
+
+    if execute.workdir and not log_path.is_absolute():
+        log_path = execute.workdir / log_path
+
     try:
-        log = invocation.phase.step.plan.execute.read(log_path)
+        return tmt.utils.log_scanner.grep(
+            tmt.utils.log_scanner.iter_lines(log_path), [FAILURE_PATTERN]
+        )
     except tmt.utils.FileError:
         return []
 
-    return [line for line in log.splitlines() if FAILURE_PATTERN.search(line)]
-
 
 @provides_framework('shell')
 class Shell(TestFramework):
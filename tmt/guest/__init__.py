@@ -11,9 +11,12 @@ import secrets
 import shlex
 import shutil
 import signal as _signal
+import socket
 import string
 import subprocess
+import tempfile
 import threading
+import time
 from collections.abc import Iterable, Iterator, Sequence
 from re import Pattern
 from shlex import quote
@@ -41,6 +44,7 @@ import tmt.options
 import tmt.package_managers
 import tmt.steps
 import tmt.steps.scripts
+import tmt.trace
 import tmt.utils
 import tmt.utils.wait
 from tmt._compat.typing import Self
@@ -56,6 +60,7 @@ from tmt.container import (
     key_to_option,
     option_to_key,
 )
+from tmt.guest.session import CommandSession, CommandSessionError
 from tmt.log import Topic as Topic
 from tmt.package_managers import (
     FileSystemPath,
@@ -72,6 +77,7 @@ from tmt.utils import (
     ShellScript,
     StreamLogger,
     configure_constant,
+    configure_float_constant,
     effective_workdir_root,
 )
 from tmt.utils.environment import Environment, EnvVarValue
@@ -186,6 +192,8 @@ SSH_OPTIONS_ENVVAR_PATTERN: Pattern[str] = re.compile(
     # fact not related to ssh options
     (?!
         MASTER_START_TIMEOUT
+        | PROBE_TIMEOUT
+        | COMMAND_SESSION
     )
     ([a-zA-Z_]+)    # match all other letter/underscore mix
     """,
@@ -301,6 +309,98 @@ def default_ssh_master_start_waiting() -> Waiting:
     return Waiting(deadline=Deadline.from_seconds(SSH_MASTER_START_TIMEOUT))
 
 
+#: How many seconds to wait for the SSH server banner when probing
+#: whether a guest accepts SSH connections.
+#: This is the default value tmt would use unless told otherwise.
+DEFAULT_SSH_PROBE_TIMEOUT: float = 0.5
+
+#: How many seconds to wait for the SSH server banner when probing
+#: whether a guest accepts SSH connections. Probing is disabled when
+#: set to zero.
+#: This is the effective value, combining the default and optional envvar,
+#: ``TMT_SSH_PROBE_TIMEOUT``.
+SSH_PROBE_TIMEOUT: float = configure_float_constant(
+    DEFAULT_SSH_PROBE_TIMEOUT, 'TMT_SSH_PROBE_TIMEOUT'
+)
+
+#: Whether commands should run in a persistent command session rather
+#: than in their own ``ssh`` process. Set ``TMT_SSH_COMMAND_SESSION``
+#: to ``1`` to enable the session.
+SSH_COMMAND_SESSION: bool = configure_constant(0, 'TMT_SSH_COMMAND_SESSION') == 1
+
+#: Environment variables of a command run on a guest are exported by the
+#: command itself, unless their exports are longer than this number of
+#: bytes. Larger environments are saved in a file pushed to the guest.
+#: This is the default value tmt would use unless told otherwise.
+DEFAULT_ENVIRONMENT_FILE_THRESHOLD: int = 8192
+
+#: Environment variables of a command run on a guest are exported by the
+#: command itself, unless their exports are longer than this number of
+#: bytes. Larger environments are saved in a file pushed to the guest.
+#: This is the effective value, combining the default and optional envvar,
+#: ``TMT_ENVIRONMENT_FILE_THRESHOLD``.
+ENVIRONMENT_FILE_THRESHOLD: int = configure_constant(
+    DEFAULT_ENVIRONMENT_FILE_THRESHOLD, 'TMT_ENVIRONMENT_FILE_THRESHOLD'
+)
+
+#: Name of the plan workdir subdirectory holding environment files.
+ENVIRONMENT_FILE_DIRNAME = 'environment'
+
+#: How many bytes of the SSH server greeting are inspected, at maximum,
+#: when looking for the identification string.
+SSH_PROBE_BANNER_LIMIT = 8192
+
+
+def probe_ssh_banner(hostname: str, port: int, timeout: float) -> bool:
+    """
+    Check whether an SSH server accepts connections at the given address.
+
+    A TCP connection is opened, and the server greeting is read until
+    the SSH identification string, ``SSH-...``, appears. No
+    authentication is attempted, which makes the probe much cheaper
+    than running ``ssh``, especially while the guest is still down.
+
+    :param hostname: hostname or IP address to connect to.
+    :param port: port to connect to.
+    :param timeout: how many seconds to wait for the identification
+        string, in total.
+    :returns: ``True`` if the identification string has been received,
+        ``False`` otherwise.
+    """
+
+    deadline = time.monotonic() + timeout
+    greeting = b''
+
+    try:
+        with socket.create_connection((hostname, port), timeout=timeout) as connection:
+            while len(greeting) < SSH_PROBE_BANNER_LIMIT:
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    return False
+
+                connection.settimeout(remaining)
+
+                chunk = connection.recv(1024)
+
+                if not chunk:
+                    return False
+
+                greeting += chunk
+
+                # The server may send other lines before its identification
+                # string, only complete lines are interesting.
+                lines = greeting.split(b'\n')[:-1]
+
+                if any(line.startswith(b'SSH-') for line in lines):
+                    return True
+
+    except OSError:
+        return False
+
+    return False
+
+
 #: Default username to use in SSH connections.
 DEFAULT_USER = 'root'
 
@@ -484,6 +584,64 @@ class TransferOptions:
         return options
 
 
+class PushManifest:
+    """
+    Files pushed to a guest, and their state at the time of the push.
+
+    Modification times, sizes and checksums of pushed files are
+    recorded, allowing files which did not change since their last push
+    to be skipped. A file rewritten with the very same content is
+    considered unchanged.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def pending(self, paths: Iterable[Path]) -> dict[Path, tuple[int, int, str]]:
+        """
+        Find files which changed since their last push.
+
+        :param paths: files to inspect.
+        :returns: changed files, with their current state, to be passed
+            to :py:meth:`record` once they are pushed.
+        """
+
+        pending: dict[Path, tuple[int, int, str]] = {}
+
+        for path in paths:
+            stat = path.stat()
+
+            with self._lock:
+                entry = self._entries.get(path)
+
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                continue
+
+            checksum = hashlib.sha256(path.read_bytes()).hexdigest()
+
+            if entry is not None and entry[2] == checksum:
+                with self._lock:
+                    self._entries[path] = (stat.st_mtime_ns, stat.st_size, checksum)
+
+                continue
+
+            pending[path] = (stat.st_mtime_ns, stat.st_size, checksum)
+
+        return pending
+
+    def record(self, entries: dict[Path, tuple[int, int, str]]) -> None:
+        """
+        Record files as pushed.
+
+        :param entries: pushed files and their state, as returned by
+            :py:meth:`pending`.
+        """
+
+        with self._lock:
+            self._entries.update(entries)
+
+
 DEFAULT_PUSH_OPTIONS = TransferOptions(
     protect_args=True,
     relative=True,
@@ -619,6 +777,11 @@ class BootMark(abc.ABC):
             is not updated yet.
         """
 
+        # Do not waste time on fetching the mark while the guest is not
+        # even accepting connections.
+        if not guest._probe_connection():
+            raise tmt.utils.wait.WaitingIncompleteError
+
         try:
             new_boot_mark = cls.fetch(guest)
 
@@ -1844,6 +2007,7 @@ class Guest(
         """
 
         self.guest_logs = []
+        self._push_manifest = PushManifest()
 
         super().__init__(logger=logger, parent=parent, name=name)
         self.load(data)
@@ -2390,16 +2554,19 @@ class Guest(
         if friendly_command is None:
             friendly_command = str(command)
 
-        return self.run(
-            command,
-            friendly_command=friendly_command,
-            silent=silent,
-            cwd=cwd,
-            environment=environment,
-            interactive=interactive,
-            log=log or self._command_verbose_logger,
-            **kwargs,
-        )
+        with tmt.trace.span(
+            'command', category='guest', guest=self.multihost_name, command=friendly_command
+        ):
+            return self.run(
+                command,
+                friendly_command=friendly_command,
+                silent=silent,
+                cwd=cwd,
+                environment=environment,
+                interactive=interactive,
+                log=log or self._command_verbose_logger,
+                **kwargs,
+            )
 
     @abc.abstractmethod
     def _run_ansible(
@@ -2606,6 +2773,40 @@ class Guest(
 
         raise NotImplementedError
 
+    def push_files(self, paths: Sequence[Path], options: Optional[TransferOptions] = None) -> None:
+        """
+        Push files to the same locations on the guest.
+
+        Files which did not change since their last push to the guest
+        are skipped, the rest is pushed at once where possible.
+
+        :param paths: files to push.
+        :param options: custom transfer options to use for all files.
+        """
+
+        if self.is_dry_run:
+            return
+
+        pending = self._push_manifest.pending(paths)
+
+        if not pending:
+            self.debug(f"Files {fmf.utils.listed(paths)} did not change since last push.", level=3)
+            return
+
+        self._push_files(list(pending), options=options)
+        self._push_manifest.record(pending)
+
+    def _push_files(self, paths: list[Path], options: Optional[TransferOptions] = None) -> None:
+        """
+        Push files to the same locations on the guest.
+
+        Files are pushed one by one, plugins may override this method
+        to push them in a single transfer.
+        """
+
+        for path in paths:
+            self.push(source=path, destination=path, options=options)
+
     @abc.abstractmethod
     def pull(
         self,
@@ -2775,6 +2976,24 @@ class Guest(
 
         raise NotImplementedError
 
+    def _probe_connection(self) -> bool:
+        """
+        Check whether the guest might be accepting connections.
+
+        A cheap check meant to precede more expensive attempts to run
+        a command on the guest while waiting for it to come up. A
+        negative answer must be reliable, when not sure, the method
+        should return ``True``.
+
+        Does nothing for :py:class:`Guest`. Should be overridden in
+        subclass if needed.
+
+        :returns: ``False`` if the guest is definitely not accepting
+            connections, ``True`` otherwise.
+        """
+
+        return True
+
     def reconnect(
         self,
         wait: Optional[Waiting] = None,
@@ -2792,6 +3011,9 @@ class Guest(
         self.debug("Wait for a connection to the guest.")
 
         def try_whoami() -> None:
+            if not self._probe_connection():
+                raise tmt.utils.wait.WaitingIncompleteError
+
             try:
                 self.execute(Command('whoami'), silent=True)
 
@@ -3128,6 +3350,29 @@ class GuestSsh(Guest, CommandCollector):
     #: other conditions. Useful for temporarily disabling the multiplexing.
     _ssh_multiplexing_disabled: bool = False
 
+    #: Guest identification and the address the SSH probe should
+    #: contact, as resolved by :py:meth:`_resolve_ssh_probe_address`.
+    _ssh_probe_address_cache: Optional[tuple[tuple[Any, ...], Optional[tuple[str, int]]]] = None
+
+    #: If set, the SSH master process will be checked for being
+    #: responsive before its next use. Set when a step starts, as the
+    #: process may have been idle for a long time.
+    _ssh_master_process_needs_check: bool = False
+
+    #: A persistent session running commands on the guest, used instead
+    #: of spawning ``ssh`` for each command when
+    #: :py:data:`SSH_COMMAND_SESSION` is enabled.
+    _command_session: Optional[CommandSession] = None
+
+    #: If set, the command session will not be used. Set when the
+    #: session could not be opened.
+    _command_session_disabled: bool = False
+
+    #: Set while an environment file is being pushed to the guest.
+    #: Commands run by the push itself, e.g. checking or installing
+    #: ``rsync``, export their environment inline.
+    _pushing_environment_file: bool = False
+
     def __init__(
         self,
         *,
@@ -3221,7 +3466,17 @@ class GuestSsh(Guest, CommandCollector):
         self.package_manager.build_container()
 
     def on_step_start(self, step: 'tmt.steps.Step') -> None:
-        self._cleanup_ssh_master_process()
+        """
+        Called when a step begins execution.
+
+        The SSH master process is shared by all steps, and it is kept
+        running between them. Since it might have been idle for a long
+        time, its health is verified before it is used again.
+
+        :param step: the step that is starting.
+        """
+
+        self._ssh_master_process_needs_check = True
 
     def on_step_complete(self, step: 'tmt.steps.Step') -> None:
         """
@@ -3234,7 +3489,78 @@ class GuestSsh(Guest, CommandCollector):
         if self.has_collected_commands:
             self.flush_collected()
 
-        self._cleanup_ssh_master_process()
+    def _resolve_ssh_probe_address(self) -> Optional[tuple[str, int]]:
+        """
+        Find out the hostname and port ``ssh`` would connect to.
+
+        ``ssh -G`` is used to evaluate the SSH configuration, the guest
+        address may be an alias, or the port may be changed by options.
+        When ``ssh`` would not connect directly, e.g. because of a proxy
+        or a jump host, the address cannot be probed.
+
+        :returns: hostname and port to probe, or ``None`` when the
+            address cannot be probed.
+        """
+
+        try:
+            output = self._run_guest_command(
+                Command('ssh') + self._ssh_options + Command('-G', self._ssh_guest),
+                environment=Environment.from_environ(),
+                silent=True,
+            )
+
+        except RunError as exc:
+            self.debug(f"Failed to evaluate SSH configuration: {exc}", level=3)
+
+            return None
+
+        config: dict[str, str] = {}
+
+        for line in (output.stdout or '').splitlines():
+            key, _, value = line.partition(' ')
+
+            config[key.lower()] = value.strip()
+
+        for key in ('proxycommand', 'proxyjump'):
+            if config.get(key, 'none').lower() != 'none':
+                self.debug(f"SSH connection uses '{key}', cannot probe it.", level=3)
+
+                return None
+
+        try:
+            return config['hostname'], int(config['port'])
+
+        except (KeyError, ValueError):
+            return None
+
+    def _probe_connection(self) -> bool:
+        """
+        Check whether the guest might be accepting connections.
+
+        Opens a plain TCP connection to the SSH server, and waits for
+        its identification string. Unlike a full ``ssh`` invocation,
+        the probe is cheap, and fails fast while the guest is down.
+        """
+
+        if SSH_PROBE_TIMEOUT <= 0 or self.primary_address is None:
+            return True
+
+        guest_id = (self.primary_address, self.port, self.user, tuple(self.ssh_option))
+
+        if self._ssh_probe_address_cache is None or self._ssh_probe_address_cache[0] != guest_id:
+            self._ssh_probe_address_cache = (guest_id, self._resolve_ssh_probe_address())
+
+        address = self._ssh_probe_address_cache[1]
+
+        if address is None:
+            return True
+
+        if probe_ssh_banner(*address, timeout=SSH_PROBE_TIMEOUT):
+            return True
+
+        self.debug(f"SSH server at '{address[0]}:{address[1]}' is not responding.", level=3)
+
+        return False
 
     @functools.cached_property
     def _ssh_guest(self) -> str:
@@ -3539,35 +3865,80 @@ class GuestSsh(Guest, CommandCollector):
             return
 
         with self._ssh_master_process_lock:
-            if self._ssh_master_process is None:
-                logger.debug(
-                    'The SSH master process cannot be terminated because it is unset.', level=3
-                )
+            self._terminate_ssh_master_process(signal=signal, logger=logger)
 
-                return
+    def _terminate_ssh_master_process(
+        self, signal: _signal.Signals = _signal.SIGTERM, logger: Optional[tmt.log.Logger] = None
+    ) -> None:
+        """
+        Terminate and clean up the SSH master process.
 
+        .. note::
+
+            The caller is responsible for holding
+            :py:attr:`_ssh_master_process_lock`.
+        """
+
+        logger = logger or self._logger
+
+        if self._ssh_master_process is None:
             logger.debug(
-                f'Terminating the SSH master process {self._ssh_master_process.pid}'
-                f' with {signal.name}.',
-                level=3,
+                'The SSH master process cannot be terminated because it is unset.', level=3
             )
 
-            self._ssh_master_process.send_signal(signal)
+            return
 
-            try:
-                # TODO: make the deadline configurable
-                self._ssh_master_process.wait(timeout=3)
+        logger.debug(
+            f'Terminating the SSH master process {self._ssh_master_process.pid}'
+            f' with {signal.name}.',
+            level=3,
+        )
 
-            except subprocess.TimeoutExpired:
-                logger.warning(
-                    f'Terminating the SSH master process {self._ssh_master_process.pid} timed out.'
-                )
+        self._ssh_master_process.send_signal(signal)
+
+        try:
+            # TODO: make the deadline configurable
+            self._ssh_master_process.wait(timeout=3)
 
-            self._flush_ssh_master_process()
+        except subprocess.TimeoutExpired:
+            logger.warning(
+                f'Terminating the SSH master process {self._ssh_master_process.pid} timed out.'
+            )
+
+        self._flush_ssh_master_process()
+
+    def _check_ssh_master_process(self) -> bool:
+        """
+        Check whether the SSH master process responds to control requests.
+
+        :returns: ``True`` if the master process is alive and accepts
+            requests, ``False`` otherwise.
+        """
+
+        try:
+            self._run_guest_command(
+                self._base_ssh_command
+                + Command(
+                    '-O',
+                    'check',
+                    'unused-hostname',
+                ),
+                environment=Environment.from_environ(),
+                silent=True,
+            )
+
+        except RunError:
+            return False
+
+        return True
 
     def _assert_ssh_master_process(self) -> None:
         """
         Make sure the SSH master process is up and running when enabled.
+
+        The master process is spawned on the first use, and then reused
+        by all following commands. Should the process die, or stop
+        responding, it is replaced with a new one.
         """
 
         if not self.is_ssh_multiplexing_enabled:
@@ -3586,32 +3957,36 @@ class GuestSsh(Guest, CommandCollector):
 
                 self._flush_ssh_master_process()
 
-            if self._ssh_master_process is None:
+            if self._ssh_master_process is not None and self._ssh_master_process_needs_check:
                 self._logger.debug(
-                    'SSH master process is not running and will be spawned.', level=3
+                    'Checking whether the the SSH master process is still responsive.', level=3
                 )
 
-                self._spawn_ssh_master_process()
+                if not self._check_ssh_master_process():
+                    self._logger.debug(
+                        f'SSH master process {self._ssh_master_process.pid} is not responsive'
+                        ' and will be replaced.',
+                        level=3,
+                    )
+
+                    self._terminate_ssh_master_process()
+
+            self._ssh_master_process_needs_check = False
+
+            if self._ssh_master_process is not None:
+                return
+
+            self._logger.debug('SSH master process is not running and will be spawned.', level=3)
+
+            self._spawn_ssh_master_process()
 
             self._logger.debug(
                 'Checking whether the the SSH master process is up and running.', level=3
             )
 
             def _wait_for_ssh_master() -> None:
-                try:
-                    self._run_guest_command(
-                        self._base_ssh_command
-                        + Command(
-                            '-O',
-                            'check',
-                            'unused-hostname',
-                        ),
-                        environment=Environment.from_environ(),
-                        silent=True,
-                    )
-
-                except RunError as exc:
-                    raise WaitingIncompleteError from exc
+                if not self._check_ssh_master_process():
+                    raise WaitingIncompleteError
 
             try:
                 # TODO: it would be nice to propagate someone's `wait`
@@ -3620,6 +3995,8 @@ class GuestSsh(Guest, CommandCollector):
                 default_ssh_master_start_waiting().wait(_wait_for_ssh_master, self._logger)
 
             except tmt.utils.wait.WaitingTimedOutError as exc:
+                self._terminate_ssh_master_process()
+
                 raise SSHMasterProcessFailedToStartError from exc
 
     @property
@@ -3886,7 +4263,7 @@ class GuestSsh(Guest, CommandCollector):
         # Accumulate all necessary commands - they will form a "shell" script, a single
         # string passed to SSH to execute on the remote machine.
         remote_commands: ShellScript = ShellScript.from_scripts(
-            self._prepare_command_environment(environment).to_shell_exports()
+            self._environment_exports(self._prepare_command_environment(environment))
         )
 
         # Change to given directory on guest if cwd provided
@@ -3908,6 +4285,28 @@ class GuestSsh(Guest, CommandCollector):
 
         self.debug(f"Execute command '{remote_command}' on guest '{self.primary_address}'.")
 
+        # Plain commands may run in the persistent session, commands
+        # interacting with the user or tracked by callers need their
+        # own process.
+        if (
+            SSH_COMMAND_SESSION
+            and not self._command_session_disabled
+            and not (interactive or tty or test_session)
+            and on_process_start is None
+            and on_process_end is None
+            and not kwargs
+        ):
+            session_output = self._run_in_command_session(
+                remote_commands,
+                ssh_command,
+                log=log,
+                friendly_command=friendly_command or str(command),
+                silent=silent,
+            )
+
+            if session_output is not None:
+                return session_output
+
         output = self._run_guest_command(
             ssh_command,
             log=log,
@@ -3935,6 +4334,122 @@ class GuestSsh(Guest, CommandCollector):
 
         return output
 
+    def _environment_exports(self, environment: Environment) -> list[ShellScript]:
+        """
+        Prepare commands setting environment variables on the guest.
+
+        Environments larger than :py:data:`ENVIRONMENT_FILE_THRESHOLD`
+        are saved in a file named after the checksum of its content, and
+        the file is sourced instead of exporting variables one by one.
+        The file is pushed to the guest only when it has not been pushed
+        already, and it contains the very same ``export`` commands,
+        including quoting of values.
+
+        Commands run on the guest while the file is being pushed, e.g.
+        the detection of ``rsync``, receive inline exports.
+
+        :param environment: environment variables to set.
+        :returns: commands to run before the actual command.
+        """
+
+        exports = environment.to_shell_exports()
+        content = '\n'.join(str(export) for export in exports)
+
+        # Pushing the file may need to run commands on the guest, with
+        # the very same environment - those cannot use the file.
+        if len(content) <= ENVIRONMENT_FILE_THRESHOLD or self._pushing_environment_file:
+            return exports
+
+        checksum = hashlib.sha256(content.encode()).hexdigest()
+        filepath = self.plan_workdir / ENVIRONMENT_FILE_DIRNAME / f'{checksum}.sh'
+
+        if not filepath.exists():
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+
+            # Values may be sensitive, keep the file private. Saved under
+            # a temporary name first, to never expose a partial file.
+            fd, temporary_filepath = tempfile.mkstemp(dir=filepath.parent, prefix='.tmp-')
+
+            with os.fdopen(fd, 'w') as f:
+                f.write(f'{content}\n')
+
+            os.replace(temporary_filepath, filepath)
+
+        self._pushing_environment_file = True
+
+        try:
+            self.push_files(
+                [filepath], options=TransferOptions(protect_args=True, preserve_perms=True)
+            )
+
+        finally:
+            self._pushing_environment_file = False
+
+        return [ShellScript(f'source {quote(str(filepath))}')]
+
+    def _run_in_command_session(
+        self,
+        script: ShellScript,
+        command: Command,
+        friendly_command: Optional[str] = None,
+        silent: bool = False,
+        log: Optional[tmt.log.VerboseLoggingFunction] = None,
+    ) -> Optional[tmt.utils.CommandOutput]:
+        """
+        Run a script in the persistent command session.
+
+        The session is opened on the first use. Should it fail to open,
+        the session is disabled for this guest, and the caller is
+        expected to run the command in its own ``ssh`` process.
+
+        :param script: script to run on the guest.
+        :param command: ``ssh`` command equivalent to running the script
+            in the session, reported by exceptions.
+        :returns: command output, or ``None`` if the session could not
+            be used.
+        """
+
+        if self._command_session is None:
+            self._command_session = CommandSession(
+                self._ssh_command + Command('-T', self._ssh_guest, tmt.utils.DEFAULT_SHELL),
+                logger=self._logger,
+            )
+
+        try:
+            with tmt.trace.span(
+                'command',
+                category='guest',
+                guest=self.multihost_name,
+                command=friendly_command or str(command),
+                session=True,
+            ):
+                return self._command_session.run(
+                    script,
+                    command=command,
+                    friendly_command=friendly_command,
+                    log=log or self._command_verbose_logger,
+                    silent=silent,
+                )
+
+        except CommandSessionError as exc:
+            self.debug(f'Failed to open command session, falling back to ssh: {exc}')
+
+            self._close_command_session()
+            self._command_session_disabled = True
+
+            return None
+
+    def _close_command_session(self) -> None:
+        """
+        Close the persistent command session, if it is open.
+        """
+
+        if self._command_session is None:
+            return
+
+        self._command_session.close()
+        self._command_session = None
+
     def _assert_rsync(self) -> None:
         """
         Make sure ``rsync`` is installed on the guest.
@@ -4031,10 +4546,17 @@ class GuestSsh(Guest, CommandCollector):
         ]
 
         try:
-            if options.create_destination:
-                self.execute(Command("mkdir", "-p", destination.parent), silent=True)
+            with tmt.trace.span(
+                'push',
+                category='rsync',
+                guest=self.multihost_name,
+                source=str(source),
+                destination=str(destination),
+            ):
+                if options.create_destination:
+                    self.execute(Command("mkdir", "-p", destination.parent), silent=True)
 
-            self._run_guest_command(cmd, silent=True)
+                self._run_guest_command(cmd, silent=True)
 
         except tmt.utils.RunError as exc:
             # Provide a reasonable error to the user
@@ -4043,6 +4565,47 @@ class GuestSsh(Guest, CommandCollector):
                 f"that login as '{self.user}' to the guest does not work."
             ) from exc
 
+    def _push_files(self, paths: list[Path], options: Optional[TransferOptions] = None) -> None:
+        """
+        Push files to the same locations on the guest in a single transfer
+        """
+
+        self._assert_rsync()
+        self._assert_ssh_master_process()
+
+        # Paths are absolute, with relative paths rsync recreates them
+        # under the root on the guest, i.e. at the very same location,
+        # creating missing directories.
+        options = (options or TransferOptions()).copy()
+        options.relative = True
+        options.recursive = False
+
+        self.debug(f"Copy {fmf.utils.listed(len(paths), 'file')} to the guest.")
+
+        cmd = Command(
+            'rsync',
+            *options.to_rsync(),
+            # Leave attributes of existing parent directories alone
+            '--no-implied-dirs',
+            '-e',
+            self._ssh_command.to_element(),
+            *(str(path) for path in paths),
+            f'{self._ssh_guest}:/',
+        )
+
+        try:
+            with tmt.trace.span(
+                'push', category='rsync', guest=self.multihost_name, files=len(paths)
+            ):
+                self._run_guest_command(cmd, silent=True)
+
+        except tmt.utils.RunError as exc:
+            # Provide a reasonable error to the user
+            raise tmt.utils.GeneralError(
+                f"Failed to push files to the guest. This usually means "
+                f"that login as '{self.user}' to the guest does not work."
+            ) from exc
+
     def pull(
         self,
         source: Optional[Path] = None,
@@ -4085,7 +4648,16 @@ class GuestSsh(Guest, CommandCollector):
             self.debug(f"Copy '{source}' from the guest to '{destination}'.")
 
         try:
-            with self.tmpdir(prefix='rsync-') as rsync_tempdir:
+            with (
+                tmt.trace.span(
+                    'pull',
+                    category='rsync',
+                    guest=self.multihost_name,
+                    source=str(source),
+                    destination=str(destination),
+                ),
+                self.tmpdir(prefix='rsync-') as rsync_tempdir,
+            ):
                 self._run_guest_command(
                     Command(
                         "rsync",
@@ -4108,6 +4680,18 @@ class GuestSsh(Guest, CommandCollector):
                 f"to the guest does not work."
             ) from exc
 
+    def reconnect(
+        self,
+        wait: Optional[Waiting] = None,
+    ) -> bool:
+        # The guest might have been restarted, or its network reconfigured,
+        # and the existing master connection cannot be trusted anymore.
+        # The first command will spawn a new master process.
+        self._close_command_session()
+        self._cleanup_ssh_master_process()
+
+        return super().reconnect(wait=wait)
+
     def suspend(self) -> None:
         """
         Suspend the guest.
@@ -4118,7 +4702,8 @@ class GuestSsh(Guest, CommandCollector):
 
         super().suspend()
 
-        # Close the master ssh connection
+        # Close the command session and the master ssh connection
+        self._close_command_session()
         self._cleanup_ssh_master_process()
 
     def stop(self) -> None:
@@ -4152,6 +4737,7 @@ class GuestSsh(Guest, CommandCollector):
                 post_trigger_action()
 
             # ... and then the cleanup.
+            self._close_command_session()
             self._cleanup_ssh_master_process()
 
             self._ssh_multiplexing_disabled = True
@@ -0,0 +1,300 @@
+"""
+Persistent command sessions.
+
+Running every command on a guest in its own ``ssh`` process is
+expensive: each command pays for a new process, a new channel and a new
+remote shell. A command session keeps a single shell running on the
+guest, and feeds it commands over its standard input, one at a time.
+
+Each command runs in its own subshell, its standard input is closed, and
+its standard output and error are captured in temporary files on the
+guest. Once the command finishes, the shell emits a frame header with
+the exit code and sizes of both outputs, followed by the outputs
+themselves, which makes it possible to demultiplex them from the single
+channel.
+"""
+
+import contextlib
+import secrets
+import subprocess
+import threading
+from typing import IO, Optional
+
+import click
+
+import tmt.log
+from tmt.utils import (
+    Command,
+    CommandOutput,
+    GeneralError,
+    ProcessExitCodes,
+    RunError,
+    ShellScript,
+    StreamLogger,
+)
+
+#: Exit code reported when the session itself fails, mirroring what
+#: ``ssh`` reports when the connection fails.
+SESSION_FAILURE_EXIT_CODE = 255
+
+#: Shell code defining the function running commands in the session.
+#: ``{marker}`` is replaced with the frame marker of the session.
+_SESSION_DRIVER = """
+__tmt_session_run() {{
+    local __tmt_script __tmt_stdout __tmt_stderr __tmt_returncode
+    __tmt_script="$(cat)"
+    if ! __tmt_stdout="$(mktemp)" || ! __tmt_stderr="$(mktemp)"; then
+        printf '%s %d 0 0\\n' '{marker}' {failure}
+        return
+    fi
+    ( eval "$__tmt_script" ) < /dev/null > "$__tmt_stdout" 2> "$__tmt_stderr"
+    __tmt_returncode=$?
+    printf '%s %d %d %d\\n' '{marker}' "$__tmt_returncode" \\
+        "$(wc -c < "$__tmt_stdout")" "$(wc -c < "$__tmt_stderr")"
+    cat "$__tmt_stdout" "$__tmt_stderr"
+    rm -f "$__tmt_stdout" "$__tmt_stderr"
+}}
+"""
+
+
+class CommandSessionError(GeneralError):
+    """
+    Raised when the session itself fails, not the command it runs.
+    """
+
+
+class CommandSession:
+    """
+    A long-running shell accepting commands over its standard input.
+
+    :param command: command spawning the shell, e.g. ``ssh`` connecting
+        to a guest and running ``bash`` there.
+    :param logger: used for logging.
+    """
+
+    def __init__(self, command: Command, *, logger: tmt.log.Logger) -> None:
+        self.command = command
+
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._stderr_logger: Optional[StreamLogger] = None
+
+        #: Marks the frame header emitted after each command. Unique for
+        #: each session, output of commands cannot be mistaken for it.
+        self._marker = f'TMT-SESSION-{secrets.token_hex(16)}'
+
+    @property
+    def is_alive(self) -> bool:
+        """
+        Whether the session shell is running.
+        """
+
+        return self._process is not None and self._process.poll() is None
+
+    def _write(self, content: str) -> None:
+        assert self._process is not None  # narrow type
+        assert self._process.stdin is not None  # narrow type
+
+        try:
+            self._process.stdin.write(content.encode('utf-8'))
+            self._process.stdin.flush()
+
+        except OSError as exc:
+            raise CommandSessionError('Failed to send command to the session.') from exc
+
+    def _read_frame(self) -> tuple[int, bytes, bytes]:
+        assert self._process is not None  # narrow type
+        assert self._process.stdout is not None  # narrow type
+
+        stream: IO[bytes] = self._process.stdout
+
+        while True:
+            line = stream.readline()
+
+            if not line:
+                raise CommandSessionError('Session terminated unexpectedly.')
+
+            if not line.startswith(self._marker.encode()):
+                # Nothing but frames is expected, anything else would
+                # come from the remote shell itself, e.g. from its profile.
+                self._logger.debug(
+                    'session', line.decode('utf-8', errors='replace').rstrip('\n'), level=3
+                )
+
+                continue
+
+            try:
+                _, returncode, stdout_size, stderr_size = line.split()
+
+                stdout = stream.read(int(stdout_size))
+                stderr = stream.read(int(stderr_size))
+
+                return int(returncode), stdout, stderr
+
+            except ValueError as exc:
+                raise CommandSessionError(f"Malformed session frame '{line!r}'.") from exc
+
+    def _open(self) -> None:
+        self._logger.debug(f'Opening command session: {self.command}', level=2)
+
+        try:
+            self._process = subprocess.Popen(
+                self.command.to_popen(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
+            )
+
+        except OSError as exc:
+            raise CommandSessionError(f"Failed to open session '{self.command}'.") from exc
+
+        self._stderr_logger = StreamLogger(
+            f'session[{self._process.pid}].stderr',
+            stream=self._process.stderr,
+            logger=self._logger.debug,
+            click_context=click.get_current_context(silent=True),
+            stream_output=True,
+        )
+        self._stderr_logger.start()
+
+        self._write(_SESSION_DRIVER.format(marker=self._marker, failure=SESSION_FAILURE_EXIT_CODE))
+
+        # Make sure the shell is up and responding before using it.
+        try:
+            self._run_script(ShellScript('true'))
+
+        except CommandSessionError:
+            self._close()
+
+            raise
+
+    def _close(self) -> None:
+        if self._process is None:
+            return
+
+        self._logger.debug(f'Closing command session {self._process.pid}.', level=3)
+
+        if self._process.stdin is not None:
+            with contextlib.suppress(OSError):
+                self._process.stdin.close()
+
+        try:
+            self._process.wait(timeout=3)
+
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+
+        if self._process.stdout is not None:
+            self._process.stdout.close()
+
+        if self._stderr_logger is not None:
+            self._stderr_logger.join()
+
+        self._process = None
+        self._stderr_logger = None
+
+    def _run_script(self, script: ShellScript) -> tuple[int, bytes, bytes]:
+        content = script.to_element()
+
+        # The script is passed as a here-document, make sure its
+        # delimiter cannot appear in the script.
+        delimiter = f'TMT_SESSION_EOF_{secrets.token_hex(8)}'
+
+        while delimiter in content:
+            delimiter = f'TMT_SESSION_EOF_{secrets.token_hex(8)}'
+
+        self._write(f"__tmt_session_run <<'{delimiter}'\n{content}\n{delimiter}\n")
+
+        return self._read_frame()
+
+    def close(self) -> None:
+        """
+        Terminate the session shell.
+        """
+
+        with self._lock:
+            self._close()
+
+    def run(
+        self,
+        script: ShellScript,
+        *,
+        command: Command,
+        friendly_command: Optional[str] = None,
+        log: Optional[tmt.log.VerboseLoggingFunction] = None,
+        silent: bool = False,
+        logger: Optional[tmt.log.Logger] = None,
+    ) -> CommandOutput:
+        """
+        Run a script in the session, and wait for it to finish.
+
+        The session is opened if it is not running yet.
+
+        :param script: script to run.
+        :param command: command equivalent to running ``script`` outside
+            of the session. It is reported by exceptions, to give users
+            a command they may run themselves.
+        :param friendly_command: if set, it would be logged instead of the
+            command itself, to improve visibility of the command in logging output.
+        :param log: a logging function to use for logging of command output. By
+            default, ``logger.debug`` is used.
+        :param silent: if set, logging of steps taken by this function would be
+            reduced.
+        :param logger: logger to use for logging.
+        :returns: command output, bundled in a :py:class:`CommandOutput` tuple.
+        :raises CommandSessionError: when the session could not be opened.
+        :raises RunError: when the script failed, or when the session
+            terminated while running the script.
+        """
+
+        logger = logger or self._logger
+
+        logger.debug(f'Run command in session: {script}', level=2)
+
+        if not silent and friendly_command:
+            (log or logger.verbose)('cmd', friendly_command, color='yellow', level=2)
+
+        output_logger = (log or logger.debug) if not silent else logger.debug
+
+        with self._lock:
+            if not self.is_alive:
+                self._close()
+                self._open()
+
+            try:
+                returncode, raw_stdout, raw_stderr = self._run_script(script)
+
+            except CommandSessionError as exc:
+                self._close()
+
+                raise RunError(
+                    f"Command '{friendly_command or str(command)}' failed: {exc}",
+                    command,
+                    SESSION_FAILURE_EXIT_CODE,
+                ) from exc
+
+        stdout = raw_stdout.decode('utf-8', errors='replace')
+        stderr = raw_stderr.decode('utf-8', errors='replace')
+
+        for header, content in (('stdout', stdout), ('stderr', stderr)):
+            for line in content.splitlines():
+                output_logger(header, line, 'yellow', level=3)
+
+        logger.debug(
+            f"Command returned '{returncode}' ({ProcessExitCodes.format(returncode)}).",
+            level=3,
+        )
+
+        if returncode != ProcessExitCodes.SUCCESS:
+            raise RunError(
+                f"Command '{friendly_command or str(command)}' returned {returncode}.",
+                command,
+                returncode,
+                stdout=stdout,
+                stderr=stderr,
+            )
+
+        return CommandOutput(stdout, stderr)
@@ -137,6 +137,21 @@ class Library(abc.ABC):
         raise NotImplementedError
 
 
+@container
+class _PendingDependency:
+    """
+    A dependency waiting to be resolved by :py:func:`resolve_dependencies`
+    """
+
+    dependency: Dependency
+    #: If set, the dependency is required rather than recommended.
+    is_required: bool
+    #: If set, the dependency is recommended rather than required.
+    is_recommended: bool
+    source_location: Optional[Path] = None
+    target_location: Optional[Path] = None
+
+
 # TODO: Move this under the test or discover interface
 def resolve_dependencies(
     *,
@@ -150,20 +165,24 @@ def resolve_dependencies(
     """
     Resolve the ``require`` and ``recommend`` dependencies.
 
-    For each library type encountered do the fetching, recursively resolve the
+    For each library type encountered do the fetching, resolve the
     library's dependencies as well, and forward all of the package dependencies
     that need to be processed by the ``PrepareInstall`` plugin.
 
-    The libraries are first processed from the ``require`` list and then from
-    the ``recommend`` list. Within each dependency list, each library's
-    dependencies are expanded first before moving to the next dependency on the
+    Dependencies are resolved in breadth-first waves: the first wave
+    consists of the given dependencies, the next wave of dependencies
+    of libraries fetched by the previous wave, and so on. Repositories
+    of all remote libraries of a wave are cloned in parallel before
+    their libraries are fetched. Dependencies from each ``require``
+    list are processed before those from the matching ``recommend``
     list.
 
     When encountering duplicate beakerlib libraries, the first library that was
     resolved takes precedence (this logic is defined in the
-    ``Beakerlib._do_fetch`` and the recursion order of this function). For
-    example, starting from the test's dependencies, the libraries can be
-    resolved as follows:
+    ``Beakerlib.fetch``), and libraries closer to the test are resolved
+    first. Requesting the same library with a different ref is an
+    error. For example, starting from the test's dependencies, the
+    libraries can be resolved as follows:
 
     .. code-block::
 
@@ -171,55 +190,80 @@ def resolve_dependencies(
          ├── library(A/lib)            (2)
          ├── library(B/lib)            (3)
          │   ├── library(A/lib)        (skipped, reuse (2))
-         │   └── library(C/lib)        (4)
-         └── library(C/lib)            (skipped, reuse (4))
+         │   └── library(C/lib)        (skipped, reuse (4))
+         └── library(C/lib)            (4)
 
     """
-    from .beakerlib import BeakerLib
+    from .beakerlib import BeakerLib, clone_repositories
 
     # TODO: These should actually be `set[DependencySimple]`
     #  need more work detangling covariant/variant issues
     require_to_install: set[Dependency] = set()
     recommend_to_install: set[Dependency] = set()
-    for dependency in (*original_require, *original_recommend):
-        try:
-            library = Library.from_identifier(
-                logger=logger,
-                identifier=dependency,
-                parent=parent,
+
+    def _pending(
+        require: list[Dependency],
+        recommend: list[Dependency],
+        source_location: Optional[Path],
+        target_location: Optional[Path],
+    ) -> list[_PendingDependency]:
+        return [
+            _PendingDependency(
+                dependency=dependency,
+                is_required=dependency in require,
+                is_recommended=dependency in recommend,
                 source_location=source_location,
                 target_location=target_location,
             )
-        except LibraryError:
-            # Not a library, just a regular package to be installed
-            # TODO: This check is not robust at all, try handling the cases
-            #  explicitly outside of the try..except.
-            if not isinstance(dependency, DependencySimple):
-                logger.warning(f"Library '{dependency}' failed unexpectedly")
-                # TODO: we should not add these to the *_to_install, but currently
-                #  DiscoverPlugin.install_libraries handles the logging of unresolved
-                #  libraries in general.
-            if dependency in original_require:
-                require_to_install.add(dependency)
-            if dependency in original_recommend:
-                recommend_to_install.add(dependency)
-            continue
-
-        if isinstance(library, BeakerLib):
-            # Recursively expand the beakerlib library dependencies
-            assert isinstance(library.tree.root, str)  # narrow type
-            requires, recommends = resolve_dependencies(
-                original_require=library.require,
-                original_recommend=library.recommend,
-                # TODO: we could do some better logging if we keep track of where the dependency
-                #  came from (parent here could be library instead)
-                parent=parent,
-                logger=logger,
-                # For any FileLibrary dependency, put them in the appropriate path?
-                source_location=library.source_directory,
-                target_location=Path(library.tree.root),
-            )
-            require_to_install.update(requires)
-            recommend_to_install.update(recommends)
+            for dependency in (*require, *recommend)
+        ]
+
+    wave = _pending(original_require, original_recommend, source_location, target_location)
+
+    while wave:
+        clone_repositories([pending.dependency for pending in wave], parent=parent, logger=logger)
+
+        next_wave: list[_PendingDependency] = []
+
+        for pending in wave:
+            dependency = pending.dependency
+
+            try:
+                library = Library.from_identifier(
+                    logger=logger,
+                    identifier=dependency,
+                    parent=parent,
+                    source_location=pending.source_location,
+                    target_location=pending.target_location,
+                )
+            except LibraryError:
+                # Not a library, just a regular package to be installed
+                # TODO: This check is not robust at all, try handling the cases
+                #  explicitly outside of the try..except.
+                if not isinstance(dependency, DependencySimple):
+                    logger.warning(f"Library '{dependency}' failed unexpectedly")
+                    # TODO: we should not add these to the *_to_install, but currently
+                    #  DiscoverPlugin.install_libraries handles the logging of unresolved
+                    #  libraries in general.
+                if pending.is_required:
+                    require_to_install.add(dependency)
+                if pending.is_recommended:
+                    recommend_to_install.add(dependency)
+                continue
+
+            if isinstance(library, BeakerLib):
+                # Expand the beakerlib library dependencies in the next wave
+                assert isinstance(library.tree.root, str)  # narrow type
+                next_wave += _pending(
+                    library.require,
+                    library.recommend,
+                    # TODO: we could do some better logging if we keep track of where the
+                    #  dependency came from (parent here could be library instead)
+                    # For any FileLibrary dependency, put them in the appropriate path?
+                    library.source_directory,
+                    Path(library.tree.root),
+                )
+
+        wave = next_wave
 
     return list(require_to_install), list(recommend_to_install)
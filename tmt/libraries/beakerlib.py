@@ -1,12 +1,15 @@
 import abc
 import hashlib
 import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, ClassVar, Literal, Optional, cast
 
 import fmf
 
 import tmt.base.core
 import tmt.log
+import tmt.trace
 import tmt.utils
 import tmt.utils.filesystem
 import tmt.utils.git
@@ -14,7 +17,7 @@ from tmt.base.core import Dependency, DependencyFmfId, DependencySimple
 from tmt.container import container, simple_field
 from tmt.convert import write
 from tmt.steps.discover import Discover
-from tmt.utils import Command, Path
+from tmt.utils import Command, Path, Stopwatch
 from tmt.utils.environment import Environment, EnvVarValue
 
 from . import Library, LibraryError
@@ -29,6 +32,9 @@ LIBRARY_REGEXP = re.compile(r'^library\(([^/]+)(/[^)]+)\)$')
 DEFAULT_REPOSITORY_TEMPLATE = 'https://github.com/beakerlib/{repository}'
 DEFAULT_DESTINATION = 'libs'
 
+#: Maximal number of library repositories cloned at the same time.
+CLONE_WORKERS: int = tmt.utils.configure_constant(4, 'TMT_LIBRARY_CLONE_WORKERS')
+
 # TODO: This can probably be dropped? Why do we strip the .git only for some?
 # List of git forges for which the .git suffix should be stripped
 STRIP_SUFFIX_FORGES = [
@@ -221,6 +227,15 @@ class BeakerLib(Library):
         Format the library name for debugging.
         """
 
+    def _check_conflict(self, cached_library: 'BeakerLib') -> None:
+        """
+        Make sure the library does not conflict with the already fetched one.
+
+        :param cached_library: the library already fetched to the same
+            location.
+        :raises GeneralError: when libraries do not use the same ref.
+        """
+
     def fetch(self) -> None:
         # Check if the library was already fetched
         # TODO: Use phase_workdir instead since this is for sure DiscoverPlugin
@@ -228,6 +243,8 @@ class BeakerLib(Library):
         local_repo_path = self.parent.workdir / self.dest / self.repo
         local_library_path = local_repo_path / self.fmf_node_path
         if cached_library := self._library_cache.get(local_library_path):
+            self._check_conflict(cached_library)
+
             # Use the already cached library as the source
             self.parent.debug(
                 f"Reusing previously fetched library '{self}' from {cached_library.ref_formatted}",
@@ -241,7 +258,14 @@ class BeakerLib(Library):
         # Otherwise do the actual fetch and finalize the library
         self.parent.debug(f"Fetch library '{self}'.", level=3)
         try:
-            self._do_fetch(local_repo_path)
+            with Stopwatch() as timer:
+                self._do_fetch(local_repo_path)
+
+            self.parent.verbose(
+                'fetched library',
+                f'{self} in {timer.duration.total_seconds():.2f}s',
+                'green',
+            )
         except (tmt.utils.RunError, tmt.utils.RetryError, tmt.utils.GitUrlError) as error:
             assert isinstance(self, BeakerLibFromUrl)
             # Fallback to install during the prepare step if in rpm format
@@ -307,6 +331,10 @@ class BeakerLibFromUrl(BeakerLib):
     # TODO: find a better home for this, either under the run/plan/discover/plugin
     _git_clone_cache: ClassVar[dict[Path, "BeakerLib"]] = {}
 
+    #: Failures of git clones. The keys are the absolute paths of the git
+    #: clones, and the values are exceptions raised while cloning them.
+    _git_clone_failures: ClassVar[dict[Path, Exception]] = {}
+
     @classmethod
     def from_identifier(
         cls,
@@ -351,30 +379,87 @@ class BeakerLibFromUrl(BeakerLib):
         ref_suffix = f"#{self.ref}" if self.ref else ""
         return f"{self} ({self.url}{ref_suffix})"
 
-    def _do_fetch(self, directory: Path) -> None:
+    @property
+    def clone_dir(self) -> Path:
+        """
+        Path to the git clone of the library repository.
+
+        Libraries from the same repository share the same clone.
+        """
+
         # TODO: Move this to a proper cache
         repo_unique_id = hashlib.sha256(usedforsecurity=False)
         repo_unique_id.update(self.url.encode())
         repo_unique_name = f"{self.repo}_{repo_unique_id.hexdigest()[:8]}"
-        clone_dir = self.parent.clone_dirpath / repo_unique_name
+        return self.parent.clone_dirpath / repo_unique_name
+
+    def clone(self, shallow: bool) -> Path:
+        """
+        Clone the library repository, unless it has been already cloned.
+
+        A failure to clone the repository is remembered, and the same
+        exception is raised again for any other library from the same
+        repository.
+
+        :param shallow: if set, try to clone just the latest commit.
+        :returns: path to the clone.
+        """
+
+        clone_dir = self.clone_dir
+
         if cached_library := self._git_clone_cache.get(clone_dir):
             self.parent.debug(
                 f"Repo '{self.identifier}' was already cloned from '{cached_library}'.", level=3
             )
-        else:
-            self.parent.debug(f"Cloning '{self.identifier}' for '{self}'.", level=3)
-
-            environment = Environment.from_environ()
-            environment["GIT_ASKPASS"] = EnvVarValue("echo")
-
-            tmt.utils.git.git_clone(
-                url=self.url,
-                destination=clone_dir,
-                shallow=self.ref is None,
-                environment=environment,
-                logger=self._logger,
+
+            return clone_dir
+
+        if failure := self._git_clone_failures.get(clone_dir):
+            raise failure
+
+        self.parent.debug(f"Cloning '{self.identifier}' for '{self}'.", level=3)
+
+        environment = Environment.from_environ()
+        environment["GIT_ASKPASS"] = EnvVarValue("echo")
+
+        try:
+            with Stopwatch() as timer:
+                tmt.utils.git.git_clone(
+                    url=self.url,
+                    destination=clone_dir,
+                    shallow=shallow,
+                    environment=environment,
+                    logger=self._logger,
+                )
+
+        except Exception as error:
+            self._git_clone_failures[clone_dir] = error
+            raise
+
+        self.parent.debug(
+            f"Cloned '{self.url}' in {timer.duration.total_seconds():.2f}s.", level=2
+        )
+
+        self._git_clone_cache[clone_dir] = self
+
+        return clone_dir
+
+    def _check_conflict(self, cached_library: BeakerLib) -> None:
+        if not isinstance(cached_library, BeakerLibFromUrl):
+            return
+
+        # Use the default branch if no ref provided, the same as the
+        # fetch would do.
+        ref = self.ref or cached_library.default_branch
+
+        if ref != cached_library.ref:
+            raise tmt.utils.GeneralError(
+                f"Library '{self}' using ref '{ref}' conflicts with already fetched "
+                f"library {cached_library.ref_formatted}."
             )
-            self._git_clone_cache[clone_dir] = self
+
+    def _do_fetch(self, directory: Path) -> None:
+        clone_dir = self.clone(shallow=self.ref is None)
         self.source_directory = clone_dir
 
         # Detect the default branch from the origin
@@ -539,3 +624,83 @@ class BeakerLibFromPath(BeakerLib):
             directory / '.fmf',
             self._logger,
         )
+
+
+def clone_repositories(
+    identifiers: Iterable[Dependency],
+    *,
+    parent: tmt.utils.Common,
+    workers: int = CLONE_WORKERS,
+    logger: tmt.log.Logger,
+) -> None:
+    """
+    Clone repositories of all remote libraries among given dependencies.
+
+    Repositories are cloned in parallel, each of them just once, no
+    matter how many libraries it provides. Clones are then used by
+    :py:meth:`BeakerLibFromUrl.fetch` of each library.
+
+    Failures are not reported by this function. They are remembered,
+    and reported once the affected library is fetched.
+
+    :param identifiers: dependencies to inspect. Dependencies which are
+        not remote beakerlib libraries are ignored.
+    :param parent: the phase that requested the libraries.
+    :param workers: maximal number of repositories cloned at the same
+        time.
+    :param logger: used for logging.
+    """
+
+    repositories: dict[Path, list[BeakerLibFromUrl]] = {}
+
+    for identifier in identifiers:
+        if isinstance(identifier, DependencySimple):
+            if not LIBRARY_REGEXP.search(identifier.strip()):
+                continue
+
+        elif not isinstance(identifier, DependencyFmfId) or not identifier.url:
+            continue
+
+        try:
+            library = BeakerLib.from_identifier(
+                identifier=identifier, parent=parent, logger=logger
+            )
+
+        # Invalid identifiers will be reported once fetched
+        except (LibraryError, tmt.utils.GeneralError):
+            continue
+
+        assert isinstance(library, BeakerLibFromUrl)  # narrow type
+
+        repositories.setdefault(library.clone_dir, []).append(library)
+
+    def _clone(libraries: list[BeakerLibFromUrl]) -> None:
+        # A shallow clone would not do if any library needs a specific ref.
+        shallow = all(library.ref is None for library in libraries)
+
+        try:
+            libraries[0].clone(shallow=shallow)
+
+        except Exception as error:
+            logger.debug(f"Failed to clone '{libraries[0].url}': {error}", level=3)
+
+    pending = [
+        libraries
+        for clone_dir, libraries in repositories.items()
+        if clone_dir not in BeakerLibFromUrl._git_clone_cache
+        and clone_dir not in BeakerLibFromUrl._git_clone_failures
+    ]
+
+    if not pending:
+        return
+
+    logger.debug(f"Cloning {len(pending)} library repositories.", level=3)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(tmt.trace.propagate(_clone), libraries) for libraries in pending
+        ]
+
+        # Consume results to wait for all clones.
+        for future in futures:
+            future.result()
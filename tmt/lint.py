@@ -63,9 +63,15 @@ following examples:
 """
 
 import enum
+import math
+import multiprocessing
+import os
 import re
+import sys
 import textwrap
-from collections.abc import Iterable, Iterator
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from typing import (
     Any,
     Callable,
@@ -77,11 +83,20 @@ from typing import (
 
 import tmt.utils
 from tmt.config import Config
-from tmt.container import container
+from tmt.container import container, simple_field
 
 # ignore[type-arg]: bound type vars cannot be generic, and it would create a loop anyway.
 LintableT = TypeVar('LintableT', bound='Lintable')  # type: ignore[type-arg]
 
+#: Number of worker processes linting objects in parallel. Set to ``1``
+#: to lint objects in the tmt process itself.
+LINT_WORKERS: int = tmt.utils.configure_constant(os.cpu_count() or 1, 'TMT_LINT_WORKERS')
+
+#: Minimal number of objects linted by a worker process at once. Trees
+#: too small to be split into at least two such chunks are linted in the
+#: tmt process itself, forking workers would not pay off.
+LINT_CHUNK_SIZE = 50
+
 
 class LinterOutcome(enum.Enum):
     SKIP = 'skip'
@@ -172,6 +187,53 @@ class Linter:
         return [f'{self.id}: {self.help}']
 
 
+@container
+class LinterTimings:
+    """
+    Time spent by linters, accumulated over all linted objects
+    """
+
+    #: Total time spent by each linter, in seconds, indexed by linter ID.
+    durations: dict[str, float] = simple_field(default_factory=dict)
+
+    #: Number of objects inspected by each linter, indexed by linter ID.
+    counts: dict[str, int] = simple_field(default_factory=dict)
+
+    def record(self, linter_id: str, duration: float, count: int = 1) -> None:
+        """
+        Record time spent by a linter.
+
+        :param linter_id: ID of the linter.
+        :param duration: time spent by the linter, in seconds.
+        :param count: number of objects inspected in that time.
+        """
+
+        self.durations[linter_id] = self.durations.get(linter_id, 0.0) + duration
+        self.counts[linter_id] = self.counts.get(linter_id, 0) + count
+
+    def update(self, other: 'LinterTimings') -> None:
+        """
+        Add time recorded by another collection of timings.
+        """
+
+        for linter_id, duration in other.durations.items():
+            self.record(linter_id, duration, count=other.counts[linter_id])
+
+    def format(self) -> list[str]:
+        """
+        Format timings for printing or logging.
+
+        :returns: a line for each linter, the slowest linters first.
+        """
+
+        return [
+            f'{linter_id} {duration:10.3f}s {self.counts[linter_id]:8} objects'
+            for linter_id, duration in sorted(
+                self.durations.items(), key=lambda item: (-item[1], item[0])
+            )
+        ]
+
+
 class Lintable(Generic[LintableT]):
     """
     Mixin class adding support for linting of class instances
@@ -260,6 +322,7 @@ class Lintable(Generic[LintableT]):
         disable_checks: Optional[list[str]] = None,
         enforce_checks: Optional[list[str]] = None,
         linters: Optional[list[Linter]] = None,
+        timings: Optional[LinterTimings] = None,
     ) -> tuple[bool, list[LinterRuling]]:
         """
         Check the instance against a battery of linters and report results.
@@ -273,6 +336,8 @@ class Lintable(Generic[LintableT]):
             a fail.
         :param linters: if set, only these linters would be applied. Providing
             ``linters`` makes ``enable_checks`` and ``disable_checks`` ignored.
+        :param timings: if set, time spent by each linter would be recorded
+            in this collection.
         :returns: a tuple of two items: a boolean reporting whether the instance
             passed the test, and a list of :py:class:`LinterRuling` items, each
             describing one linter outcome. Note that linters may produce none or
@@ -293,6 +358,8 @@ class Lintable(Generic[LintableT]):
         rulings: list[LinterRuling] = []
 
         for linter in sorted(linters, key=lambda x: x.id):
+            start = time.monotonic()
+
             for outcome, message in linter.callback(self):
                 if outcome == LinterOutcome.FAIL:
                     rulings.append((linter, outcome, outcome, message))
@@ -311,6 +378,9 @@ class Lintable(Generic[LintableT]):
                 else:
                     rulings.append((linter, outcome, outcome, message))
 
+            if timings is not None:
+                timings.record(linter.id, time.monotonic() - start)
+
         return valid, rulings
 
     @classmethod
@@ -330,6 +400,134 @@ class Lintable(Generic[LintableT]):
         return '\n'.join(hints)
 
 
+#: A ruling as passed from worker processes: linter ID, outcomes and message.
+_RawLinterRuling = tuple[str, LinterOutcome, LinterOutcome, str]
+
+#: Objects and linters shared with worker processes. Workers are forked,
+#: and inherit them from the tmt process instead of unpickling them.
+_WORKER_JOB: Optional[tuple[Sequence['Lintable[Any]'], list[Linter], list[str]]] = None
+
+
+def _lint_chunk(
+    start: int, end: int
+) -> tuple[list[tuple[bool, list[_RawLinterRuling]]], LinterTimings]:
+    """
+    Lint a chunk of objects shared with worker processes
+    """
+
+    assert _WORKER_JOB is not None  # narrow type
+
+    lintables, linters, enforce_checks = _WORKER_JOB
+    timings = LinterTimings()
+
+    results: list[tuple[bool, list[_RawLinterRuling]]] = []
+
+    for lintable in lintables[start:end]:
+        valid, rulings = lintable.lint(
+            linters=linters, enforce_checks=enforce_checks, timings=timings
+        )
+
+        results.append(
+            (
+                valid,
+                [
+                    (linter.id, actual_outcome, eventual_outcome, message)
+                    for linter, actual_outcome, eventual_outcome, message in rulings
+                ],
+            )
+        )
+
+    return results, timings
+
+
+def lint_objects(
+    lintables: Sequence[LintableT],
+    *,
+    linters: list[Linter],
+    enforce_checks: Optional[list[str]] = None,
+    workers: int = 1,
+    timings: Optional[LinterTimings] = None,
+) -> Iterator[tuple[LintableT, bool, list[LinterRuling]]]:
+    """
+    Check multiple objects against a battery of linters.
+
+    Objects are split into chunks, and chunks are linted by a pool of
+    forked worker processes. Results are yielded in the order of given
+    objects, no matter which worker linted them.
+
+    Objects are linted in the tmt process itself when only one worker
+    is allowed, when there are too few objects to split, or when the
+    platform does not support forking processes.
+
+    :param lintables: objects to lint.
+    :param linters: linters to apply.
+    :param enforce_checks: if set, listed checks would be marked as failed
+        if their outcome is not ``pass``.
+    :param workers: maximal number of worker processes.
+    :param timings: if set, time spent by each linter would be recorded
+        in this collection.
+    :yields: a tuple of three items for each object: the object itself,
+        a boolean reporting whether the object passed the test, and a list
+        of :py:class:`LinterRuling` items, as :py:meth:`Lintable.lint`
+        would report.
+    """
+
+    global _WORKER_JOB
+
+    enforce_checks = enforce_checks or []
+
+    chunk_size = max(LINT_CHUNK_SIZE, math.ceil(len(lintables) / (workers * 4)))
+    chunks = [
+        (start, min(start + chunk_size, len(lintables)))
+        for start in range(0, len(lintables), chunk_size)
+    ]
+
+    if workers <= 1 or len(chunks) <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        for lintable in lintables:
+            valid, rulings = lintable.lint(
+                linters=linters, enforce_checks=enforce_checks, timings=timings
+            )
+
+            yield lintable, valid, rulings
+
+        return
+
+    linters_by_id = {linter.id: linter for linter in linters}
+
+    # Forked workers would flush whatever they inherited in output
+    # buffers, make sure nothing is printed twice.
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    _WORKER_JOB = (lintables, linters, enforce_checks)
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            mp_context=multiprocessing.get_context('fork'),
+        ) as executor:
+            futures = [executor.submit(_lint_chunk, start, end) for start, end in chunks]
+
+            for (start, end), future in zip(chunks, futures):
+                results, chunk_timings = future.result()
+
+                if timings is not None:
+                    timings.update(chunk_timings)
+
+                for lintable, (valid, raw_rulings) in zip(lintables[start:end], results):
+                    yield (
+                        lintable,
+                        valid,
+                        [
+                            (linters_by_id[linter_id], actual_outcome, eventual_outcome, message)
+                            for linter_id, actual_outcome, eventual_outcome, message in raw_rulings
+                        ],
+                    )
+
+    finally:
+        _WORKER_JOB = None
+
+
 def filter_allowed_checks(
     rulings: Iterable[LinterRuling],
     outcomes: Optional[list[LinterOutcome]] = None,
@@ -555,6 +555,19 @@ LINT_OPTIONS: list[ClickOptionDecoratorType] = [
         choices=_lint_outcomes,
         help='Display only checks with the given outcome.',
     ),
+    option(
+        '--changed-since',
+        metavar='REF',
+        help="""
+             Lint only objects whose fmf files changed since the given git reference,
+             including uncommitted and untracked files.
+             """,
+    ),
+    option(
+        '--show-timings',
+        is_flag=True,
+        help='Display time spent by each check.',
+    ),
 ]
 
 
@@ -1,10 +1,13 @@
 import dataclasses
-import uuid
+import hashlib
+import json
 from collections.abc import Iterator
-from typing import Any, Optional
+from shlex import quote
+from typing import TYPE_CHECKING, Any, Optional
 
 import fmf.utils
 
+import tmt.log
 import tmt.utils
 from tmt.container import PYDANTIC_V1, ConfigDict, MetadataContainer
 from tmt.guest import TransferOptions
@@ -17,8 +20,66 @@ from tmt.package_managers import (
 )
 from tmt.utils import Command, CommandOutput, Path, ShellScript
 
+if TYPE_CHECKING:
+    from tmt.guest import Guest
+
 LOCALHOST_BOOTC_IMAGE_PREFIX = "localhost/tmt"
 
+#: Label of built images, holding a checksum of commands applied on top of
+#: the base image.
+BOOTC_IMAGE_LAYERS_LABEL = "tmt.bootc.layers"
+
+#: Format of ``podman image inspect`` output: image ID and the checksum
+#: of layers applied by tmt.
+IMAGE_INSPECT_FORMAT = f'{{{{.Id}}}} {{{{index .Labels "{BOOTC_IMAGE_LAYERS_LABEL}"}}}}'
+
+
+def layers_checksum(layers: list[str]) -> str:
+    """
+    Compute a checksum of Containerfile directives
+    """
+
+    return hashlib.sha256(json.dumps(layers).encode()).hexdigest()
+
+
+def normalize_layers(layers: list[str], plan_workdir: Path, run_workdir: Path) -> list[str]:
+    """
+    Replace run-specific paths in Containerfile directives with placeholders.
+
+    Collected commands export plan and guest environment, e.g.
+    ``TMT_PLAN_DATA`` or ``TMT_TREE``, pointing to the plan workdir.
+    Without the replacement, commands collected by different runs or
+    plans would never be considered identical.
+
+    :param layers: Containerfile directives to normalize.
+    :param plan_workdir: workdir of the plan collecting the directives.
+    :param run_workdir: workdir of the run the plan belongs to.
+    :returns: directives suitable for :py:func:`layers_checksum`.
+    """
+
+    # Plan workdir lives under the run workdir, replace it first.
+    return [
+        layer.replace(str(plan_workdir), '<plan-workdir>').replace(
+            str(run_workdir), '<run-workdir>'
+        )
+        for layer in layers
+    ]
+
+
+def image_cache_key(base_image_id: str, layers: list[str]) -> str:
+    """
+    Compute a key of an image built from the given base image.
+
+    :param base_image_id: ID of the base image, i.e. the digest of its
+        content, not its name, which may point to different images over
+        time.
+    :param layers: Containerfile directives applied on top of the base
+        image, one layer each.
+    :returns: a key suitable as an image tag.
+    """
+
+    return hashlib.sha256(f'{base_image_id}\n{layers_checksum(layers)}'.encode()).hexdigest()
+
 
 class BootcMetadataContainer(MetadataContainer):
     """
@@ -206,6 +267,15 @@ class Bootc(PackageManager[BootcEngine]):
     # Needs to be bigger than priorities of `yum`, `dnf`, `dnf5` and `rpm-ostree`.
     probe_priority = 130
 
+    def __init__(self, *, guest: 'Guest', logger: tmt.log.Logger) -> None:
+        super().__init__(guest=guest, logger=logger)
+
+        #: Number of builds avoided by reusing an image.
+        self.cache_hits = 0
+
+        #: Number of images which had to be built.
+        self.cache_misses = 0
+
     def extract_package_name_from_package_manager_output(self, output: str) -> Iterator[str]:
         return self.guest.bootc_builder.extract_package_name_from_package_manager_output(output)
 
@@ -225,7 +295,61 @@ class Bootc(PackageManager[BootcEngine]):
 
         return results
 
+    def _inspect_image(self, image: str) -> tuple[str, str]:
+        """
+        Find the ID of an image and the checksum of its tmt layers.
+
+        :returns: ID of the image, and the checksum of commands applied
+            by tmt when building the image, or an empty string if the
+            image was not built by tmt.
+        """
+
+        output = self.guest.execute(
+            ShellScript(
+                f'{self.guest.facts.sudo_prefix} podman image inspect'
+                f' --format {quote(IMAGE_INSPECT_FORMAT)} {quote(image)}'
+            ),
+            silent=True,
+        )
+
+        image_id, _, checksum = (output.stdout or '').strip().partition(' ')
+
+        if not image_id:
+            raise tmt.utils.PrepareError(f"Failed to inspect image '{image}'.")
+
+        return image_id, '' if checksum == '<no value>' else checksum
+
+    def _image_exists(self, image: str) -> bool:
+        try:
+            self.guest.execute(
+                ShellScript(f'{self.guest.facts.sudo_prefix} podman image exists {quote(image)}'),
+                silent=True,
+            )
+
+        except tmt.utils.RunError:
+            return False
+
+        return True
+
+    def _report_cache(self, outcome: str) -> None:
+        self.info(
+            "package",
+            f"image cache {outcome} ({self.cache_hits} hits, {self.cache_misses} misses)",
+            "green",
+        )
+
     def build_container(self) -> Optional[CommandOutput]:
+        """
+        Build an image from collected directives, switch to it and reboot.
+
+        Every directive but the base image is a separate layer, and the
+        image is tagged by a key computed from the ID of the base image
+        and the layers. An image built already is reused rather than
+        built again, and nothing is done when the booted image has been
+        built from the very same layers, e.g. when a prepare phase is
+        applied again.
+        """
+
         # Skip in dry run mode
         if self.guest.is_dry_run:
             return None
@@ -234,13 +358,20 @@ class Bootc(PackageManager[BootcEngine]):
             self.debug("No Containerfile directives to build container image, skipping build.")
             return None
 
-        image_tag = f"{LOCALHOST_BOOTC_IMAGE_PREFIX}/bootc/{uuid.uuid4()}"
-
         # Write the final Containerfile
         with self.guest.mkdtemp() as containerfile_dir:
             containerfile_path = Path(containerfile_dir, 'Containerfile')
 
             containerfile = '\n'.join(self.engine.containerfile_directives)
+            layers = normalize_layers(
+                [
+                    directive
+                    for directive in self.engine.containerfile_directives
+                    if not directive.startswith('FROM ')
+                ],
+                self.guest.plan_workdir,
+                self.guest.run_workdir,
+            )
 
             base_image = self.engine._get_current_bootc_image()
 
@@ -261,32 +392,33 @@ class Bootc(PackageManager[BootcEngine]):
                         ')"'
                     )
                 )
-                # Write Containerfile via push() to avoid exceeding
-                # the OS ARG_MAX limit on the SSH command line.
-                local_containerfile = self.guest.guest_workdir / 'Containerfile'
-                local_containerfile.write_text(containerfile)
-                self.guest.push(
-                    source=local_containerfile,
-                    destination=containerfile_path,
-                    options=TransferOptions(
-                        recursive=False,
-                        compress=True,
-                    ),
-                )
 
-                self.debug(f"containerfile content: {containerfile}")
-                # Build the container image
-                self.info("package", "building container image with dependencies", "green")
+                base_image_id, base_image_layers = self._inspect_image(base_image)
 
-                assert self.guest.parent is not None
+                # The booted image has been built from the very same layers,
+                # applying them again would not change anything.
+                if base_image_layers == layers_checksum(layers):
+                    self.cache_hits += 1
+                    self._report_cache("hit, image is booted already")
 
-                # Mount run_workdir so scripts have access to tmt files during build.
-                # Use :Z for SELinux private label.
-                build_output = self.guest.execute(
-                    ShellScript(
-                        f'{self.guest.facts.sudo_prefix} podman build -v {self.guest.run_workdir}:{self.guest.run_workdir}:Z -t {image_tag} -f {containerfile_path} {self.guest.run_workdir}'  # noqa: E501
+                    return None
+
+                image_key = image_cache_key(base_image_id, layers)
+                image_tag = f"{LOCALHOST_BOOTC_IMAGE_PREFIX}/bootc:{image_key}"
+
+                build_output: Optional[CommandOutput] = None
+
+                if self._image_exists(image_tag):
+                    self.cache_hits += 1
+                    self._report_cache(f"hit, reusing image {image_tag}")
+
+                else:
+                    self.cache_misses += 1
+                    self._report_cache("miss")
+
+                    build_output = self._build_image(
+                        containerfile, containerfile_path, image_tag, layers
                     )
-                )
 
                 # Switch to the new image for next boot
                 self.info("package", f"switching to new image {image_tag}", "green")
@@ -305,6 +437,43 @@ class Bootc(PackageManager[BootcEngine]):
                 # Reset containerfile directives
                 self.engine.flush_containerfile_directives()
 
+    def _build_image(
+        self, containerfile: str, containerfile_path: Path, image_tag: str, layers: list[str]
+    ) -> CommandOutput:
+        """
+        Build and tag an image from the given Containerfile
+        """
+
+        # Write Containerfile via push() to avoid exceeding
+        # the OS ARG_MAX limit on the SSH command line.
+        local_containerfile = self.guest.guest_workdir / 'Containerfile'
+        local_containerfile.write_text(containerfile)
+        self.guest.push(
+            source=local_containerfile,
+            destination=containerfile_path,
+            options=TransferOptions(
+                recursive=False,
+                compress=True,
+            ),
+        )
+
+        self.debug(f"containerfile content: {containerfile}")
+        # Build the container image
+        self.info("package", "building container image with dependencies", "green")
+
+        assert self.guest.parent is not None
+
+        # Mount run_workdir so scripts have access to tmt files during build.
+        # Use :Z for SELinux private label.
+        return self.guest.execute(
+            ShellScript(
+                f'{self.guest.facts.sudo_prefix} podman build'
+                f' --label {BOOTC_IMAGE_LAYERS_LABEL}={layers_checksum(layers)}'
+                f' -v {self.guest.run_workdir}:{self.guest.run_workdir}:Z'
+                f' -t {image_tag} -f {containerfile_path} {self.guest.run_workdir}'
+            )
+        )
+
     def refresh_metadata(self) -> CommandOutput:
         self.engine.refresh_metadata()
 
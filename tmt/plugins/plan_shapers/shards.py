@@ -0,0 +1,293 @@
+import abc
+import collections
+import heapq
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Callable
+
+import tmt.durations
+import tmt.log
+import tmt.utils
+from tmt._compat.pathlib import Path
+from tmt.durations import expected_durations, parse_result_duration
+from tmt.plugins import PluginRegistry
+from tmt.plugins.plan_shapers import PlanShaper, provides_plan_shaper
+
+if TYPE_CHECKING:
+    from tmt.base.core import Test
+    from tmt.base.plan import Plan
+    from tmt.options import ClickOptionDecoratorType
+    from tmt.steps.discover import TestOrigin
+
+
+#: Ways of balancing shards.
+BALANCE_METHODS = ('duration', 'count')
+
+#: How many of the most recent runs are inspected for test durations.
+HISTORY_RUN_LIMIT = 10
+
+#: Readers of result files, indexed by file suffix.
+_RESULTS_READERS: dict[str, Callable[[str], Any]] = {
+    '.yaml': tmt.utils.from_yaml,
+    '.json': tmt.utils.from_json,
+}
+
+
+class DurationHistory(abc.ABC):
+    """
+    A base class for sources of historical test durations.
+    """
+
+    def __init__(self, *, logger: tmt.log.Logger) -> None:
+        self._logger = logger
+
+    @abc.abstractmethod
+    def durations(self, plan: 'Plan', tests: list['TestOrigin']) -> dict[str, float]:
+        """
+        Provide known durations of given tests.
+
+        :param plan: plan the tests belong to.
+        :param tests: tests whose durations are requested.
+        :returns: a mapping between test names and their expected
+            durations, in seconds. Tests with no known duration may be
+            left out.
+        """
+
+        raise NotImplementedError
+
+
+_DURATION_HISTORY_REGISTRY: PluginRegistry[type[DurationHistory]] = PluginRegistry(
+    'plan_shapers.shards.history'
+)
+
+provides_duration_history: Callable[
+    [str],
+    Callable[[type[DurationHistory]], type[DurationHistory]],
+] = _DURATION_HISTORY_REGISTRY.create_decorator()
+
+
+@provides_duration_history('results')
+class ResultsDurationHistory(DurationHistory):
+    """
+    Durations recorded in results of previous runs of the same plan.
+
+    Results of the plan and of plans derived from it are inspected in
+    :py:data:`HISTORY_RUN_LIMIT` most recent runs found in the workdir
+    root, and the average recorded duration of each test is used.
+    """
+
+    def _iter_results_filepaths(self, plan: 'Plan') -> Iterator[Path]:
+        assert plan.my_run is not None  # narrow type
+
+        workdir_root = plan.my_run.workdir_root
+        current_run_workdir = plan.my_run.run_workdir
+
+        if not workdir_root.is_dir():
+            return
+
+        run_workdirs: list[tuple[float, str, Path]] = []
+
+        for run_workdir in workdir_root.iterdir():
+            if run_workdir == current_run_workdir:
+                continue
+
+            try:
+                if not run_workdir.is_dir():
+                    continue
+
+                run_workdirs.append((run_workdir.stat().st_mtime, run_workdir.name, run_workdir))
+
+            except OSError:
+                continue
+
+        run_workdirs.sort(reverse=True)
+
+        plan_dirname = plan.safe_name.lstrip('/')
+
+        for _, _, run_workdir in run_workdirs[:HISTORY_RUN_LIMIT]:
+            plan_workdir = run_workdir / plan_dirname
+
+            if not plan_workdir.parent.is_dir():
+                continue
+
+            # The plan itself, and plans derived from it by shapers,
+            # e.g. `/plans/foo.1`.
+            for dirpath in sorted(
+                [plan_workdir, *plan_workdir.parent.glob(f'{plan_workdir.name}.*')]
+            ):
+                for suffix in _RESULTS_READERS:
+                    filepath = dirpath / 'execute' / f'results{suffix}'
+
+                    if filepath.is_file():
+                        yield filepath
+
+    def durations(self, plan: 'Plan', tests: list['TestOrigin']) -> dict[str, float]:
+        wanted_names = {test_origin.test.name for test_origin in tests}
+        observed: dict[str, list[float]] = collections.defaultdict(list)
+
+        for filepath in self._iter_results_filepaths(plan):
+            try:
+                results = _RESULTS_READERS[filepath.suffix](filepath.read_text())
+
+            except Exception as exc:
+                self._logger.debug(f"Failed to load results from '{filepath}': {exc}", level=3)
+                continue
+
+            if not isinstance(results, list):
+                continue
+
+            for result in results:
+                if not isinstance(result, dict) or result.get('name') not in wanted_names:
+                    continue
+
+                duration = parse_result_duration(result.get('duration'))
+
+                if duration is not None:
+                    observed[result['name']].append(duration)
+
+        return {name: sum(durations) / len(durations) for name, durations in observed.items()}
+
+
+@provides_duration_history('store')
+class StoreDurationHistory(DurationHistory):
+    """
+    Durations recorded in the duration history database.
+
+    The database of the user is updated by every execute step, and it
+    survives removal of runs. See :py:mod:`tmt.durations`.
+    """
+
+    def durations(self, plan: 'Plan', tests: list['TestOrigin']) -> dict[str, float]:
+        return tmt.durations.DurationStore(logger=self._logger).durations(tests)
+
+
+def pack_shards(weights: Sequence[float], shard_count: int) -> list[list[int]]:
+    """
+    Distribute items of given weights among shards of similar total weight.
+
+    Items are assigned from the heaviest to the lightest one, each to the
+    currently lightest shard. Ties are broken by the original position of
+    the item and by the shard index, making the outcome deterministic.
+
+    :param weights: weights of items.
+    :param shard_count: number of shards to fill.
+    :returns: indices of items assigned to each shard, in their original
+        order. Shards which received no items are not included.
+    """
+
+    shards: list[list[int]] = [[] for _ in range(shard_count)]
+    loads: list[tuple[float, int]] = [(0.0, shard_index) for shard_index in range(shard_count)]
+
+    for index in sorted(range(len(weights)), key=lambda index: (-weights[index], index)):
+        load, shard_index = heapq.heappop(loads)
+
+        shards[shard_index].append(index)
+
+        heapq.heappush(loads, (load + weights[index], shard_index))
+
+    return [sorted(shard) for shard in shards if shard]
+
+
+@provides_plan_shaper('shards')
+class ShardsPlanShaper(PlanShaper):
+    """
+    Reshape a plan by splitting its tests into shards of similar duration.
+    """
+
+    @classmethod
+    def run_options(cls) -> list['ClickOptionDecoratorType']:
+        from tmt.options import option
+
+        return [
+            option(
+                '--shards',
+                metavar='N',
+                envvar='TMT_RUN_SHARDS',
+                help='Split every plan into N plans of similar expected duration.',
+                type=int,
+                default=-1,
+            ),
+            option(
+                '--balance',
+                envvar='TMT_RUN_BALANCE',
+                choices=BALANCE_METHODS,
+                help="""
+                    How to balance shards: by expected test duration, or
+                    by the number of tests.
+                    """,
+                default='duration',
+            ),
+            option(
+                '--balance-history',
+                envvar='TMT_RUN_BALANCE_HISTORY',
+                choices=list(_DURATION_HISTORY_REGISTRY.iter_plugin_ids()),
+                help="""
+                    Source of historical test durations used when balancing
+                    shards by duration.
+                    """,
+                default='results',
+            ),
+        ]
+
+    @classmethod
+    def check(cls, plan: 'Plan', tests: list['TestOrigin']) -> bool:
+        if not plan.my_run:
+            return False
+
+        if plan.my_run.opt('shards') <= 1:
+            return False
+
+        if len(tests) <= 1:
+            return False
+
+        # Plans derived from another plan, e.g. shards, are not split
+        # again. Imported plans have an original plan too, but they are
+        # not derived from it.
+        if plan._original_plan is not None and any(
+            derived_plan is plan for derived_plan in plan._original_plan._derived_plans
+        ):
+            return False
+
+        return True
+
+    @classmethod
+    def apply(cls, plan: 'Plan', tests: list['TestOrigin']) -> Iterator['Plan']:
+        assert plan.my_run is not None
+
+        shard_count = plan.my_run.opt('shards')
+        balance = plan.my_run.opt('balance')
+
+        if balance == 'duration':
+            history_source_id = plan.my_run.opt('balance-history')
+            history_source_class = _DURATION_HISTORY_REGISTRY.get_plugin(history_source_id)
+
+            if history_source_class is None:
+                raise tmt.utils.GeneralError(
+                    f"Unknown test duration history source '{history_source_id}'."
+                )
+
+            history = history_source_class(logger=plan._logger).durations(plan, tests)
+
+            plan.debug(f"Found duration history of {len(history)} tests.", level=2)
+
+            weights = expected_durations(tests, history, logger=plan._logger)
+
+        else:
+            weights = [1.0] * len(tests)
+
+        plan.info(f'Splitting plan to {shard_count} shards balanced by {balance}.')
+
+        for shard_id, shard in enumerate(pack_shards(weights, shard_count), start=1):
+            batch: dict[str, list[Test]] = collections.defaultdict(list)
+
+            for index in shard:
+                batch[tests[index].phase].append(tests[index].test)
+
+            plan.debug(
+                f"Shard {shard_id}: {len(shard)} tests,"
+                f" expected duration {sum(weights[index] for index in shard):.0f} seconds.",
+                level=2,
+            )
+
+            derived_plan = plan.derive_plan(shard_id, dict(batch))
+
+            yield derived_plan
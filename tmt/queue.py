@@ -6,6 +6,7 @@ from collections.abc import Iterable, Iterator
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar
 
+import tmt.trace
 from tmt._compat.typing import ParamSpec
 from tmt.log import Logger
 from tmt.utils import GeneralError
@@ -390,7 +391,7 @@ class MultiGuestTask(Task[TaskResultT]):
             inject_logger=lambda task, guest, logger: guest.inject_logger(logger),
             # Submit work for the executor pool.
             submit=lambda task, guest, logger, executor: executor.submit(
-                self.run_on_guest, guest, logger
+                tmt.trace.propagate(self.run_on_guest), guest, logger
             ),
             on_complete=_on_complete,
             logger=self.logger,
@@ -1,5 +1,9 @@
 import enum
-from typing import TYPE_CHECKING, Any, Callable, Optional, cast
+import sys
+import threading
+import weakref
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar, cast
 
 import fmf.utils
 
@@ -128,6 +132,77 @@ ResultIds = dict[str, Optional[str]]
 #: the actual keys are not important.
 RawResult = Any
 
+#: A type of objects shared by results via :py:class:`ResultInternPool`.
+InternedT = TypeVar('InternedT')
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a serialized value into a hashable key.
+
+    :raises TypeError: when the value cannot be converted.
+    """
+
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+
+    hash(value)
+
+    return cast(Hashable, value)
+
+
+class ResultInternPool(Generic[InternedT]):
+    """
+    A pool of objects shared by results.
+
+    Results of a run often describe the very same guest, fmf context or
+    fmf id, and keeping a separate copy for each result wastes a lot of
+    memory when there are hundreds of thousands of results. The pool
+    makes results restored from the same serialized data share a single
+    object.
+
+    Objects are held by weak references only, once no result refers to
+    them, they are dropped from the pool too.
+
+    .. note::
+
+       Shared objects must be treated as read-only. To change guest
+       data, context or fmf id of a single result, assign a new object
+       to the result.
+    """
+
+    def __init__(self, factory: Callable[[Any], InternedT]) -> None:
+        self._factory = factory
+        self._pool: weakref.WeakValueDictionary[Hashable, Any] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def unserialize(self, serialized: Any) -> InternedT:
+        """
+        Provide an object for the given serialized data.
+
+        If an equal object has been unserialized already and is still
+        alive, it is returned, otherwise a new object is created by
+        the pool factory.
+        """
+
+        try:
+            key = _freeze({k: v for k, v in serialized.items() if k != '__class__'})
+
+        except (AttributeError, TypeError):
+            return self._factory(serialized)
+
+        with self._lock:
+            obj = self._pool.get(key)
+
+            if obj is None:
+                obj = self._factory(serialized)
+                self._pool[key] = obj
+
+            return cast(InternedT, obj)
+
 
 @container
 class ResultGuestData(SerializableContainer):
@@ -173,19 +248,39 @@ class ResultGuestData(SerializableContainer):
 
 # This needs to be a stand-alone function because of the import of `tmt.base.core`.
 # It cannot be imported on module level because of circular dependency.
-def _unserialize_fmf_id(serialized: 'tmt.base.core._RawFmfId') -> 'tmt.base.core.FmfId':
+def _create_fmf_id(serialized: 'tmt.base.core._RawFmfId') -> 'tmt.base.core.FmfId':
     from tmt.base.core import FmfId
 
     return FmfId.from_spec(serialized)
 
 
+#: Guest data shared by restored results.
+RESULT_GUEST_DATA_POOL: ResultInternPool[ResultGuestData] = ResultInternPool(
+    ResultGuestData.from_serialized
+)
+
+#: Fmf contexts shared by restored results.
+RESULT_CONTEXT_POOL: ResultInternPool[tmt.utils.FmfContext] = ResultInternPool(
+    tmt.utils.FmfContext.from_serialized
+)
+
+#: Fmf ids shared by restored results.
+RESULT_FMF_ID_POOL: ResultInternPool['tmt.base.core.FmfId'] = ResultInternPool(_create_fmf_id)
+
+
+def _unserialize_fmf_id(serialized: 'tmt.base.core._RawFmfId') -> 'tmt.base.core.FmfId':
+    return RESULT_FMF_ID_POOL.unserialize(serialized)
+
+
 @container
 class BaseResult(SerializableContainer):
     """
     Describes what tmt knows about a result
     """
 
-    name: str
+    # Test and check names repeat a lot - every check, every guest and
+    # every repetition of a test - share the string objects.
+    name: str = field(unserialize=sys.intern)
     result: ResultOutcome = field(
         default=ResultOutcome.PASS,
         serialize=lambda result: result.value,
@@ -334,13 +429,13 @@ class Result(BaseResult):
     context: tmt.utils.FmfContext = field(
         default_factory=tmt.utils.FmfContext,
         serialize=lambda context: context.to_spec(),
-        unserialize=lambda serialized: tmt.utils.FmfContext(serialized),
+        unserialize=RESULT_CONTEXT_POOL.unserialize,
     )
     ids: ResultIds = field(default_factory=cast(Callable[[], ResultIds], dict))
     guest: ResultGuestData = field(
         default_factory=ResultGuestData,
         serialize=lambda value: value.to_serialized(),
-        unserialize=lambda serialized: ResultGuestData.from_serialized(serialized),
+        unserialize=RESULT_GUEST_DATA_POOL.unserialize,
     )
 
     subresult: list[SubResult] = field(
@@ -42,6 +42,7 @@ import tmt.options
 import tmt.queue
 import tmt.result
 import tmt.steps.context
+import tmt.trace
 import tmt.utils
 import tmt.utils.rest
 from tmt._compat.typing import Self, TypeGuard
@@ -3395,6 +3396,18 @@ class GuestTopology(SerializableContainer):
         self.hostname = guest.topology_address
 
 
+def _write_if_changed(filepath: Path, content: str) -> None:
+    """
+    Write a file, unless it exists already with the very same content
+    """
+
+    with suppress(OSError):
+        if filepath.read_text() == content:
+            return
+
+    filepath.write_text(content)
+
+
 @container(init=False)
 class Topology(SerializableContainer):
     """
@@ -3466,7 +3479,7 @@ class Topology(SerializableContainer):
         serialized['guest-names'] = serialized.pop('guest_names')
         serialized['role-names'] = serialized.pop('role_names')
 
-        filepath.write_text(tmt.utils.to_yaml(serialized))
+        _write_if_changed(filepath, tmt.utils.to_yaml(serialized))
 
         return filepath
 
@@ -3508,7 +3521,7 @@ class Topology(SerializableContainer):
         for role, guest_names in self.roles.items():
             lines += [f'TMT_ROLES[{role}]="{" ".join(guest_names)}"']
 
-        filepath.write_text("\n".join(lines))
+        _write_if_changed(filepath, "\n".join(lines))
 
         return filepath
 
@@ -3553,17 +3566,27 @@ class Topology(SerializableContainer):
 
         topology_filepaths = self.save(dirpath=dirpath, filename_base=filename_base)
 
+        guest.push_files(
+            topology_filepaths,
+            options=TransferOptions(protect_args=True, preserve_perms=True, chmod=0o755),
+        )
+
+        return self.to_environment(topology_filepaths, logger=logger)
+
+    @staticmethod
+    def to_environment(topology_filepaths: list[Path], *, logger: tmt.log.Logger) -> Environment:
+        """
+        Describe saved topology files in environment variables.
+
+        :param topology_filepaths: files created by :py:meth:`save`.
+        :returns: environment variables pointing to topology files.
+        """
+
         environment = Environment()
 
         for filepath in topology_filepaths:
             logger.debug('test topology', filepath)
 
-            guest.push(
-                source=filepath,
-                destination=filepath,
-                options=TransferOptions(protect_args=True, preserve_perms=True, chmod=0o755),
-            )
-
             if filepath.suffix == '.sh':
                 environment['TMT_TOPOLOGY_BASH'] = EnvVarValue(filepath)
 
@@ -3594,7 +3617,8 @@ class ActionTask(tmt.queue.GuestlessTask[None]):
         return self.phase.name
 
     def run(self, logger: tmt.log.Logger) -> None:
-        self.phase.go()
+        with tmt.trace.span(self.phase.name, category='phase'):
+            self.phase.go()
 
 
 class PluginTask(
@@ -3637,7 +3661,13 @@ class PluginTask(
         return f'{self.phase_name} on {fmf.utils.listed(self.guest_ids)}'
 
     def run_on_guest(self, guest: 'Guest', logger: tmt.log.Logger) -> PluginReturnValueT:
-        return self.phase.go(guest=guest, logger=logger)
+        with tmt.trace.span(
+            self.phase_name,
+            category='phase',
+            step=self.phase.step.name,
+            guest=guest.multihost_name,
+        ):
+            return self.phase.go(guest=guest, logger=logger)
 
 
 class PhaseQueue(tmt.queue.Queue[Union[ActionTask, PluginTask[StepDataT, PluginReturnValueT]]]):
@@ -249,11 +249,6 @@ class PidFileContext(HasEnvironment):
         self.logger.debug(f'{label} wrapper', wrapper, level=3)
 
         self.phase.write(wrapper_filepath, str(wrapper), mode='w', permissions=0o755)
-        self.guest.push(
-            source=wrapper_filepath,
-            destination=wrapper_filepath,
-            options=TransferOptions(protect_args=True, preserve_perms=True, chmod=0o755),
-        )
 
         return wrapper_filepath
 
@@ -264,8 +259,18 @@ class PidFileContext(HasEnvironment):
         outer_filename_template: str,
         before_message_template: Optional[str] = None,
         after_message_template: Optional[str] = None,
+        push: bool = True,
         **variables: Any,
     ) -> tuple[Path, Path]:
+        """
+        Create and push the inner and the outer wrapper.
+
+        :param push: if unset, wrappers are not pushed to the guest, and
+            the caller is responsible for pushing them, e.g. together
+            with other files.
+        :returns: paths to the inner and the outer wrapper.
+        """
+
         inner_wrapper_filepath = self._create_wrapper(
             'inner', path, inner_filename_template, INNER_WRAPPER_TEMPLATE, **variables
         )
@@ -285,4 +290,10 @@ class PidFileContext(HasEnvironment):
             **variables,
         )
 
+        if push:
+            self.guest.push_files(
+                [inner_wrapper_filepath, outer_wrapper_filepath],
+                options=TransferOptions(protect_args=True, preserve_perms=True, chmod=0o755),
+            )
+
         return (inner_wrapper_filepath, outer_wrapper_filepath)
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
 
 import tmt.base.core
 import tmt.steps
+import tmt.trace
 import tmt.utils
 import tmt.utils.filesystem
 import tmt.utils.git
@@ -623,6 +624,7 @@ class Discover(tmt.steps.Step):
         #  another class should own it instead.
         BeakerLib._library_cache.clear()
         BeakerLibFromUrl._git_clone_cache.clear()
+        BeakerLibFromUrl._git_clone_failures.clear()
 
     @property
     def loaded_from_recipe(self) -> bool:
@@ -910,13 +912,15 @@ class Discover(tmt.steps.Step):
         # Perform test discovery, gather discovered tests
         for phase in self.phases(classes=(Action, DiscoverPlugin)):
             if isinstance(phase, Action):
-                phase.go()
+                with tmt.trace.span(phase.name, category='phase', step=self.name):
+                    phase.go()
 
             elif isinstance(phase, DiscoverPlugin):
                 if not phase.enabled_by_when:
                     continue
 
-                self.discover_tests(phase)
+                with tmt.trace.span(phase.name, category='phase', step=self.name):
+                    self.discover_tests(phase)
 
                 prefix = f'/{phase.name}' if len(self.phases()) > 1 else ''
 
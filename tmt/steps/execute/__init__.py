@@ -13,10 +13,12 @@ import fmf.utils
 import tmt
 import tmt.base.core
 import tmt.base.run
+import tmt.durations
 import tmt.guest
 import tmt.log
 import tmt.steps
 import tmt.steps.scripts
+import tmt.trace
 import tmt.utils
 import tmt.utils.signals
 import tmt.utils.wait
@@ -408,16 +410,24 @@ class TestInvocation(HasStepWorkdir, HasEnvironment):
         return environment
 
     def invoke_check(self, event: CheckEvent, check: Check) -> list[CheckResult]:
-        results, exc, timer = Stopwatch.measure(
-            check.go,
-            event=event,
-            invocation=self,
-            environment=self.environment,
-            logger=self.logger,
-        )
+        with tmt.trace.span(
+            check.how,
+            category='check',
+            check=check.how,
+            event=event.value,
+            test=self.test.name,
+            guest=self.guest.multihost_name,
+        ):
+            results, exc, timer = Stopwatch.measure(
+                check.go,
+                event=event,
+                invocation=self,
+                environment=self.environment,
+                logger=self.logger,
+            )
 
-        if exc is not None:
-            raise exc
+            if exc is not None:
+                raise exc
 
         if results is not None:
             for result in results:
@@ -730,7 +740,18 @@ class ExecutePlugin(tmt.steps.Plugin[ExecuteStepDataT, None]):
 
         invocations: list[TestInvocation] = []
 
-        for test_origin in self.discover.tests(phase_name=self.discover_phase, enabled=True):
+        test_origins = self.discover.tests(phase_name=self.discover_phase, enabled=True)
+
+        if self.step.plan.test_order == 'longest-first':
+            history = tmt.durations.DurationStore(logger=logger).durations(
+                test_origins, arch=guest.facts.arch
+            )
+
+            logger.debug(f'Known durations of {len(history)} tests.', level=3)
+
+            test_origins = tmt.durations.order_longest_first(test_origins, history, logger=logger)
+
+        for test_origin in test_origins:
             test = test_origin.test
 
             invocation = TestInvocation(phase=self, test=test, guest=guest, logger=logger)
@@ -1320,6 +1341,12 @@ class Execute(tmt.steps.StepWithQueue[ExecuteStepData, None]):
         if not failed_tasks:
             self.status('done')
 
+        # Record durations of just executed tests, to be used by future runs
+        tmt.durations.DurationStore(logger=self._logger).record(
+            self._results,
+            arches={guest.name: guest.facts.arch for guest in self.plan.provision.guests},
+        )
+
         # Merge old results back to get all results in report step
         if self.should_run_again:
             self._results += self._old_results
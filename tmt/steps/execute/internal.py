@@ -5,12 +5,13 @@ import tmt.base.core
 import tmt.log
 import tmt.steps
 import tmt.steps.execute
+import tmt.trace
 import tmt.utils
 import tmt.utils.signals
 import tmt.utils.themes
 import tmt.utils.wait
 from tmt.container import container, field
-from tmt.guest import DEFAULT_PULL_OPTIONS, Guest
+from tmt.guest import DEFAULT_PULL_OPTIONS, Guest, TransferOptions
 from tmt.result import Result, ResultOutcome
 from tmt.steps.context.abort import AbortStep
 from tmt.steps.discover import DiscoverPlugin
@@ -352,24 +353,36 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin[ExecuteInternalData]):
         logger.debug(f"Use workdir '{workdir}'.", level=3)
 
         # Create data directory, prepare test environment
-        _, test_outer_wrapper_filepath = invocation.pidfile.create_wrappers(
-            workdir,
-            TEST_INNER_WRAPPER_FILENAME_TEMPLATE,
-            TEST_OUTER_WRAPPER_FILENAME_TEMPLATE,
-            before_message_template=TEST_BEFORE_MESSAGE_TEMPLATE,
-            after_message_template=TEST_AFTER_MESSAGE_TEMPLATE,
-            INVOCATION=invocation,
-            ACTION=invocation.test.test_framework.get_test_command(invocation, logger),
-            WITH_TTY=invocation.test.tty,
-            WITH_INTERACTIVE=self.data.interactive,
+        test_inner_wrapper_filepath, test_outer_wrapper_filepath = (
+            invocation.pidfile.create_wrappers(
+                workdir,
+                TEST_INNER_WRAPPER_FILENAME_TEMPLATE,
+                TEST_OUTER_WRAPPER_FILENAME_TEMPLATE,
+                before_message_template=TEST_BEFORE_MESSAGE_TEMPLATE,
+                after_message_template=TEST_AFTER_MESSAGE_TEMPLATE,
+                INVOCATION=invocation,
+                ACTION=invocation.test.test_framework.get_test_command(invocation, logger),
+                WITH_TTY=invocation.test.tty,
+                WITH_INTERACTIVE=self.data.interactive,
+                push=False,
+            )
         )
 
         # Create topology files
         topology = tmt.steps.Topology(self.step.plan.provision.ready_guests)
         topology.guest = tmt.steps.GuestTopology(guest)
 
+        topology_filepaths = topology.save(dirpath=invocation.path)
+
         invocation.environment.update(
-            topology.push(dirpath=invocation.path, guest=guest, logger=logger)
+            tmt.steps.Topology.to_environment(topology_filepaths, logger=logger)
+        )
+
+        # Push wrappers and topology at once, skipping files which did not
+        # change since the last push, e.g. when the test is restarted.
+        guest.push_files(
+            [test_inner_wrapper_filepath, test_outer_wrapper_filepath, *topology_filepaths],
+            options=TransferOptions(protect_args=True, preserve_perms=True, chmod=0o755),
         )
 
         # Prepare the actual remote command
@@ -560,7 +573,10 @@ class ExecuteInternal(tmt.steps.execute.ExecutePlugin[ExecuteInternalData]):
                 progress_bar.update(progress, test.name)
                 logger.verbose('test', test.summary or test.name, color='cyan', shift=1, level=2)
 
-                self.execute(invocation=invocation, logger=logger)
+                with tmt.trace.span(
+                    test.name, category='test', test=test.name, guest=guest.multihost_name
+                ):
+                    self.execute(invocation=invocation, logger=logger)
 
                 assert invocation.real_duration is not None  # narrow type
                 duration = style(invocation.real_duration, fg='cyan')
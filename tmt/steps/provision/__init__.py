@@ -20,6 +20,7 @@ import tmt.log
 import tmt.options
 import tmt.queue
 import tmt.steps
+import tmt.trace
 import tmt.utils
 from tmt._compat.typing import Self
 from tmt.ansible import AnsibleInventory
@@ -268,7 +269,9 @@ class ProvisionTask(tmt.queue.GuestlessTask[None]):
             extract_logger=lambda task, phase: phase._logger,
             inject_logger=lambda task, phase, logger: phase.inject_logger(logger),
             # Submit work for the executor pool.
-            submit=lambda task, phase, logger, executor: executor.submit(phase.go),
+            submit=lambda task, phase, logger, executor: executor.submit(
+                tmt.trace.traced(phase.go, phase.name, category='phase', step='provision')
+            ),
             on_complete=_on_complete,
             logger=self.logger,
         )
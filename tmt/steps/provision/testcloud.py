@@ -1,14 +1,18 @@
 import collections
+import contextlib
 import functools
+import hashlib
 import itertools
+import json
 import os
 import platform
 import re
 import shutil
+import struct
 import tempfile
 import threading
 import types
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from string import Template
 from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
@@ -35,6 +39,7 @@ from tmt.utils import (
     retry,
     retry_session,
 )
+from tmt.utils.filesystem import FileLock
 from tmt.utils.wait import Deadline, Waiting
 
 if TYPE_CHECKING:
@@ -225,6 +230,240 @@ IMAGE_URL_FETCH_RETRY_INTERVAL = 5
 IMAGE_PREPARE_RETRY_ATTEMPTS = 3
 IMAGE_PREPARE_RETRY_INTERVAL = 5
 
+#: Default size limit of the image cache, in GiB. ``0`` means the cache
+#: size is not limited.
+DEFAULT_IMAGE_CACHE_SIZE = 0
+
+#: Size limit of the image cache, in GiB. This is the effective value,
+#: combining the default and optional envvar,
+#: ``TMT_TESTCLOUD_IMAGE_CACHE_SIZE``.
+IMAGE_CACHE_SIZE: int = configure_constant(
+    DEFAULT_IMAGE_CACHE_SIZE, 'TMT_TESTCLOUD_IMAGE_CACHE_SIZE'
+)
+
+#: Magic bytes starting the header of a qcow2 image.
+QCOW2_MAGIC = b'QFI\xfb'
+
+
+def _qcow2_backing_file(path: Path) -> Optional[Path]:
+    """
+    Find the backing file of a qcow2 image.
+
+    Only the image header is read, the image does not need to be
+    inspected by ``qemu-img``.
+
+    :returns: absolute path to the backing file, or ``None`` if the
+        image has no backing file, or it is not a qcow2 image.
+    """
+
+    try:
+        with path.open('rb') as f:
+            header = f.read(20)
+
+            if len(header) < 20 or not header.startswith(QCOW2_MAGIC):
+                return None
+
+            offset, size = struct.unpack('>QI', header[8:20])
+
+            if not offset or not size:
+                return None
+
+            f.seek(offset)
+            backing_file = Path(os.fsdecode(f.read(size)))
+
+    except OSError:
+        return None
+
+    return backing_file if backing_file.is_absolute() else path.parent / backing_file
+
+
+class ImageCache:
+    """
+    Host-wide cache of testcloud images.
+
+    Images are downloaded by testcloud into its store directory, shared
+    by all runs. The cache adds what the store is missing:
+
+    * a lock for each image, held while the image is prepared, so
+      concurrent provisioners share a single download,
+    * records of verified images, with their checksums, so images do
+      not need to be checked again on every start,
+    * eviction of least recently used images once the store outgrows
+      its size limit. Images locked by other provisioners and images
+      backing overlays of existing instances are never evicted.
+    """
+
+    def __init__(self, data_dirpath: Path, *, size_limit: int = 0) -> None:
+        """
+        Prepare the cache.
+
+        :param data_dirpath: testcloud data directory, with images and
+            instances.
+        :param size_limit: the maximal size of all images, in bytes.
+            ``0`` means the size is not limited.
+        """
+
+        self.image_dirpath = data_dirpath / 'images'
+        self.instance_dirpath = data_dirpath / 'instances'
+        self.record_dirpath = data_dirpath / 'image-cache'
+        self.size_limit = size_limit
+
+    def lock(self, name: str) -> FileLock:
+        """
+        Create a lock of an image
+        """
+
+        return FileLock(self.record_dirpath / f'{name}.lock')
+
+    def _record_path(self, name: str) -> Path:
+        return self.record_dirpath / f'{name}.json'
+
+    @staticmethod
+    def _fingerprint(path: Path) -> dict[str, int]:
+        stat = path.stat()
+
+        return {
+            'device': stat.st_dev,
+            'inode': stat.st_ino,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+        }
+
+    def is_verified(self, path: Path) -> bool:
+        """
+        Check whether an image has been verified already.
+
+        The image must not have changed since its verification, its
+        recorded fingerprint must match the image file.
+        """
+
+        try:
+            record = json.loads(self._record_path(path.name).read_text())
+
+            return bool(record['fingerprint'] == self._fingerprint(path))
+
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+    def mark_verified(self, path: Path, *, url: Optional[str] = None) -> None:
+        """
+        Record an image as verified, together with its checksum.
+
+        :param path: image to record.
+        :param url: if set, the URL the image was downloaded from.
+        """
+
+        digest = hashlib.sha256()
+
+        with path.open('rb') as f:
+            while chunk := f.read(1024 * 1024):
+                digest.update(chunk)
+
+        record = {
+            'url': url,
+            'fingerprint': self._fingerprint(path),
+            'sha256': digest.hexdigest(),
+        }
+
+        self.record_dirpath.mkdir(parents=True, exist_ok=True)
+
+        record_path = self._record_path(path.name)
+        record_path_tmp = record_path.with_suffix('.tmp')
+
+        record_path_tmp.write_text(json.dumps(record))
+        record_path_tmp.rename(record_path)
+
+    def forget(self, name: str) -> None:
+        """
+        Drop the record of an image
+        """
+
+        self._record_path(name).unlink(missing_ok=True)
+
+    def mark_used(self, name: str) -> None:
+        """
+        Record that an image has just been used
+        """
+
+        with contextlib.suppress(OSError):
+            os.utime(self._record_path(name))
+
+    def _last_used(self, path: Path) -> float:
+        try:
+            return self._record_path(path.name).stat().st_mtime
+
+        except OSError:
+            return path.stat().st_mtime
+
+    def backing_files(self) -> set[Path]:
+        """
+        Find images backing overlays of existing instances
+        """
+
+        return {
+            backing_file.resolve()
+            for overlay in self.instance_dirpath.glob('*/*.qcow2')
+            if (backing_file := _qcow2_backing_file(overlay)) is not None
+        }
+
+    def evict(self, logger: tmt.log.Logger, *, keep: Iterable[str] = ()) -> list[Path]:
+        """
+        Remove least recently used images until the size limit is met.
+
+        :param keep: names of images which must not be removed.
+        :returns: removed images.
+        """
+
+        if self.size_limit <= 0 or not self.image_dirpath.is_dir():
+            return []
+
+        # Symlinks to local images do not take any space
+        images = {
+            path: path.stat().st_size
+            for path in self.image_dirpath.iterdir()
+            if path.is_file() and not path.is_symlink()
+        }
+
+        total_size = sum(images.values())
+
+        if total_size <= self.size_limit:
+            return []
+
+        keep = set(keep)
+        backing_files = self.backing_files()
+        evicted: list[Path] = []
+
+        for path in sorted(images, key=self._last_used):
+            if total_size <= self.size_limit:
+                break
+
+            if path.name in keep or path.resolve() in backing_files:
+                continue
+
+            lock = self.lock(path.name)
+
+            # Image is being used by another provisioner
+            if not lock.acquire(blocking=False):
+                continue
+
+            try:
+                logger.debug(f"Evicting image '{path}' from the image cache.")
+
+                path.unlink()
+                self.forget(path.name)
+
+            except OSError as error:
+                logger.warning(f"Failed to evict image '{path}': {error}.")
+                continue
+
+            finally:
+                lock.release()
+
+            total_size -= images[path]
+            evicted.append(path)
+
+        return evicted
+
 
 def normalize_memory_size(
     key_address: str,
@@ -1126,181 +1365,215 @@ class GuestTestcloud(tmt.GuestSsh):
 
         assert testcloud is not None  # Narrow type
 
-        # Make a symlink to the file image
-        if self.image_url.startswith("file://"):
-            image_path = Path(self.image_url.removeprefix("file://"))
-            # We should not symlink any supported formats, e.g. the `.xz`
-            # does an extract step that would be skip if we make the symlink.
-            if image_path.suffixes and image_path.suffixes[-1] == ".qcow2":
-                # Create a symlink in the testcloud STORE_DIR and make sure
-                # it is always updated to the requested version.
-                image_symlink = self.testcloud_image_dirpath / image_path.name
-                image_symlink.unlink(missing_ok=True)
-                image_symlink.symlink_to(image_path)
-                # Adjust selinux tags for the actual image
-                testcloud.image.Image._adjust_image_selinux(image_path)
-
-        # Initialize and prepare testcloud image with validation and retry.
-        # Testcloud does not check the qemu-img return code when creating
-        # an overlay, so a corrupt base image causes a confusing libvirt
-        # error later. Validate the image after download and retry if needed.
-        def prepare_image() -> None:
-            self._image = testcloud.image.Image(self.image_url)
-            self.verbose('qcow', self._image.name, 'green')
-            if not Path(self._image.local_path).exists():
-                self.info('progress', 'downloading...', 'cyan')
-            try:
-                self._image.prepare()
-            except FileNotFoundError as error:
-                raise ProvisionError(f"Image '{self._image.local_path}' not found.") from error
-            except (testcloud.exceptions.TestcloudPermissionsError, PermissionError) as error:
-                raise ProvisionError(
-                    f"Failed to prepare the image. Check the "
-                    f"'{self.testcloud_image_dirpath}' directory permissions."
-                ) from error
-            except KeyError as error:
-                raise ProvisionError(f"Failed to prepare image '{self.image_url}'.") from error
+        # Images are shared by all runs on the host. Concurrent provisioners
+        # wait for the image lock, the first one downloads the image and
+        # the others use it.
+        image_cache = ImageCache(
+            self.testcloud_data_dirpath, size_limit=IMAGE_CACHE_SIZE * 1024**3
+        )
+
+        self._image = testcloud.image.Image(self.image_url)
+        self.verbose('qcow', self._image.name, 'green')
+
+        image_lock = image_cache.lock(self._image.name)
+        image_lock.acquire()
+
+        # The lock is released once the overlay exists, it protects the
+        # image from eviction then, or on any failure before that.
+        try:
+            # Make a symlink to the file image
+            if self.image_url.startswith("file://"):
+                image_path = Path(self.image_url.removeprefix("file://"))
+                # We should not symlink any supported formats, e.g. the `.xz`
+                # does an extract step that would be skip if we make the symlink.
+                if image_path.suffixes and image_path.suffixes[-1] == ".qcow2":
+                    # Create a symlink in the testcloud STORE_DIR and make sure
+                    # it is always updated to the requested version.
+                    image_symlink = self.testcloud_image_dirpath / image_path.name
+                    image_symlink.unlink(missing_ok=True)
+                    image_symlink.symlink_to(image_path)
+                    # Adjust selinux tags for the actual image
+                    testcloud.image.Image._adjust_image_selinux(image_path)
+
+            # Initialize and prepare testcloud image with validation and retry.
+            # Testcloud does not check the qemu-img return code when creating
+            # an overlay, so a corrupt base image causes a confusing libvirt
+            # error later. Validate the image after download and retry if needed.
+            def prepare_image() -> None:
+                assert self._image is not None  # Narrow type
+                if not Path(self._image.local_path).exists():
+                    self.info('progress', 'downloading...', 'cyan')
+                try:
+                    self._image.prepare()
+                except FileNotFoundError as error:
+                    raise ProvisionError(f"Image '{self._image.local_path}' not found.") from error
+                except (testcloud.exceptions.TestcloudPermissionsError, PermissionError) as error:
+                    raise ProvisionError(
+                        f"Failed to prepare the image. Check the "
+                        f"'{self.testcloud_image_dirpath}' directory permissions."
+                    ) from error
+                except KeyError as error:
+                    raise ProvisionError(f"Failed to prepare image '{self.image_url}'.") from error
+
+                # Validate the base image is a proper qcow2 file, unless it has
+                # been validated already and did not change since then
+                image_path = Path(self._image.local_path)
+                if image_cache.is_verified(image_path):
+                    self.debug(f"Image '{image_path}' has been verified already.")
+                    return
+                try:
+                    Command("qemu-img", "check", str(image_path)).run(
+                        cwd=Path.cwd(),
+                        logger=self._logger,
+                    )
+                except tmt.utils.RunError as error:
+                    if image_path.exists():
+                        self.debug(f"Removing corrupt image '{image_path}'.")
+                        image_path.unlink()
+                    image_cache.forget(image_path.name)
+                    raise ProvisionError(
+                        f"Image '{image_path}' is not a valid qcow2 image."
+                    ) from error
+                image_cache.mark_verified(image_path, url=self.image_url)
 
-            # Validate the base image is a proper qcow2 file
-            image_path = Path(self._image.local_path)
             try:
-                Command("qemu-img", "check", str(image_path)).run(
-                    cwd=Path.cwd(),
+                retry(
+                    func=prepare_image,
+                    attempts=IMAGE_PREPARE_RETRY_ATTEMPTS,
+                    interval=IMAGE_PREPARE_RETRY_INTERVAL,
+                    label=f"Prepare image '{self.image_url}'",
                     logger=self._logger,
                 )
-            except tmt.utils.RunError as error:
-                if image_path.exists():
-                    self.debug(f"Removing corrupt image '{image_path}'.")
-                    image_path.unlink()
+            except tmt.utils.RetryError as error:
                 raise ProvisionError(
-                    f"Image '{image_path}' is not a valid qcow2 image."
+                    f"Failed to prepare a valid image "
+                    f"after {IMAGE_PREPARE_RETRY_ATTEMPTS} attempts."
                 ) from error
 
-        try:
-            retry(
-                func=prepare_image,
-                attempts=IMAGE_PREPARE_RETRY_ATTEMPTS,
-                interval=IMAGE_PREPARE_RETRY_INTERVAL,
-                label=f"Prepare image '{self.image_url}'",
-                logger=self._logger,
-            )
-        except tmt.utils.RetryError as error:
-            raise ProvisionError(
-                f"Failed to prepare a valid image after {IMAGE_PREPARE_RETRY_ATTEMPTS} attempts."
-            ) from error
+            # Let other provisioners use the image, but keep it locked until
+            # its overlay is created, it must not be evicted before that.
+            image_lock.acquire(shared=True)
+            image_cache.mark_used(self._image.name)
 
-        # Prepare hostname (get rid of possible unwanted characters)
-        hostname = re.sub(r"[^a-zA-Z0-9\-]+", "-", self.name.lower()).strip("-")
+            for evicted_image in image_cache.evict(self._logger, keep=[self._image.name]):
+                self.verbose('evicted image', evicted_image.name, 'green', level=2)
 
-        # Create instance
-        self.instance_name = self._tmt_name()
+            # Prepare hostname (get rid of possible unwanted characters)
+            hostname = re.sub(r"[^a-zA-Z0-9\-]+", "-", self.name.lower()).strip("-")
 
-        # Prepare DomainConfiguration object before Instance object
-        self._domain = DomainConfiguration(self.instance_name)
-        self._domain.console_log_file = console_log.filepath
+            # Create instance
+            self.instance_name = self._tmt_name()
 
-        # Prepare Workarounds object
-        self._workarounds = Workarounds(defaults=True)
-        for cmd in TESTCLOUD_WORKAROUNDS:
-            self._workarounds.add(cmd)
+            # Prepare DomainConfiguration object before Instance object
+            self._domain = DomainConfiguration(self.instance_name)
+            self._domain.console_log_file = console_log.filepath
 
-        # Process hardware and find a suitable HW properties
-        self._domain.cpu_count = DEFAULT_CPU_COUNT
+            # Prepare Workarounds object
+            self._workarounds = Workarounds(defaults=True)
+            for cmd in TESTCLOUD_WORKAROUNDS:
+                self._workarounds.add(cmd)
 
-        self._combine_hw_memory()
-        self._combine_hw_disk_size()
+            # Process hardware and find a suitable HW properties
+            self._domain.cpu_count = DEFAULT_CPU_COUNT
 
-        if self.hardware:
-            self.verbose('effective hardware', self.hardware.to_spec(), color='green')
+            self._combine_hw_memory()
+            self._combine_hw_disk_size()
 
-            for line in self.hardware.format_variants():
-                self._logger.debug('effective hardware', line, level=3)
+            if self.hardware:
+                self.verbose('effective hardware', self.hardware.to_spec(), color='green')
 
-        self._apply_hw_memory(self._domain)
-        _apply_hw_cpu_processors(self.hardware, self._domain, self._logger)
-        _apply_hw_disk_size(self.hardware, self._domain, self._logger)
-        _apply_hw_tpm(self.hardware, self._domain, self._logger)
+                for line in self.hardware.format_variants():
+                    self._logger.debug('effective hardware', line, level=3)
 
-        self.info(
-            'memory',
-            f'{int(tmt.hardware.UNITS(f"{self._domain.memory_size} kB").to("MB").magnitude)} MB',
-            'green',
-        )
-        self.info(
-            'disk',
-            f'{tmt.hardware.UNITS(f"{self._domain.storage_devices[0].size} GB").to("GB")}',
-            'green',
-        )
+            self._apply_hw_memory(self._domain)
+            _apply_hw_cpu_processors(self.hardware, self._domain, self._logger)
+            _apply_hw_disk_size(self.hardware, self._domain, self._logger)
+            _apply_hw_tpm(self.hardware, self._domain, self._logger)
 
-        for i, device in enumerate(self._domain.storage_devices):
-            self.debug(
-                f'domain disk #{i} size', f'{tmt.hardware.UNITS(f"{device.size} GB").to("GB")}'
+            memory_size = tmt.hardware.UNITS(f"{self._domain.memory_size} kB").to("MB")
+            self.info('memory', f'{int(memory_size.magnitude)} MB', 'green')
+            self.info(
+                'disk',
+                f'{tmt.hardware.UNITS(f"{self._domain.storage_devices[0].size} GB").to("GB")}',
+                'green',
             )
 
-        # Is this a CoreOS?
-        self._domain.coreos = self.is_coreos
+            for i, device in enumerate(self._domain.storage_devices):
+                self.debug(
+                    f'domain disk #{i} size', f'{tmt.hardware.UNITS(f"{device.size} GB").to("GB")}'
+                )
 
-        self._apply_hw_arch(
-            self._domain,
-            self.is_kvm,
-            self.is_legacy_os,
-            boot_method=_get_hw_boot_method(self.hardware, self._logger),
-        )
+            # Is this a CoreOS?
+            self._domain.coreos = self.is_coreos
 
-        mac_address = testcloud.util.generate_mac_address()
-        if f"qemu:///{self.connection}" == "qemu:///system":
-            self._domain.network_configuration = SystemNetworkConfiguration(
-                mac_address=mac_address
+            self._apply_hw_arch(
+                self._domain,
+                self.is_kvm,
+                self.is_legacy_os,
+                boot_method=_get_hw_boot_method(self.hardware, self._logger),
             )
-        elif f"qemu:///{self.connection}" == "qemu:///session":
-            device_type = "virtio-net-pci" if not self.is_legacy_os else "e1000"
-            with GuestTestcloud._testcloud_lock:
-                port = testcloud.util.spawn_instance_port_file(self.instance_name)
-            self._domain.network_configuration = UserNetworkConfiguration(
-                mac_address=mac_address, port=port, device_type=device_type
+
+            mac_address = testcloud.util.generate_mac_address()
+            if f"qemu:///{self.connection}" == "qemu:///system":
+                self._domain.network_configuration = SystemNetworkConfiguration(
+                    mac_address=mac_address
+                )
+            elif f"qemu:///{self.connection}" == "qemu:///session":
+                device_type = "virtio-net-pci" if not self.is_legacy_os else "e1000"
+                with GuestTestcloud._testcloud_lock:
+                    port = testcloud.util.spawn_instance_port_file(self.instance_name)
+                self._domain.network_configuration = UserNetworkConfiguration(
+                    mac_address=mac_address, port=port, device_type=device_type
+                )
+            else:
+                raise tmt.utils.ProvisionError("Only system, or session connection is supported.")
+
+            if not self._domain.coreos:
+                seed_disk = RawStorageDevice(self._domain.seed_path)
+                self._domain.storage_devices.append(seed_disk)
+
+            self._instance = testcloud.instance.Instance(
+                hostname=hostname,
+                image=self._image,
+                connection=f"qemu:///{self.connection}",
+                domain_configuration=self._domain,
+                workarounds=self._workarounds,
             )
-        else:
-            raise tmt.utils.ProvisionError("Only system, or session connection is supported.")
 
-        if not self._domain.coreos:
-            seed_disk = RawStorageDevice(self._domain.seed_path)
-            self._domain.storage_devices.append(seed_disk)
+            self.verbose('name', self.instance_name, 'green')
 
-        self._instance = testcloud.instance.Instance(
-            hostname=hostname,
-            image=self._image,
-            connection=f"qemu:///{self.connection}",
-            domain_configuration=self._domain,
-            workarounds=self._workarounds,
-        )
+            # Decide if we want to multiply timeouts when emulating an architecture
+            time_coeff = NON_KVM_TIMEOUT_COEF if not self.is_kvm else 1
 
-        self.verbose('name', self.instance_name, 'green')
+            # Prepare ssh key
+            # TODO: Maybe... some better way to do this?
+            public_key = self.prepare_ssh_key(SSH_KEYGEN_TYPE)
+            if self._domain.coreos:
+                self._instance.coreos = True
+                # prepare_ssh_key() writes key directly to COREOS_DATA
+                self._instance.ssh_path = []
+                data_tpl = Template(COREOS_DATA).safe_substitute(
+                    user_name=self.user, public_key=public_key
+                )
+            else:
+                data_tpl = Template(USER_DATA).safe_substitute(
+                    user_name=self.user, public_key=public_key
+                )
 
-        # Decide if we want to multiply timeouts when emulating an architecture
-        time_coeff = NON_KVM_TIMEOUT_COEF if not self.is_kvm else 1
+            # Boot the virtual machine
+            self.info('progress', 'booting...', 'cyan')
+            self.verbose("console log", self.logdir / CONSOLE_LOG_FILE, level=2, color="cyan")
+            assert libvirt is not None
 
-        # Prepare ssh key
-        # TODO: Maybe... some better way to do this?
-        public_key = self.prepare_ssh_key(SSH_KEYGEN_TYPE)
-        if self._domain.coreos:
-            self._instance.coreos = True
-            # prepare_ssh_key() writes key directly to COREOS_DATA
-            self._instance.ssh_path = []
-            data_tpl = Template(COREOS_DATA).safe_substitute(
-                user_name=self.user, public_key=public_key
-            )
-        else:
-            data_tpl = Template(USER_DATA).safe_substitute(
-                user_name=self.user, public_key=public_key
-            )
+            try:
+                self._instance.prepare(data_tpl=data_tpl)
+            except (testcloud.exceptions.TestcloudInstanceError, libvirt.libvirtError) as error:
+                raise ProvisionError("Failed to boot testcloud instance.") from error
 
-        # Boot the virtual machine
-        self.info('progress', 'booting...', 'cyan')
-        self.verbose("console log", self.logdir / CONSOLE_LOG_FILE, level=2, color="cyan")
-        assert libvirt is not None
+        finally:
+            image_lock.release()
 
         try:
-            self._instance.prepare(data_tpl=data_tpl)
             self._instance.spawn_vm()
             self._instance.start(BOOT_TIMEOUT * time_coeff)
         except (testcloud.exceptions.TestcloudInstanceError, libvirt.libvirtError) as error:
@@ -1590,6 +1863,7 @@ class ProvisionTestcloud(tmt.steps.provision.ProvisionPlugin[ProvisionTestcloudD
         if not testcloud_images.exists():
             clean.warn(f"Directory '{testcloud_images}' does not exist.", shift=2)
             return True
+        image_cache = ImageCache(workdir_root / 'testcloud')
         successful = True
         total_size = tmt.hardware.UNITS('0 bytes')
         for image in testcloud_images.iterdir():
@@ -1602,6 +1876,7 @@ class ProvisionTestcloud(tmt.steps.provision.ProvisionPlugin[ProvisionTestcloudD
                 clean.verbose(f"Removing '{image}' ({formatted_size}).", shift=2)
                 try:
                     image.unlink()
+                    image_cache.forget(image.name)
                 except OSError:
                     clean.fail(f"Failed to remove '{image}'.", shift=2)
                     successful = False
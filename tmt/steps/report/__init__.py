@@ -1,16 +1,34 @@
-from typing import Optional, TypeVar, Union, cast
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Optional, TypeVar, Union, cast
+
+import fmf.utils
 
 import tmt.log
+import tmt.queue
 import tmt.result
 import tmt.steps
-from tmt.container import container
+import tmt.trace
+import tmt.utils
+from tmt.container import container, field
 from tmt.plugins import PluginRegistry
-from tmt.steps import Action
+from tmt.steps import Action, ActionTask, PhaseQueue
+
+if TYPE_CHECKING:
+    from tmt._compat.typing import Self
 
 
 @container
 class ReportStepData(tmt.steps.StepData):
-    pass
+    serial: bool = field(
+        default=False,
+        option='--serial',
+        is_flag=True,
+        help="""
+            Do not run the phase in parallel with other report phases.
+            Useful for reporters that cannot safely share the run
+            with others.
+            """,
+    )
 
 
 ReportStepDataT = TypeVar('ReportStepDataT', bound=ReportStepData)
@@ -31,6 +49,20 @@ class ReportPlugin(tmt.steps.GuestlessPlugin[ReportStepDataT, None]):
     # Methods ("how: ..." implementations) registered for the same step.
     _supported_methods: PluginRegistry[tmt.steps.Method] = PluginRegistry('step.report')
 
+    #: If set, the plugin can run in parallel with other report phases.
+    #: Report plugins consume the same results of the ``execute`` step,
+    #: and most of them can run at the same time. Plugins that do not
+    #: support parallel reporting should set this to ``False``.
+    _thread_safe: bool = True
+
+    @property
+    def is_parallel(self) -> bool:
+        """
+        Whether the phase may run in parallel with other report phases.
+        """
+
+        return self._thread_safe and not self.data.serial
+
     def go(self, *, logger: Optional[tmt.log.Logger] = None) -> None:
         """
         Perform actions shared among plugins when beginning their tasks
@@ -39,6 +71,64 @@ class ReportPlugin(tmt.steps.GuestlessPlugin[ReportStepDataT, None]):
         self.go_prolog(logger or self._logger)
 
 
+class ReportTask(tmt.queue.GuestlessTask[None]):
+    """
+    A task to run multiple report phases in parallel
+    """
+
+    #: Phases to run.
+    phases: list[ReportPlugin[ReportStepData]]
+
+    #: When ``ReportTask`` instance is received from the queue, ``phase``
+    #: points to the phase that has been run by the task.
+    phase: Optional[ReportPlugin[ReportStepData]] = None
+
+    def __init__(self, phases: list[ReportPlugin[ReportStepData]], logger: tmt.log.Logger) -> None:
+        super().__init__(logger)
+
+        self.phases = phases
+
+    @property
+    def name(self) -> str:
+        return cast(str, fmf.utils.listed([phase.name for phase in self.phases]))
+
+    def go(self) -> Iterator['ReportTask']:
+        def _on_complete(task: 'Self', phase: ReportPlugin[ReportStepData]) -> 'Self':
+            task.phases = []
+            task.phase = phase
+
+            return task
+
+        yield from self._invoke_in_pool(
+            # Run across all phases known to this task.
+            units=self.phases,
+            # Unit ID here is phases's name
+            get_label=lambda task, phase: phase.name,
+            extract_logger=lambda task, phase: phase._logger,
+            inject_logger=lambda task, phase, logger: phase.inject_logger(logger),
+            # Submit work for the executor pool.
+            submit=lambda task, phase, logger, executor: executor.submit(
+                tmt.trace.traced(phase.go, phase.name, category='phase', step='report')
+            ),
+            on_complete=_on_complete,
+            logger=self.logger,
+        )
+
+    def run(self, logger: tmt.log.Logger) -> None:
+        raise AssertionError("run is not used by ReportTask.go")
+
+
+class ReportQueue(tmt.queue.Queue[ReportTask]):
+    """
+    Queue class for running report tasks
+    """
+
+    def enqueue(
+        self, *, phases: list[ReportPlugin[ReportStepData]], logger: tmt.log.Logger
+    ) -> None:
+        self.enqueue_task(ReportTask(phases, logger))
+
+
 class Report(tmt.steps.Step):
     """
     Provide test results overview and send reports.
@@ -96,16 +186,134 @@ class Report(tmt.steps.Step):
             self.actions()
             return
 
-        # Perform the reporting
-        for phase in self.phases(classes=(Action, ReportPlugin)):
-            # TODO: I don't understand this, but mypy seems to be confused about the type
-            # of `phase`. Mypy in my Code reports correct `Action | ReportPlugin` union,
-            # but pre-commit's mypy sees `Phase` - which should not be the right answer
-            # since `classes` is clearly not `None`. Adding `cast()` to overcome this
-            # because I can't find the actual error :/
-            phase = cast(Union[Action, ReportPlugin[ReportStepData]], phase)
-            if phase.enabled_by_when:
-                phase.go()
+        def _run_report_phases(
+            phases: list[ReportPlugin[ReportStepData]],
+        ) -> tuple[list[ReportTask], list[ReportTask]]:
+            """
+            Run the given set of report phases in parallel.
+
+            :param phases: list of report phases.
+            :returns: two lists, a list of all :py:class:`ReportTask`
+                instances yielded by the queue, and a subset of the first
+                list collecting only those tasks that failed.
+            """
+
+            queue = ReportQueue('report', self._logger.descend(logger_name=f'{self}.queue'))
+
+            queue.enqueue(phases=phases, logger=queue._logger)
+
+            all_tasks: list[ReportTask] = []
+            failed_tasks: list[ReportTask] = []
+
+            for outcome in queue.run():
+                all_tasks.append(outcome)
+
+                if outcome.exc:
+                    outcome.logger.fail(str(outcome.exc))
+
+                    failed_tasks.append(outcome)
+
+            return all_tasks, failed_tasks
+
+        def _run_action_phases(phases: list[Action]) -> tuple[list[ActionTask], list[ActionTask]]:
+            """
+            Run the given set of actions.
+
+            :param phases: list of actions, e.g. ``login`` or ``reboot``, given
+                in the ``report`` step.
+            :returns: two lists, a list of all :py:class:`ActionTask` instances
+                queued, and a subset of the first list collecting only those
+                tasks that failed.
+            """
+
+            queue: PhaseQueue[ReportStepData, None] = PhaseQueue(
+                'report.action', self._logger.descend(logger_name=f'{self}.queue')
+            )
+
+            for action in phases:
+                queue.enqueue_action(phase=action)
+
+            all_tasks: list[ActionTask] = []
+            failed_tasks: list[ActionTask] = []
+
+            for outcome in queue.run():
+                assert isinstance(outcome, ActionTask)
+
+                all_tasks.append(outcome)
+
+                if outcome.exc:
+                    outcome.logger.fail(str(outcome.exc))
+
+                    failed_tasks.append(outcome)
+
+            return all_tasks, failed_tasks
+
+        # Report phases consume the same results, and do not depend on each
+        # other, therefore phases sharing the same `order` are collected into
+        # batches and run in parallel. Actions, and phases which cannot run
+        # in parallel, are run on their own, in the order of their `order`
+        # key. A failing phase does not stop the other phases.
+        # TODO: I don't understand this, but mypy seems to be confused about the type
+        # of `phase`. Mypy in my Code reports correct `Action | ReportPlugin` union,
+        # but pre-commit's mypy sees `Phase` - which should not be the right answer
+        # since `classes` is clearly not `None`. Adding `cast()` to overcome this
+        # because I can't find the actual error :/
+        all_phases = [
+            cast(Union[Action, ReportPlugin[ReportStepData]], phase)
+            for phase in self.phases(classes=(Action, ReportPlugin))
+        ]
+        all_phases = [phase for phase in all_phases if phase.enabled_by_when]
+
+        all_outcomes: list[Union[ActionTask, ReportTask]] = []
+        failed_outcomes: list[Union[ActionTask, ReportTask]] = []
+
+        while all_phases:
+            phase = all_phases.pop(0)
+
+            if isinstance(phase, Action):
+                action_phases: list[Action] = [phase]
+
+                while all_phases and isinstance(all_phases[0], Action):
+                    action_phases.append(cast(Action, all_phases.pop(0)))
+
+                all_action_outcomes, failed_action_outcomes = _run_action_phases(action_phases)
+
+                all_outcomes += all_action_outcomes
+                failed_outcomes += failed_action_outcomes
+
+            else:
+                plugin_phases: list[ReportPlugin[ReportStepData]] = [phase]
+
+                if phase.is_parallel:
+                    while all_phases:
+                        next_phase = all_phases[0]
+
+                        if not isinstance(next_phase, ReportPlugin):
+                            break
+
+                        if not next_phase.is_parallel or next_phase.order != phase.order:
+                            break
+
+                        plugin_phases.append(next_phase)
+                        all_phases.pop(0)
+
+                all_plugin_outcomes, failed_plugin_outcomes = _run_report_phases(plugin_phases)
+
+                all_outcomes += all_plugin_outcomes
+                failed_outcomes += failed_plugin_outcomes
+
+        exiting_tasks = [outcome for outcome in all_outcomes if outcome.requested_exit is not None]
+
+        if exiting_tasks:
+            assert exiting_tasks[0].requested_exit is not None
+
+            raise exiting_tasks[0].requested_exit
+
+        if failed_outcomes:
+            raise tmt.utils.GeneralError(
+                'report step failed',
+                causes=[outcome.exc for outcome in failed_outcomes if outcome.exc is not None],
+            )
 
         # Give a summary, update status and save
         self.summary()
@@ -322,6 +322,10 @@ class ReportDisplay(tmt.steps.report.ReportPlugin[ReportDisplayData]):
 
     _data_class = ReportDisplayData
 
+    # Results are printed on the terminal, and their output must not be
+    # interleaved with output of other phases.
+    _thread_safe = False
+
     def _print_step_results(
         self,
         step: tmt.steps.Step,
@@ -1,25 +1,31 @@
 import functools
 import re
 import sys
+import tempfile
 from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypedDict, Union, cast, overload
 
 from jinja2 import FileSystemLoader, select_autoescape
 
 import tmt
+import tmt.hardware
 import tmt.log
 import tmt.result
 import tmt.steps
 import tmt.steps.report
 import tmt.utils
+import tmt.utils.log_scanner
 from tmt._compat.importlib.readers import MultiplexedPath
+from tmt._compat.warnings import deprecated
 from tmt.container import container, field
 from tmt.result import ResultOutcome
+from tmt.steps import _RawStepData
 from tmt.utils import Path
-from tmt.utils.templates import default_template_environment, render_template_file
+from tmt.utils.templates import default_template_environment, render_template_file_into_stream
 
 if TYPE_CHECKING:
     from tmt._compat.typing import TypeAlias
+    from tmt.hardware.constraints import Size
 
     XMLElement: TypeAlias = Any
 
@@ -31,6 +37,17 @@ CUSTOM_FLAVOR_NAME = 'custom'
 # Relative path to tmt junit template directory.
 DEFAULT_TEMPLATE_RESOURCE = 'steps/report/junit/templates'
 
+#: Default size limit of an output log included in the JUnit file.
+DEFAULT_OUTPUT_LOG_SIZE_LIMIT: 'Size' = tmt.hardware.UNITS('10 MB')
+
+#: Indentation used by the pretty print.
+_JUNIT_XML_INDENT = '  '
+
+#: Elements at this depth, i.e. ``<testcase>`` elements of most flavors,
+#: are written by the pretty print as a whole, their ancestors are
+#: written piece by piece.
+_JUNIT_XML_STREAMED_DEPTH = 2
+
 
 @overload
 def _duration_to_seconds_filter(duration: str) -> int:
@@ -258,25 +275,207 @@ class ResultsContext(ImplementProperties):
         )
 
 
-def make_junit_xml(
+def _read_log_tail(phase: tmt.steps.report.ReportPlugin[Any], log: Path, size_limit: int) -> str:
+    """
+    Read the end of a result log, up to the given size.
+
+    :param phase: report phase reading the log.
+    :param log: path to the log, relative to the execute step workdir.
+    :param size_limit: maximal number of bytes to read.
+    :returns: the end of the log, with a note on the truncation if the
+        log is larger than the limit.
+    """
+
+    execute = phase.step.plan.execute
+
+    if execute.workdir and not log.is_absolute():
+        log = execute.workdir / log
+
+    phase.debug(f"Read file '{log}'.", level=2)
+
+    content, skipped = tmt.utils.log_scanner.read_tail(log, size_limit)
+
+    if not skipped:
+        return content
+
+    return (
+        f"WARNING: Output log has been truncated, {skipped} bytes at its beginning have"
+        f" been left out because the log exceeds the limit of {size_limit} bytes. The limit"
+        f" is controlled with the '--output-log-size-limit' option.\n\n{content}"
+    )
+
+
+def _load_junit_schema(phase: tmt.steps.report.ReportPlugin[Any], flavor: str) -> 'XMLElement':
+    """
+    Load the XSD schema of a JUnit flavor.
+    """
+
+    from lxml import etree
+
+    try:
+        xsd_schema_path = tmt.utils.resource_files(
+            f'steps/report/junit/schemas/{flavor}.xsd',
+            logger=phase._logger,
+            assert_file=True,
+        )
+    except FileNotFoundError as exc:
+        raise tmt.utils.GeneralError(f"Junit schema '{flavor}.xsd' not found") from exc
+
+    schema_root: XMLElement = etree.XML(xsd_schema_path.read_bytes())
+
+    return etree.XMLSchema(schema_root)
+
+
+def _rewrite_junit_xml(
+    source: Path,
+    target: Optional[Path],
+    schema: Optional['XMLElement'] = None,
+) -> None:
+    """
+    Parse a JUnit XML file, optionally validate it and write it prettified.
+
+    The file is parsed incrementally, and never held in memory as a
+    whole: elements nested deeper than the ``<testcase>`` level are
+    written and discarded as soon as they are parsed, only their
+    ancestors are kept.
+
+    :param source: the JUnit XML file to parse.
+    :param target: if set, the prettified XML is written into this file.
+    :param schema: if set, the file is validated against this schema.
+    :raises lxml.etree.XMLSyntaxError: when the file is not a valid XML
+        file, or when it is not valid against the schema.
+    """
+
+    from lxml import etree
+
+    events = etree.iterparse(
+        str(source),
+        events=('start', 'end', 'comment'),
+        remove_blank_text=True,
+        huge_tree=True,
+        schema=schema,
+    )
+
+    if target is None:
+        for event, element in events:
+            if event == 'end' and element.getparent() is not None:
+                element.clear()
+
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+        return
+
+    with etree.xmlfile(str(target), encoding='utf-8') as xml_file:
+        xml_file.write_declaration()
+
+        # Elements whose start tags have been written, and elements whose
+        # start tags are yet to be written. The latter are postponed
+        # until their first child arrives, elements without children
+        # are written as a whole.
+        writers: list[Any] = []
+        pending: list[tuple[Any, int]] = []
+
+        def _write_indented(item: Any, depth: int) -> None:
+            # Nothing but elements may be written outside of the root element.
+            if writers:
+                xml_file.write('\n' + _JUNIT_XML_INDENT * depth)
+
+            if item is None:
+                return
+
+            if item.tag is not etree.Comment:
+                etree.indent(item, space=_JUNIT_XML_INDENT, level=depth)
+
+            xml_file.write(item)
+
+        def _write_pending() -> None:
+            for pending_element, pending_depth in pending:
+                _write_indented(None, pending_depth)
+
+                writer = xml_file.element(pending_element.tag, dict(pending_element.attrib))
+                writer.__enter__()
+                writers.append(writer)
+
+            pending.clear()
+
+        depth = 0
+
+        for event, element in events:
+            if event == 'comment':
+                if depth <= _JUNIT_XML_STREAMED_DEPTH:
+                    _write_pending()
+                    _write_indented(element, depth)
+
+                continue
+
+            if event == 'start':
+                if depth < _JUNIT_XML_STREAMED_DEPTH:
+                    pending.append((element, depth))
+
+                depth += 1
+
+                continue
+
+            depth -= 1
+
+            if depth < _JUNIT_XML_STREAMED_DEPTH:
+                if pending:
+                    pending.pop()
+                    _write_pending()
+                    _write_indented(element, depth)
+
+                else:
+                    _write_indented(None, depth)
+                    writers.pop().__exit__(None, None, None)
+
+            elif depth == _JUNIT_XML_STREAMED_DEPTH:
+                _write_pending()
+                _write_indented(element, depth)
+
+            else:
+                continue
+
+            # Drop what has been written already, keep just the ancestors.
+            parent = element.getparent()
+
+            if parent is not None:
+                parent.clear(keep_tail=True)
+
+    target.append_text('\n')
+
+
+def write_junit_xml(
     phase: tmt.steps.report.ReportPlugin[Any],
+    filepath: Path,
     flavor: str = DEFAULT_FLAVOR_NAME,
     template_path: Optional[Path] = None,
     include_output_log: bool = True,
+    output_log_size_limit: Optional[int] = None,
     prettify: bool = True,
+    validate: bool = False,
     results_context: Optional[ResultsContext] = None,
     **extra_variables: Any,
-) -> str:
+) -> None:
     """
-    Create JUnit XML file and return the data.
+    Create JUnit XML file.
+
+    The template is rendered into the file piece by piece, as results
+    are processed, and the file is then optionally validated and
+    prettified in a streaming fashion. The whole document is never held
+    in memory.
 
     :param phase: instance of a :py:class:`tmt.steps.report.ReportPlugin`.
+    :param filepath: path to the file to save the XML into.
     :param flavor: name of a JUnit flavor to generate.
     :param template_path: if set, the provided template will be used instead of a pre-defined
         flavor template. In this case, the ``flavor`` must be set to ``custom`` value.
     :param include_output_log: if enabled, the ``<system-out>`` tags are included in the final
         template output.
+    :param output_log_size_limit: if set, at most this many bytes of
+        each output log are included, from the end of the log.
     :param prettify: allows to control the XML pretty print.
+    :param validate: if enabled, the XML is validated against the XSD schema of the flavor.
     :param results_context: if set, the provided :py:class:`ResultsContext` is used in a template.
     :param extra_variables: if set, these variables get propagated into the Jinja template.
     """
@@ -315,7 +514,11 @@ def make_junit_xml(
             return ''
 
         try:
-            return str(phase.step.plan.execute.read(log))
+            if output_log_size_limit is None:
+                return str(phase.step.plan.execute.read(log))
+
+            return _read_log_tail(phase, log, output_log_size_limit)
+
         except tmt.utils.FileError:
             return ''
 
@@ -348,17 +551,40 @@ def make_junit_xml(
     # See /teemtee/tmt/issues/2873 for more info.
     environment.autoescape = select_autoescape(enabled_extensions=('xml.j2'))
 
-    xml_data = render_template_file(
-        template_path,
-        environment,
-        RESULTS=results_context,
-        PLAN=phase.step.plan,
-        INCLUDE_OUTPUT_LOG=include_output_log,
-        **extra_variables,
-    )
+    if flavor == CUSTOM_FLAVOR_NAME:
+        phase.warn(
+            f"The '{CUSTOM_FLAVOR_NAME}' JUnit flavor is used, you are solely responsible "
+            "for the validity of the XML schema."
+        )
+
+        if prettify:
+            phase.warn(
+                f"The pretty print is always disabled for '{CUSTOM_FLAVOR_NAME}' JUnit flavor."
+            )
+
+        prettify = False
 
-    # Try to use lxml to check the flavor XML schema and prettify the final XML
-    # output.
+    # The pretty print rewrites the rendered template, render into a
+    # temporary file first.
+    rendered_filepath = filepath.with_name(f'.{filepath.name}.rendered') if prettify else filepath
+
+    try:
+        with rendered_filepath.open('w', encoding='utf-8') as stream:
+            render_template_file_into_stream(
+                template_path,
+                stream,
+                environment,
+                RESULTS=results_context,
+                PLAN=phase.step.plan,
+                INCLUDE_OUTPUT_LOG=include_output_log,
+                **extra_variables,
+            )
+
+    except OSError as error:
+        raise tmt.utils.ReportError(f"Failed to write the output '{filepath}'.") from error
+
+    # Try to use lxml to check the XML, its flavor XML schema and prettify the
+    # final XML output.
     try:
         from lxml import etree
 
@@ -367,84 +593,96 @@ def make_junit_xml(
 
         print_hints('report/junit', logger=phase._logger)
 
-        return xml_data
+        if rendered_filepath != filepath:
+            rendered_filepath.rename(filepath)
 
-    xml_parser_kwargs: dict[str, Any] = {
-        'remove_blank_text': prettify,
-        'huge_tree': True,
-        'schema': None,
-    }
+        return
 
     # The schema check must be done only for a non-custom JUnit flavors
-    if flavor != CUSTOM_FLAVOR_NAME:
+    schema = (
+        _load_junit_schema(phase, flavor) if validate and flavor != CUSTOM_FLAVOR_NAME else None
+    )
+    target = filepath if prettify else None
+
+    try:
         try:
-            xsd_schema_path = tmt.utils.resource_files(
-                f'steps/report/junit/schemas/{flavor}.xsd',
-                logger=phase._logger,
-                assert_file=True,
-            )
-        except FileNotFoundError as exc:
-            raise tmt.utils.GeneralError(f"Junit schema '{flavor}.xsd' not found") from exc
+            _rewrite_junit_xml(rendered_filepath, target, schema=schema)
 
-        schema_root: XMLElement = etree.XML(xsd_schema_path.read_bytes())
-        xml_parser_kwargs['schema'] = etree.XMLSchema(schema_root)
-    else:
-        phase.warn(
-            f"The '{CUSTOM_FLAVOR_NAME}' JUnit flavor is used, you are solely responsible "
-            "for the validity of the XML schema."
-        )
+        except etree.XMLSyntaxError as e:
+            if schema is None:
+                raise
 
-        if prettify:
             phase.warn(
-                f"The pretty print is always disabled for '{CUSTOM_FLAVOR_NAME}' JUnit flavor."
+                'The generated XML output is not a valid XML file or it is not valid against the '
+                'XSD schema.'
             )
+            phase.warn('Please, report this problem to project maintainers.')
 
-        xml_parser_kwargs['remove_blank_text'] = prettify = False
+            for err in e.error_log:
+                phase.warn(str(err))
 
-    xml_parser = etree.XMLParser(**xml_parser_kwargs)
-    try:
-        tree_root: XMLElement = etree.fromstring(xml_data, xml_parser)
+            # Return the prettified XML without checking the XSD
+            _rewrite_junit_xml(rendered_filepath, target)
 
-    except etree.XMLSyntaxError as e:
-        phase.warn(
-            'The generated XML output is not a valid XML file or it is not valid against the '
-            'XSD schema.'
-        )
+    except etree.XMLSyntaxError as error:
+        if rendered_filepath != filepath:
+            rendered_filepath.rename(filepath)
 
-        if flavor != CUSTOM_FLAVOR_NAME:
-            phase.warn('Please, report this problem to project maintainers.')
+        raise tmt.utils.ReportError(
+            f"The generated XML output is not a valid XML file, see '{filepath}'."
+        ) from error
 
-        for err in e.error_log:
-            phase.warn(str(err))
+    except OSError as error:
+        raise tmt.utils.ReportError(f"Failed to write the output '{filepath}'.") from error
 
-        # Return the prettified XML without checking the XSD
-        del xml_parser_kwargs['schema']
+    if rendered_filepath != filepath:
+        rendered_filepath.unlink()
 
-        xml_parser = etree.XMLParser(**xml_parser_kwargs)
 
-        try:
-            tree_root = etree.fromstring(xml_data, xml_parser)
-        except etree.XMLSyntaxError as error:
-            phase.verbose('rendered XML', xml_data, 'red')
-            raise tmt.utils.ReportError(
-                'The generated XML output is not a valid XML file. Use `--verbose` argument '
-                'to show the output.'
-            ) from error
-
-    # Do not be fooled by the `encoding` parameter: even with `utf-8`,
-    # `tostring()` will still return bytes. `unicode`, on the other
-    # hand, would give us a string, but then, no XML declaration.
-    # So, we get bytes, and we need to apply `decode()` on our own.
-    xml_output: bytes = etree.tostring(
-        tree_root,
-        xml_declaration=True,
-        pretty_print=prettify,
-        # The 'utf-8' encoding must be used instead of 'unicode', otherwise
-        # the XML declaration is not included in the output.
-        encoding='utf-8',
-    )
+@deprecated("Use write_junit_xml instead")
+def make_junit_xml(
+    phase: tmt.steps.report.ReportPlugin[Any],
+    flavor: str = DEFAULT_FLAVOR_NAME,
+    template_path: Optional[Path] = None,
+    include_output_log: bool = True,
+    prettify: bool = True,
+    results_context: Optional[ResultsContext] = None,
+    **extra_variables: Any,
+) -> str:
+    """
+    Create JUnit XML file and return the data.
+
+    Deprecated, use :py:func:`write_junit_xml` instead, which does not
+    hold the whole document in memory. Non-custom flavors are validated
+    against their XSD schema.
+
+    :param phase: instance of a :py:class:`tmt.steps.report.ReportPlugin`.
+    :param flavor: name of a JUnit flavor to generate.
+    :param template_path: if set, the provided template will be used instead of a pre-defined
+        flavor template. In this case, the ``flavor`` must be set to ``custom`` value.
+    :param include_output_log: if enabled, the ``<system-out>`` tags are included in the final
+        template output.
+    :param prettify: allows to control the XML pretty print.
+    :param results_context: if set, the provided :py:class:`ResultsContext` is used in a template.
+    :param extra_variables: if set, these variables get propagated into the Jinja template.
+    """
 
-    return str(xml_output.decode('utf-8'))
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepath = Path(dirpath) / DEFAULT_FILENAME
+
+        write_junit_xml(
+            phase,
+            filepath,
+            flavor=flavor,
+            template_path=template_path,
+            include_output_log=include_output_log,
+            prettify=prettify,
+            validate=True,
+            results_context=results_context,
+            **extra_variables,
+        )
+
+        return filepath.read_text()
 
 
 @container
@@ -491,6 +729,41 @@ class ReportJUnitData(tmt.steps.report.ReportStepData):
         help='Include full standard output in resulting xml file.',
     )
 
+    output_log_size_limit: 'Size' = field(
+        default=DEFAULT_OUTPUT_LOG_SIZE_LIMIT,
+        option='--output-log-size-limit',
+        metavar='SIZE',
+        help=f"""
+            Size limit of the standard output of each test included in resulting xml file.
+            When exceeded, only the end of the output is included. The default limit is
+            {DEFAULT_OUTPUT_LOG_SIZE_LIMIT}.
+            """,
+        normalize=tmt.utils.normalize_data_amount,
+        serialize=lambda limit: str(limit),
+        unserialize=lambda serialized: tmt.hardware.UNITS(serialized),
+    )
+
+    validate: bool = field(
+        default=False,
+        option=('--validate / --no-validate'),
+        is_flag=True,
+        show_default=True,
+        help="""
+            Validate the generated XML against the XSD schema of the flavor. Requires the
+            ``lxml`` package.
+            """,
+    )
+
+    def to_spec(self) -> _RawStepData:
+        spec = super().to_spec()
+        spec['output-log-size-limit'] = str(self.output_log_size_limit)  # type: ignore[reportGeneralTypeIssues,typeddict-unknown-key,unused-ignore]
+        return spec
+
+    def to_minimal_spec(self) -> _RawStepData:
+        spec = super().to_minimal_spec()
+        spec['output-log-size-limit'] = str(self.output_log_size_limit)  # type: ignore[reportGeneralTypeIssues,typeddict-unknown-key,unused-ignore]
+        return spec
+
 
 @tmt.steps.provides_method(
     'junit',
@@ -534,6 +807,11 @@ class ReportJUnit(tmt.steps.report.ReportPlugin[ReportJUnitData]):
     * ``fail`` - ``<failure />`` tag
     * ``skip`` or ``info`` - ``<skipped />`` tag
     * ``error``, ``warn``, or ``pending`` - ``<error />`` tag
+
+    Only the end of large test outputs is included, see the
+    ``output-log-size-limit`` key. The generated XML is validated
+    against the XSD schema of the flavor only when ``validate`` is
+    enabled.
     """
 
     _data_class = ReportJUnitData
@@ -580,15 +858,15 @@ class ReportJUnit(tmt.steps.report.ReportPlugin[ReportJUnitData]):
 
         f_path = self.data.file or self.phase_workdir / DEFAULT_FILENAME
 
-        xml_data = make_junit_xml(
+        write_junit_xml(
             phase=self,
+            filepath=f_path,
             flavor=self.data.flavor,
             template_path=self.data.template_path,
             include_output_log=self.data.include_output_log,
+            output_log_size_limit=int(self.data.output_log_size_limit.to('bytes').magnitude),
             prettify=self.data.prettify,
+            validate=self.data.validate,
         )
-        try:
-            f_path.write_text(xml_data)
-            self.info('output', f_path, 'yellow')
-        except Exception as error:
-            raise tmt.utils.ReportError(f"Failed to write the output '{f_path}'.") from error
+
+        self.info('output', f_path, 'yellow')
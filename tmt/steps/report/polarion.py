@@ -11,7 +11,7 @@ import tmt.utils
 from tmt.container import container, field
 from tmt.utils import Path
 
-from .junit import ResultsContext, make_junit_xml
+from .junit import ResultsContext, write_junit_xml
 
 DEFAULT_FILENAME = 'xunit.xml'
 
@@ -438,21 +438,18 @@ class ReportPolarion(tmt.steps.report.ReportPlugin[ReportPolarionData]):
             testsuites_properties.update({'polarion-custom-deploymentMode': deployment_mode[0]})
         results_context.properties = testsuites_properties
 
-        xml_data = make_junit_xml(
+        f_path = self.data.file or self.phase_workdir / DEFAULT_FILENAME
+
+        write_junit_xml(
             phase=self,
+            filepath=f_path,
             flavor='polarion',
             prettify=self.data.prettify,
+            validate=True,
             include_output_log=self.data.include_output_log,
             results_context=results_context,
         )
 
-        f_path = self.data.file or self.phase_workdir / DEFAULT_FILENAME
-
-        try:
-            f_path.write_text(xml_data)
-        except Exception as error:
-            raise tmt.utils.ReportError(f"Failed to write the output '{f_path}'.") from error
-
         if upload:
             server_url = str(PolarionWorkItem._session._server.url)
             polarion_import_url = (
@@ -460,14 +457,15 @@ class ReportPolarion(tmt.steps.report.ReportPlugin[ReportPolarionData]):
             )
             auth = (PolarionWorkItem._session.user_id, PolarionWorkItem._session.password)
 
-            response = post(
-                polarion_import_url,
-                auth=auth,
-                files={
-                    'file': ('xunit.xml', xml_data),
-                },
-                timeout=10,
-            )
+            with f_path.open('rb') as xml_file:
+                response = post(
+                    polarion_import_url,
+                    auth=auth,
+                    files={
+                        'file': ('xunit.xml', xml_file),
+                    },
+                    timeout=10,
+                )
             self.info(f'Response code is {response.status_code} with text: {response.text}')
         else:
             self.info('Polarion upload can be done manually using command:')
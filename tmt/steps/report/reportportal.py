@@ -1,3 +1,4 @@
+import concurrent.futures
 import datetime
 import os
 import re
@@ -11,6 +12,7 @@ import tmt.hardware
 import tmt.log
 import tmt.result
 import tmt.steps.report
+import tmt.trace
 import tmt.utils
 import tmt.utils.templates
 from tmt._compat.pathlib import Path
@@ -24,9 +26,6 @@ from tmt.utils import (
     format_timestamp,
     sanitize_string,
 )
-from tmt.utils import (
-    yaml_to_dict as _yaml_to_dict,
-)
 
 if TYPE_CHECKING:
     from tmt._compat.typing import TypeAlias
@@ -37,6 +36,10 @@ DEFAULT_LOG_SIZE_LIMIT: 'Size' = tmt.hardware.UNITS('1 MB')
 DEFAULT_TRACEBACK_SIZE_LIMIT: 'Size' = tmt.hardware.UNITS('50 kB')
 # https://reportportal.io/docs/log-data-in-reportportal/ImportDataToReportPortal
 MAX_LOG_SIZE_LIMIT: 'Size' = tmt.hardware.UNITS('32MB')
+#: Maximal size of log messages sent to ReportPortal in a single batch request.
+MAX_LOG_BATCH_SIZE: 'Size' = MAX_LOG_SIZE_LIMIT
+#: Default number of test items uploaded to ReportPortal in parallel.
+DEFAULT_UPLOAD_WORKERS = 8
 
 DEFAULT_LOG_PATTERNS: list[Pattern[str]] = [
     re.compile(pattern)
@@ -49,10 +52,23 @@ DEFAULT_LOG_PATTERNS: list[Pattern[str]] = [
 ]
 
 
-def yaml_to_dict(data: str, yaml_type: tmt.utils.YamlTypType = "safe") -> dict[str, Any]:
-    d: dict[str, Any] = _yaml_to_dict(data, yaml_type=yaml_type)
+def response_to_dict(response: requests.Response) -> dict[str, Any]:
+    """
+    Parse the JSON body of a ReportPortal response
+    """
 
-    return d
+    try:
+        data = response.json()
+
+    except ValueError as exc:
+        raise tmt.utils.ReportError(
+            f"Received invalid response from ReportPortal: {response.text}"
+        ) from exc
+
+    if not isinstance(data, dict):
+        raise tmt.utils.ReportError(f"Received unexpected response from ReportPortal: {data}")
+
+    return data
 
 
 def _flag_env_to_default(option: str, default: bool) -> bool:
@@ -79,6 +95,10 @@ def _str_env_to_default(option: str, default: Optional[str]) -> Optional[str]:
     return str(os.getenv(env_var))
 
 
+def _int_env_to_default(option: str, default: int) -> int:
+    return int(_str_env_to_default(option, str(default)))
+
+
 def _pattern_list_env_to_default(option: str, default: list[Pattern[str]]) -> list[Pattern[str]]:
     env_var = 'TMT_PLUGIN_REPORT_REPORTPORTAL_' + option.upper()
     if env_var not in os.environ or os.getenv(env_var) is None:
@@ -377,6 +397,17 @@ class ReportReportPortalData(tmt.steps.report.ReportStepData):
              """,
     )
 
+    upload_workers: int = field(
+        option="--upload-workers",
+        metavar="N",
+        default=_int_env_to_default('upload_workers', DEFAULT_UPLOAD_WORKERS),
+        help=f"""
+             Number of test items uploaded to ReportPortal in parallel.
+             The default is {DEFAULT_UPLOAD_WORKERS}.
+             """,
+        normalize=tmt.utils.normalize_int,
+    )
+
     launch_url: Optional[str] = None
     launch_uuid: Optional[str] = None
     suite_uuid: Optional[str] = None
@@ -535,6 +566,11 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
         ResultOutcome.PENDING: "SKIPPED",
     }
 
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self._project_settings: Optional[dict[str, Any]] = None
+
     def handle_response(self, response: requests.Response) -> None:
         """
         Check the endpoint response and raise an exception if needed
@@ -640,14 +676,23 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                 attributes += [{'key': 'contact', 'value': contact} for contact in test.contact]
         return attributes
 
+    def get_project_settings(self, session: requests.Session) -> dict[str, Any]:
+        """
+        Fetch settings of the project, only once per report phase
+        """
+
+        if self._project_settings is None:
+            self._project_settings = response_to_dict(self.rp_api_get(session, "settings"))
+
+        return self._project_settings
+
     def get_defect_type_locator(
         self, session: requests.Session, defect_type: Optional[str]
     ) -> str:
         if not defect_type:
             return "ti001"
 
-        response = self.rp_api_get(session, "settings")
-        defect_types = yaml_to_dict(response.text).get("subTypes")
+        defect_types = self.get_project_settings(session).get("subTypes")
         if not defect_types:
             return "ti001"
 
@@ -691,6 +736,45 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
         self.handle_response(response)
         return response
 
+    def rp_api_post_logs(self, session: requests.Session, logs: list[JSON]) -> None:
+        """
+        Upload log entries in batches via the multipart log endpoint
+
+        Each request carries as many entries as fit into
+        :py:data:`MAX_LOG_BATCH_SIZE`, but always at least one.
+        """
+
+        # The content type is set by requests, including the boundary
+        headers = {key: value for key, value in self.headers.items() if key != "Content-Type"}
+        batch_size_limit = int(MAX_LOG_BATCH_SIZE.to('bytes').magnitude)
+
+        def post_batch(batch: list[JSON]) -> None:
+            response = session.post(
+                url=f"{self.url}/log",
+                headers=headers,
+                files=[
+                    ("json_request_part", (None, tmt.utils.to_json(batch), "application/json"))
+                ],
+            )
+            self.handle_response(response)
+
+        batch: list[JSON] = []
+        batch_size = 0
+
+        for log in logs:
+            log_size = len(log["message"].encode())
+
+            if batch and batch_size + log_size > batch_size_limit:
+                post_batch(batch)
+
+                batch, batch_size = [], 0
+
+            batch.append(log)
+            batch_size += log_size
+
+        if batch:
+            post_batch(batch)
+
     def append_description(self, curr_description: str) -> str:
         """
         Extend text with the launch description (if provided)
@@ -733,6 +817,8 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
         Upload all result log files into the ReportPortal instance
         """
 
+        entries: list[JSON] = []
+
         def upload_log(log_path: Path, is_yaml: bool = False, is_traceback: bool = False) -> None:
             try:
                 if is_yaml:
@@ -756,17 +842,14 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                 # Add file name to the log if it is not a traceback
                 if not is_traceback:
                     log = f'### `{log_path.name}`\n{log}'
-                # Upload log
-                self.rp_api_post(
-                    session=session,
-                    path="log/entry",
-                    json={
+                entries.append(
+                    {
                         "message": _filter_log(log, filter_settings),
                         "itemUuid": item_uuid,
                         "launchUuid": launch_uuid,
                         "level": "ERROR" if is_traceback else "INFO",
                         "time": timestamp,
-                    },
+                    }
                 )
 
         # Upload result logs
@@ -787,6 +870,10 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
             for failure_log in result.failure_logs:
                 upload_log(failure_log, is_yaml=True, is_traceback=True)
 
+        # Upload all collected log entries at once
+        if entries:
+            self.rp_api_post_logs(session, entries)
+
     def execute_rp_import(self, logger: tmt.log.Logger) -> None:
         """
         Execute the import of test, results and subresults into ReportPortal
@@ -857,7 +944,7 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
             launch_description += f"<br>{self.data.artifacts_url}"
             suite_description += f"<br>{self.data.artifacts_url}"
 
-        # Communication with RP instance
+        # Communication with RP instance, with a connection for each upload worker
         with tmt.utils.retry_session(
             status_forcelist=(
                 429,  # Too Many Requests
@@ -866,6 +953,7 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                 503,  # Service Unavailable
                 504,  # Gateway Timeout
             ),
+            pool_size=self.data.upload_workers,
             logger=logger,
         ) as session:
             session.verify = self.data.ssl_verify
@@ -884,27 +972,28 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                         "rerun": launch_rerun,
                     },
                 )
-                launch_uuid = yaml_to_dict(response.text).get("id")
+                launch_uuid = response_to_dict(response).get("id")
 
             else:
                 # Get the launch_uuid or info to log
                 if suite_id:
                     response = self.rp_api_get(session, f"item/{suite_id}")
-                    suite_uuid = yaml_to_dict(response.text).get("uuid")
-                    suite_name = str(yaml_to_dict(response.text).get("name"))
-                    launch_id = yaml_to_dict(response.text).get("launchId")
+                    suite = response_to_dict(response)
+                    suite_uuid = suite.get("uuid")
+                    suite_name = str(suite.get("name"))
+                    launch_id = suite.get("launchId")
 
                 if launch_id:
                     response = self.rp_api_get(session, f"launch/{launch_id}")
-                    launch_uuid = yaml_to_dict(response.text).get("uuid")
+                    launch_uuid = response_to_dict(response).get("uuid")
 
             if launch_uuid and not launch_id:
                 response = self.rp_api_get(session, f"launch/uuid/{launch_uuid}")
-                launch_id = yaml_to_dict(response.text).get("id")
+                launch_id = response_to_dict(response).get("id")
 
             # Print the launch info
             if not create_launch:
-                launch_name = yaml_to_dict(response.text).get("name") or ""
+                launch_name = response_to_dict(response).get("name") or ""
                 self.verbose("launch", launch_name, color="green")
                 self.verbose("id", launch_id, "yellow", shift=1)
 
@@ -930,7 +1019,7 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                         "type": "suite",
                     },
                 )
-                suite_uuid = yaml_to_dict(response.text).get("id")
+                suite_uuid = response_to_dict(response).get("id")
                 assert suite_uuid is not None
 
             elif suite_name:
@@ -941,32 +1030,30 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                 self.verbose("uuid", suite_uuid, "yellow", shift=1)
                 self.data.suite_uuid = suite_uuid
 
-            # The first test starts with the launch (at the worst case)
-            test_start_time = launch_start_time
+            defect_type_locator = self.get_defect_type_locator(session, defect_type)
 
-            for result, test_origin in self.step.plan.execute.results_for_tests(
-                self.step.plan.discover.tests()
-            ):
-                test = test_origin.test if test_origin else None
+            def upload_test(
+                result: Optional[Result],
+                test: Optional[Test],
+                item_uuid: Optional[str],
+                test_start_time: str,
+                test_end_time: str,
+            ) -> str:
+                """
+                Create a test item unless given, upload its logs and subresults, and finish it
+                """
 
                 test_name = None
                 test_description = ''
                 test_link = None
                 test_id = None
                 env_vars = None
-                guest_name = None
 
                 if result:
-                    serial_number = result.serial_number
                     test_name = result.name
-                    guest_name = result.guest.name
-
-                    # Use the actual timestamp or reuse the old one if missing
-                    test_start_time = result.start_time or test_start_time
 
                 # update RP item with additional attributes if test details are available
                 if test:
-                    serial_number = test.serial_number
                     if not test_name:
                         test_name = test.name
                     if test.summary:
@@ -982,7 +1069,7 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                         if not re.search(envar_pattern, key)
                     ]
 
-                if create_test:
+                if item_uuid is None:
                     if (
                         self.data.upload_to_launch and launch_per_plan
                     ) or self.data.upload_to_suite:
@@ -1013,23 +1100,13 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                         },
                     )
 
-                    item_uuid = yaml_to_dict(response.text).get("id")
+                    item_uuid = response_to_dict(response).get("id")
                     assert item_uuid is not None
                     self.verbose("uuid", item_uuid, "yellow", shift=1)
-                    self.data.test_uuids.setdefault(serial_number, {})[guest_name] = item_uuid
-                else:
-                    item_uuid = self.data.test_uuids[serial_number][guest_name]
-
-                # If the result end-time is not defined, use the latest result start-time as
-                # default.
-                test_end_time = test_start_time
 
                 # Support for idle tests
                 item_status = "SKIPPED"
                 if result:
-                    # Shift the timestamp to the end of a test.
-                    test_end_time = result.end_time or test_end_time
-
                     item_status = self.TMT_TO_RP_RESULT_STATUS[result.result]
 
                     self.upload_result_logs(
@@ -1063,7 +1140,7 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                                 },
                             )
 
-                            child_item_uuid = yaml_to_dict(response.text).get("id")
+                            child_item_uuid = response_to_dict(response).get("id")
                             assert child_item_uuid is not None
 
                             child_item_status = self.TMT_TO_RP_RESULT_STATUS[subresult.result]
@@ -1080,7 +1157,7 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                             )
 
                             # Finish the child item
-                            response = self.rp_api_put(
+                            self.rp_api_put(
                                 session=session,
                                 path=f"item/{child_item_uuid}",
                                 json={
@@ -1093,20 +1170,114 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                             self.verbose("uuid", child_item_uuid, "yellow", shift=2)
 
                 # Finish the parent test item
-                response = self.rp_api_put(
+                self.rp_api_put(
                     session=session,
                     path=f"item/{item_uuid}",
                     json={
                         "launchUuid": launch_uuid,
                         "endTime": test_end_time,
                         "status": item_status,
-                        "issue": {"issueType": self.get_defect_type_locator(session, defect_type)},
+                        "issue": {"issueType": defect_type_locator},
                     },
                 )
 
+                return item_uuid
+
+            # Missing timestamps are inherited from previous tests, collect
+            # them in the order of results before uploading tests in parallel.
+            # The first test starts with the launch (at the worst case).
+            test_start_time = launch_start_time
+            launch_end_time = launch_start_time
+
+            uploads: list[
+                tuple[
+                    int, Optional[str], Optional[Result], Optional[Test], Optional[str], str, str
+                ]
+            ] = []
+
+            for result, test_origin in self.step.plan.execute.results_for_tests(
+                self.step.plan.discover.tests()
+            ):
+                test = test_origin.test if test_origin else None
+
+                guest_name = None
+
+                if result:
+                    serial_number = result.serial_number
+                    guest_name = result.guest.name
+
+                    # Use the actual timestamp or reuse the old one if missing
+                    test_start_time = result.start_time or test_start_time
+
+                if test:
+                    serial_number = test.serial_number
+
+                # If the result end-time is not defined, use the latest result start-time as
+                # default.
+                test_end_time = test_start_time
+
+                if result:
+                    # Shift the timestamp to the end of a test.
+                    test_end_time = result.end_time or test_end_time
+
+                item_uuid = (
+                    None if create_test else self.data.test_uuids[serial_number][guest_name]
+                )
+
+                uploads.append(
+                    (
+                        serial_number,
+                        guest_name,
+                        result,
+                        test,
+                        item_uuid,
+                        test_start_time,
+                        test_end_time,
+                    )
+                )
+
                 # The launch ends with the last test
                 launch_end_time = test_end_time
 
+            # The launch and the suite exist already, and test items do not
+            # depend on each other, therefore they can be uploaded in parallel.
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.data.upload_workers
+            ) as executor:
+                futures = [
+                    (
+                        serial_number,
+                        guest_name,
+                        executor.submit(
+                            tmt.trace.traced(
+                                upload_test,
+                                'upload',
+                                category='reportportal',
+                                test=result.name if result else test.name if test else '',
+                                guest=guest_name or '',
+                            ),
+                            result,
+                            test,
+                            item_uuid,
+                            start,
+                            end,
+                        ),
+                    )
+                    for serial_number, guest_name, result, test, item_uuid, start, end in uploads
+                ]
+
+                try:
+                    for serial_number, guest_name, future in futures:
+                        self.data.test_uuids.setdefault(serial_number, {})[guest_name] = (
+                            future.result()
+                        )
+
+                except BaseException:
+                    for _, _, future in futures:
+                        future.cancel()
+
+                    raise
+
             if create_suite:
                 # Finish the test suite
                 response = self.rp_api_put(
@@ -1128,7 +1299,7 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
                     path=f"launch/{launch_uuid}/finish",
                     json={"endTime": launch_end_time},
                 )
-                launch_url = str(yaml_to_dict(response.text).get("link"))
+                launch_url = str(response_to_dict(response).get("link"))
 
             assert launch_url is not None
             self.info("url", launch_url, "magenta")
@@ -1154,6 +1325,9 @@ class ReportReportPortal(tmt.steps.report.ReportPlugin[ReportReportPortalData]):
         if not self.data.token:
             raise tmt.utils.ReportError("No ReportPortal token provided.")
 
+        if self.data.upload_workers < 1:
+            raise tmt.utils.ReportError("Number of upload workers must be at least 1.")
+
         if not self.step.plan.my_run:
             raise tmt.utils.ReportError("No run data available.")
 
@@ -0,0 +1,447 @@
+"""
+Tracing of tmt activities.
+
+Spans record how long interesting activities took - steps, phases,
+tests, commands executed on guests, and so on. Spans are nested: a span
+started while another span is active in the same thread, or in a worker
+thread started by :py:func:`propagate`, becomes its child, and inherits
+its attributes, e.g. the name of the plan or the guest.
+
+Tracing is disabled by default, and :py:func:`span` is then very cheap.
+Once enabled by :py:func:`enable`, finished spans are collected by the
+tracer, and may be saved as a `Chrome trace`__ file, to be inspected
+by ``chrome://tracing`` or `Perfetto`__, or as an `OTLP JSON`__ file,
+to be imported by tools supporting OpenTelemetry.
+
+__ https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU
+__ https://ui.perfetto.dev/
+__ https://opentelemetry.io/docs/specs/otlp/#json-protobuf-encoding
+
+.. code-block:: python
+
+    import tmt.trace
+
+    with tmt.trace.span('push', category='guest', guest=guest.multihost_name):
+        ...
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
+
+from tmt._compat.typing import ParamSpec
+from tmt.container import container, simple_field
+
+if TYPE_CHECKING:
+    import tmt.log
+    from tmt._compat.pathlib import Path
+
+
+T = TypeVar('T')
+P = ParamSpec('P')
+
+#: A type of span attribute values.
+AttributeValue = Union[str, int, float, bool]
+
+#: Name of the service as reported by OTLP exports.
+SERVICE_NAME = 'tmt'
+
+#: OTLP span kind ``SPAN_KIND_INTERNAL``.
+_OTLP_SPAN_KIND_INTERNAL = 1
+
+#: OTLP status code ``STATUS_CODE_ERROR``.
+_OTLP_STATUS_CODE_ERROR = 2
+
+
+@container
+class Span:
+    """
+    A single traced activity
+    """
+
+    #: Name of the activity.
+    name: str
+    #: Category of the activity, e.g. ``step`` or ``guest``.
+    category: str
+    #: Unique ID of the span.
+    span_id: str
+    #: ID of the parent span, if any.
+    parent_id: Optional[str]
+    #: Time when the span started, in nanoseconds since the epoch.
+    start_time: int
+    #: ID of the thread which started the span.
+    thread_id: int
+    #: Name of the thread which started the span.
+    thread_name: str
+    #: Attributes describing the activity.
+    attributes: dict[str, AttributeValue] = simple_field(default_factory=dict)
+    #: Time when the span ended, in nanoseconds since the epoch.
+    end_time: Optional[int] = None
+    #: If set, the activity failed with this error.
+    error: Optional[str] = None
+
+    def set_attribute(self, name: str, value: AttributeValue) -> None:
+        """
+        Add or update an attribute of the span.
+        """
+
+        self.attributes[name] = value
+
+
+#: Span active in the current context.
+_CURRENT_SPAN: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    'tmt_trace_span', default=None
+)
+
+
+class Tracer:
+    """
+    Collects finished spans.
+
+    Spans may be started and finished by multiple threads at the same
+    time.
+    """
+
+    def __init__(self) -> None:
+        #: ID shared by all spans of the tracer.
+        self.trace_id = secrets.token_hex(16)
+
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> list[Span]:
+        """
+        Finished spans, in the order in which they finished.
+        """
+
+        with self._lock:
+            return self._spans[:]
+
+    @contextlib.contextmanager
+    def span(
+        self, name: str, category: str, attributes: dict[str, AttributeValue]
+    ) -> Iterator[Span]:
+        """
+        Trace an activity.
+
+        :param name: name of the activity.
+        :param category: category of the activity.
+        :param attributes: attributes describing the activity. Attributes
+            of the parent span are inherited.
+        :yields: the new span.
+        """
+
+        parent = _CURRENT_SPAN.get()
+        thread = threading.current_thread()
+
+        span = Span(
+            name=name,
+            category=category,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_time=time.time_ns(),
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            attributes={**parent.attributes, **attributes} if parent else attributes,
+        )
+
+        token = _CURRENT_SPAN.set(span)
+
+        try:
+            yield span
+
+        except BaseException as exc:
+            span.error = f'{type(exc).__name__}: {exc}'
+
+            raise
+
+        finally:
+            span.end_time = time.time_ns()
+
+            _CURRENT_SPAN.reset(token)
+
+            with self._lock:
+                self._spans.append(span)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Convert spans into Chrome trace event format.
+
+        Each span becomes a complete event, attributes become its
+        arguments. Thread names are exported as metadata events.
+        """
+
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+        threads: dict[int, str] = {}
+
+        for span in self.spans:
+            assert span.end_time is not None  # narrow type
+
+            threads.setdefault(span.thread_id, span.thread_name)
+
+            args: dict[str, Any] = dict(span.attributes)
+
+            if span.error is not None:
+                args['error'] = span.error
+
+            events.append(
+                {
+                    'name': span.name,
+                    'cat': span.category,
+                    'ph': 'X',
+                    'ts': span.start_time / 1000,
+                    'dur': (span.end_time - span.start_time) / 1000,
+                    'pid': pid,
+                    'tid': span.thread_id,
+                    'args': args,
+                }
+            )
+
+        events += [
+            {
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': pid,
+                'tid': thread_id,
+                'args': {'name': thread_name},
+            }
+            for thread_id, thread_name in threads.items()
+        ]
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def to_otlp(self) -> dict[str, Any]:
+        """
+        Convert spans into OTLP JSON format.
+        """
+
+        import tmt
+
+        def _attribute(key: str, value: AttributeValue) -> dict[str, Any]:
+            if isinstance(value, bool):
+                return {'key': key, 'value': {'boolValue': value}}
+
+            if isinstance(value, int):
+                return {'key': key, 'value': {'intValue': str(value)}}
+
+            if isinstance(value, float):
+                return {'key': key, 'value': {'doubleValue': value}}
+
+            return {'key': key, 'value': {'stringValue': str(value)}}
+
+        def _span(span: Span) -> dict[str, Any]:
+            assert span.end_time is not None  # narrow type
+
+            exported: dict[str, Any] = {
+                'traceId': self.trace_id,
+                'spanId': span.span_id,
+                'name': span.name,
+                'kind': _OTLP_SPAN_KIND_INTERNAL,
+                'startTimeUnixNano': str(span.start_time),
+                'endTimeUnixNano': str(span.end_time),
+                'attributes': [
+                    _attribute(key, value)
+                    for key, value in {
+                        'tmt.category': span.category,
+                        'thread.id': span.thread_id,
+                        'thread.name': span.thread_name,
+                        **span.attributes,
+                    }.items()
+                ],
+            }
+
+            if span.parent_id is not None:
+                exported['parentSpanId'] = span.parent_id
+
+            if span.error is not None:
+                exported['status'] = {'code': _OTLP_STATUS_CODE_ERROR, 'message': span.error}
+
+            return exported
+
+        return {
+            'resourceSpans': [
+                {
+                    'resource': {
+                        'attributes': [
+                            _attribute('service.name', SERVICE_NAME),
+                            _attribute('service.version', tmt.__version__),
+                            _attribute('process.pid', os.getpid()),
+                        ]
+                    },
+                    'scopeSpans': [
+                        {
+                            'scope': {'name': __name__, 'version': tmt.__version__},
+                            'spans': [_span(span) for span in self.spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def save(
+        self,
+        *,
+        chrome_trace_path: Optional['Path'] = None,
+        otlp_path: Optional['Path'] = None,
+        logger: 'tmt.log.Logger',
+    ) -> None:
+        """
+        Save collected spans into files.
+
+        :param chrome_trace_path: if set, spans would be saved into this
+            file in Chrome trace event format.
+        :param otlp_path: if set, spans would be saved into this file in
+            OTLP JSON format.
+        :param logger: used for logging.
+        """
+
+        for path, content in (
+            (chrome_trace_path, self.to_chrome_trace),
+            (otlp_path, self.to_otlp),
+        ):
+            if path is None:
+                continue
+
+            try:
+                path.write_text(json.dumps(content()))
+
+            except OSError as exc:
+                logger.warning(f"Failed to save trace into '{path}': {exc}")
+
+                continue
+
+            logger.debug(f"Trace saved into '{path}'.")
+
+
+#: Tracer collecting spans, if tracing is enabled.
+_TRACER: Optional[Tracer] = None
+
+#: Returned by :py:func:`span` when tracing is disabled.
+_NO_SPAN: AbstractContextManager[Optional[Span]] = contextlib.nullcontext()
+
+
+def enable() -> Tracer:
+    """
+    Enable tracing.
+
+    :returns: the tracer collecting spans. If tracing has been already
+        enabled, the existing tracer is returned.
+    """
+
+    global _TRACER
+
+    if _TRACER is None:
+        _TRACER = Tracer()
+
+    return _TRACER
+
+
+def disable() -> None:
+    """
+    Disable tracing, and drop the tracer with all collected spans.
+    """
+
+    global _TRACER
+
+    _TRACER = None
+
+
+def is_enabled() -> bool:
+    """
+    Check whether tracing is enabled.
+    """
+
+    return _TRACER is not None
+
+
+def span(
+    name: str, *, category: str = 'tmt', **attributes: AttributeValue
+) -> AbstractContextManager[Optional[Span]]:
+    """
+    Trace an activity.
+
+    .. code-block:: python
+
+        with tmt.trace.span('clone', category='git', url=url):
+            ...
+
+    :param name: name of the activity.
+    :param category: category of the activity.
+    :param attributes: attributes describing the activity.
+    :returns: a context manager yielding the new span, or ``None`` when
+        tracing is disabled.
+    """
+
+    tracer = _TRACER
+
+    if tracer is None:
+        return _NO_SPAN
+
+    return tracer.span(name, category, attributes)
+
+
+def propagate(fn: Callable[P, T]) -> Callable[P, T]:
+    """
+    Make the current span the parent of spans started by ``fn``.
+
+    Threads do not inherit the context of the thread which started
+    them, therefore spans started in worker threads would have no
+    parent. Wrap a callable with this function before submitting it to
+    a worker thread. The wrapped callable cannot run in multiple threads
+    at the same time, wrap the callable for each submission.
+
+    .. code-block:: python
+
+        executor.submit(tmt.trace.propagate(guest.push))
+
+    :param fn: callable to wrap.
+    :returns: a callable running ``fn`` in a copy of the current
+        context, or ``fn`` itself when tracing is disabled.
+    """
+
+    if _TRACER is None:
+        return fn
+
+    context = contextvars.copy_context()
+
+    def _propagated(*args: P.args, **kwargs: P.kwargs) -> T:
+        return context.run(fn, *args, **kwargs)
+
+    return _propagated
+
+
+def traced(
+    fn: Callable[P, T], name: str, *, category: str = 'tmt', **attributes: AttributeValue
+) -> Callable[P, T]:
+    """
+    Trace an activity performed by a callable, possibly in a worker thread.
+
+    .. code-block:: python
+
+        executor.submit(tmt.trace.traced(phase.go, phase.name, category='phase'))
+
+    :param fn: callable to wrap.
+    :param name: name of the activity.
+    :param category: category of the activity.
+    :param attributes: attributes describing the activity.
+    :returns: a callable running ``fn`` in a new span, child of the
+        current span, or ``fn`` itself when tracing is disabled.
+    """
+
+    if _TRACER is None:
+        return fn
+
+    def _traced(*args: P.args, **kwargs: P.kwargs) -> T:
+        with span(name, category=category, **attributes):
+            return fn(*args, **kwargs)
+
+    return propagate(_traced)
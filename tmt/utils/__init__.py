@@ -31,7 +31,7 @@ from collections import Counter
 from collections.abc import Iterable, Iterator
 from math import ceil
 from re import Pattern
-from threading import RLock, Thread
+from threading import RLock, Thread, local
 from types import ModuleType
 from typing import (
     IO,
@@ -1892,6 +1892,7 @@ class Common(_CommonBase, metaclass=_CommonMeta):
         mode: WriteMode = 'w',
         debug_level: DebugLevel = 2,
         permissions: Optional[int] = None,
+        atomic: bool = False,
     ) -> None:
         """
         Write into a file in the workdir of this object.
@@ -1903,6 +1904,10 @@ class Common(_CommonBase, metaclass=_CommonMeta):
             or for appending, ``a``.
         :param debug_level: a level of ``debug`` verbosity to use when
             logging the operation.
+        :param atomic: if set, the content is written into a temporary
+            file first, which then replaces ``filepath``. Readers would
+            never see partially written content. Applies to ``w`` mode
+            only.
         """
 
         if self.workdir and not filepath.is_absolute():
@@ -1919,6 +1924,9 @@ class Common(_CommonBase, metaclass=_CommonMeta):
             if mode == 'a':
                 filepath.append_text(data, encoding='utf-8', errors='replace')
 
+            elif atomic:
+                filepath.write_text_atomically(data, encoding='utf-8', errors='replace')
+
             else:
                 filepath.write_text(data, encoding='utf-8', errors='replace')
 
@@ -3016,7 +3024,7 @@ _JSON_REPRESENTERS: dict[Any, Callable[[Any], Any]] = {
 }
 
 
-def _yaml(
+def _create_yaml(
     *,
     yaml_type: YamlTypType = "safe",
     width: Optional[int] = None,
@@ -3072,6 +3080,49 @@ def _yaml(
     return yaml
 
 
+#: Already configured YAML loader/dumper instances. Instances are not
+#: thread-safe, therefore each thread maintains its own set.
+_YAML_INSTANCES = local()
+
+
+def _yaml(
+    *,
+    yaml_type: YamlTypType = "safe",
+    width: Optional[int] = None,
+    start: bool = False,
+) -> YAML:
+    """
+    Provide a YAML loader/dumper instance.
+
+    Instances are created by :py:func:`_create_yaml` on the first use,
+    and reused by later calls with the same arguments made by the same
+    thread.
+
+    :param yaml_type: which implementation of the loader/dumper to use.
+        See :py:class:`YAML` for details.
+    :param width: if set, enforce this as the maximal length of lines.
+    :param start: if set, a document start marker, ``---``, would be
+        emitted before each dumped object.
+    :returns: a loader/dumper instance.
+    """
+
+    instances: Optional[dict[tuple[YamlTypType, Optional[int], bool], YAML]] = getattr(
+        _YAML_INSTANCES, 'instances', None
+    )
+
+    if instances is None:
+        instances = _YAML_INSTANCES.instances = {}
+
+    key = (yaml_type, width, start)
+
+    yaml = instances.get(key)
+
+    if yaml is None:
+        yaml = instances[key] = _create_yaml(yaml_type=yaml_type, width=width, start=start)
+
+    return yaml
+
+
 def _sanitize_yaml_string(s: str) -> str:
     """
     Convert multiline strings, sanitize invalid characters.
@@ -3088,6 +3139,11 @@ def _sanitize_yaml_string(s: str) -> str:
     if '\n' in s:
         s = ruamel.yaml.scalarstring.preserve_literal(s)
 
+    # Most strings contain no offending characters at all, check the
+    # whole string first instead of inspecting characters one by one.
+    if pattern.search(s) is None:
+        return s
+
     return ''.join(rf'#{{{ord(c):x}}}' if pattern.match(c) else c for c in s)
 
 
@@ -3324,12 +3380,26 @@ class StateFormat:
     from_state: Callable[[str], Any]
 
 
+def _to_compact_json(data: Any) -> str:
+    """
+    Convert a Python data structure into its compact JSON representation.
+
+    Unlike :py:func:`to_json`, no whitespace is emitted, and non-ASCII
+    characters are not escaped.
+    """
+
+    return json.dumps(
+        data, separators=(',', ':'), ensure_ascii=False, default=_custom_json_encoder
+    )
+
+
 #: Format conversions tmt can use for storing and reading its on-disk
 #: state information. It is a mapping between format name and three
 #: items, a file suffix for files holding the state, and Python-to-format
 #: and format-to-Python converters.
 _SUPPORTED_STATE_FORMATS: dict[str, StateFormat] = {
     'json': StateFormat('json', '.json', to_json, from_json),
+    'json-compact': StateFormat('json-compact', '.json', _to_compact_json, from_json),
     'yaml': StateFormat('yaml', '.yaml', to_yaml, from_yaml),
 }
 
@@ -3445,7 +3515,7 @@ def write_state(filepath: Path, data: Any, format_name: Optional[str] = None) ->
 
     state_format = get_state_format(format=format_name)
 
-    Path(f'{filepath}{state_format.suffix}').write_text(state_format.to_state(data))
+    Path(f'{filepath}{state_format.suffix}').write_text_atomically(state_format.to_state(data))
 
 
 def markdown_to_html(filename: Path) -> str:
@@ -4521,6 +4591,7 @@ class retry_session(contextlib.AbstractContextManager):  # type: ignore[type-arg
         allowed_methods: Optional[tuple[str, ...]] = None,
         status_forcelist: tuple[int, ...] = DEFAULT_RETRIABLE_HTTP_CODES,
         timeout: Optional[int] = None,
+        pool_size: int = requests.adapters.DEFAULT_POOLSIZE,
         logger: tmt.log.Logger,
     ) -> requests.Session:
         # `method_whitelist`` has been renamed to `allowed_methods` since
@@ -4550,10 +4621,12 @@ class retry_session(contextlib.AbstractContextManager):  # type: ignore[type-arg
 
         if timeout is not None:
             http_adapter: requests.adapters.HTTPAdapter = TimeoutHTTPAdapter(
-                timeout=timeout, max_retries=retry_strategy
+                timeout=timeout, max_retries=retry_strategy, pool_maxsize=pool_size
             )
         else:
-            http_adapter = requests.adapters.HTTPAdapter(max_retries=retry_strategy)
+            http_adapter = requests.adapters.HTTPAdapter(
+                max_retries=retry_strategy, pool_maxsize=pool_size
+            )
 
         session = requests.Session()
         session.mount('http://', http_adapter)
@@ -4570,6 +4643,7 @@ class retry_session(contextlib.AbstractContextManager):  # type: ignore[type-arg
         allowed_methods: Optional[tuple[str, ...]] = None,
         status_forcelist: tuple[int, ...] = DEFAULT_RETRIABLE_HTTP_CODES,
         timeout: Optional[int] = None,
+        pool_size: int = requests.adapters.DEFAULT_POOLSIZE,
         logger: tmt.log.Logger,
     ) -> None:
         self.retries = retries
@@ -4578,6 +4652,7 @@ class retry_session(contextlib.AbstractContextManager):  # type: ignore[type-arg
         self.allowed_methods = allowed_methods
         self.status_forcelist = status_forcelist
         self.timeout = timeout
+        self.pool_size = pool_size
         self.logger = logger
 
     def __enter__(self) -> requests.Session:
@@ -4588,6 +4663,7 @@ class retry_session(contextlib.AbstractContextManager):  # type: ignore[type-arg
             allowed_methods=self.allowed_methods,
             status_forcelist=self.status_forcelist,
             timeout=self.timeout,
+            pool_size=self.pool_size,
             logger=self.logger,
         )
 
@@ -2,10 +2,14 @@
 Utility functions for filesystem operations.
 """
 
+import fcntl
 import shutil
+from types import TracebackType
+from typing import IO, Optional
 
 import tmt.log
 from tmt._compat.pathlib import Path
+from tmt._compat.typing import Self
 from tmt.utils import Command, GeneralError, RunError
 
 
@@ -136,3 +140,86 @@ def copy_tree(
         raise GeneralError(
             f"Failed to copy directory tree from '{src}' to '{dst}' using all strategies."
         ) from error
+
+
+class FileLock:
+    """
+    Advisory lock of a file, shared by processes and threads.
+
+    The lock is based on :manpage:`flock(2)`, each instance uses its own
+    open file description, therefore instances exclude each other even
+    when used by threads of the same process. The lock is released when
+    the instance is garbage-collected, or when the process terminates.
+
+    .. code-block:: python
+
+        with FileLock(path):
+            ...
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+        self._file: Optional[IO[bytes]] = None
+
+    @property
+    def is_locked(self) -> bool:
+        return self._file is not None
+
+    def acquire(self, *, shared: bool = False, blocking: bool = True) -> bool:
+        """
+        Acquire the lock.
+
+        An already acquired lock is converted to the requested mode.
+
+        :param shared: if set, acquire a shared lock, which may be held
+            by multiple owners at once. Otherwise, acquire an exclusive
+            lock.
+        :param blocking: if unset, do not wait for the lock to become
+            available.
+        :returns: ``True`` if the lock was acquired, ``False`` if it was
+            not available and ``blocking`` was unset.
+        """
+
+        was_locked = self._file is not None
+
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open('ab')
+
+        operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+
+        try:
+            fcntl.flock(self._file, operation if blocking else operation | fcntl.LOCK_NB)
+
+        except BlockingIOError:
+            if not was_locked:
+                self.release()
+
+            return False
+
+        return True
+
+    def release(self) -> None:
+        """
+        Release the lock
+        """
+
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> Self:
+        self.acquire()
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.release()
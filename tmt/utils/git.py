@@ -12,6 +12,7 @@ from re import Pattern
 from typing import TYPE_CHECKING, Optional
 
 import tmt.log
+import tmt.trace
 import tmt.utils
 import tmt.utils.url
 from tmt.container import container
@@ -367,6 +368,47 @@ def git_root(*, fmf_root: Path, logger: tmt.log.Logger) -> Optional[Path]:
         return None
 
 
+def git_changed_files(*, root: Path, ref: str, logger: tmt.log.Logger) -> set[Path]:
+    """
+    Collect files changed since the given git reference.
+
+    Besides files changed by commits since ``ref``, files modified in
+    the working tree and untracked files which are not ignored are
+    included as well.
+
+    :param root: path to a directory in a git repository.
+    :param ref: git reference to compare the working tree with.
+    :param logger: used for logging.
+    :returns: absolute paths of changed files.
+    :raises GeneralError: when ``root`` does not lie in a git repository,
+        or when changes cannot be listed, e.g. because ``ref`` does not
+        exist.
+    """
+
+    repository = git_root(fmf_root=root, logger=logger)
+
+    if repository is None:
+        raise GeneralError(f"Directory '{root}' is not in a git repository.")
+
+    try:
+        changed = Command('git', 'diff', '--name-only', ref, '--').run(
+            cwd=repository, logger=logger
+        )
+        untracked = Command('git', 'ls-files', '--others', '--exclude-standard').run(
+            cwd=repository, logger=logger
+        )
+
+    except RunError as error:
+        raise GeneralError(f"Failed to list files changed since '{ref}'.") from error
+
+    return {
+        (repository / line.strip()).resolve()
+        for output in (changed.stdout, untracked.stdout)
+        for line in (output or '').splitlines()
+        if line.strip()
+    }
+
+
 def git_add(*, path: Path, logger: tmt.log.Logger) -> None:
     """
     Add path to the git index.
@@ -777,9 +819,10 @@ def git_clone(
         """
 
         depth = ['--depth=1'] if shallow else []
-        output = Command('git', 'clone', *depth, url, destination).run(
-            cwd=Path('/'), environment=environment, timeout=timeout, logger=logger
-        )
+        with tmt.trace.span('clone', category='git', url=url, shallow=shallow):
+            output = Command('git', 'clone', *depth, url, destination).run(
+                cwd=Path('/'), environment=environment, timeout=timeout, logger=logger
+            )
         logger.info(
             'cloned-commit-hash',
             git_hash(directory=destination, logger=logger),
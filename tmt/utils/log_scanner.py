@@ -0,0 +1,534 @@
+"""
+Streaming helpers for scanning logs.
+
+Test and check logs may grow to gigabytes, and reading them into
+memory, splitting them into lists of lines and searching them line by
+line is expensive. Helpers below read logs lazily, line by line, both
+forward and backward, and collect only a bounded amount of matching
+lines. Growing logs can be followed the way ``tail -F`` does.
+"""
+
+import ctypes
+import ctypes.util
+import mmap
+import os
+import re
+import select
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from re import Pattern
+from typing import BinaryIO, Callable, Optional, Union
+
+from tmt._compat.pathlib import Path
+from tmt.utils import FileError
+
+#: Encoding used when decoding log content.
+LOG_ENCODING = 'utf-8'
+
+#: Maximal number of lines collected by a single scan. Logs with more
+#: matching lines would be represented by the first lines only.
+DEFAULT_MAX_LINES = 10000
+
+#: Line added to lines collected by a scan which hit its limit, with the
+#: limit filled in.
+TRUNCATED_NOTE = '... output truncated after {} lines'
+
+#: Line boundaries recognized by :py:meth:`str.splitlines`.
+_LINE_BOUNDARY_PATTERN = re.compile(r'\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+
+#: A pattern to search for, either a compiled regular expression, or
+#: a string to be compiled.
+PatternLike = Union[str, Pattern[str]]
+
+#: Size of blocks read when looking for the tail of a file.
+TAIL_BLOCK_SIZE = 64 * 1024
+
+#: How often followed logs are checked for new content, in seconds.
+FOLLOW_POLL_INTERVAL = 0.5
+
+#: How often followed logs are checked for new content when inotify
+#: reports their changes. Serves as a safety net for changes inotify
+#: cannot see, e.g. those made by other hosts on network filesystems.
+FOLLOW_INOTIFY_POLL_INTERVAL = 5.0
+
+# inotify events of directories containing followed logs: a log was
+# modified, created, removed or renamed, or its attributes changed.
+_INOTIFY_EVENTS = 0x2 | 0x4 | 0x40 | 0x80 | 0x100 | 0x200
+
+
+def compile_patterns(patterns: Iterable[PatternLike]) -> list[Pattern[str]]:
+    """
+    Compile given patterns, keeping the already compiled ones intact.
+    """
+
+    return [
+        pattern if isinstance(pattern, Pattern) else re.compile(pattern) for pattern in patterns
+    ]
+
+
+def iter_lines(path: Path) -> Iterator[str]:
+    """
+    Iterate over lines of a file, from the first one to the last one.
+
+    Lines are terminated by ``\n``, ``\r\n`` or ``\r``, and yielded
+    without these terminators.
+
+    :param path: file to read.
+    :raises FileError: when the file cannot be opened.
+    """
+
+    try:
+        f = path.open(encoding=LOG_ENCODING, errors='replace', newline='')
+
+    except OSError as exc:
+        raise FileError(f"Failed to read from '{path}'.") from exc
+
+    with f:
+        for line in f:
+            yield line.rstrip('\r\n')
+
+
+def iter_lines_reversed(path: Path) -> Iterator[str]:
+    """
+    Iterate over lines of a file, from the last one to the first one.
+
+    The file is memory-mapped, and lines are located by searching for
+    newline characters backward from the end of the file, therefore
+    only the part of the file actually consumed is ever read.
+
+    Lines are split on ``\\n`` only, and the very same lines are yielded
+    as :py:meth:`str.split` would produce, in the reversed order. In
+    particular, a file ending with a newline would yield an empty line
+    first.
+
+    :param path: file to read.
+    :raises FileError: when the file cannot be opened.
+    """
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+
+    except OSError as exc:
+        raise FileError(f"Failed to read from '{path}'.") from exc
+
+    try:
+        size = os.fstat(fd).st_size
+
+        if size == 0:
+            yield ''
+            return
+
+        try:
+            content: Union[mmap.mmap, bytes] = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+
+        # Some files cannot be mapped, e.g. those living on special
+        # filesystems. Fall back to reading the whole file.
+        except (OSError, ValueError):
+            with os.fdopen(os.dup(fd), 'rb') as f:
+                content = f.read()
+
+        try:
+            line_end = len(content)
+
+            while True:
+                index = content.rfind(b'\n', 0, line_end)
+
+                yield content[index + 1 : line_end].decode(LOG_ENCODING, errors='replace')
+
+                if index < 0:
+                    break
+
+                line_end = index
+
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+
+    finally:
+        os.close(fd)
+
+
+def read_tail(path: Path, max_bytes: int) -> tuple[str, int]:
+    """
+    Read at most the given number of bytes from the end of a file.
+
+    Only the tail of the file is read, no matter how large the file is.
+    When the file is truncated, the tail starts with the first complete
+    line, unless there is none.
+
+    :param path: file to read.
+    :param max_bytes: maximal number of bytes to read.
+    :returns: a tuple of the content read, and the number of bytes left
+        out from the beginning of the file.
+    :raises FileError: when the file cannot be read.
+    """
+
+    try:
+        with path.open('rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            skipped = max(0, size - max_bytes)
+
+            f.seek(skipped)
+            content = f.read(max_bytes)
+
+    except OSError as exc:
+        raise FileError(f"Failed to read from '{path}'.") from exc
+
+    if skipped:
+        newline = content.find(b'\n')
+
+        if 0 <= newline < len(content) - 1:
+            skipped += newline + 1
+            content = content[newline + 1 :]
+
+    return content.decode(LOG_ENCODING, errors='replace'), skipped
+
+
+def iter_text_lines(text: str) -> Iterator[str]:
+    """
+    Iterate over lines of a string without splitting it into a list.
+
+    Lines are split the same way :py:meth:`str.splitlines` would split
+    them, but only one line at a time exists as a separate string.
+    """
+
+    start = 0
+
+    for match in _LINE_BOUNDARY_PATTERN.finditer(text):
+        yield text[start : match.start()]
+
+        start = match.end()
+
+    if start < len(text):
+        yield text[start:]
+
+
+def grep(
+    lines: Iterable[str],
+    patterns: Sequence[PatternLike],
+    *,
+    ignore_patterns: Sequence[PatternLike] = (),
+    max_lines: Optional[int] = DEFAULT_MAX_LINES,
+) -> list[str]:
+    """
+    Collect lines matching any of given patterns.
+
+    :param lines: lines to search.
+    :param patterns: a line matching any of these patterns is collected.
+    :param ignore_patterns: a line matching any of these patterns is
+        never collected.
+    :param max_lines: if set, stop after collecting this many lines.
+        Should there be more matching lines, :py:data:`TRUNCATED_NOTE`
+        is added as the last line.
+    :returns: matching lines, in the order in which they were found.
+    """
+
+    compiled_patterns = compile_patterns(patterns)
+    compiled_ignore_patterns = compile_patterns(ignore_patterns)
+
+    matches: list[str] = []
+
+    if not compiled_patterns:
+        return matches
+
+    # The most common case is a single pattern, spare the overhead of
+    # `any()` for it, it adds up with millions of lines.
+    if len(compiled_patterns) == 1:
+        search = compiled_patterns[0].search
+
+        def _matches(line: str) -> bool:
+            return search(line) is not None
+
+    else:
+
+        def _matches(line: str) -> bool:
+            return any(pattern.search(line) for pattern in compiled_patterns)
+
+    for line in lines:
+        if not _matches(line):
+            continue
+
+        if compiled_ignore_patterns and any(
+            pattern.search(line) for pattern in compiled_ignore_patterns
+        ):
+            continue
+
+        if max_lines is not None and len(matches) >= max_lines:
+            matches.append(TRUNCATED_NOTE.format(max_lines))
+            break
+
+        matches.append(line)
+
+    return matches
+
+
+def find_tail_offset(f: BinaryIO, lines: int, *, block_size: int = TAIL_BLOCK_SIZE) -> int:
+    """
+    Find where the given number of last lines of a file begins.
+
+    The file is read backward, block by block, until enough lines are
+    found, therefore only the tail of the file is ever read.
+
+    :param f: file to inspect, opened in binary mode.
+    :param lines: number of lines to find. A newline at the very end of
+        the file terminates the last line, it does not start a new one.
+    :param block_size: how many bytes to read at once.
+    :returns: offset of the first of the last lines, or ``0`` if the
+        file does not have that many lines.
+    """
+
+    end = f.seek(0, os.SEEK_END)
+
+    if lines <= 0:
+        return end
+
+    if end > 0:
+        f.seek(end - 1)
+
+        if f.read(1) == b'\n':
+            end -= 1
+
+    while end > 0:
+        start = max(0, end - block_size)
+
+        f.seek(start)
+        block = f.read(end - start)
+
+        index = len(block)
+
+        while (index := block.rfind(b'\n', 0, index)) >= 0:
+            lines -= 1
+
+            if lines == 0:
+                return start + index + 1
+
+        end = start
+
+    return 0
+
+
+class _InotifyWatcher:
+    """
+    Wait for changes in given directories with inotify
+    """
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    @classmethod
+    def create(cls, directories: Iterable[Path]) -> Optional['_InotifyWatcher']:
+        """
+        Start watching directories.
+
+        :returns: a new watcher, or ``None`` if inotify is not available
+            for any of the directories.
+        """
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        except (OSError, AttributeError):
+            return None
+
+        if fd < 0:
+            return None
+
+        watcher = cls(fd)
+
+        for directory in directories:
+            if libc.inotify_add_watch(fd, os.fsencode(directory), _INOTIFY_EVENTS) < 0:
+                watcher.close()
+                return None
+
+        return watcher
+
+    def wait(self, timeout: float) -> None:
+        """
+        Wait until something changes, or until the timeout expires
+        """
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+
+        if not ready:
+            return
+
+        # Events themselves are not interesting, all logs are checked
+        # after any change.
+        try:
+            while os.read(self._fd, 65536):
+                pass
+
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _FollowedLog:
+    """
+    A single followed log
+    """
+
+    def __init__(self, path: Path, prefix: str) -> None:
+        self.path = path
+        self.prefix = prefix
+
+        self.file: Optional[BinaryIO] = None
+        self.inode: Optional[int] = None
+        self.pending = b''
+
+    def open(self) -> bool:
+        """
+        Open the log, if it exists already
+        """
+
+        try:
+            self.file = self.path.open('rb')
+
+        except FileNotFoundError:
+            return False
+
+        except OSError as exc:
+            raise FileError(f"Failed to read from '{self.path}'.") from exc
+
+        self.inode = os.fstat(self.file.fileno()).st_ino
+        self.pending = b''
+
+        return True
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+
+        self.file = None
+
+    def read(self) -> list[str]:
+        """
+        Read complete lines added since the last read
+        """
+
+        if self.file is None and not self.open():
+            return []
+
+        assert self.file is not None  # narrow type
+
+        lines = self._consume(self.file.read())
+
+        try:
+            stat = os.stat(self.path)
+
+        # The log has been rotated, and its replacement does not exist yet.
+        except FileNotFoundError:
+            return lines
+
+        # The log has been rotated, and its replacement exists already.
+        # Finish the old log, including its unterminated last line, and
+        # continue with the new one.
+        if stat.st_ino != self.inode:
+            lines += self._consume(self.file.read())
+
+            if self.pending:
+                lines += self._consume(b'\n')
+
+            self.close()
+
+            return lines + self.read()
+
+        # The log has been truncated, start from its beginning.
+        if stat.st_size < self.file.tell():
+            self.file.seek(0)
+            self.pending = b''
+
+            lines += self._consume(self.file.read())
+
+        return lines
+
+    def _consume(self, data: bytes) -> list[str]:
+        if not data:
+            return []
+
+        *complete, self.pending = (self.pending + data).split(b'\n')
+
+        return [f'{self.prefix}{line.decode(LOG_ENCODING, errors="replace")}' for line in complete]
+
+
+class LogFollower:
+    """
+    Follow growing logs, the way ``tail -F`` does.
+
+    Lines are yielded as soon as they are complete, prefixed by the
+    prefix of their log. New content is waited for with inotify where
+    available, or by polling logs periodically. Logs which do not exist
+    yet are followed once they appear. Rotated logs are read to their
+    end before their replacements are followed, and truncated logs are
+    read again from their beginning.
+
+    .. code-block:: python
+
+        follower = LogFollower({path: ''}, lines=10)
+
+        for line in follower.follow():
+            print(line)
+    """
+
+    def __init__(self, logs: Mapping[Path, str], *, lines: int = 0) -> None:
+        """
+        Prepare following of logs.
+
+        :param logs: logs to follow, and prefixes of their lines.
+        :param lines: number of already existing lines of each log to
+            emit before new content.
+        """
+
+        self._logs = [_FollowedLog(path, prefix) for path, prefix in logs.items()]
+        self._lines = lines
+
+    def follow(self, stop: Optional[Callable[[], bool]] = None) -> Iterator[str]:
+        """
+        Yield lines of followed logs.
+
+        :param stop: if set, following stops once this callable returns
+            ``True``. It is called whenever there is no new content.
+            Otherwise, logs are followed forever.
+        :yields: prefixed lines of all logs, without newlines.
+        """
+
+        for log in self._logs:
+            if log.open():
+                assert log.file is not None  # narrow type
+
+                log.file.seek(find_tail_offset(log.file, self._lines))
+
+        watcher = _InotifyWatcher.create({log.path.parent for log in self._logs})
+        poll_interval = FOLLOW_INOTIFY_POLL_INTERVAL if watcher else FOLLOW_POLL_INTERVAL
+
+        try:
+            while True:
+                found = False
+
+                for log in self._logs:
+                    for line in log.read():
+                        found = True
+
+                        yield line
+
+                if found:
+                    continue
+
+                if stop is not None and stop():
+                    return
+
+                if watcher is None:
+                    time.sleep(poll_interval)
+
+                else:
+                    watcher.wait(poll_interval)
+
+        finally:
+            if watcher is not None:
+                watcher.close()
+
+            for log in self._logs:
+                log.close()
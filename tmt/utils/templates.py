@@ -5,15 +5,18 @@ Package provides primitives for Jinja2 template rendering, plus our
 custom filters.
 """
 
+import contextlib
 import re
 import shlex
 import textwrap
+from collections.abc import Iterator
 from re import Match
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Optional,
+    TextIO,
     cast,
 )
 
@@ -479,36 +482,16 @@ def default_template_environment(sandboxed: bool = True) -> jinja2.Environment:
     return environment
 
 
-def render_template(
-    template: str,
-    template_filepath: Optional[Path] = None,
-    environment: Optional[jinja2.Environment] = None,
-    sandboxed: bool = True,
-    **variables: Any,
-) -> str:
+@contextlib.contextmanager
+def _template_errors(template_filepath: Optional[Path] = None) -> Iterator[None]:
     """
-    Render a template.
+    Convert Jinja2 exceptions raised while rendering into tmt exceptions.
 
-    :param template: template to render.
     :param template_filepath: path to the template file, if any.
-    :param environment: Jinja2 environment to use.
-    :param variables: variables to pass to the template.
     """
 
-    environment = environment or default_template_environment(sandboxed=sandboxed)
-
-    def raise_error(message: str) -> None:
-        """
-        An in-template helper for raising exceptions
-        """
-
-        raise Exception(message)
-
-    if 'raise_error' not in variables:
-        variables['raise_error'] = raise_error
-
     try:
-        return environment.from_string(template).render(**variables).strip()
+        yield
 
     except jinja2.exceptions.SecurityError as error:
         if template_filepath:
@@ -529,6 +512,39 @@ def render_template(
         raise GeneralError("Could not render template.") from error
 
 
+def _raise_error(message: str) -> None:
+    """
+    An in-template helper for raising exceptions
+    """
+
+    raise Exception(message)
+
+
+def render_template(
+    template: str,
+    template_filepath: Optional[Path] = None,
+    environment: Optional[jinja2.Environment] = None,
+    sandboxed: bool = True,
+    **variables: Any,
+) -> str:
+    """
+    Render a template.
+
+    :param template: template to render.
+    :param template_filepath: path to the template file, if any.
+    :param environment: Jinja2 environment to use.
+    :param variables: variables to pass to the template.
+    """
+
+    environment = environment or default_template_environment(sandboxed=sandboxed)
+
+    if 'raise_error' not in variables:
+        variables['raise_error'] = _raise_error
+
+    with _template_errors(template_filepath):
+        return environment.from_string(template).render(**variables).strip()
+
+
 def render_template_file(
     template_filepath: Path,
     environment: Optional[jinja2.Environment] = None,
@@ -584,3 +600,49 @@ def render_template_file_into_file(
     )
 
     output_filepath.append_text('\n')
+
+
+def render_template_file_into_stream(
+    template_filepath: Path,
+    stream: TextIO,
+    environment: Optional[jinja2.Environment] = None,
+    sandboxed: bool = True,
+    **variables: Any,
+) -> None:
+    """
+    Render a template from a file, and write the result into a stream.
+
+    Unlike :py:func:`render_template_file`, the rendering is never held
+    in memory as a whole, it is written into the stream piece by piece
+    as the template renders. Like :py:func:`render_template`, leading
+    whitespace is dropped.
+
+    :param template_filepath: path to the template file.
+    :param stream: stream to write the rendering into.
+    :param environment: Jinja2 environment to use.
+    :param variables: variables to pass to the template.
+    """
+
+    environment = environment or default_template_environment(sandboxed=sandboxed)
+
+    if 'raise_error' not in variables:
+        variables['raise_error'] = _raise_error
+
+    try:
+        template = template_filepath.read_text()
+
+    except FileNotFoundError as error:
+        raise GeneralError(f"Could not open template '{template_filepath}'.") from error
+
+    with _template_errors(template_filepath):
+        chunks = environment.from_string(template).generate(**variables)
+
+        for chunk in chunks:
+            chunk = chunk.lstrip()
+
+            if chunk:
+                stream.write(chunk)
+                break
+
+        for chunk in chunks:
+            stream.write(chunk)